@@ -0,0 +1,317 @@
+import hashlib
+import json
+import os
+
+import pygame
+
+import config
+from helper import Helper
+
+
+class AssetCache:
+    """
+    Carregador de imagens e sons com atlas de texturas e cache em disco.
+
+    Com o atlas gerado (`python atlas_builder.py`), todas as imagens vêm de uma
+    única textura e são recortadas pelo índice (`atlas.json`). Na primeira
+    execução as regiões convertidas para o formato de pixel da tela são
+    gravadas em disco; nas seguintes, apenas as regiões pedidas (o tema
+    sorteado) são lidas desse cache, sem decodificar nenhum PNG. Os sons
+    seguem a mesma ideia: o PCM decodificado é gravado e relido em vez do OGG.
+
+    As chaves do cache incluem o hash dos ativos (do índice) e o formato da
+    tela/mixer, então um atlas refeito ou outra configuração de vídeo/áudio
+    simplesmente gera um cache novo.
+
+    O índice também guarda tamanho, data de modificação e hash de cada arquivo
+    de origem. Ao carregar, cada arquivo é conferido (só é relido para o hash
+    se o tamanho ou a data mudou): se algum ativo foi alterado depois do
+    `atlas_builder.py`, o atlas está velho e tudo vem dos arquivos originais
+    até ele ser gerado de novo.
+
+    Sem o atlas, as imagens são carregadas diretamente dos arquivos originais.
+
+    Attributes:
+        index (dict | None): Índice do atlas (None se o atlas não foi gerado ou está velho).
+        stale (bool): O atlas existe, mas algum ativo mudou depois dele.
+        cache_path (str): Diretório do cache em disco.
+    """
+
+    def __init__(self, atlas_index: str = config.ATLAS_INDEX, cache_path: str = config.ASSET_CACHE_PATH) -> None:
+        """
+        Lê o índice do atlas (se existir) e confere se os ativos ainda são os dele.
+
+        Args:
+            atlas_index (str): Caminho do índice gerado pelo `AtlasBuilder`.
+            cache_path (str): Diretório onde o cache de superfícies e sons é gravado.
+        """
+        self.atlas_index = atlas_index
+        self.cache_path = cache_path
+        self.index: dict | None = None
+        self.stale = False
+
+        if os.path.exists(atlas_index):
+            with open(atlas_index) as file:
+                self.index = json.load(file)
+
+            if not self.current(self.index):
+                self.index, self.stale = None, True
+
+        # Estado preguiçoso: só é preenchido quando a primeira imagem é pedida
+        self._sources: dict[str, pygame.Surface] = {}
+        self._surfaces: dict[str, pygame.Surface] = {}
+        self._image_cache: dict | None = None
+
+    # --- Tabela de ativos ---
+
+    @staticmethod
+    def image_sources() -> dict[str, tuple[str, int | None, bool]]:
+        """
+        Todas as imagens do jogo, por nome.
+
+        Returns:
+            dict: nome -> (arquivo, índice do quadro na spritesheet ou None, tem transparência).
+        """
+        sources = {
+            f"background/{name}": (path, None, False) for name, path in config.BACKGROUND_IMAGES.items()
+        }
+        sources["game_start"] = (config.GAME_START_IMAGE, None, True)
+        sources["game_over"] = (config.GAME_OVER_IMAGE, None, True)
+        sources["base"] = (config.BASE_IMAGE, None, False)
+
+        for color, images in config.PLAYER_IMAGES.items():
+            for flap, path in images.items():
+                sources[f"player/{color}/{flap}"] = (path, None, True)
+
+        for i in range(10):
+            sources[f"score/{i}"] = (f"{config.SCORE_IMAGES_PATH}/{i}.png", None, True)
+
+        for color, path in config.PIPE_IMAGES.items():
+            sources[f"pipe/{color}"] = (path, None, True)
+
+        for color, path in config.COIN_IMAGES.items():
+            for i in range(config.COINT_TILE_SET_SIZE):
+                sources[f"coin/{color}/{i}"] = (path, i, True)
+
+        return sources
+
+    @staticmethod
+    def sound_sources() -> dict[str, str]:
+        """Todos os sons do jogo, por nome."""
+        return {
+            "score": config.SCORE_SOUND,
+            "hit": config.HIT_SOUND,
+            "action": config.ACTION_SOUND,
+            "move_up": config.MOVE_UP_SOUND,
+            "die": config.DIE_SOUND,
+        }
+
+    @staticmethod
+    def source_files() -> list[str]:
+        """Arquivos de origem de todas as imagens e sons, sem repetição."""
+        paths = [path for path, _, _ in AssetCache.image_sources().values()]
+        return list(dict.fromkeys(paths + list(AssetCache.sound_sources().values())))
+
+    @staticmethod
+    def relative(path: str) -> str:
+        """Caminho de um ativo relativo a `BASE_DIR` (a chave dele no índice)."""
+        prefix = config.BASE_DIR + os.sep
+
+        # Os caminhos do `config` partem de `BASE_DIR`; `relpath` (bem mais lento) só para os outros
+        return path[len(prefix) :] if path.startswith(prefix) else os.path.relpath(path, config.BASE_DIR)
+
+    @staticmethod
+    def file_hash(path: str) -> str:
+        """Hash SHA-256 do conteúdo de um arquivo."""
+        with open(path, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
+
+    @staticmethod
+    def file_entry(path: str) -> list:
+        """Registro de um arquivo de origem no índice: [tamanho, data de modificação (ns), hash]."""
+        stat = os.stat(path)
+        return [stat.st_size, stat.st_mtime_ns, AssetCache.file_hash(path)]
+
+    @staticmethod
+    def current(index: dict) -> bool:
+        """
+        Verifica se os arquivos de origem ainda são os que geraram o atlas.
+
+        Args:
+            index (dict): Índice do atlas.
+
+        Returns:
+            bool: False se algum arquivo mudou, sumiu ou não está no índice (ex: índice antigo).
+        """
+        files = index.get("files", {})
+        paths = AssetCache.source_files()
+
+        if len(files) != len(paths):
+            return False
+
+        for path in paths:
+            entry = files.get(AssetCache.relative(path))
+
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                return False
+
+            if entry is None:
+                return False
+
+            # Mesmo tamanho e data: inalterado, sem reler o arquivo
+            if [stat.st_size, stat.st_mtime_ns] != entry[:2] and AssetCache.file_hash(path) != entry[2]:
+                return False
+
+        return True
+
+    @staticmethod
+    def load_source(path: str, tile: int | None, loaded: dict[str, pygame.Surface]) -> pygame.Surface:
+        """
+        Decodifica uma imagem original (ou um quadro da spritesheet), sem conversão.
+
+        Args:
+            path (str): Arquivo da imagem.
+            tile (int | None): Quadro da spritesheet (None = imagem inteira).
+            loaded (dict): Arquivos já decodificados (evita decodificar o mesmo PNG duas vezes).
+        """
+        if path not in loaded:
+            loaded[path] = pygame.image.load(path)
+
+        if tile is None:
+            return loaded[path]
+
+        return Helper.get_tile(tile, 0, config.COIN_TILE_SIZE, loaded[path])
+
+    # --- Imagens ---
+
+    def image(self, name: str) -> pygame.Surface:
+        """
+        Retorna a imagem `name` já convertida para o formato de pixel da tela.
+
+        Args:
+            name (str): Nome do ativo (ver `image_sources`), ex: "player/RED/UPFLAP".
+
+        Returns:
+            pygame.Surface: A imagem pronta para desenho.
+        """
+        if name in self._surfaces:
+            return self._surfaces[name]
+
+        if self.index is None:
+            path, tile, alpha = self.image_sources()[name]
+            image = self.load_source(path, tile, self._sources)
+            surface = image.convert_alpha() if alpha else image.convert()
+        else:
+            surface = self._cached_image(name)
+
+        self._surfaces[name] = surface
+        return surface
+
+    def _image_cache_file(self) -> str:
+        """Arquivo do cache de superfícies para este atlas e este formato de tela."""
+        probe = pygame.Surface((1, 1))
+        formats = [
+            (surface.get_bitsize(), surface.get_masks(), surface.get_flags() & pygame.SRCALPHA)
+            for surface in (probe.convert(), probe.convert_alpha())
+        ]
+        key = hashlib.sha256(f"{self.index['hash']}{formats}".encode()).hexdigest()[:16]
+        return os.path.join(self.cache_path, f"images-{key}")
+
+    def _cached_image(self, name: str) -> pygame.Surface:
+        """Lê a região do cache em disco, criando o cache a partir do atlas se necessário."""
+        path = self._image_cache_file()
+
+        if self._image_cache is None:
+            if os.path.exists(f"{path}.json"):
+                with open(f"{path}.json") as file:
+                    self._image_cache = json.load(file)
+            else:
+                self._image_cache = self._write_image_cache(path)
+
+        width, height, bitsize, masks, flags, pitch, offset, size = self._image_cache[name]
+        surface = pygame.Surface((width, height), flags, bitsize, masks)
+
+        if surface.get_pitch() != pitch:
+            raise ValueError(f"Cache de imagens incompatível: {path}")
+
+        # Copia os bytes (já no formato da tela) direto para a superfície
+        with open(f"{path}.bin", "rb") as file:
+            file.seek(offset)
+            surface.get_buffer().write(file.read(size))
+
+        return surface
+
+    def _write_image_cache(self, path: str) -> dict:
+        """Converte todas as regiões do atlas e grava seus bytes (formato da tela) no cache."""
+        atlas = pygame.image.load(os.path.join(os.path.dirname(self.atlas_index), self.index["image"]))
+        entries = {}
+        chunks = []
+        offset = 0
+
+        for name, region in self.index["regions"].items():
+            image = atlas.subsurface(region["rect"])
+            surface = image.convert_alpha() if region["alpha"] else image.convert()
+            data = surface.get_buffer().raw
+            entries[name] = [
+                surface.get_width(),
+                surface.get_height(),
+                surface.get_bitsize(),
+                list(surface.get_masks()),
+                surface.get_flags() & pygame.SRCALPHA,
+                surface.get_pitch(),
+                offset,
+                len(data),
+            ]
+            chunks.append(data)
+            offset += len(data)
+
+            # Aproveita as superfícies já convertidas nesta execução
+            self._surfaces[name] = surface
+
+        os.makedirs(self.cache_path, exist_ok=True)
+
+        # Grava em arquivos temporários e renomeia: um cache nunca fica pela metade
+        with open(f"{path}.bin.tmp", "wb") as file:
+            file.write(b"".join(chunks))
+        with open(f"{path}.json.tmp", "w") as file:
+            json.dump(entries, file)
+
+        os.replace(f"{path}.bin.tmp", f"{path}.bin")
+        os.replace(f"{path}.json.tmp", f"{path}.json")
+        return entries
+
+    # --- Sons ---
+
+    def sound(self, name: str) -> pygame.mixer.Sound:
+        """
+        Retorna o som `name`, lendo o PCM decodificado do cache quando possível.
+
+        Args:
+            name (str): Nome do som (ver `sound_sources`), ex: "hit".
+
+        Returns:
+            pygame.mixer.Sound: O som pronto para tocar.
+        """
+        path = self.sound_sources()[name]
+
+        if self.index is None or name not in self.index["sounds"]:
+            return pygame.mixer.Sound(path)
+
+        # O PCM depende do formato do mixer (frequência, tamanho da amostra e canais)
+        key = hashlib.sha256(f"{self.index['sounds'][name]}{pygame.mixer.get_init()}".encode()).hexdigest()[:16]
+        cache_file = os.path.join(self.cache_path, f"sound-{key}.pcm")
+
+        if os.path.exists(cache_file):
+            with open(cache_file, "rb") as file:
+                return pygame.mixer.Sound(buffer=file.read())
+
+        sound = pygame.mixer.Sound(path)
+        os.makedirs(self.cache_path, exist_ok=True)
+
+        with open(f"{cache_file}.tmp", "wb") as file:
+            file.write(sound.get_raw())
+
+        os.replace(f"{cache_file}.tmp", cache_file)
+        return sound
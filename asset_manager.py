@@ -1,80 +1,106 @@
 import random
+from functools import cached_property
 
 import pygame
 
 import config
-from helper import Helper
+from asset_cache import AssetCache
+from rotation_cache import RotationCache
+from silent_sound import SilentSound
 
 
 class AssetManager:
     """
     Gerenciador central de ativos (assets) do jogo.
 
-    Responsável por carregar imagens e sons do disco para a memória,
+    Responsável por carregar imagens e sons do disco para a memória (via `AssetCache`),
     além de definir aleatoriamente o tema visual da partida atual
     (cor do pássaro, cenário dia/noite, cor dos canos, etc.).
 
     Attributes:
         background_image (pygame.Surface): Imagem de fundo (Dia ou Noite).
         player_images (list[pygame.Surface]): Sequência de quadros de animação do pássaro.
+        player_rotations (RotationCache | None): Quadros do pássaro pré-renderizados em cada inclinação
+            (None = sem inclinação).
+        player_dead_images (list[pygame.Surface]): Quadros do pássaro de cabeça para baixo (morte sem inclinação),
+            invertidos no primeiro acesso.
         pipe_image (pygame.Surface): Imagem do obstáculo (cano).
+        top_pipe_image (pygame.Surface): Imagem do cano invertida (cano de cima).
         coin_images (list[pygame.Surface]): Quadros de animação da moeda.
         score_display_images (list[pygame.Surface]): Imagens dos números 0-9 para o placar.
         sounds (dict): (Implícito) Vários efeitos sonoros carregados via pygame.mixer.
         channel (pygame.mixer.Channel): Canal reservado (ID 0) para sequência de sons de morte.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        audio: bool = True,
+        rng: random.Random | None = None,
+        cache: AssetCache | None = None,
+        tilt: bool = config.PLAYER_TILT,
+    ) -> None:
         """
-        Carrega todos os ativos, define as variações aleatórias da sessão e configura o sistema de áudio prioritário.
+        Carrega os ativos do tema sorteado, define as variações aleatórias da sessão e configura o sistema de
+        áudio prioritário.
+
+        Apenas as imagens do tema escolhido são carregadas (do atlas/cache quando gerados).
+
+        Args:
+            audio (bool): Se False, não usa o `pygame.mixer` e todos os sons ficam mudos.
+            rng (random.Random | None): Gerador usado para sortear o tema. Se None, cria um sem semente fixa.
+            cache (AssetCache | None): Carregador de ativos. Se None, usa o atlas e o cache padrão.
+            tilt (bool): Se True, pré-renderiza os quadros do pássaro inclinados (`RotationCache`).
         """
+        rng = rng if rng is not None else random.Random()
+        cache = cache if cache is not None else AssetCache()
 
         # --- Cenário (Background) ---
-        background_color = random.choice(["DAY", "NIGHT"])
-        background_image = config.BACKGROUND_IMAGES[background_color]
-        self.background_image = pygame.image.load(background_image).convert()
+        background_color = rng.choice(["DAY", "NIGHT"])
+        self.background_image = cache.image(f"background/{background_color}")
 
         # --- Interface (UI) ---
-        self.game_start_image = pygame.image.load(config.GAME_START_IMAGE).convert_alpha()
-        self.game_over_image = pygame.image.load(config.GAME_OVER_IMAGE).convert_alpha()
-        self.base_image = pygame.image.load(config.BASE_IMAGE).convert()
+        self.game_start_image = cache.image("game_start")
+        self.game_over_image = cache.image("game_over")
+        self.base_image = cache.image("base")
 
         # --- Jogador (Player) ---
         # Seleciona aleatoriamente a cor e carrega os 3 estados de asa
-        player_color = random.choice(["YELLOW", "BLUE", "RED"])
-        player_images = config.PLAYER_IMAGES[player_color]
+        player_color = rng.choice(["YELLOW", "BLUE", "RED"])
+        midflap_image = cache.image(f"player/{player_color}/MIDFLAP")
         self.player_images = [
-            pygame.image.load(player_images["DOWNFLAP"]).convert_alpha(),
-            pygame.image.load(player_images["MIDFLAP"]).convert_alpha(),
-            pygame.image.load(player_images["UPFLAP"]).convert_alpha(),
-            pygame.image.load(player_images["MIDFLAP"]).convert_alpha(),
+            cache.image(f"player/{player_color}/DOWNFLAP"),
+            midflap_image,
+            cache.image(f"player/{player_color}/UPFLAP"),
+            midflap_image,
         ]
+        # Tabela de inclinações: cada ângulo é girado no primeiro uso, o sprite só escolhe a superfície
+        self.player_rotations = RotationCache(self.player_images) if tilt else None
 
         # --- Placar (Score) ---
-        self.score_display_images = [
-            pygame.image.load(f"{config.SCORE_IMAGES_PATH}/{i}.png").convert_alpha() for i in range(10)
-        ]
+        self.score_display_images = [cache.image(f"score/{i}") for i in range(10)]
 
         # --- Obstáculos (Pipes) ---
-        pipe_color = random.choice(["GREEN", "RED"])
-        pipe_image = config.PIPE_IMAGES[pipe_color]
-        self.pipe_image = pygame.image.load(pipe_image).convert_alpha()
+        pipe_color = rng.choice(["GREEN", "RED"])
+        self.pipe_image = cache.image(f"pipe/{pipe_color}")
+        # Versão invertida (cano de cima), calculada uma vez e compartilhada por todos os canos
+        self.top_pipe_image = pygame.transform.flip(self.pipe_image, flip_x=False, flip_y=True)
 
         # --- Colecionáveis (Coins) ---
-        # Recorta os sprites da moeda de uma folha de sprites (spritesheet)
-        coin_color = random.choice(["GOLD", "SILVER"])
-        coin_images = config.COIN_IMAGES[coin_color]
-        coin_tile_set = pygame.image.load(coin_images).convert_alpha()
-        self.coin_images = [
-            Helper.get_tile(i, 0, config.COIN_TILE_SIZE, coin_tile_set) for i in range(config.COINT_TILE_SET_SIZE)
-        ]
+        # Os quadros da spritesheet já são recortados pelo AssetCache
+        coin_color = rng.choice(["GOLD", "SILVER"])
+        self.coin_images = [cache.image(f"coin/{coin_color}/{i}") for i in range(config.COINT_TILE_SET_SIZE)]
 
         # --- Áudio (Sounds) ---
-        self.score_sound = pygame.mixer.Sound(config.SCORE_SOUND)
-        self.hit_sound = pygame.mixer.Sound(config.HIT_SOUND)
-        self.action_sound = pygame.mixer.Sound(config.ACTION_SOUND)
-        self.move_up_sound = pygame.mixer.Sound(config.MOVE_UP_SOUND)
-        self.die_sound = pygame.mixer.Sound("assets/audios/audio_die.ogg")
+        if not audio:
+            self.score_sound = self.hit_sound = self.action_sound = SilentSound()
+            self.move_up_sound = self.die_sound = self.channel = SilentSound()
+            return
+
+        self.score_sound = cache.sound("score")
+        self.hit_sound = cache.sound("hit")
+        self.action_sound = cache.sound("action")
+        self.move_up_sound = cache.sound("move_up")
+        self.die_sound = cache.sound("die")
 
         # Configuração de canal prioritário
         # O canal 0 foi reservado na inicialização do pygame. Aqui nós pegamos a referência dele.
@@ -83,3 +109,8 @@ class AssetManager:
         # Configura um evento customizado para ser disparado quando o som
         # tocando neste canal terminar. Usado para encadear HIT -> DIE.
         self.channel.set_endevent(config.HIT_SOUND_END_EVENT)
+
+    @cached_property
+    def player_dead_images(self) -> list[pygame.Surface]:
+        """Quadros invertidos, calculados uma vez (só quando pedidos) e compartilhados por todos os níveis."""
+        return [pygame.transform.flip(image, flip_x=False, flip_y=True) for image in self.player_images]
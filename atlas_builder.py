@@ -0,0 +1,123 @@
+import argparse
+import json
+import os
+
+import pygame
+
+import config
+from asset_cache import AssetCache
+
+
+class AtlasBuilder:
+    """
+    Etapa de build: empacota todas as imagens do jogo em um único atlas.
+
+    Cada imagem (e cada quadro da spritesheet das moedas) vira uma região de
+    `atlas.png`, posicionada por empacotamento em prateleiras (shelf packing).
+    O índice `atlas.json` guarda o retângulo de cada região e os hashes dos
+    arquivos de origem, que servem de chave para o `AssetCache`, além do
+    tamanho e da data de cada arquivo, com que o `AssetCache` percebe um
+    ativo alterado depois do build.
+
+    Attributes:
+        width (int): Largura do atlas (as prateleiras quebram linha ao atingi-la).
+    """
+
+    def __init__(self, width: int = 1024) -> None:
+        """
+        Args:
+            width (int): Largura do atlas em pixels.
+        """
+        self.width = width
+
+    def pack(self, sizes: dict[str, tuple[int, int]]) -> tuple[dict[str, tuple[int, int]], int]:
+        """
+        Posiciona os retângulos em prateleiras, dos mais altos para os mais baixos.
+
+        Args:
+            sizes (dict): nome -> (largura, altura).
+
+        Returns:
+            tuple: (nome -> posição (x, y), altura total do atlas).
+        """
+        positions = {}
+        x = y = shelf_height = 0
+
+        for name in sorted(sizes, key=lambda name: (-sizes[name][1], name)):
+            width, height = sizes[name]
+
+            if x + width > self.width:
+                x, y = 0, y + shelf_height
+                shelf_height = 0
+
+            positions[name] = (x, y)
+            x += width
+            shelf_height = max(shelf_height, height)
+
+        return positions, y + shelf_height
+
+    def build(self, atlas_image: str = config.ATLAS_IMAGE, atlas_index: str = config.ATLAS_INDEX) -> dict:
+        """
+        Gera `atlas.png` e `atlas.json`.
+
+        Os pixels são copiados como bytes RGBA (sem mistura de transparência),
+        então cada região é idêntica à imagem original.
+
+        Args:
+            atlas_image (str): Caminho de saída do atlas.
+            atlas_index (str): Caminho de saída do índice.
+
+        Returns:
+            dict: O índice gerado.
+        """
+        sources = AssetCache.image_sources()
+        loaded: dict[str, pygame.Surface] = {}
+        images = {
+            name: AssetCache.load_source(path, tile, loaded) for name, (path, tile, _) in sources.items()
+        }
+        positions, height = self.pack({name: image.get_size() for name, image in images.items()})
+
+        pixels = bytearray(self.width * height * 4)
+
+        for name, image in images.items():
+            x, y = positions[name]
+            width = image.get_width()
+            data = pygame.image.tobytes(image, "RGBA")
+
+            for row in range(image.get_height()):
+                start = ((y + row) * self.width + x) * 4
+                pixels[start : start + width * 4] = data[row * width * 4 : (row + 1) * width * 4]
+
+        os.makedirs(os.path.dirname(atlas_image), exist_ok=True)
+        pygame.image.save(pygame.image.frombytes(bytes(pixels), (self.width, height), "RGBA"), atlas_image)
+
+        index = {
+            "image": os.path.relpath(atlas_image, os.path.dirname(atlas_index)),
+            "hash": AssetCache.file_hash(atlas_image),
+            "regions": {
+                name: {
+                    "rect": [*positions[name], *images[name].get_size()],
+                    "alpha": sources[name][2],
+                    "source": AssetCache.file_hash(sources[name][0]),
+                }
+                for name in sources
+            },
+            "sounds": {name: AssetCache.file_hash(path) for name, path in AssetCache.sound_sources().items()},
+            "files": {
+                AssetCache.relative(path): AssetCache.file_entry(path) for path in AssetCache.source_files()
+            },
+        }
+
+        with open(atlas_index, "w") as file:
+            json.dump(index, file, indent=1)
+
+        return index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera o atlas de texturas e o índice dos ativos")
+    parser.add_argument("--width", type=int, default=1024, help="Largura do atlas em pixels")
+    args = parser.parse_args()
+
+    index = AtlasBuilder(args.width).build()
+    print(f"{len(index['regions'])} regiões e {len(index['sounds'])} sons indexados em {config.ATLAS_INDEX}")
@@ -0,0 +1,289 @@
+import math
+import time
+
+import config
+from pixel import pixel
+from player_body import PlayerBody
+from simulation import Simulation
+
+
+class Autopilot:
+    """
+    Piloto automático (modo demonstração e bot de referência para QA).
+
+    A cada quadro decide se o pássaro bate as asas simulando os próximos
+    `horizon` segundos. Não clona a `Simulation`: o modelo à frente é
+    analítico e só tem números.
+
+    - O pássaro segue `PlayerBody.advance`, a mesma integração exata da
+      simulação, amostrada a cada `step`.
+    - Os obstáculos andam a `GAME_SPEED`. Para cada amostra, os canos que
+      cruzam a coluna do pássaro viram limites para o centro do círculo da
+      colisão, com `margin` de folga. O chão é um limite fixo. Os limites são
+      apertados de trás para frente pelo quanto o pássaro consegue subir ou
+      cair entre amostras, o que corta cedo os ramos sem saída.
+    - O plano do quadro anterior (as amostras em que bater as asas) é
+      conferido de novo, uma amostra adiante; na maioria dos quadros ele
+      continua valendo e a decisão custa uma simulação linear do horizonte.
+    - Se não vale mais, uma busca em profundidade tenta bater as asas o mais
+      tarde possível (a cada `stride` amostras), memorizando os pontos
+      (amostra, altura) de onde bater não tem saída. Primeiro exige passar
+      pelo centro de cada moeda ativa; se não houver plano assim, só sobreviver.
+
+    A busca para ao visitar `max_nodes` estados ou perto do prazo da decisão
+    (`budget` depois do seu início), o que mantém o tempo de
+    planejamento dentro do orçamento do quadro. Sem tempo, vale o melhor
+    plano já encontrado: o do quadro anterior, se ele ainda sobrevive (mesmo
+    sem passar pelas moedas). Sem plano, vale uma regra simples (bater as
+    asas abaixo do meio da faixa livre).
+
+    Attributes:
+        samples (int): Amostras no horizonte (`horizon / step`).
+        step (float): Intervalo entre amostras (segundos).
+        stride (int): Intervalo (em amostras) entre as batidas de asas consideradas na busca.
+        margin (int): Folga do modelo em relação aos canos e ao chão (px).
+        coin_tolerance (int): Distância vertical do centro da moeda aceita ao passar por ela (px).
+        max_nodes (int): Limite de estados visitados por decisão.
+        budget (float): Prazo de cada decisão; acima dele, a busca para e a decisão conta como lenta (segundos).
+        decisions (int): Decisões tomadas.
+        total_time (float): Tempo total de planejamento (segundos).
+        max_time (float): Decisão mais demorada (segundos).
+        slow (int): Decisões acima de `budget`.
+        searches (int): Decisões que precisaram de uma busca nova.
+        plan (list[int]): Amostras (a partir da decisão atual) em que o plano bate as asas.
+    """
+
+    def __init__(
+        self,
+        horizon: float = config.AUTOPILOT_HORIZON,
+        step: float = config.AUTOPILOT_STEP,
+        stride: int = config.AUTOPILOT_STRIDE,
+        margin: int = config.AUTOPILOT_MARGIN,
+        coin_tolerance: int = config.AUTOPILOT_COIN_TOLERANCE,
+        max_nodes: int = config.AUTOPILOT_MAX_NODES,
+        budget: float = config.AUTOPILOT_BUDGET,
+    ) -> None:
+        """
+        Configura o planejador.
+
+        Args:
+            horizon (float): Segundos simulados à frente.
+            step (float): Intervalo entre amostras (segundos); o plano avança uma amostra por decisão.
+            stride (int): Na busca, bate as asas só em amostras múltiplas de `stride`.
+            margin (int): Folga do modelo em relação aos canos e ao chão (px).
+            coin_tolerance (int): Distância vertical do centro da moeda aceita (px).
+            max_nodes (int): Limite de estados visitados por decisão.
+            budget (float): Prazo de cada decisão (segundos).
+        """
+        self.samples = max(1, round(horizon / step))
+        self.step = step
+        self.stride = stride
+        self.margin = margin
+        self.coin_tolerance = coin_tolerance
+        self.max_nodes = max_nodes
+        self.budget = budget
+
+        self.decisions = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.slow = 0
+
+        # Limites do centro do pássaro em cada amostra (recalculados a cada decisão)
+        self.top = [0.0] * (self.samples + 1)
+        self.bottom = [0.0] * (self.samples + 1)
+        self.coins: list[tuple[float, float] | None] = [None] * (self.samples + 1)
+        self.failed: set[tuple[int, int]] = set()
+        self.route: list[int] = []
+        self.plan: list[int] = []
+        self.nodes = 0
+        self.searches = 0
+        self.deadline = 0.0
+
+    def decide(self, simulation: Simulation) -> bool:
+        """
+        Decide se o pássaro deve bater as asas agora.
+
+        Args:
+            simulation (Simulation): A partida em andamento (só lida).
+
+        Returns:
+            bool: True para bater as asas neste quadro.
+        """
+        start = time.perf_counter()
+        # A busca para antes do prazo: o resto dele fica para conferir o plano anterior e decidir
+        self.deadline = start + 0.8 * self.budget
+        self._prepare(simulation)
+        player = simulation.player
+        flap = self._plan(player.y, player.change_y)
+
+        elapsed = time.perf_counter() - start
+        self.decisions += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.slow += elapsed > self.budget
+        return flap
+
+    def stats(self) -> dict[str, float]:
+        """
+        Resumo do tempo de planejamento.
+
+        Returns:
+            dict: "decisions", "mean" e "max" (ms), "slow" (decisões acima de `budget`)
+                e "searches" (decisões com busca nova).
+        """
+        if self.decisions == 0:
+            return {}
+
+        return {
+            "decisions": self.decisions,
+            "mean": self.total_time / self.decisions * 1_000,
+            "max": self.max_time * 1_000,
+            "slow": self.slow,
+            "searches": self.searches,
+        }
+
+    # --- Modelo à frente ---
+
+    def _prepare(self, simulation: Simulation) -> None:
+        """Calcula os limites do centro do pássaro em cada amostra do horizonte."""
+        collision = Simulation.collision
+        player = simulation.player
+        center_x = player.x + collision.center_x
+        radius = collision.radius + self.margin
+        ground = simulation.bases[0].y - radius
+        half_step = config.GAME_SPEED * self.step / 2
+
+        # Só os obstáculos que ainda podem cruzar a coluna do pássaro
+        obstacles = [
+            (obstacle.x, obstacle.width, obstacle.y + config.PIPE_HEIGHT, obstacle.bottom_pipe_y, obstacle.coin)
+            for obstacle in simulation.obstacles
+            if obstacle.right + radius > center_x
+        ]
+
+        for sample in range(self.samples + 1):
+            scroll = config.GAME_SPEED * self.step * sample
+            top, bottom, coin_band = -math.inf, ground, None
+
+            for x, width, gap_top, gap_bottom, coin in obstacles:
+                left = x - scroll
+
+                if left - radius < center_x < left + width + radius:
+                    top = max(top, gap_top + radius)
+                    bottom = min(bottom, gap_bottom - radius)
+
+                # A amostra em que o pássaro passa pelo centro da moeda
+                if coin.active and abs(coin.x + coin.width / 2 - scroll - center_x) <= half_step:
+                    coin_y = (gap_top + gap_bottom) / 2
+                    coin_band = (coin_y - self.coin_tolerance, coin_y + self.coin_tolerance)
+
+            self.top[sample] = top
+            self.bottom[sample] = bottom
+            self.coins[sample] = coin_band
+
+        # Limites que ainda deixam alcançar os seguintes: o pássaro sobe no máximo
+        # `PLAYER_IMPULSE` e cai no máximo a velocidade terminal por segundo
+        rise = config.PLAYER_IMPULSE * self.step
+        fall = config.PLAYER_DOWN_SPEED_LIMIT * self.step
+
+        for sample in range(self.samples - 1, 0, -1):
+            self.bottom[sample] = min(self.bottom[sample], self.bottom[sample + 1] + rise)
+            self.top[sample] = max(self.top[sample], self.top[sample + 1] - fall)
+
+        # O estado atual é dado, não se verifica
+        self.top[0], self.bottom[0], self.coins[0] = -math.inf, math.inf, None
+
+    def _plan(self, y: float, change_y: float) -> bool:
+        """Escolhe a ação: segue o plano anterior se ele ainda vale, senão procura outro."""
+        # O plano do quadro anterior, uma amostra adiante
+        shifted = [sample - 1 for sample in self.plan if sample > 0]
+
+        for coins in (True, False):
+            if self._follows(y, change_y, shifted, coins):
+                self.plan = shifted
+                return bool(shifted) and shifted[0] == 0
+
+            self.nodes = 0
+            self.failed.clear()
+            self.route.clear()
+
+            if self._survives(0, y, change_y, coins):
+                self.plan = self.route[::-1]
+                self.searches += 1
+                return bool(self.plan) and self.plan[0] == 0
+
+        # Sem plano (ou sem tempo): bate as asas se estiver abaixo do meio da faixa livre
+        self.plan = []
+        center = y + Simulation.collision.center_y
+        return center > (max(self.top[1], 0.0) + self.bottom[1]) / 2
+
+    def _blocked(self, sample: int, center: float, coins: bool) -> bool:
+        """Se o centro do pássaro nesta amostra bate nos limites (ou perde a moeda, se `coins`)."""
+        if not self.top[sample] <= center <= self.bottom[sample]:
+            return True
+
+        coin_band = self.coins[sample] if coins else None
+        return coin_band is not None and not coin_band[0] <= center <= coin_band[1]
+
+    def _follows(self, y: float, change_y: float, plan: list[int], coins: bool) -> bool:
+        """Se as batidas de asas de `plan` (amostras, em ordem) levam o pássaro até o fim do horizonte."""
+        advance = PlayerBody.advance
+        center_y = Simulation.collision.center_y
+        flaps = iter(plan)
+        flap = next(flaps, None)
+
+        for sample in range(self.samples):
+            if sample == flap:
+                change_y = -config.PLAYER_IMPULSE
+                flap = next(flaps, None)
+
+            y, change_y = advance(y, change_y, self.step)
+
+            if self._blocked(sample + 1, y + center_y, coins):
+                return False
+
+        return True
+
+    def _survives(self, sample: int, y: float, change_y: float, coins: bool) -> bool:
+        """
+        Procura batidas de asas que levem o pássaro até o fim do horizonte.
+
+        Cai sem bater as asas até a primeira amostra proibida e então tenta bater
+        as asas nas amostras anteriores, da mais tardia para a mais cedo. Em caso
+        de sucesso, as amostras das batidas ficam em `route` (da última para a primeira).
+        """
+        advance = PlayerBody.advance
+        center_y = Simulation.collision.center_y
+        falling = []
+
+        while sample <= self.samples:
+            self.nodes += 1
+
+            if self.nodes > self.max_nodes or time.perf_counter() > self.deadline:
+                return False
+
+            if self._blocked(sample, y + center_y, coins):
+                break
+
+            falling.append((sample, y))
+            y, change_y = advance(y, change_y, self.step)
+            sample += 1
+        else:
+            return True
+
+        for sample, y in reversed(falling):
+            if sample % self.stride:
+                continue
+
+            # Depois de bater as asas, o futuro só depende da amostra e da altura
+            key = (sample, pixel(y))
+
+            if key in self.failed:
+                continue
+
+            if self._survives(sample + 1, *advance(y, -config.PLAYER_IMPULSE, self.step), coins):
+                self.route.append(sample)
+                return True
+
+            self.failed.add(key)
+
+        return False
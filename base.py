@@ -1,52 +1,53 @@
 import pygame
 
-import config
+from base_body import BaseBody
 
 
-class Base(pygame.sprite.Sprite):
+class Base(pygame.sprite.DirtySprite):
     """
-    Representa o chão (base) do jogo em movimento.
+    Representa visualmente o chão (base) do jogo em movimento.
 
-    Esta classe é geralmente instanciada duas vezes com offsets diferentes
-    para criar o efeito de 'scroll infinito' (paralaxe).
+    Esta classe é instanciada duas vezes (uma para cada `BaseBody` da
+    simulação) para criar o efeito de 'scroll infinito' (paralaxe).
 
     Attributes:
         _layer (int): Camada de renderização (6). Fica acima dos canos e fundo.
-        change_x (float): Acumulador de movimento sub-pixel para suavidade.
+        body (BaseBody): O estado físico do segmento na simulação.
+        dirty (int): 1 quando a posição mudou desde o último desenho.
     """
 
-    def __init__(self, base_image: pygame.Surface, offset: int = 0) -> None:
+    def __init__(self, body: BaseBody, base_image: pygame.Surface) -> None:
         """
         Inicializa um segmento do chão.
 
         Args:
+            body (BaseBody): Estado físico que o sprite acompanha.
             base_image (pygame.Surface): A imagem texturizada do chão.
-            offset (int): Posição inicial no eixo X (usado para encadear segmentos).
         """
         super().__init__()
         self._layer = 6
+        self.body = body
         self.image = base_image
         self.rect = self.image.get_rect()
+        self.handle_movement()
 
-        # Posicionamento inicial
-        self.rect.left = offset
-        self.rect.bottom = config.SCREEN_HEIGHT + config.BASE_OFFSET
+    def reset(self) -> None:
+        """Volta à posição do corpo (reinício no lugar)."""
+        self.handle_movement()
 
-        self.change_x = 0
+    def handle_movement(self) -> None:
+        """Sincroniza o retângulo do sprite com a posição do corpo na simulação."""
+        position = (self.body.left, self.body.y)
+
+        if self.rect.topleft != position:
+            self.rect.topleft = position
+            self.dirty = 1
 
     def update(self, dt: float) -> None:
         """
         Atualiza a posição horizontal do chão.
 
-        Utiliza um acumulador (change_x) para lidar com movimentos fracionados
-        (float) resultantes do cálculo de delta time, convertendo para pixels
-        inteiros apenas quando necessário.
-
         Args:
             dt (float): Delta time em segundos.
         """
-        self.change_x += config.GAME_SPEED * dt
-
-        if self.change_x >= 1:
-            self.rect.x -= round(self.change_x)
-            self.change_x = 0
+        self.handle_movement()
@@ -0,0 +1,47 @@
+import config
+from hitbox import Hitbox
+from pixel import pixel
+
+
+class BaseBody:
+    """
+    Estado físico de um segmento do chão.
+
+    Attributes:
+        hitbox (Hitbox): Hitbox retangular (o chão é totalmente sólido).
+        x (float): Posição horizontal (esquerda) do segmento, com precisão sub-pixel.
+        y (int): Posição vertical (topo) do segmento.
+    """
+
+    hitbox = Hitbox.rect(config.BASE_WIDTH, config.BASE_HEIGHT)
+
+    def __init__(self, offset: int = 0) -> None:
+        """
+        Inicializa um segmento do chão.
+
+        Args:
+            offset (int): Posição inicial no eixo X (usado para encadear segmentos).
+        """
+        self.width = config.BASE_WIDTH
+        self.height = config.BASE_HEIGHT
+        self.offset = offset
+        self.y = config.SCREEN_HEIGHT + config.BASE_OFFSET - self.height
+        self.restart()
+
+    def restart(self) -> None:
+        """Volta à posição inicial (reinício sem alocar um segmento novo)."""
+        self.x = float(self.offset)
+
+    @property
+    def left(self) -> int:
+        """Esquerda do retângulo inteiro do segmento (desenho e colisão)."""
+        return pixel(self.x)
+
+    @property
+    def right(self) -> float:
+        """Borda direita do segmento."""
+        return self.x + self.width
+
+    def update(self, dt: float) -> None:
+        """Move o segmento para a esquerda na velocidade do cenário."""
+        self.x -= config.GAME_SPEED * dt
@@ -0,0 +1,461 @@
+import numpy as np
+
+import config
+from pixel import PIXEL_EPSILON
+from player_body import PlayerBody
+from simulation import Simulation
+
+
+class BatchSimulation:
+    """
+    Simulação vetorizada de N partidas independentes com NumPy.
+
+    Cada mundo reproduz a fase RUNNING da `Simulation` (gravidade com
+    velocidade terminal, teto, rolagem e reciclagem de obstáculos, oscilação
+    e coleta de moedas, colisão com canos e chão), mas todo o estado fica em
+    arrays e um único `step` avança todos os mundos de uma vez. Mundos que
+    terminam (colisão) são reiniciados automaticamente.
+
+    As posições são contínuas (float) e cada `step` é dividido nos mesmos
+    sub-passos da `Simulation.update`, com os retângulos inteiros derivados
+    da mesma forma (`pixel`) para a colisão.
+
+    A física é a mesma, mas um mundo não reproduz uma partida da `Simulation`
+    com a mesma semente: as alturas dos vãos de todos os mundos vêm de um
+    único gerador do lote (`rng`), não de um `Course`, e cada mundo começa já
+    voando, com os obstáculos entrando pela direita da tela.
+
+    Attributes:
+        size (int): Número de mundos (N).
+        dt (float): Passo fixo da simulação (segundos).
+        player_y (np.ndarray): Topo do pássaro em cada mundo (float), shape (N,).
+        change_y (np.ndarray): Velocidade vertical do pássaro (pixels/s), shape (N,).
+        obstacle_x (np.ndarray): Esquerda dos obstáculos (float), shape (N, 2).
+        obstacle_y (np.ndarray): Topo dos obstáculos (retângulo pai), shape (N, 2).
+        coin_active (np.ndarray): Moedas ainda coletáveis, shape (N, 2).
+        score (np.ndarray): Pontuação de cada mundo, shape (N,).
+        done (np.ndarray): Mundos que terminaram no último passo, shape (N,).
+        final_score (np.ndarray): Pontuação final dos mundos que terminaram no último passo.
+    """
+
+    OBSERVATION_SIZE = 4
+    """Centro vertical do pássaro, velocidade, distância e altura do próximo vão."""
+
+    def __init__(
+        self,
+        size: int,
+        dt: float = 1 / config.FPS,
+        seed: int | None = None,
+        max_step: float | None = config.SIMULATION_MAX_STEP,
+        max_substeps: int = config.SIMULATION_MAX_SUBSTEPS,
+    ) -> None:
+        """
+        Aloca o estado de todos os mundos e inicia cada um em uma partida nova.
+
+        Args:
+            size (int): Número de mundos independentes.
+            dt (float): Passo fixo da simulação em segundos.
+            seed (int | None): Semente do gerador de alturas dos vãos do lote (não é a semente de um
+                `Course`: a mesma semente não dá o percurso da `Simulation`).
+            max_step (float | None): Maior sub-passo (segundos). None = um único passo por
+                `step`, o modo mais rápido para avaliação em lote (a colisão por varredura
+                continua encontrando canos e moedas no meio do trajeto).
+            max_substeps (int): Limite de sub-passos por `step`.
+        """
+        self.size = size
+        self.dt = dt
+        self.max_step = max_step
+        self.max_substeps = max_substeps
+        self.rng = np.random.default_rng(seed)
+
+        # --- Jogador (Player) ---
+        self.player_x = float(config.SCREEN_WIDTH // 4 - config.PLAYER_WIDTH // 2)
+        self.player_left = config.SCREEN_WIDTH // 4 - config.PLAYER_WIDTH // 2
+        self.player_y = np.zeros(size, dtype=np.float64)
+        self.change_y = np.zeros(size, dtype=np.float64)
+
+        # --- Obstáculos (Obstacles) ---
+        self.obstacle_x = np.zeros((size, 2), dtype=np.float64)
+        self.obstacle_y = np.zeros((size, 2), dtype=np.int64)
+
+        # --- Moedas (Coins) ---
+        self.coin_active = np.zeros((size, 2), dtype=bool)
+        self.coin_x = np.zeros((size, 2), dtype=np.float64)
+        self.coin_y = np.zeros((size, 2), dtype=np.int64)
+        self.coin_offset = np.zeros((size, 2), dtype=np.int64)
+        self.coin_direction = np.zeros((size, 2), dtype=np.int64)
+        self.coin_movement_step = np.zeros((size, 2), dtype=np.float64)
+
+        # --- Placar e Fim de Partida ---
+        self.score = np.zeros(size, dtype=np.int64)
+        self.done = np.zeros(size, dtype=bool)
+        self.final_score = np.zeros(size, dtype=np.int64)
+
+        # --- Geometria de Colisão ---
+        # Mesmos perfis analíticos usados pela `Simulation`, em forma de array
+        collision = Simulation.collision
+        self.hitbox_first = np.array(collision.first, dtype=np.int64)
+        self.hitbox_last = np.array(collision.last, dtype=np.int64)
+        self.hitbox_widest_row = collision.widest_row
+        self.coin_offset_y = collision.coin_offset
+        self.coin_dx_min = np.array(collision.coin_dx_min, dtype=np.int64)
+        self.coin_dx_max = np.array(collision.coin_dx_max, dtype=np.int64)
+        self.center_x = self.player_x + collision.center_x
+        self.sweep_radius = collision.radius - config.COLLISION_SWEEP_MARGIN
+        self.coin_sweep_radius = collision.radius + collision.coin_radius - config.COLLISION_SWEEP_MARGIN
+
+        self.reset()
+
+    def _random_offsets(self, count: int) -> np.ndarray:
+        """Sorteia `count` alturas de vão, como o `random.randint` do `ObstacleBody`."""
+        return self.rng.integers(config.PIPE_VERTICAL_OFFSET_MIN, config.PIPE_VERTICAL_OFFSET_MAX, count, endpoint=True)
+
+    def reset(self, worlds: np.ndarray | None = None) -> np.ndarray:
+        """
+        Reinicia os mundos indicados (ou todos) na posição de partida, já voando.
+
+        Args:
+            worlds (np.ndarray | None): Máscara booleana (N,) dos mundos a reiniciar.
+
+        Returns:
+            np.ndarray: Observações de todos os mundos, shape (N, OBSERVATION_SIZE).
+        """
+        if worlds is None:
+            worlds = np.ones(self.size, dtype=bool)
+
+        count = int(np.count_nonzero(worlds))
+
+        if count:
+            self.player_y[worlds] = PlayerBody().y
+            self.change_y[worlds] = 0
+
+            offsets = self._random_offsets(count * 2).reshape(count, 2)
+            base_y = (config.SCREEN_HEIGHT // 2) - (config.PIPE_DISTANCE // 2) - config.PIPE_HEIGHT
+            spacing = config.SCREEN_WIDTH // 2 + config.PIPE_WIDTH // 2
+            self.obstacle_x[worlds] = config.SCREEN_WIDTH + np.arange(2) * spacing
+            self.obstacle_y[worlds] = base_y + offsets
+
+            self.coin_active[worlds] = True
+            self.coin_offset[worlds] = 0
+            self.coin_direction[worlds] = 1
+            self.coin_movement_step[worlds] = config.COIN_MOVEMENT_STEP
+            self.coin_x[worlds] = self.obstacle_x[worlds] + self._center_x - config.COIN_TILE_SIZE // 2
+            self.coin_y[worlds] = self.obstacle_y[worlds] + self._center_y - config.COIN_TILE_SIZE // 2
+
+            self.score[worlds] = 0
+
+        return self.observations()
+
+    @property
+    def _center_x(self) -> int:
+        return config.PIPE_WIDTH // 2
+
+    @property
+    def _center_y(self) -> int:
+        return ((config.PIPE_HEIGHT * 2) + config.PIPE_DISTANCE) // 2
+
+    def observations(self) -> np.ndarray:
+        """
+        Monta as observações de todos os mundos.
+
+        Returns:
+            np.ndarray: (N, 4) float32 com centro vertical do pássaro, velocidade,
+            distância horizontal até o fim do próximo obstáculo e centro do próximo vão.
+        """
+        obstacle_right = self.obstacle_x + config.PIPE_WIDTH
+        # Próximo obstáculo: o mais à esquerda que ainda não passou pelo pássaro
+        ahead = obstacle_right > self.player_x
+        distance = np.where(ahead, obstacle_right - self.player_x, np.inf)
+        index = np.argmin(distance, axis=1)
+        rows = np.arange(self.size)
+
+        observations = np.empty((self.size, self.OBSERVATION_SIZE), dtype=np.float32)
+        observations[:, 0] = self.player_y + config.PLAYER_HEIGHT // 2
+        observations[:, 1] = self.change_y
+        observations[:, 2] = distance[rows, index]
+        observations[:, 3] = self.obstacle_y[rows, index] + self._center_y
+        return observations
+
+    @staticmethod
+    def _pixel(value: np.ndarray) -> np.ndarray:
+        """Pixel inteiro de posições contínuas (mesma regra de `pixel.pixel`)."""
+        return np.floor(value + PIXEL_EPSILON).astype(np.int64)
+
+    def _update_coins(self, worlds: np.ndarray, dt: float) -> None:
+        """Oscilação e alinhamento das moedas selecionadas (mesma regra do `CoinBody`)."""
+        self.coin_movement_step[worlds] -= dt
+
+        # Cada degrau da oscilação carrega o tempo que sobrou para o próximo
+        while True:
+            step = worlds & (self.coin_movement_step < 0)
+
+            if not step.any():
+                break
+
+            self.coin_offset[step] += self.coin_direction[step]
+            self.coin_direction[step & (np.abs(self.coin_offset) >= 5)] *= -1
+            self.coin_movement_step[step] += config.COIN_MOVEMENT_STEP
+
+        self.coin_x[worlds] = (self.obstacle_x + self._center_x - config.COIN_TILE_SIZE // 2)[worlds]
+        self.coin_y[worlds] = (self.obstacle_y + self._center_y + self.coin_offset - config.COIN_TILE_SIZE // 2)[
+            worlds
+        ]
+
+    def _overlaps_rect(self, left: np.ndarray, right: np.ndarray, top: np.ndarray, bottom: np.ndarray) -> np.ndarray:
+        """
+        Teste exato entre a hitbox circular do pássaro e retângulos [left, right) x [top, bottom).
+
+        Entre as linhas do círculo que cruzam o retângulo, a mais larga é a mais
+        próxima do centro; basta comparar o intervalo horizontal dessa linha.
+        """
+        player_y = self._pixel(self.player_y)[:, None]
+        first_row = np.maximum(top - player_y, 0)
+        last_row = np.minimum(bottom - player_y, config.PLAYER_HEIGHT) - 1
+        row = np.clip(self.hitbox_widest_row, first_row, np.maximum(first_row, last_row))
+        row = np.minimum(row, config.PLAYER_HEIGHT - 1)
+
+        return (
+            (first_row <= last_row)
+            & (self.player_left + self.hitbox_first[row] < right)
+            & (self.player_left + self.hitbox_last[row] >= left)
+        )
+
+    @staticmethod
+    def _sweep_circle(
+        x0: float,
+        y0: np.ndarray,
+        x1: float,
+        y1: np.ndarray,
+        radius: float,
+        center_x: np.ndarray,
+        center_y: np.ndarray,
+        enter: np.ndarray | float = 0.0,
+        leave: np.ndarray | float = 1.0,
+    ) -> np.ndarray:
+        """Versão vetorizada de `Collision.sweep_circle` (np.inf = sem contato)."""
+        dx, dy = x1 - x0, y1 - y0
+
+        # Quinas no infinito (chão) geram inf/nan, descartados pelas máscaras abaixo
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fx, fy = x0 - center_x, y0 - center_y
+            c = fx * fx + fy * fy - radius * radius
+            a = dx * dx + dy * dy
+            b = fx * dx + fy * dy
+            discriminant = b * b - a * c
+            time = (-b - np.sqrt(np.maximum(discriminant, 0.0))) / a
+
+        hit = (a != 0) & (discriminant >= 0) & (enter <= time) & (time <= leave)
+        return np.where(c <= 0, enter, np.where(hit, time, np.inf))
+
+    @classmethod
+    def _sweep_rect(
+        cls,
+        x0: float,
+        y0: np.ndarray,
+        x1: float,
+        y1: np.ndarray,
+        radius: float,
+        left: np.ndarray,
+        top: np.ndarray,
+        right: np.ndarray,
+        bottom: np.ndarray,
+    ) -> np.ndarray:
+        """Versão vetorizada de `Collision.sweep_rect` (np.inf = sem contato)."""
+        enter = np.zeros(np.broadcast_shapes(np.shape(y0), np.shape(left)))
+        leave = np.ones_like(enter)
+        miss = np.zeros(enter.shape, dtype=bool)
+
+        for start, end, low, high in ((x0, x1, left - radius, right + radius), (y0, y1, top - radius, bottom + radius)):
+            delta = end - start
+            still = delta == 0
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                time_low, time_high = (low - start) / delta, (high - start) / delta
+
+            miss |= still & ((start < low) | (start > high))
+            enter = np.where(still, enter, np.maximum(enter, np.minimum(time_low, time_high)))
+            leave = np.where(still, leave, np.minimum(leave, np.maximum(time_low, time_high)))
+
+        miss |= enter > leave
+
+        # Entrada por uma face (contato imediato) ou pela região de uma quina
+        x, y = x0 + (x1 - x0) * enter, y0 + (y1 - y0) * enter
+        face = ((left <= x) & (x <= right)) | ((top <= y) & (y <= bottom))
+        corner_x = np.where(x < left, left, right)
+        corner_y = np.where(y < top, top, bottom)
+        corner = cls._sweep_circle(x0, y0, x1, y1, radius, corner_x, corner_y, enter, leave)
+
+        return np.where(miss, np.inf, np.where(face, enter, corner))
+
+    def _rect_time(
+        self, segments: list[tuple], left: np.ndarray, right: np.ndarray, top: np.ndarray, bottom: np.ndarray
+    ) -> np.ndarray:
+        """Primeiro contato com retângulos: varredura ou, sem ela, teste pixel a pixel na posição final (1.0)."""
+        chords = len(segments)
+        time = np.full(np.broadcast_shapes(segments[0][1].shape, np.shape(left)), np.inf)
+
+        for chord, segment in enumerate(segments):
+            time = np.minimum(time, (chord + self._sweep_rect(*segment, left, top, right, bottom)) / chords)
+
+        return np.where(np.isinf(time) & self._overlaps_rect(left, right, top, bottom), 1.0, time)
+
+    def _pipe_time(self, segments: list[tuple], columns: slice | np.ndarray = slice(None)) -> np.ndarray:
+        """Primeiro contato do pássaro com os canos (boca larga + corpo recuado) de cada mundo (só os `columns`)."""
+        lip = config.PIPE_LIP_HEIGHT
+        inset = config.PIPE_BODY_OFFSET
+        obstacle_y = self.obstacle_y[:, columns]
+        left = self._pixel(self.obstacle_x[:, columns])
+        right = left + config.PIPE_WIDTH
+        body_left, body_right = left + inset, right - inset
+
+        top_pipe_bottom = obstacle_y + config.PIPE_HEIGHT
+        bottom_pipe_top = top_pipe_bottom + config.PIPE_DISTANCE
+
+        time = self._rect_time(segments, body_left, body_right, obstacle_y, top_pipe_bottom - lip)
+        time = np.minimum(time, self._rect_time(segments, left, right, top_pipe_bottom - lip, top_pipe_bottom))
+        time = np.minimum(time, self._rect_time(segments, left, right, bottom_pipe_top, bottom_pipe_top + lip))
+        time = np.minimum(
+            time,
+            self._rect_time(
+                segments, body_left, body_right, bottom_pipe_top + lip, bottom_pipe_top + config.PIPE_HEIGHT
+            ),
+        )
+        return time.min(axis=1)
+
+    def _coin_time(self, segments: list[tuple], columns: slice | np.ndarray = slice(None)) -> np.ndarray:
+        """Primeiro contato com as moedas (só as `columns`): varredura ou o perfil de sobreposição na posição final."""
+        coin_y = self.coin_y[:, columns]
+        left = self._pixel(self.coin_x[:, columns])
+        dx = left - self.player_left
+        index = coin_y - self._pixel(self.player_y)[:, None] + self.coin_offset_y
+        inside = (index >= 0) & (index < len(self.coin_dx_min))
+        index = np.where(inside, index, 0)
+        overlaps = inside & (self.coin_dx_min[index] <= dx) & (dx <= self.coin_dx_max[index])
+
+        center = Simulation.collision.coin_center
+        chords = len(segments)
+        time = np.full(left.shape, np.inf)
+
+        for chord, (x0, y0, x1, y1, _) in enumerate(segments):
+            contact = self._sweep_circle(x0, y0, x1, y1, self.coin_sweep_radius, left + center, coin_y + center)
+            time = np.minimum(time, (chord + contact) / chords)
+
+        time = np.where(np.isinf(time) & overlaps, 1.0, time)
+        return np.where(self.coin_active[:, columns], time, np.inf)
+
+    @staticmethod
+    def _advance(y: np.ndarray, change_y: np.ndarray, dt: float) -> tuple[np.ndarray, np.ndarray]:
+        """Versão vetorizada de `PlayerBody.advance` (integração exata com velocidade terminal e teto)."""
+        gravity, limit = config.GRAVITY, config.PLAYER_DOWN_SPEED_LIMIT
+        falling = np.clip((limit - change_y) / gravity, 0.0, dt)
+        new_y = y + change_y * falling + gravity * falling * falling / 2
+        change_y = np.minimum(change_y + gravity * falling, limit)
+        new_y += change_y * (dt - falling)
+
+        below_ceiling = new_y > 0
+        return np.where(below_ceiling, new_y, 0.0), np.where(below_ceiling, change_y, 0.0)
+
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Avança todos os mundos em um passo fixo.
+
+        Args:
+            actions (np.ndarray): (N,) booleano/inteiro; verdadeiro = bater as asas.
+
+        Returns:
+            tuple: (observações (N, 4), recompensas (N,), done (N,)). A recompensa
+            é o número de moedas coletadas no passo. Mundos com done=True já foram
+            reiniciados e suas observações são da nova partida.
+        """
+        # --- Input: bater as asas (antes da física, como no loop do jogo) ---
+        self.change_y[np.asarray(actions, dtype=bool)] = -config.PLAYER_IMPULSE
+
+        # --- Sub-passos: mesma divisão da `Simulation.update` ---
+        steps = Simulation.substeps(self.dt, self.max_step, self.max_substeps)
+        dt = self.dt / steps
+        dead = np.zeros(self.size, dtype=bool)
+        rewards = np.zeros(self.size, dtype=np.int64)
+
+        for _ in range(steps):
+            rewards += self._substep(dt, dead)
+
+        # --- Reinício automático dos mundos que terminaram ---
+        self.done[:] = dead
+        self.final_score[:] = np.where(dead, self.score, 0)
+        observations = self.reset(dead) if dead.any() else self.observations()
+
+        return observations, rewards.astype(np.float32), self.done.copy()
+
+    def _substep(self, dt: float, dead: np.ndarray) -> np.ndarray:
+        """
+        Avança todos os mundos um sub-passo de `dt` segundos.
+
+        Mundos que já terminaram neste passo (`dead`) continuam andando, mas não
+        pontuam mais; eles são reiniciados ao fim do `step`.
+
+        Args:
+            dt (float): Duração do sub-passo em segundos.
+            dead (np.ndarray): (N,) mundos que já terminaram; atualizado no lugar.
+
+        Returns:
+            np.ndarray: (N,) moedas coletadas no sub-passo.
+        """
+        # --- Física do pássaro (integração exata, como no `PlayerBody`) ---
+        start_y, start_change_y = self.player_y.copy(), self.change_y.copy()
+        self.player_y[:], self.change_y[:] = self._advance(start_y, start_change_y, dt)
+
+        # --- Rolagem e reciclagem dos obstáculos ---
+        self.obstacle_x -= config.GAME_SPEED * dt
+
+        recycled = self.obstacle_x + config.PIPE_WIDTH < 0
+        count = int(np.count_nonzero(recycled))
+
+        if count:
+            base_y = (config.SCREEN_HEIGHT // 2) - (config.PIPE_DISTANCE // 2) - config.PIPE_HEIGHT
+            self.obstacle_x[recycled] += config.SCREEN_WIDTH + config.PIPE_WIDTH
+            self.obstacle_y[recycled] = base_y + self._random_offsets(count)
+            self.coin_active |= recycled
+            self._update_coins(recycled, 0.0)
+
+        # --- Moedas acompanham o pai (já deslocado) e oscilam ---
+        self._update_coins(self.coin_active, dt)
+
+        # --- Colisões ao longo do trajeto, relativo ao cenário (como na `Simulation.find_collision`) ---
+        chords = Simulation.sweep_chords(dt)
+        tops = [start_y]
+        tops += [self._advance(start_y, start_change_y, dt * chord / chords)[0] for chord in range(1, chords)]
+        tops.append(self.player_y)
+
+        scroll = config.GAME_SPEED * dt
+        center_y = Simulation.collision.center_y
+        segments = [
+            (
+                self.center_x - scroll * (chords - chord) / chords,
+                (tops[chord] + center_y)[:, None],
+                self.center_x - scroll * (chords - chord - 1) / chords,
+                (tops[chord + 1] + center_y)[:, None],
+                self.sweep_radius,
+            )
+            for chord in range(chords)
+        ]
+
+        # O chão cobre toda a largura da tela: basta o trecho vertical
+        ground_y = config.SCREEN_HEIGHT + config.BASE_OFFSET - config.BASE_HEIGHT
+        ground_time = self._rect_time(
+            segments,
+            np.array([-np.inf]),
+            np.array([np.inf]),
+            np.array([ground_y]),
+            np.array([ground_y + config.BASE_HEIGHT]),
+        )[:, 0]
+        hit_time = np.minimum(ground_time, self._pipe_time(segments))
+        hit = np.isfinite(hit_time)
+
+        # Moedas tocadas antes da batida são coletadas (em um empate, a batida vence)
+        coins = (self._coin_time(segments) < hit_time[:, None]) & ~dead[:, None]
+        self.coin_active &= ~coins
+        rewards = coins.sum(axis=1)
+        self.score += rewards
+        dead |= hit
+
+        return rewards
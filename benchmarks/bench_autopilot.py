@@ -0,0 +1,111 @@
+"""
+Benchmark do piloto automático (`Autopilot`) dentro do loop do jogo.
+
+Roda o corpo do loop principal sem janela (driver `dummy`) a 120 FPS de passo
+fixo: `handle_events` (onde o piloto decide), `update`, `draw`. O profiler
+mede a fase PLANNER de cada quadro; um quadro seria perdido se o trabalho
+todo (sem a espera) passasse de 1 / FPS.
+
+Relata, por semente, quanto o piloto sobreviveu e quantas moedas pegou, e no
+total os percentis do tempo de planejamento por quadro e do quadro inteiro.
+
+Uso:
+    python benchmarks/bench_autopilot.py [--seconds S] [--seeds N]
+"""
+
+import argparse
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+import config  # noqa: E402
+from autopilot import Autopilot  # noqa: E402
+from frame_profiler import FrameProfiler  # noqa: E402
+from game import Game  # noqa: E402
+from game_state import GameState  # noqa: E402
+from profiler_phase import ProfilerPhase  # noqa: E402
+
+STEP = 1 / config.FPS
+
+
+def run(screen: pygame.Surface, seed: int, frames: int) -> tuple[list[int], Autopilot, FrameProfiler]:
+    """
+    Joga `frames` quadros com o piloto automático.
+
+    Returns:
+        tuple: (pontuação de cada partida, piloto, profiler com o tempo de cada quadro).
+    """
+    autopilot = Autopilot()
+    profiler = FrameProfiler(enabled=True, history=frames)
+    game = Game(screen, audio=False, seed=seed, profiler=profiler, autopilot=autopilot)
+    game.start_level()
+    simulation = game.level_manager.simulation
+    scores = []
+    profiler.start()
+
+    for _ in range(frames):
+        game.handle_events()
+        profiler.mark(ProfilerPhase.EVENTS)
+        running = simulation.state == GameState.RUNNING
+        game.update(STEP)
+
+        if running and simulation.state == GameState.GAMEOVER:
+            scores.append(simulation.score)
+
+        game.draw()
+        profiler.end_frame()
+
+    if simulation.state == GameState.RUNNING:
+        scores.append(simulation.score)
+
+    return scores, autopilot, profiler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=120.0, help="Tempo de jogo por semente")
+    parser.add_argument("--seeds", type=int, default=4)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    frames = round(args.seconds / STEP)
+    planner_times, frame_times = [], []
+    decisions = searches = slow = 0
+
+    for seed in range(args.seeds):
+        scores, autopilot, profiler = run(screen, seed, frames)
+        stats = autopilot.stats()
+        decisions += stats["decisions"]
+        searches += stats["searches"]
+        slow += stats["slow"]
+        planner_times.append(profiler.phase_times[:, ProfilerPhase.PLANNER.value].copy())
+        frame_times.append(profiler.frame_times.copy())
+        print(f"semente {seed}: {len(scores)} partida(s), moedas {scores}, {args.seconds:g} s de jogo")
+
+    pygame.quit()
+    planner = np.concatenate(planner_times) * 1e3
+    frame = np.concatenate(frame_times) * 1e3
+    p50, p99 = np.percentile(planner, [50, 99])
+    frame_p50, frame_p99 = np.percentile(frame, [50, 99])
+    dropped = int(np.count_nonzero(frame > STEP * 1e3))
+
+    print()
+    print(
+        f"planejamento por quadro ({decisions} decisões, {searches} com busca nova): "
+        f"p50 {p50:.3f} ms, p99 {p99:.3f} ms, máx {planner.max():.2f} ms, "
+        f"{slow} acima de {config.AUTOPILOT_BUDGET * 1e3:g} ms"
+    )
+    print(
+        f"quadro inteiro (eventos + piloto + update + draw): p50 {frame_p50:.2f} ms, p99 {frame_p99:.2f} ms; "
+        f"{dropped} de {len(frame)} acima de 1/{config.FPS} s ({STEP * 1e3:.2f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Verificação e micro-benchmark do sistema de colisão.
+
+1. Verificação: compara, para todos os deslocamentos relativos possíveis, o
+   resultado de `Collision` com `pygame.mask.Mask.overlap` usando as mesmas
+   máscaras que o jogo original criava (círculo do pássaro/moeda e alfa da
+   imagem dos canos). Qualquer divergência encerra o script com erro.
+2. Benchmark: mede o custo de colisão por quadro em uma partida real com
+   `spritecollideany` + `collide_mask` (abordagem original), com a `Hitbox`
+   genérica (bitmask) e com `Simulation.find_collision` (analítico + broadphase).
+
+Uso:
+    python benchmarks/bench_collision.py [--frames N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+
+import config  # noqa: E402
+from coin_body import CoinBody  # noqa: E402
+from course import Course  # noqa: E402
+from game_state import GameState  # noqa: E402
+from player_body import PlayerBody  # noqa: E402
+from simulation import Simulation  # noqa: E402
+
+
+def circle_mask(size: tuple[int, int], radius: int) -> pygame.mask.Mask:
+    """Máscara circular construída exatamente como em `Player`/`Coin` originais."""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.circle(surface, (255, 255, 255), (size[0] // 2, size[1] // 2), radius)
+    return pygame.mask.from_surface(surface)
+
+
+def verify() -> int:
+    """Compara `Collision` com as máscaras do Pygame para todos os deslocamentos; retorna nº de casos."""
+    collision = Simulation.collision
+    player_mask = circle_mask((config.PLAYER_WIDTH, config.PLAYER_HEIGHT), PlayerBody.hitbox.height // 2)
+    coin_mask = circle_mask((config.COIN_TILE_SIZE, config.COIN_TILE_SIZE), config.COIN_TILE_SIZE // 3)
+    base_mask = pygame.mask.Mask((config.BASE_WIDTH, config.BASE_HEIGHT), fill=True)
+    cases = 0
+
+    def check(mask: pygame.mask.Mask, analytic) -> None:
+        nonlocal cases
+        width, height = mask.get_size()
+
+        for dx in range(-width, config.PLAYER_WIDTH + 1):
+            for dy in range(-height, config.PLAYER_HEIGHT + 1):
+                expected = player_mask.overlap(mask, (dx, dy)) is not None
+                if analytic(dx, dy) != expected:
+                    raise SystemExit(f"Divergência em dx={dx}, dy={dy}: esperado {expected}")
+                cases += 1
+
+    for path in config.PIPE_IMAGES.values():
+        image = pygame.image.load(path)
+
+        for flip in (False, True):
+            mask = pygame.mask.from_surface(pygame.transform.flip(image, False, flip))
+            obstacle = Simulation().obstacles[0]
+            obstacle.x = 0.0
+            # Cano de cima com topo em y=0 ou cano de baixo com topo em y=0
+            obstacle.y = 0 if flip else -(obstacle.height - config.PIPE_HEIGHT)
+            rects = obstacle.pipe_rects[:2] if flip else obstacle.pipe_rects[2:]
+
+            check(
+                mask,
+                lambda dx, dy: any(
+                    collision.overlaps_rect(-dx, -dy, left, top, right, bottom) for left, top, right, bottom in rects
+                ),
+            )
+
+    check(
+        base_mask,
+        lambda dx, dy: collision.overlaps_rect(-dx, -dy, 0, 0, config.BASE_WIDTH, config.BASE_HEIGHT),
+    )
+    check(coin_mask, lambda dx, dy: collision.overlaps_coin(-dx, -dy, 0, 0))
+    return cases
+
+
+def make_sprite(image: pygame.Surface, mask: pygame.mask.Mask | None = None) -> pygame.sprite.Sprite:
+    """Cria um sprite simples (com ou sem máscara própria, como no jogo original)."""
+    sprite = pygame.sprite.Sprite()
+    sprite.image = image
+    sprite.rect = image.get_rect()
+
+    if mask is not None:
+        sprite.mask = mask
+
+    return sprite
+
+
+def benchmark(frames: int, repeat: int = 20) -> None:
+    """Mede o custo de colisão por quadro das três abordagens sobre os mesmos estados."""
+    pipe_image = pygame.image.load(config.PIPE_IMAGES["GREEN"])
+    player = make_sprite(
+        pygame.Surface((config.PLAYER_WIDTH, config.PLAYER_HEIGHT), pygame.SRCALPHA),
+        circle_mask((config.PLAYER_WIDTH, config.PLAYER_HEIGHT), config.PLAYER_HEIGHT // 2),
+    )
+    bases = [make_sprite(pygame.Surface((config.BASE_WIDTH, config.BASE_HEIGHT))) for _ in range(2)]
+    pipes = [make_sprite(pygame.transform.flip(pipe_image, False, i % 2 == 0)) for i in range(4)]
+    coins = [
+        make_sprite(
+            pygame.Surface((config.COIN_TILE_SIZE, config.COIN_TILE_SIZE), pygame.SRCALPHA),
+            circle_mask((config.COIN_TILE_SIZE, config.COIN_TILE_SIZE), config.COIN_TILE_SIZE // 3),
+        )
+        for _ in range(2)
+    ]
+    group = pygame.sprite.Group(bases, pipes[:2], coins[0], pipes[2:], coins[1])
+
+    simulation = Simulation(Course(0))
+    simulation.start()
+    totals = {"collide_mask": 0.0, "hitbox": 0.0, "analytic": 0.0}
+    measured = 0
+
+    def hitbox_collision():
+        p = simulation.player
+        x, y = p.left, p.top
+        for base in simulation.bases:
+            if p.hitbox.overlaps(x, y, base.hitbox, base.left, base.y):
+                return base
+        for obstacle in simulation.obstacles:
+            if p.hitbox.overlaps(x, y, obstacle.top_pipe_hitbox, obstacle.left, obstacle.y):
+                return obstacle
+            if p.hitbox.overlaps(x, y, obstacle.bottom_pipe_hitbox, obstacle.left, obstacle.bottom_pipe_y):
+                return obstacle
+        for obstacle in simulation.obstacles:
+            coin = obstacle.coin
+            if coin.active and p.hitbox.overlaps(x, y, CoinBody.hitbox, coin.left, coin.top):
+                return coin
+        return None
+
+    while measured < frames:
+        if simulation.state != GameState.RUNNING:
+            simulation = Simulation(Course(measured))
+            simulation.start()
+
+        # Bot simples: bate as asas abaixo do centro do próximo vão
+        obstacle = min((o for o in simulation.obstacles if o.right > simulation.player.x), key=lambda o: o.x)
+        if simulation.player.y + config.PLAYER_HEIGHT // 2 > obstacle.center_y + 8 and simulation.player.change_y >= 0:
+            simulation.move_up()
+
+        simulation.update(1 / config.FPS)
+        simulation.events.clear()
+
+        # Posiciona os sprites no estado atual para a abordagem original
+        player.rect.topleft = (simulation.player.left, simulation.player.top)
+        for sprite, body in zip(bases, simulation.bases):
+            sprite.rect.topleft = (body.left, body.y)
+        for index, body in enumerate(simulation.obstacles):
+            pipes[index * 2].rect.topleft = (body.left, body.y)
+            pipes[index * 2 + 1].rect.topleft = (body.left, body.bottom_pipe_y)
+            coins[index].rect.topleft = (body.coin.left, body.coin.top)
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            pygame.sprite.spritecollideany(player, group, pygame.sprite.collide_mask)
+        totals["collide_mask"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            hitbox_collision()
+        totals["hitbox"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            simulation.find_collision()
+        totals["analytic"] += time.perf_counter() - start
+
+        measured += 1
+
+    for name, total in totals.items():
+        print(f"{name:>13}: {total / (measured * repeat) * 1e6:8.2f} µs/quadro")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=5_000)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    print(f"verificação: {verify():,} deslocamentos idênticos às máscaras do Pygame")
+    benchmark(args.frames)
+
+
+if __name__ == "__main__":
+    main()
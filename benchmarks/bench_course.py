@@ -0,0 +1,177 @@
+"""
+Verificação e benchmark do percurso (`Course`).
+
+1. Correção: `peek` entrega exatamente o que `next` consome depois; `restore`
+   para posições aleatórias (para trás e para frente, dentro e fora da fila)
+   repete as mesmas alturas; um percurso gravado (`save`) e aberto (`open`)
+   é idêntico ao gerado e recomeça do início depois da última altura.
+2. Custo por altura: `Course.next` contra o `random.Random.randint` por
+   reciclagem usado antes; custo de `peek` dos próximos vãos.
+3. Arquivos de percurso: tempo de `open` (mmap) contra ler o arquivo inteiro,
+   para 1 e 10 milhões de canos; e, em Linux, a memória do mapeamento em dois
+   processos que percorrem o mesmo arquivo ao mesmo tempo (Rss contra Pss:
+   com as páginas compartilhadas, cada processo responde por metade).
+
+Uso:
+    python benchmarks/bench_course.py [--gaps N] [--pipes N]
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+import config  # noqa: E402
+from course import Course  # noqa: E402
+
+
+def check(gaps: int, directory: str) -> None:
+    """Fila, `restore` e arquivo consistentes com o percurso gerado."""
+    reference = Course(7)
+    expected = [reference.next() for _ in range(gaps)]
+
+    if not all(config.PIPE_VERTICAL_OFFSET_MIN <= gap <= config.PIPE_VERTICAL_OFFSET_MAX for gap in expected):
+        raise SystemExit("altura fora dos limites do `PIPE_VERTICAL_OFFSET`")
+
+    # `peek` de tamanhos variados antes de cada consumo, atravessando os blocos
+    course = Course(7)
+    rng = random.Random(0)
+
+    while course.position < gaps - 64:
+        position = course.position
+        count = rng.randrange(1, 64)
+
+        if course.peek(count) != expected[position : position + count]:
+            raise SystemExit(f"posição {position}: peek difere das próximas alturas")
+
+        consumed = rng.randrange(1, count + 1)
+
+        if [course.next() for _ in range(consumed)] != expected[position : position + consumed]:
+            raise SystemExit(f"posição {position}: next difere do percurso")
+
+    course = Course(7)
+
+    for _ in range(1_000):
+        position = rng.randrange(gaps - 16)
+        course.restore(position)
+
+        if [course.next() for _ in range(16)] != expected[position : position + 16]:
+            raise SystemExit(f"restore({position}) não repete as alturas")
+
+    path = os.path.join(directory, "check.fbco")
+    count = gaps // 3 + 5
+    Course(7).save(path, count)
+    stored = Course.open(path)
+
+    if [stored.next() for _ in range(2 * count)] != expected[:count] * 2:
+        raise SystemExit("o percurso gravado difere do gerado (ou não recomeça depois do fim)")
+
+    print(f"{gaps:,} alturas: peek, restore e arquivo ({count:,} canos) idênticos ao percurso gerado")
+
+
+def per_gap(gaps: int) -> None:
+    """Microssegundos por altura consumida e por leitura dos próximos vãos."""
+    rng = random.Random(0)
+    low, high = config.PIPE_VERTICAL_OFFSET_MIN, config.PIPE_VERTICAL_OFFSET_MAX
+    course = Course(0)
+
+    for name, function in [
+        ("random.Random.randint", lambda: rng.randint(low, high)),
+        ("Course.next", course.next),
+        (f"Course.peek({config.COURSE_LOOKAHEAD})", lambda: course.peek(config.COURSE_LOOKAHEAD)),
+    ]:
+        start = time.perf_counter()
+
+        for _ in range(gaps):
+            function()
+
+        print(f"{name:<22} {(time.perf_counter() - start) / gaps * 1e9:7.0f} ns")
+
+
+def touch(path: str, barrier) -> tuple[int, int]:
+    """Percorre o percurso inteiro e devolve (Rss, Pss) do mapeamento em KiB, com o outro processo ainda vivo."""
+    # Lê todas as alturas (carrega todas as páginas do arquivo); o percurso
+    # continua vivo até a leitura do smaps, senão o mapa já teria sido desfeito
+    course = Course.open(path)
+    course.gaps.sum()
+    barrier.wait()
+    rss = pss = 0
+    inside = False
+
+    with open("/proc/self/smaps") as smaps:
+        for line in smaps:
+            fields = line.split()
+
+            if "-" in fields[0] and len(fields) >= 5:
+                inside = fields[-1] == path
+            elif inside and fields[0] == "Rss:":
+                rss += int(fields[1])
+            elif inside and fields[0] == "Pss:":
+                pss += int(fields[1])
+
+    barrier.wait()
+    return rss, pss
+
+
+def files(pipes: int, directory: str) -> None:
+    """Abrir com mmap contra ler o arquivo, e páginas compartilhadas entre processos."""
+    for count in (pipes, pipes * 10):
+        path = os.path.join(directory, f"course-{count}.fbco")
+        start = time.perf_counter()
+        Course(0).save(path, count)
+        write_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        course = Course.open(path)
+        course.peek(config.COURSE_LOOKAHEAD)
+        open_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        np.fromfile(path, dtype="<i2", offset=Course.HEADER.size)
+        read_time = time.perf_counter() - start
+
+        print(
+            f"{count:>11,} canos ({os.path.getsize(path) / 2**20:5.1f} MiB): gravação {write_time * 1e3:7.1f} ms, "
+            f"open + peek {open_time * 1e6:6.0f} µs, leitura completa {read_time * 1e3:6.1f} ms"
+        )
+
+    if not os.path.exists("/proc/self/smaps"):
+        print("(sem /proc/self/smaps: medição de páginas compartilhadas ignorada)")
+        return
+
+    path = os.path.realpath(os.path.join(directory, f"course-{pipes * 10}.fbco"))
+    context = multiprocessing.get_context("spawn")
+
+    with context.Manager() as manager:
+        barrier = manager.Barrier(2)
+
+        with context.Pool(2) as pool:
+            results = pool.starmap(touch, [(path, barrier)] * 2)
+
+    for index, (rss, pss) in enumerate(results):
+        print(f"processo {index}: mapeamento com Rss {rss / 1024:5.1f} MiB, Pss {pss / 1024:5.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--gaps", type=int, default=200_000)
+    parser.add_argument("--pipes", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        check(min(args.gaps, 50_000), directory)
+        print()
+        per_gap(args.gaps)
+        print()
+        files(args.pipes, directory)
+
+
+if __name__ == "__main__":
+    main()
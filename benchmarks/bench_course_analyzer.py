@@ -0,0 +1,225 @@
+"""
+Verificação e benchmark da análise de alcançabilidade dos percursos (`CourseAnalyzer`).
+
+1. Tabela de transições: tempo de cálculo, as janelas mais apertadas e quantos
+   pares de alturas são injustos (ou impossíveis) com os parâmetros do `config`.
+2. Percursos longos: tempo para verificar um percurso de 100 mil canos e para
+   gerá-lo já restrito (`Course` com `analyzer`), que não pode ter transições
+   injustas.
+3. Pares contra o percurso inteiro: a tabela supõe que o pássaro pode estar
+   em qualquer altura do vão anterior; `trace` segue o conjunto real de estados
+   ao longo de cada percurso. Com um intervalo entre batidas em que há pares
+   impossíveis, o primeiro vão impossível segundo os dois tem de coincidir.
+4. Física real: um controlador escolhe, a cada decisão, bater as asas ou não
+   pelos conjuntos viáveis do modelo (respeitando o intervalo entre batidas),
+   aplicando as ações em uma `Simulation` de verdade em percursos restritos e
+   em um que alterna a transição justa mais apertada. O pássaro tem de
+   atravessar todos os canos.
+
+Uso:
+    python benchmarks/bench_course_analyzer.py [--pipes N] [--courses N] [--runs N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+import config  # noqa: E402
+from course import Course  # noqa: E402
+from course_analyzer import CourseAnalyzer  # noqa: E402
+from game_state import GameState  # noqa: E402
+from simulation import Simulation  # noqa: E402
+
+LOW = config.PIPE_VERTICAL_OFFSET_MIN
+
+
+def table() -> CourseAnalyzer:
+    """Calcula a tabela com os parâmetros do `config` e resume as janelas."""
+    start = time.perf_counter()
+    analyzer = CourseAnalyzer()
+    elapsed = time.perf_counter() - start
+    window = analyzer.window
+    unfair = int(np.count_nonzero(window < analyzer.min_window))
+
+    print(
+        f"tabela de {window.size:,} transições em {elapsed:.2f} s "
+        f"(decisões de {analyzer.step * 1e3:.1f} ms, no máximo uma batida a cada {analyzer.flap_interval} decisões, "
+        f"grade {len(analyzer.shifts)} x {analyzer.heights})"
+    )
+    print(
+        f"janela: mínima {window.min():.1f} px, mediana {np.median(window):.1f} px; "
+        f"{unfair} pares injustos (< {analyzer.min_window} px), {np.count_nonzero(window == 0)} impossíveis; "
+        f"{len(analyzer.reachable)} alturas alcançáveis de qualquer outra"
+    )
+
+    for index in np.argsort(window, axis=None)[:3].tolist():
+        previous, following = divmod(index, window.shape[1])
+        print(f"  {previous + LOW:+4d} -> {following + LOW:+4d}: janela {window[previous, following]:.1f} px")
+
+    return analyzer
+
+
+def long_course(analyzer: CourseAnalyzer, pipes: int) -> None:
+    """Verifica um percurso longo e gera um restrito do mesmo tamanho."""
+    course = Course(0)
+    gaps = np.array([course.next() for _ in range(pipes)])
+    start = time.perf_counter()
+    unfair = analyzer.check(gaps)
+    check_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    course = Course(0, analyzer=analyzer)
+    fair_gaps = np.array([course.next() for _ in range(pipes)])
+    fair_time = time.perf_counter() - start
+    start = time.perf_counter()
+    plain = Course(0)
+    [plain.next() for _ in range(pipes)]
+    plain_time = time.perf_counter() - start
+
+    if analyzer.check(fair_gaps).size:
+        raise SystemExit("o percurso restrito tem transições injustas")
+
+    print(
+        f"{pipes:,} canos: verificação {check_time * 1e3:.1f} ms ({len(unfair)} injustas); "
+        f"geração restrita {fair_time * 1e3:.0f} ms contra {plain_time * 1e3:.0f} ms sem restrição, 0 injustas"
+    )
+
+
+def history(courses: int, length: int) -> None:
+    """O primeiro vão impossível pela tabela contra o do conjunto de estados seguido ao longo do percurso."""
+    # Com toques mais espaçados aparecem pares impossíveis (janela zero)
+    analyzer = CourseAnalyzer(flap_interval=0.25)
+    rng = np.random.default_rng(0)
+    gaps = rng.integers(LOW, config.PIPE_VERTICAL_OFFSET_MAX, (courses, length), endpoint=True)
+
+    window = analyzer.window[gaps[:, :-1] - LOW, gaps[:, 1:] - LOW]
+    impossible = window == 0
+    pairs = np.where(impossible.any(axis=1), impossible.argmax(axis=1) + 1, length)
+    start = time.perf_counter()
+    traced = analyzer.trace(gaps)
+    elapsed = time.perf_counter() - start
+
+    if not np.array_equal(pairs, traced):
+        mismatches = np.flatnonzero(pairs != traced)
+        raise SystemExit(f"{len(mismatches)} percursos em que a tabela e o percurso inteiro discordam")
+
+    print(
+        f"{courses} percursos de {length} canos (uma batida a cada {analyzer.flap_interval} decisões): "
+        f"tabela e percurso inteiro concordam ({np.count_nonzero(traced < length)} com vão impossível; "
+        f"trace {elapsed / (courses * length) * 1e3:.2f} ms por cano)"
+    )
+
+
+def viable_sets(analyzer: CourseAnalyzer, gaps: list[int], first: int) -> list[np.ndarray]:
+    """Estados viáveis do modelo em cada decisão, do início da partida até depois do último cano."""
+    samples = first + len(gaps) * analyzer.period
+    sets = [analyzer.ground.copy()]
+
+    for sample in range(samples - 1, -1, -1):
+        states = analyzer._retreat(sets[-1])
+        pipe, phase = divmod(sample - first, analyzer.period)
+
+        if sample >= first and phase < analyzer.overlap:
+            states &= analyzer.bands[gaps[pipe] - LOW]
+
+        sets.append(states)
+
+    return sets[::-1]
+
+
+def tightest(analyzer: CourseAnalyzer) -> Course:
+    """Percurso que alterna o vão mais baixo na tela e o mais alto que ainda é justo depois dele."""
+    high = config.PIPE_VERTICAL_OFFSET_MAX
+    following = int(analyzer.offsets[analyzer.window[high - LOW] >= analyzer.min_window].min())
+    # Percurso fixo sem arquivo, como o `Course.open` monta
+    return Course._from_gaps(np.array([high, following] * 64, dtype="<i2"))
+
+
+def real_physics(analyzer: CourseAnalyzer, runs: int, pipes: int) -> None:
+    """Controlador guiado pelos conjuntos viáveis do modelo, jogando em uma `Simulation`."""
+    survived = 0
+    courses = [Course(seed, analyzer=analyzer) for seed in range(runs)] + [tightest(analyzer)]
+    runs = len(courses)
+
+    for seed, course in enumerate(courses):
+        gaps = course.peek(pipes)
+        simulation = Simulation(course)
+        simulation.start()
+        player = simulation.player
+        radius = analyzer.collision.radius + analyzer.margin
+        center_x = player.x + analyzer.collision.center_x
+        scroll = config.GAME_SPEED * analyzer.step
+        # Primeira decisão com o primeiro cano na coluna do pássaro
+        first = int((simulation.obstacles[0].x - center_x - radius) // scroll) + 1
+        sets = viable_sets(analyzer, gaps, first)
+        # Estado do modelo: decisões desde a batida (o `start` acabou de bater) e a altura da batida
+        row, cell = 0, round(player.y * analyzer.resolution)
+
+        def viable(states: np.ndarray, row: int, cell: int, spread: int) -> bool:
+            """Se as células a até `spread` de distância são todas viáveis (fora da grade = chão)."""
+            if row >= len(analyzer.shifts) or cell + spread >= analyzer.heights:
+                return False
+
+            return bool(states[row, max(0, cell - spread) : cell + spread + 1].all())
+
+        for sample in range(len(sets) - 1):
+            states = sets[sample + 1]
+            flap_cell = round(player.y * analyzer.resolution)
+            can_flap = row >= analyzer.flap_interval
+
+            # A posição real difere da do modelo em até meia célula a cada batida: prefere a
+            # ação que deixa o pássaro longe da borda do conjunto viável, e na dúvida não bate
+            if viable(states, row + 1, cell, 1):
+                flap = False
+            elif can_flap and viable(states, 1, flap_cell, 1):
+                flap = True
+            else:
+                flap = can_flap and not viable(states, row + 1, cell, 0) and viable(states, 1, flap_cell, 0)
+
+            if flap:
+                simulation.flap()
+                row, cell = 0, flap_cell
+
+            simulation.update(analyzer.step)
+            row += 1
+
+            if simulation.state != GameState.RUNNING:
+                print(f"  semente {seed}: batida no cano {max(0, sample - first) // analyzer.period}")
+                break
+        else:
+            survived += 1
+
+    if survived < runs:
+        raise SystemExit(f"o pássaro bateu em {runs - survived} de {runs} percursos justos")
+
+    high, following = courses[-1].peek(2)
+    print(
+        f"{runs} percursos justos de {pipes} canos na `Simulation` (o último alterna {high:+d} e {following:+d}), "
+        f"com no máximo uma batida a cada {analyzer.flap_interval * analyzer.step:.2f} s guiada pelo modelo: "
+        "todos atravessados"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pipes", type=int, default=100_000, help="Canos do percurso longo")
+    parser.add_argument("--courses", type=int, default=64, help="Percursos comparados com `trace`")
+    parser.add_argument("--runs", type=int, default=20, help="Percursos jogados na Simulation")
+    args = parser.parse_args()
+
+    analyzer = table()
+    print()
+    long_course(analyzer, args.pipes)
+    print()
+    history(args.courses, 40)
+    print()
+    real_physics(analyzer, args.runs, 12)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark de vazão do `FlappyBirdEnv` (passos por segundo).
+
+Roda o ambiente sem limitação de FPS, com um bot simples, e compara a
+vazão com renderização desligada (apenas `Simulation`) e ligada (`Game.draw`
+no driver de vídeo `dummy`).
+
+Uso:
+    python benchmarks/bench_env.py [--steps N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flappy_bird import FlappyBirdEnv  # noqa: E402
+
+
+def policy(observation) -> int:
+    """Bot simples: bate as asas quando o pássaro está abaixo do centro do próximo vão."""
+    player_y, change_y, _, gap_y = observation
+    return int(player_y > gap_y + 8 and change_y >= 0)
+
+
+def run(env: FlappyBirdEnv, steps: int) -> float:
+    """Executa `steps` passos (reiniciando ao fim de cada partida) e retorna passos/s."""
+    observation, _ = env.reset(seed=0)
+    start = time.perf_counter()
+
+    for _ in range(steps):
+        observation, _, terminated, _ = env.step(policy(observation))
+
+        if terminated:
+            observation, _ = env.reset()
+
+    return steps / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=20_000)
+    args = parser.parse_args()
+
+    headless = run(FlappyBirdEnv(render=False), args.steps)
+    print(f"render=off: {headless:12,.0f} passos/s")
+
+    env = FlappyBirdEnv(render=True)
+    rendered = run(env, args.steps)
+    env.close()
+    print(f"render=on:  {rendered:12,.0f} passos/s")
+
+
+if __name__ == "__main__":
+    main()
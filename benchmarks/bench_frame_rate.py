@@ -0,0 +1,146 @@
+"""
+Verificação de que a partida é idêntica em qualquer taxa de quadros.
+
+Joga partidas a 30 Hz com um bot simples e grava os instantes dos inputs
+(sempre em múltiplos de 1/30 s). Depois repete exatamente os mesmos inputs,
+com a mesma semente, a 60, 120 e 240 Hz e compara, a cada 1/30 s, os
+retângulos inteiros de todas as entidades, as moedas, a pontuação e o estado
+da partida. Qualquer diferença faz o script sair com erro.
+
+Também mede o custo da simulação por segundo de jogo em cada taxa.
+
+Uso:
+    python benchmarks/bench_frame_rate.py [--games N] [--seconds S]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from course import Course  # noqa: E402
+from game_state import GameState  # noqa: E402
+from simulation import Simulation  # noqa: E402
+
+INPUT_RATE = 30
+"""Taxa (Hz) em que os inputs são decididos; todas as taxas testadas são múltiplas dela."""
+
+RATES = [30, 60, 120, 240]
+
+
+def snapshot(simulation: Simulation) -> tuple:
+    """Tudo o que o jogador vê ou que afeta a partida, em pixels inteiros."""
+    player = simulation.player
+
+    return (
+        simulation.state,
+        player.state,
+        simulation.score,
+        (player.left, player.top),
+        tuple(base.left for base in simulation.bases),
+        tuple(
+            (obstacle.left, obstacle.y, obstacle.coin.active, obstacle.coin.left, obstacle.coin.top)
+            for obstacle in simulation.obstacles
+        ),
+    )
+
+
+def record(seed: int, seconds: float) -> list[int]:
+    """
+    Joga uma partida a 30 Hz com um bot e retorna os ticks (de 1/30 s) em que houve input.
+
+    O bot bate as asas quando o pássaro está abaixo do centro do próximo vão e caindo.
+    """
+    simulation = Simulation(Course(seed))
+    flaps = []
+
+    for tick in range(int(seconds * INPUT_RATE)):
+        player = simulation.player
+
+        if simulation.state == GameState.IDLE:
+            flap = True
+        elif simulation.state == GameState.RUNNING:
+            obstacle = min((o for o in simulation.obstacles if o.right > player.x), key=lambda o: o.x)
+            flap = player.y + player.height // 2 > obstacle.center_y + 8 and player.change_y >= 0
+        else:
+            break
+
+        if flap:
+            simulation.flap()
+            flaps.append(tick)
+
+        simulation.update(1 / INPUT_RATE)
+
+    return flaps
+
+
+def replay(seed: int, seconds: float, rate: int, flaps: list[int]) -> tuple[list[tuple], float]:
+    """
+    Repete os inputs gravados a `rate` Hz.
+
+    Returns:
+        tuple: (snapshot a cada 1/30 s, tempo gasto em `Simulation.update` em segundos).
+    """
+    simulation = Simulation(Course(seed))
+    frames_per_tick = rate // INPUT_RATE
+    pending = set(flaps)
+    snapshots = []
+    elapsed = 0.0
+
+    for frame in range(int(seconds * rate)):
+        tick, phase = divmod(frame, frames_per_tick)
+
+        if phase == 0:
+            snapshots.append(snapshot(simulation))
+
+            if tick in pending:
+                simulation.flap()
+
+        start = time.perf_counter()
+        simulation.update(1 / rate)
+        elapsed += time.perf_counter() - start
+
+    return snapshots, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=60.0, help="Duração máxima de cada partida (segundos)")
+    args = parser.parse_args()
+
+    costs = dict.fromkeys(RATES, 0.0)
+    scores = []
+
+    for seed in range(args.games):
+        flaps = record(seed, args.seconds)
+        reference = None
+
+        for rate in RATES:
+            snapshots, elapsed = replay(seed, args.seconds, rate, flaps)
+            costs[rate] += elapsed
+
+            if reference is None:
+                reference = snapshots
+                continue
+
+            for tick, (expected, actual) in enumerate(zip(reference, snapshots)):
+                if expected != actual:
+                    raise SystemExit(
+                        f"partida {seed}: {rate} Hz difere de {RATES[0]} Hz em t={tick / INPUT_RATE:.3f}s\n"
+                        f"  {RATES[0]} Hz: {expected}\n  {rate} Hz: {actual}"
+                    )
+
+        scores.append(reference[-1][2])
+
+    print(f"{args.games} partidas idênticas a {', '.join(map(str, RATES))} Hz (pontuações: {scores})")
+    simulated = args.games * args.seconds
+
+    for rate in RATES:
+        print(f"{rate:>4} Hz: {costs[rate] / simulated * 1e3:8.3f} ms de simulação por segundo de jogo")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Verificação e benchmark da entrada com horário (batidas de asas no sub-passo em que aconteceram).
+
+1. Jitter: gera cliques em instantes arbitrários (não alinhados aos quadros) e
+   os repete a 30, 60, 120 e 240 Hz, aplicando cada clique no início do quadro
+   (como antes) ou no sub-passo em que aconteceu (`Simulation.update(dt,
+   flaps)`). Mede a diferença entre o clique e o instante simulado em que
+   ele vale e verifica que, com horário, a partida é idêntica em todas as taxas.
+2. Latência clique -> tela: roda o loop principal sem janela (`FramePacer`,
+   `Game.handle_events`, `update` e `draw`, como `FlappyBird.start`) enquanto
+   uma thread posta cliques em instantes aleatórios, e mostra a distribuição
+   medida pelo `InputLatency` para algumas taxas de quadros.
+
+Uso:
+    python benchmarks/bench_input.py [--games N] [--seconds S] [--clicks N]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import threading
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+
+import config  # noqa: E402
+from course import Course  # noqa: E402
+from frame_pacer import FramePacer  # noqa: E402
+from game import Game  # noqa: E402
+from game_state import GameState  # noqa: E402
+from input_latency import InputLatency  # noqa: E402
+from simulation import Simulation  # noqa: E402
+
+RATES = [30, 60, 120, 240]
+
+
+def clicks(seed: int, seconds: float) -> list[float]:
+    """Instantes dos cliques (segundos desde o início), o primeiro inicia a partida."""
+    rng = random.Random(seed)
+    times = [0.0]
+
+    while times[-1] < seconds:
+        times.append(times[-1] + rng.uniform(0.18, 0.45))
+
+    return times[:-1]
+
+
+def replay(seed: int, seconds: float, rate: int, times: list[float], timestamped: bool) -> tuple[list, list[float]]:
+    """
+    Joga a partida a `rate` Hz com os cliques dados.
+
+    Returns:
+        tuple: (estado a cada 1/30 s, diferença entre cada clique e o instante simulado em que vale).
+    """
+    simulation = Simulation(Course(seed))
+    simulation.flap()
+    dt = 1 / rate
+    step = dt / Simulation.substeps(dt, simulation.max_step, simulation.max_substeps)
+    pending = times[1:]
+    snapshots, errors = [], []
+
+    for frame in range(round(seconds * rate)):
+        start = frame * dt
+        flaps = []
+
+        # Cliques que aconteceram durante o intervalo simulado neste quadro
+        while pending and pending[0] < start + dt:
+            offset = pending.pop(0) - start
+
+            if timestamped:
+                flaps.append(offset)
+                errors.append(offset - math.floor(offset / step) * step)
+            else:
+                simulation.flap()
+                errors.append(offset)
+
+        simulation.update(dt, flaps)
+
+        if (frame + 1) % (rate // RATES[0]) == 0:
+            player = simulation.player
+            snapshots.append((simulation.state, simulation.score, player.left, player.top))
+
+    return snapshots, errors
+
+
+def jitter(games: int, seconds: float) -> None:
+    """Erro de tempo dos cliques por taxa e verificação da independência da taxa."""
+    print(f"{'taxa':>6}   erro no início do quadro (médio / máx)     no sub-passo (médio / máx)")
+    results = {}
+
+    for rate in RATES:
+        frame_errors, step_errors = [], []
+
+        for seed in range(games):
+            times = clicks(seed, seconds)
+            frame_errors += replay(seed, seconds, rate, times, False)[1]
+            snapshots, errors = replay(seed, seconds, rate, times, True)
+            step_errors += errors
+            results[rate, seed] = snapshots
+
+        print(
+            f"{rate:>4} Hz   {sum(frame_errors) / len(frame_errors) * 1e3:8.2f} / {max(frame_errors) * 1e3:5.2f} ms"
+            f"{'':>21}{sum(step_errors) / len(step_errors) * 1e3:6.2f} / {max(step_errors) * 1e3:5.2f} ms"
+        )
+
+    for seed in range(games):
+        for rate in RATES[1:]:
+            if results[rate, seed] != results[RATES[0], seed]:
+                raise SystemExit(f"partida {seed}: {rate} Hz difere de {RATES[0]} Hz com cliques no sub-passo")
+
+    print(f"{games} partidas idênticas a {', '.join(map(str, RATES))} Hz com cliques no sub-passo")
+
+
+def post_clicks(count: int, interval: float, stop: threading.Event) -> None:
+    """Posta `count` cliques do botão esquerdo em instantes aleatórios."""
+    rng = random.Random(0)
+
+    for _ in range(count):
+        if stop.wait(interval * rng.uniform(0.5, 1.5)):
+            return
+
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(0, 0)))
+
+
+def latency(screen: pygame.Surface, fps: int, count: int) -> dict[str, float]:
+    """Roda o loop principal sem janela a `fps` e retorna as estatísticas do `InputLatency`."""
+    input_latency = InputLatency(enabled=True)
+    game = Game(screen, audio=False, seed=0, input_latency=input_latency)
+    game.start_level()
+    game.flap()
+    pacer = FramePacer(pygame.time.Clock(), fps=fps)
+    stop = threading.Event()
+    thread = threading.Thread(target=post_clicks, args=(count, 0.3, stop))
+    thread.start()
+    dt, events = 0.0, []
+
+    while thread.is_alive():
+        game.handle_events(events)
+        game.update(dt, pacer.last)
+        game.draw()
+        level_manager = game.level_manager
+        dt, events = pacer.wait(level_manager.state, level_manager.player.state)
+
+        # Cliques que acertam os canos também contam: a partida recomeça na hora
+        if level_manager.state == GameState.GAMEOVER:
+            game.start_level()
+            game.flap()
+
+    stop.set()
+    return input_latency.stats()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=20.0, help="Duração de cada partida do teste de jitter")
+    parser.add_argument("--clicks", type=int, default=100, help="Cliques por taxa no teste de latência")
+    args = parser.parse_args()
+
+    jitter(args.games, args.seconds)
+    print()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    print(f"{'FPS':>6} {'cliques':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'máx':>8}   (latência clique -> tela)")
+
+    for fps in [60, config.FPS, 240]:
+        stats = latency(screen, fps, args.clicks)
+        print(
+            f"{fps:>6} {stats['count']:>8} {stats['p50']:5.2f} ms {stats['p90']:5.2f} ms"
+            f" {stats['p99']:5.2f} ms {stats['max']:5.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark do controle de tempo adaptativo (`FramePacer`).
+
+Roda o loop principal (eventos, update, draw e espera, como `FlappyBird.start`)
+por alguns segundos de relógio em cada estado: IDLE, RUNNING com um bot
+simples, PAUSED e GAMEOVER com o pássaro DEAD. Mede a utilização de CPU
+(tempo de CPU do processo / tempo de relógio) e os quadros por segundo, com a
+economia de energia desligada (taxa máxima em todos os estados, como antes) e
+ligada.
+
+Também mede o tempo para acordar de uma tela parada: uma thread posta um
+clique em instantes aleatórios e o script mede quanto o loop demora para
+recebê-lo.
+
+Uso:
+    python benchmarks/bench_pacing.py [--seconds S] [--dirty-rects]
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+
+import config  # noqa: E402
+from frame_pacer import FramePacer  # noqa: E402
+from game import Game  # noqa: E402
+from game_state import GameState  # noqa: E402
+from player_state import PlayerState  # noqa: E402
+
+WAKE_EVENT = pygame.USEREVENT + 1
+
+
+class Loop:
+    """Loop principal sem janela, com o mesmo roteiro de `FlappyBird.start`."""
+
+    def __init__(self, screen: pygame.Surface, power_save: bool, dirty_rects: bool) -> None:
+        self.game = Game(screen, audio=False, seed=0, dirty_rects=dirty_rects)
+        self.game.start_level()
+        self.pacer = FramePacer(pygame.time.Clock(), power_save)
+        self.events: list[pygame.event.Event] = []
+        self.dt = 0.0
+        self.bot = False
+        self.woken: list[float] = []
+
+    def frame(self) -> None:
+        """Um quadro: eventos, bot, update, draw e espera."""
+        level_manager = self.game.level_manager
+
+        # Cliques ainda na fila (sem economia de energia) ou que acordaram o `FramePacer`
+        for event in self.events + pygame.event.get(WAKE_EVENT):
+            if event.type == WAKE_EVENT:
+                self.woken.append(time.perf_counter() - event.posted)
+
+        self.game.handle_events(self.events)
+
+        if self.bot and level_manager.state == GameState.RUNNING:
+            # Bot simples: bate as asas abaixo do centro do próximo vão
+            player = level_manager.simulation.player
+            obstacle = min((o for o in level_manager.simulation.obstacles if o.right > player.x), key=lambda o: o.x)
+
+            if player.y + player.height // 2 > obstacle.center_y + 8 and player.change_y >= 0:
+                self.game.flap()
+
+        self.game.update(self.dt)
+        self.game.draw()
+        self.dt, self.events = self.pacer.wait(level_manager.state, level_manager.player.state)
+
+    def measure(self, seconds: float) -> tuple[float, float]:
+        """Roda por `seconds` de relógio e retorna (utilização de CPU, quadros por segundo)."""
+        frames = 0
+        wall, cpu = time.perf_counter(), time.process_time()
+
+        while time.perf_counter() - wall < seconds:
+            self.frame()
+            frames += 1
+
+            # O bot pode errar: a partida recomeça para continuar medindo RUNNING
+            if self.bot and self.game.level_manager.state == GameState.GAMEOVER:
+                self.game.start_level()
+                self.game.flap()
+
+        wall = time.perf_counter() - wall
+        return (time.process_time() - cpu) / wall, frames / wall
+
+
+def post_clicks(count: int, interval: float) -> None:
+    """Posta `count` eventos em instantes aleatórios, guardando o instante em que foram postados."""
+    rng = random.Random(0)
+
+    for _ in range(count):
+        time.sleep(interval * rng.uniform(0.5, 1.5))
+        pygame.event.post(pygame.event.Event(WAKE_EVENT, posted=time.perf_counter()))
+
+
+def run(screen: pygame.Surface, power_save: bool, dirty_rects: bool, seconds: float) -> dict[str, tuple]:
+    """Mede cada estado e retorna {estado: (CPU, FPS)}, mais a latência para acordar em PAUSED."""
+    loop = Loop(screen, power_save, dirty_rects)
+    results = {"IDLE": loop.measure(seconds)}
+
+    loop.game.flap()
+    loop.bot = True
+    results["RUNNING"] = loop.measure(seconds)
+    loop.bot = False
+
+    simulation = loop.game.level_manager.simulation
+    simulation.toggle_pause()
+    clicks = threading.Thread(target=post_clicks, args=(10, seconds / 12))
+    clicks.start()
+    results["PAUSED"] = loop.measure(seconds)
+    clicks.join()
+    simulation.toggle_pause()
+
+    # Cai até o chão antes de medir a tela de fim de partida
+    level_manager = loop.game.level_manager
+
+    while not (level_manager.state == GameState.GAMEOVER and level_manager.player.state == PlayerState.DEAD):
+        loop.frame()
+
+    results["GAMEOVER (DEAD)"] = loop.measure(seconds)
+    results["wake"] = sorted(loop.woken)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=3.0, help="Tempo de relógio medido em cada estado")
+    parser.add_argument("--dirty-rects", action="store_true", default=config.DIRTY_RECTS)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+    before = run(screen, False, args.dirty_rects, args.seconds)
+    after = run(screen, True, args.dirty_rects, args.seconds)
+
+    print(f"{'estado':>16} {'CPU antes':>10} {'CPU depois':>11} {'FPS antes':>10} {'FPS depois':>11}")
+
+    for name in ["IDLE", "RUNNING", "PAUSED", "GAMEOVER (DEAD)"]:
+        (cpu_before, fps_before), (cpu_after, fps_after) = before[name], after[name]
+        print(f"{name:>16} {cpu_before:9.1%} {cpu_after:10.1%} {fps_before:10.1f} {fps_after:11.1f}")
+
+    for label, results in [("antes", before), ("depois", after)]:
+        wake = results["wake"]
+        print(
+            f"acordar em PAUSED ({label}): mediana {wake[len(wake) // 2] * 1e3:5.2f} ms,"
+            f" máximo {wake[-1] * 1e3:5.2f} ms ({len(wake)} cliques)"
+        )
+
+
+if __name__ == "__main__":
+    main()
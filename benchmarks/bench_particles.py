@@ -0,0 +1,264 @@
+"""
+Verificação e benchmark do sistema de partículas (`ParticleSystem`).
+
+1. Correção: a integração vetorizada de um pool pequeno é comparada, passo a
+   passo, com a mesma física calculada partícula a partícula em Python
+   (posição, velocidade e expiração); o pool nunca passa da capacidade.
+2. Alocação: `spawn` não aloca arrays (pico medido com `tracemalloc` ao
+   longo de milhares de chamadas: só as views temporárias, o mesmo para
+   rajadas de qualquer tamanho), nem `update` em regime, com partículas
+   expirando e sendo compactadas a cada quadro.
+3. Custo por quadro com o pool mantido em N partículas vivas (emissores em
+   posições aleatórias repõem as que expiram): `spawn`, `update` e `draw`
+   (uma chamada a `Surface.blits`), comparados com o orçamento de 1 / FPS, e
+   o mesmo número de partículas como `Sprite` em um `pygame.sprite.Group`.
+
+Uso:
+    python benchmarks/bench_particles.py [--particles N ...] [--frames N]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+import config  # noqa: E402
+from asset_manager import AssetManager  # noqa: E402
+from particle_kind import ParticleKind  # noqa: E402
+from particle_system import ParticleSystem  # noqa: E402
+
+BUDGET = 1 / config.FPS
+KINDS = list(ParticleKind)
+
+
+def check(assets: AssetManager) -> None:
+    """Pool pequeno contra a mesma física partícula a partícula; capacidade respeitada."""
+    particles = ParticleSystem(assets, capacity=256, seed=0)
+    dt = 1 / config.FPS
+
+    for index, kind in enumerate(KINDS):
+        particles.spawn(kind, 50 + 60 * index, 200, 40)
+
+    # Referência: uma lista de partículas em Python, com os valores sorteados pelo pool
+    count = particles.count
+    reference = np.column_stack(
+        [
+            particles.position[:count],
+            particles.velocity[:count],
+            np.zeros(count),
+            particles.rate[:count],
+            particles.gravity[:count],
+            particles.drag[:count],
+        ]
+    ).tolist()
+    scroll = config.GAME_SPEED
+    steps = 0
+
+    while particles.count:
+        particles.update(dt, scroll)
+        survivors = []
+
+        for x, y, vx, vy, age, rate, gravity, drag in reference:
+            vy += gravity * dt
+            factor = max(0.0, 1 - drag * dt)
+            vx, vy = vx * factor, vy * factor
+            x, y, age = x + vx * dt - scroll * dt, y + vy * dt, age + dt
+
+            if age * rate < config.PARTICLE_FRAMES and x > -particles.size:
+                survivors.append([x, y, vx, vy, age, rate, gravity, drag])
+
+        reference = survivors
+        steps += 1
+
+        if len(reference) != particles.count:
+            raise SystemExit(f"passo {steps}: {particles.count} vivas, referência com {len(reference)}")
+
+        # A compactação preserva a ordem das sobreviventes
+        expected = np.array([row[:4] for row in reference], dtype=np.float32).reshape(-1, 4)
+        actual = np.hstack([particles.position[: particles.count], particles.velocity[: particles.count]])
+
+        if not np.allclose(actual, expected, atol=1e-2):
+            raise SystemExit(f"passo {steps}: posição ou velocidade diferente da referência")
+
+    for _ in range(100):
+        particles.spawn(ParticleKind.DUST, 10, 10, 7)
+
+    if particles.count != particles.capacity:
+        raise SystemExit("o pool passou da capacidade (ou descartou partículas com espaço livre)")
+
+    print(
+        f"{len(KINDS) * 40} partículas por {steps} passos ({steps / config.FPS:.2f} s): idênticas à física "
+        f"partícula a partícula; rajadas além da capacidade ({particles.capacity}) descartadas"
+    )
+
+
+def allocation(assets: AssetManager) -> None:
+    """Pico de memória alocada por `spawn` (rajadas pequenas e grandes) e por `update` em regime."""
+    particles = ParticleSystem(assets, seed=0)
+
+    for burst in (4, 64, 1_024):
+        particles.clear()
+        # Primeira chamada fora da medição (caches internos do NumPy)
+        particles.spawn(ParticleKind.FEATHER, 100, 100, burst)
+        particles.clear()
+        calls = particles.capacity // burst
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+
+        for index in range(calls):
+            particles.spawn(KINDS[index % len(KINDS)], 100.0, 100.0, burst)
+
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        tracemalloc.stop()
+        print(f"spawn de {burst:>5} partículas ({calls:>5} chamadas): pico alocado {peak:>5} bytes")
+
+        # Só os objetos das views (alguns KiB no total, seja qual for a rajada); arrays novos
+        # para uma rajada de 1024 partículas ocupariam dezenas de KiB
+        if peak > 4_096:
+            raise SystemExit("spawn alocou memória proporcional às partículas")
+
+    # Regime: rajadas a cada quadro, com as mais antigas expirando (compactação em quase todo quadro)
+    particles.clear()
+    dt = 1 / config.FPS
+    frames = 10 * config.FPS
+    compactions = 0
+
+    for index in range(config.FPS + frames):
+        if index == config.FPS:
+            # Depois de um segundo (idades variadas), mede o resto
+            tracemalloc.start()
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+
+        particles.spawn(KINDS[index % len(KINDS)], 100.0, 100.0, 64)
+        count = particles.count
+        particles.update(dt, config.GAME_SPEED)
+        compactions += index >= config.FPS and particles.count < count
+
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    print(f"spawn + update em regime ({frames} quadros, {compactions} compactações): pico alocado {peak:>5} bytes")
+
+    if peak > 4_096:
+        raise SystemExit("update alocou memória proporcional às partículas")
+
+
+def timed(function, frames: int) -> float:
+    """Milissegundos por chamada (mediana de `frames`)."""
+    times = []
+
+    for _ in range(frames):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return float(np.median(times)) * 1e3
+
+
+def frame_cost(screen: pygame.Surface, assets: AssetManager, live: int, frames: int) -> None:
+    """Custo de cada parte do quadro com o pool mantido em `live` partículas."""
+    particles = ParticleSystem(assets, capacity=max(live, config.PARTICLE_CAPACITY), seed=0)
+    rng = random.Random(0)
+    dt = 1 / config.FPS
+
+    def top_up() -> None:
+        # Emissores de 16 partículas em posições aleatórias até completar `live`
+        while particles.count < live:
+            kind = KINDS[rng.randrange(len(KINDS))]
+            x, y = rng.uniform(0, config.SCREEN_WIDTH), rng.uniform(0, config.SCREEN_HEIGHT)
+            particles.spawn(kind, x, y, min(16, live - particles.count))
+
+    # Atinge o regime (idades variadas) antes de medir
+    for _ in range(config.FPS):
+        top_up()
+        particles.update(dt, config.GAME_SPEED)
+
+    spawn_times, update_times, draw_times = [], [], []
+
+    for _ in range(frames):
+        screen.blit(assets.background_image, (0, 0))
+        start = time.perf_counter()
+        top_up()
+        spawned = time.perf_counter()
+        particles.update(dt, config.GAME_SPEED)
+        updated = time.perf_counter()
+        particles.draw(screen)
+        drawn = time.perf_counter()
+        spawn_times.append(spawned - start)
+        update_times.append(updated - spawned)
+        draw_times.append(drawn - updated)
+
+    spawn_time, update_time, draw_time = (
+        float(np.median(times)) * 1e3 for times in (spawn_times, update_times, draw_times)
+    )
+    total = spawn_time + update_time + draw_time
+    print(
+        f"{live:>6} vivas | spawn {spawn_time:5.2f} ms, update {update_time:5.2f} ms, draw {draw_time:5.2f} ms | "
+        f"total {total:5.2f} ms de {BUDGET * 1e3:.2f} ms ({total / (BUDGET * 1e3):4.0%})"
+    )
+
+
+def sprite_cost(screen: pygame.Surface, assets: AssetManager, live: int, frames: int) -> None:
+    """As mesmas partículas como um `Sprite` cada, atualizadas em Python e desenhadas com `Group.draw`."""
+    particles = ParticleSystem(assets, seed=0)
+    rng = random.Random(0)
+    dt = 1 / config.FPS
+    group = pygame.sprite.Group()
+
+    for _ in range(live):
+        sprite = pygame.sprite.Sprite()
+        sprite.image = particles.images[rng.randrange(len(particles.images))]
+        sprite.rect = sprite.image.get_rect(topleft=(rng.uniform(0, 288), rng.uniform(0, 512)))
+        angle = rng.uniform(0, 2 * math.pi)
+        sprite.x, sprite.y = float(sprite.rect.x), float(sprite.rect.y)
+        sprite.vx, sprite.vy = 80 * math.cos(angle), 80 * math.sin(angle)
+        group.add(sprite)
+
+    def step() -> None:
+        for sprite in group:
+            sprite.vy += 120 * dt
+            sprite.vx *= 0.97
+            sprite.vy *= 0.97
+            sprite.x += sprite.vx * dt - config.GAME_SPEED * dt
+            sprite.y += sprite.vy * dt
+            sprite.rect.topleft = (sprite.x, sprite.y)
+
+        group.draw(screen)
+
+    print(f"{live:>6} Sprites (update em Python + Group.draw): {timed(step, frames):5.2f} ms por quadro")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--particles", type=int, nargs="+", default=[1_000, 5_000, 10_000, 16_384])
+    parser.add_argument("--frames", type=int, default=600, help="Quadros medidos por tamanho")
+    args = parser.parse_args()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    assets = AssetManager(audio=False, rng=random.Random(0))
+
+    check(assets)
+    print()
+    allocation(assets)
+    print()
+
+    for live in args.particles:
+        frame_cost(screen, assets, live, args.frames)
+
+    sprite_cost(screen, assets, 10_000, max(10, args.frames // 20))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
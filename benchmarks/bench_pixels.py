@@ -0,0 +1,152 @@
+"""
+Benchmark e verificação das observações em pixels (`PixelObserver`).
+
+1. Confere, em quadros de partidas reais, que a captura é idêntica à mesma
+   conversão feita a partir de uma cópia da tela (`pygame.image.tobytes`) e
+   que a pilha sai em ordem, do quadro mais antigo ao mais novo.
+2. Custo por captura: `PixelObserver.capture` contra o caminho com cópia
+   (`tobytes` + NumPy) e contra `surfarray.array3d`; memória alocada pelas
+   capturas (`tracemalloc`).
+3. Vazão do `FlappyBirdEnv` com observações em pixels, comparada à
+   renderização com `display.flip` e ao ambiente só com o vetor de estado.
+
+Uso:
+    python benchmarks/bench_pixels.py [--steps N] [--captures N]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+import config  # noqa: E402
+from flappy_bird import FlappyBirdEnv  # noqa: E402
+from pixel_observer import PixelObserver  # noqa: E402
+
+
+def policy(env: FlappyBirdEnv) -> int:
+    """Bot simples (lê o estado da simulação, não os pixels)."""
+    player = env.simulation.player
+    obstacle = min((o for o in env.simulation.obstacles if o.right > player.x), key=lambda o: o.x)
+    return int(player.y + player.height // 2 > obstacle.center_y + 8 and player.change_y >= 0)
+
+
+def reference(surface: pygame.Surface, width: int, height: int) -> np.ndarray:
+    """A mesma conversão a partir de uma cópia da tela (caminho antigo, com alocações)."""
+    source_width, source_height = surface.get_size()
+    rgb = np.frombuffer(pygame.image.tobytes(surface, "RGB"), np.uint8).reshape(source_height, source_width, 3)
+    columns = ((np.arange(width) + 0.5) * source_width / width).astype(np.intp)
+    rows = ((np.arange(height) + 0.5) * source_height / height).astype(np.intp)
+    sampled = rgb[rows][:, columns].astype(np.uint16)
+    return ((sampled[..., 0] * 77 + sampled[..., 1] * 150 + sampled[..., 2] * 29) >> 8).astype(np.uint8)
+
+
+def check(steps: int) -> None:
+    """Capturas idênticas à referência e pilha em ordem."""
+    env = FlappyBirdEnv(pixels=True)
+    observer = env.observer
+    observation, _ = env.reset(seed=0)
+    history = [reference(observer.surface, observer.width, observer.height)] * observer.stack
+
+    if not np.array_equal(observation, np.stack(history)):
+        raise SystemExit("reset: a pilha difere da referência")
+
+    for step in range(steps):
+        observation, _, terminated, _ = env.step(policy(env))
+        history = history[1:] + [reference(observer.surface, observer.width, observer.height)]
+
+        if not np.array_equal(observation, np.stack(history)):
+            raise SystemExit(f"passo {step}: a pilha difere da referência")
+
+        if terminated:
+            observation, _ = env.reset()
+            history = [reference(observer.surface, observer.width, observer.height)] * observer.stack
+
+    env.close()
+    print(f"{steps} passos: pilhas idênticas à conversão a partir de tobytes, em ordem")
+
+
+def capture_cost(captures: int) -> None:
+    """Microssegundos por captura e memória alocada."""
+    pygame.display.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    screen.fill((84, 192, 201))
+    observer = PixelObserver(screen)
+    width, height = observer.width, observer.height
+    columns = ((np.arange(width) + 0.5) * config.SCREEN_WIDTH / width).astype(np.intp)
+    rows = ((np.arange(height) + 0.5) * config.SCREEN_HEIGHT / height).astype(np.intp)
+    weights = np.array([0.299, 0.587, 0.114], np.float32)
+
+    def array3d() -> np.ndarray:
+        return (pygame.surfarray.array3d(screen)[columns][:, rows] @ weights).T.astype(np.uint8)
+
+    for name, function in [
+        ("PixelObserver.capture", observer.capture),
+        ("tobytes + NumPy", lambda: reference(screen, width, height)),
+        ("surfarray.array3d", array3d),
+    ]:
+        function()
+        start = time.perf_counter()
+
+        for _ in range(captures):
+            function()
+
+        elapsed = (time.perf_counter() - start) / captures
+        tracemalloc.start()
+
+        for _ in range(100):
+            function()
+
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{name:<22} {elapsed * 1e6:8.1f} µs por captura, pico alocado {peak / 1024:7.1f} KiB")
+
+    pygame.quit()
+
+
+def throughput(steps: int) -> None:
+    """Passos por segundo do ambiente em cada modo."""
+    modes = [
+        ("estado, sem desenho", lambda: FlappyBirdEnv()),
+        ("estado + draw + flip", lambda: FlappyBirdEnv(render=True)),
+        ("pixels (sem flip)", lambda: FlappyBirdEnv(pixels=True)),
+    ]
+
+    for name, factory in modes:
+        env = factory()
+        env.reset(seed=0)
+        start = time.perf_counter()
+
+        for _ in range(steps):
+            _, _, terminated, _ = env.step(policy(env))
+
+            if terminated:
+                env.reset()
+
+        rate = steps / (time.perf_counter() - start)
+        env.close()
+        print(f"{name:<22} {rate:10,.0f} passos/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=5_000)
+    parser.add_argument("--captures", type=int, default=2_000)
+    args = parser.parse_args()
+
+    check(min(args.steps, 2_000))
+    print()
+    capture_cost(args.captures)
+    print()
+    throughput(args.steps)
+
+
+if __name__ == "__main__":
+    main()
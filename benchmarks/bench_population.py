@@ -0,0 +1,195 @@
+"""
+Verificação e benchmark do modo população (`Population` + `PopulationRenderer`).
+
+1. Equivalência: cada pássaro da população é comparado, passo a passo, com
+   uma `Simulation` própria no mesmo percurso (`Course` com a mesma semente e
+   a mesma fase da oscilação das moedas), com os mesmos cliques. Altura, moedas e o passo da
+   batida têm de ser idênticos.
+2. Custo por quadro com todos os pássaros vivos (um bot simples os mantém no
+   ar): passo da simulação, decisão dos controladores e desenho. O desenho
+   com uma única chamada a `Surface.blits` (uma imagem por altura ocupada) é
+   comparado com a mesma lista desenhada por `blit` um a um e com um
+   `pygame.sprite.Group` com um sprite por pássaro. O orçamento de cada
+   quadro é 1 / FPS.
+
+Uso:
+    python benchmarks/bench_population.py [--birds N] [--frames N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+import config  # noqa: E402
+from asset_manager import AssetManager  # noqa: E402
+from course import Course  # noqa: E402
+from game_state import GameState  # noqa: E402
+from population import Population  # noqa: E402
+from population_policy import PopulationPolicy  # noqa: E402
+from population_renderer import PopulationRenderer  # noqa: E402
+from simulation import Simulation  # noqa: E402
+
+BUDGET = 1 / config.FPS
+
+
+def bot(population: Population, observations: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Segue o centro do vão com uma folga diferente por pássaro (e um pouco de ruído)."""
+    margin = population.ids % 10 * 2 + 2
+    below = observations[:, 0] > observations[:, 3] + margin
+    return below & (observations[:, 1] >= 0) & (rng.random(population.size) < 0.9)
+
+
+def check(birds: int, seconds: float) -> None:
+    """Cada pássaro da população contra uma `Simulation` própria no mesmo percurso."""
+    population = Population(birds, seed=0)
+    rng = np.random.default_rng(0)
+    simulations = []
+
+    for _ in range(birds):
+        simulation = Simulation(Course(0))
+        simulation.start()
+        simulations.append(simulation)
+
+    # O `start` já bateu as asas; na população, o primeiro passo faz o mesmo
+    actions = np.ones(birds, dtype=bool)
+    steps = 0
+
+    while population.size and steps < seconds * config.FPS:
+        ids = population.ids.copy()
+
+        for index in ids:
+            simulation = simulations[index]
+
+            if steps and actions[index]:
+                simulation.move_up()
+
+            # A fase da oscilação das moedas é do percurso compartilhado (na `Simulation`,
+            # uma moeda coletada para de oscilar só para aquele pássaro)
+            for column, obstacle in enumerate(simulation.obstacles):
+                obstacle.coin.vertical_offset = int(population.coin_offset[0, column])
+                obstacle.coin.vertical_direction = int(population.coin_direction[0, column])
+                obstacle.coin.movement_step = float(population.coin_movement_step[0, column])
+
+        observations, _, dead = population.step(actions[ids])
+        alive = dict(zip(population.ids.tolist(), population.player_y.tolist()))
+
+        for index, died in zip(ids.tolist(), dead.tolist()):
+            simulation = simulations[index]
+            simulation.update(population.dt)
+            simulation.events.clear()
+
+            if (simulation.state == GameState.GAMEOVER) != died or simulation.score != population.scores[index]:
+                raise SystemExit(f"passo {steps}, pássaro {index}: batida ou moedas diferentes da Simulation")
+
+            if not died and simulation.player.y != alive[index]:
+                raise SystemExit(f"passo {steps}, pássaro {index}: altura diferente da Simulation")
+
+        actions = np.zeros(birds, dtype=bool)
+        actions[population.ids] = bot(population, observations, rng)
+        steps += 1
+
+    print(
+        f"{birds} pássaros, {steps} passos ({steps / config.FPS:.1f} s): idênticos à Simulation "
+        f"(melhor {population.scores.max()} moedas, {population.size} vivos no fim)"
+    )
+
+
+def timed(function, repeat: int) -> float:
+    """Milissegundos por chamada (mediana de `repeat`)."""
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return float(np.median(times)) * 1e3
+
+
+def frame_cost(screen: pygame.Surface, assets: AssetManager, birds: int, frames: int) -> None:
+    """Custo de cada parte do quadro com `birds` pássaros vivos."""
+    population = Population(birds, seed=0)
+    policy = PopulationPolicy(birds, seed=0)
+    renderer = PopulationRenderer(screen, assets)
+    rng = np.random.default_rng(0)
+    observations = population.reset()
+
+    # Chega ao trecho com canos e moedas na tela
+    for _ in range(config.FPS):
+        observations, _, _ = population.step(bot(population, observations, rng))
+
+    def step() -> None:
+        nonlocal observations
+        observations, _, _ = population.step(bot(population, observations, rng))
+
+    step_time = timed(step, frames)
+    act_time = timed(lambda: policy.act(observations, population.ids), frames)
+    draw_time = timed(lambda: renderer.draw(population), frames)
+    size = population.size
+    heights = len(np.unique(population._pixel(population.player_y)))
+
+    # A mesma lista de desenho, uma chamada de `blit` por superfície
+    blit = screen.blit
+
+    def one_by_one() -> None:
+        for image, position in renderer.draw_list(population):
+            blit(image, position)
+
+    loop_time = timed(one_by_one, frames)
+
+    # Um sprite por pássaro (`Group.draw`), o resto do cenário com `blits`
+    group = pygame.sprite.Group()
+
+    for y in population._pixel(population.player_y).tolist():
+        sprite = pygame.sprite.Sprite()
+        sprite.image = assets.player_images[0]
+        sprite.rect = sprite.image.get_rect(topleft=(population.player_left, y))
+        group.add(sprite)
+
+    def sprites() -> None:
+        scenery = renderer.draw_list(population)
+        screen.blits(scenery[: -heights - 3], doreturn=False)
+        for sprite, y in zip(group.sprites(), population._pixel(population.player_y).tolist()):
+            sprite.rect.y = y
+        group.draw(screen)
+        screen.blits(scenery[-3:], doreturn=False)
+
+    group_time = timed(sprites, frames)
+
+    total = step_time + act_time + draw_time
+    print(
+        f"{size:>6} vivos ({heights:>3} alturas) | passo {step_time:5.2f} ms, controladores {act_time:4.2f} ms, "
+        f"desenho {draw_time:4.2f} ms (blit um a um {loop_time:5.2f}, sprites {group_time:5.2f}) | "
+        f"total {total:5.2f} ms de {BUDGET * 1e3:.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--birds", type=int, nargs="+", default=[1_000, 2_000, 5_000, 10_000])
+    parser.add_argument("--frames", type=int, default=300, help="Quadros medidos por tamanho")
+    args = parser.parse_args()
+
+    check(50, 60.0)
+    print()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    assets = AssetManager(audio=False, rng=random.Random(0))
+
+    for birds in args.birds:
+        frame_cost(screen, assets, birds, args.frames)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
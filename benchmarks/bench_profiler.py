@@ -0,0 +1,87 @@
+"""
+Benchmark do custo do `FrameProfiler`.
+
+Mede o custo de uma marcação (`mark`) com o profiler desligado e ligado e o
+tempo de um quadro completo do `Game` (update + draw, driver `dummy`) sem
+profiler, com profiler ligado e com o gráfico na tela.
+
+Uso:
+    python benchmarks/bench_profiler.py [--frames N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+
+import config  # noqa: E402
+from frame_profiler import FrameProfiler  # noqa: E402
+from game import Game  # noqa: E402
+from game_state import GameState  # noqa: E402
+from profiler_phase import ProfilerPhase  # noqa: E402
+
+
+def mark_cost(profiler: FrameProfiler, calls: int = 1_000_000) -> float:
+    """Custo médio de `mark` em nanossegundos."""
+    start = time.perf_counter()
+
+    for _ in range(calls):
+        profiler.mark(ProfilerPhase.SIMULATION)
+
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def frame_cost(screen: pygame.Surface, profiler: FrameProfiler, frames: int) -> float:
+    """Tempo médio de um quadro (update + draw) em microssegundos, com um bot simples."""
+    game = Game(screen, audio=False, seed=0, profiler=profiler)
+    game.start_level()
+    game.flap()
+    profiler.start()
+    start = time.perf_counter()
+
+    for _ in range(frames):
+        simulation = game.level_manager.simulation
+
+        if simulation.state == GameState.GAMEOVER:
+            game.start_level()
+            game.flap()
+        else:
+            player = simulation.player
+            obstacle = min((o for o in simulation.obstacles if o.right > player.x), key=lambda o: o.x)
+
+            if player.y + player.height // 2 > obstacle.center_y + 8 and player.change_y >= 0:
+                game.flap()
+
+        game.update(1 / config.FPS)
+        game.draw()
+        profiler.end_frame()
+
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=5_000)
+    args = parser.parse_args()
+
+    print(f"mark desligado: {mark_cost(FrameProfiler()):8.1f} ns")
+    print(f"mark ligado:    {mark_cost(FrameProfiler(enabled=True)):8.1f} ns")
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+    for name, profiler in [
+        ("sem profiler", FrameProfiler()),
+        ("profiler ligado", FrameProfiler(enabled=True)),
+        ("ligado + gráfico", FrameProfiler(enabled=True, overlay=True)),
+    ]:
+        print(f"quadro ({name}): {frame_cost(screen, profiler, args.frames):8.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark do desenho por retângulos sujos (`Game.draw`).
+
+Roda o mesmo roteiro de partida (IDLE, RUNNING com um bot simples, PAUSED,
+queda até DEAD e reinício) com o desenho completo e com retângulos sujos,
+e mede o tempo de CPU de `Game.draw` por estado. Também verifica que os dois
+modos produzem telas idênticas, pixel a pixel, em todos os quadros.
+
+Uso:
+    python benchmarks/bench_render.py [--frames N] [--seed S]
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+
+import config  # noqa: E402
+from game import Game  # noqa: E402
+from game_state import GameState  # noqa: E402
+from player_state import PlayerState  # noqa: E402
+
+
+def label(game: Game) -> str:
+    """Nome do estado atual usado para agrupar as medições."""
+    state = game.level_manager.state
+
+    if state == GameState.GAMEOVER and game.level_manager.player.state == PlayerState.DEAD:
+        return "GAMEOVER (DEAD)"
+
+    return state.name
+
+
+def run(
+    screen: pygame.Surface, dirty_rects: bool, frames: int, seed: int
+) -> tuple[dict[str, list[float]], list[bytes]]:
+    """
+    Executa o roteiro e retorna os tempos de `draw` por estado e o hash da tela de cada quadro.
+
+    Roteiro (cada fase com `frames` quadros): IDLE, RUNNING, PAUSED, RUNNING sem
+    bater as asas até a morte, GAMEOVER com o pássaro DEAD e um novo IDLE.
+    """
+    game = Game(screen, audio=False, seed=seed, dirty_rects=dirty_rects)
+    game.start_level()
+    dt = 1 / config.FPS
+    timings: dict[str, list[float]] = {}
+    hashes: list[bytes] = []
+
+    def frame(bot: bool = False) -> None:
+        simulation = game.level_manager.simulation
+
+        if bot and simulation.state == GameState.RUNNING:
+            # Bot simples: bate as asas abaixo do centro do próximo vão
+            player = simulation.player
+            obstacle = min((o for o in simulation.obstacles if o.right > player.x), key=lambda o: o.x)
+
+            if player.y + player.height // 2 > obstacle.center_y + 8 and player.change_y >= 0:
+                game.flap()
+
+        game.update(dt)
+        name = label(game)
+        start = time.process_time()
+        game.draw()
+        timings.setdefault(name, []).append(time.process_time() - start)
+        hashes.append(hashlib.blake2b(pygame.image.tobytes(screen, "RGB")).digest())
+
+    for _ in range(frames):
+        frame()
+
+    game.flap()
+    for _ in range(frames):
+        frame(bot=True)
+
+    game.level_manager.simulation.toggle_pause()
+    for _ in range(frames):
+        frame()
+
+    game.level_manager.simulation.toggle_pause()
+    while label(game) != "GAMEOVER (DEAD)":
+        frame()
+
+    for _ in range(frames):
+        frame()
+
+    game.start_level()
+    for _ in range(frames):
+        frame()
+
+    return timings, hashes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+    full, full_hashes = run(screen, False, args.frames, args.seed)
+    dirty, dirty_hashes = run(screen, True, args.frames, args.seed)
+
+    for index, (expected, actual) in enumerate(zip(full_hashes, dirty_hashes)):
+        if expected != actual:
+            raise SystemExit(f"Divergência de pixels no quadro {index}")
+
+    if len(full_hashes) != len(dirty_hashes):
+        raise SystemExit("Os roteiros tiveram números de quadros diferentes")
+
+    print(f"verificação: {len(full_hashes):,} quadros idênticos, pixel a pixel, nos dois modos")
+    print(f"{'estado':>16} {'completo':>12} {'sujos':>12} {'redução':>8}")
+
+    for name in full:
+        full_time = sum(full[name]) / len(full[name]) * 1e6
+        dirty_time = sum(dirty[name]) / len(dirty[name]) * 1e6
+        print(f"{name:>16} {full_time:9.1f} µs {dirty_time:9.1f} µs {full_time / max(dirty_time, 1e-9):7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
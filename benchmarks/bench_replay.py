@@ -0,0 +1,196 @@
+"""
+Verificação e benchmark do registro de sessões e do replay.
+
+1. Grava sessões jogadas por um bot através do `Game.handle_events` (cliques
+   com horário em qualquer ponto do quadro, pausas e reinícios após a morte),
+   com passo fixo, guardando o estado do nível a cada 10 s de jogo.
+2. Salva e relê o registro (`SessionLog`) e mostra o tamanho por minuto.
+3. Reproduz a sessão sem tela (`ReplayPlayer.advance`), verifica que o estado
+   é idêntico ao gravado em cada ponto e mede a velocidade do avanço rápido
+   em relação ao tempo real.
+4. Mede a busca para o minuto `--seek` a partir do passo 0 e a partir dos
+   quadros-chave (no pior caso, o passo anterior ao próximo quadro-chave), e
+   verifica que o estado e a imagem desenhada são iguais aos do replay linear.
+
+Uso:
+    python benchmarks/bench_replay.py [--minutes M] [--seek MINUTE] [--sessions N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+
+import config  # noqa: E402
+from game import Game  # noqa: E402
+from game_state import GameState  # noqa: E402
+from replay_player import ReplayPlayer  # noqa: E402
+from session_log import SessionLog  # noqa: E402
+
+STEP = 1 / 120
+CHECKPOINT = 10.0
+
+
+def bot_events(game: Game, rng: random.Random, frame: int, paused_until: list[int]) -> list[pygame.event.Event]:
+    """
+    Inputs do bot para o quadro `frame` (o intervalo simulado vai de `frame * STEP` a `(frame + 1) * STEP`).
+
+    Bate as asas abaixo do centro do próximo vão (às vezes se distrai e morre),
+    pausa de vez em quando e reinicia após a animação de morte.
+    """
+    simulation = game.level_manager.simulation
+    state = simulation.state
+    click = pygame.MOUSEBUTTONDOWN
+
+    if state == GameState.PAUSED:
+        if frame >= paused_until[0]:
+            return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p)]
+        return []
+
+    if state == GameState.IDLE:
+        return [pygame.event.Event(click, button=1, pos=(0, 0))]
+
+    if state == GameState.GAMEOVER:
+        return [pygame.event.Event(click, button=3, pos=(0, 0))] if simulation.can_restart else []
+
+    if rng.random() < 0.0005:
+        paused_until[0] = frame + rng.randrange(30, 600)
+        return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p)]
+
+    player = simulation.player
+    obstacle = min((o for o in simulation.obstacles if o.right > player.x), key=lambda o: o.x)
+
+    if player.y + player.height // 2 > obstacle.center_y + 8 and player.change_y >= 0 and rng.random() > 0.002:
+        # Clique em um instante qualquer dentro do intervalo deste quadro
+        return [pygame.event.Event(click, button=1, pos=(0, 0), timestamp=(frame + rng.random()) * STEP)]
+
+    return []
+
+
+def record(screen: pygame.Surface, seed: int, frames: int) -> tuple[SessionLog, dict[int, tuple], int]:
+    """
+    Grava uma sessão de `frames` passos.
+
+    Returns:
+        tuple: (registro, estado do nível a cada `CHECKPOINT` segundos e no fim, melhor pontuação).
+    """
+    log = SessionLog(seed, STEP)
+    game = Game(screen, audio=False, seed=seed, session_log=log)
+    game.start_level()
+    rng = random.Random(seed)
+    paused_until = [0]
+    checkpoints = {}
+    best = 0
+    interval = round(CHECKPOINT / STEP)
+
+    for frame in range(frames):
+        game.handle_events(bot_events(game, rng, frame, paused_until))
+        game.update(STEP, (frame + 1) * STEP)
+        best = max(best, game.level_manager.score)
+
+        if game.frame % interval == 0:
+            checkpoints[game.frame] = game.level_manager.snapshot()
+
+    log.frames = game.frame
+    checkpoints[game.frame] = game.level_manager.snapshot()
+    return log, checkpoints, best
+
+
+def compare(player: ReplayPlayer, checkpoints: dict[int, tuple], label: str) -> None:
+    """Interrompe o benchmark se o estado do replay difere do gravado no passo atual."""
+    if player.game.level_manager.snapshot() != checkpoints[player.frame]:
+        raise SystemExit(f"{label}: estado do replay difere da sessão gravada no passo {player.frame}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=float, default=12.0, help="Duração de cada sessão gravada")
+    parser.add_argument("--seek", type=float, default=10.0, help="Minuto de destino da busca")
+    parser.add_argument("--sessions", type=int, default=3)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    frames = round(args.minutes * 60 / STEP)
+    keyframe_frames = round(config.REPLAY_KEYFRAME_INTERVAL / STEP)
+    # Pior caso da busca: o passo anterior a um quadro-chave
+    target = (round(args.seek * 60 / STEP) // keyframe_frames + 1) * keyframe_frames - 1
+
+    for seed in range(args.sessions):
+        log, checkpoints, _ = record(screen, seed, frames)
+        counts = {}
+
+        for _, event, _ in log.events:
+            counts[event.name] = counts.get(event.name, 0) + 1
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "session.fbsl")
+            log.save(path)
+            size = os.path.getsize(path)
+            log = SessionLog.load(path)
+
+        print(
+            f"sessão {seed}: {log.duration / 60:.1f} min, "
+            + ", ".join(f"{count} {name}" for name, count in sorted(counts.items()))
+            + f"; {size} bytes ({size / (log.duration / 60):.0f} bytes/min)"
+        )
+
+        # --- Avanço rápido sem tela, conferindo cada ponto gravado ---
+        player = ReplayPlayer(log, screen)
+        start = time.perf_counter()
+        elapsed = 0.0
+
+        while not player.finished:
+            player.advance(round(CHECKPOINT / STEP))
+            elapsed += time.perf_counter() - start
+            compare(player, checkpoints, f"sessão {seed}")
+            start = time.perf_counter()
+
+        print(
+            f"  avanço rápido: {log.frames / elapsed:,.0f} passos/s = {log.duration / elapsed:.0f}x tempo real; "
+            f"{len(checkpoints)} pontos idênticos à gravação"
+        )
+
+        # --- Busca: do passo 0 e a partir dos quadros-chave ---
+        linear = ReplayPlayer(log, screen, dirty_rects=False)
+        start = time.perf_counter()
+        linear.seek(target)
+        from_start = time.perf_counter() - start
+        expected = linear.game.level_manager.snapshot()
+        linear.game.draw()
+        expected_image = pygame.image.tobytes(screen, "RGB")
+
+        player.seek(0)
+        player.game.dirty_rects = False
+        timings = []
+
+        for origin in [0, target - 1, log.frames, target + 3_000, target]:
+            player.seek(origin)
+            start = time.perf_counter()
+            player.seek(target)
+            timings.append(time.perf_counter() - start)
+
+            if player.game.level_manager.snapshot() != expected:
+                raise SystemExit(f"sessão {seed}: busca a partir do passo {origin} difere do replay linear")
+
+        player.game.draw()
+
+        if pygame.image.tobytes(screen, "RGB") != expected_image:
+            raise SystemExit(f"sessão {seed}: imagem após a busca difere do replay linear")
+
+        print(
+            f"  busca ao minuto {args.seek:g}: {from_start * 1e3:.0f} ms do passo 0, "
+            f"{max(timings) * 1e3:.1f} ms (máx) com quadros-chave a cada {config.REPLAY_KEYFRAME_INTERVAL:g} s; "
+            "estado e imagem idênticos"
+        )
+
+
+if __name__ == "__main__":
+    main()
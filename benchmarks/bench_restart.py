@@ -0,0 +1,104 @@
+"""
+Benchmark de reinícios de partida (recriar tudo x reinício no lugar).
+
+1. Vazão: reinícios por segundo da `Simulation` (objeto novo x `restart()`)
+   e do `LevelManager` com sprites (`create_fresh_level` x `restart_level`).
+2. Memória: executa 100k ciclos (inicia, joga e desenha alguns quadros, reinicia) pelo
+   caminho de reinício no lugar e verifica com `tracemalloc` que a memória
+   alocada não cresce entre o início e o fim.
+
+Uso:
+    python benchmarks/bench_restart.py [--restarts N] [--cycles N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+
+import config  # noqa: E402
+from asset_manager import AssetManager  # noqa: E402
+from course import Course  # noqa: E402
+from level_manager import LevelManager  # noqa: E402
+from simulation import Simulation  # noqa: E402
+
+
+def rate(restart, restarts: int) -> float:
+    """Executa `restart` `restarts` vezes e retorna reinícios por segundo."""
+    start = time.perf_counter()
+
+    for _ in range(restarts):
+        restart()
+
+    return restarts / (time.perf_counter() - start)
+
+
+def memory_growth(level_manager: LevelManager, screen: pygame.Surface, cycles: int) -> int:
+    """Roda `cycles` ciclos de partida curta + reinício e retorna o crescimento da memória (bytes)."""
+    dt = 1 / config.FPS
+    background = level_manager.asset_manager.background_image
+
+    def cycle() -> None:
+        level_manager.simulation.start()
+        level_manager.sprites.add(level_manager.score_display)
+
+        for _ in range(10):
+            level_manager.simulation.update(dt)
+            level_manager.sprites.update(dt)
+            level_manager.simulation.events.clear()
+
+        level_manager.sprites.draw(screen, background)
+
+        level_manager.restart_level()
+
+    # Aquece caches internos (listas, dicionários) antes da primeira medição
+    for _ in range(1_000):
+        cycle()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    for _ in range(cycles):
+        cycle()
+
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--restarts", type=int, default=20_000)
+    parser.add_argument("--cycles", type=int, default=100_000)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    rng = random.Random(0)
+    course = Course(0)
+
+    simulation = Simulation(course)
+    print(f"Simulation() novo:          {rate(lambda: Simulation(course), args.restarts):12,.0f} reinícios/s")
+    print(f"Simulation.restart():       {rate(simulation.restart, args.restarts):12,.0f} reinícios/s")
+
+    level_manager = LevelManager(AssetManager(audio=False, rng=rng), seed=0)
+    level_manager.create_fresh_level()
+    print(f"create_fresh_level():       {rate(level_manager.create_fresh_level, args.restarts):12,.0f} reinícios/s")
+    print(f"restart_level():            {rate(level_manager.restart_level, args.restarts):12,.0f} reinícios/s")
+
+    growth = memory_growth(level_manager, screen, args.cycles)
+    print(f"memória após {args.cycles:,} reinícios: {growth:+,} bytes")
+
+    if growth > 64 * 1024:
+        raise SystemExit("A memória cresceu durante os reinícios")
+
+
+if __name__ == "__main__":
+    main()
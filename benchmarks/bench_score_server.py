@@ -0,0 +1,237 @@
+"""
+Verificação e benchmark do serviço de verificação de pontuação (`ScoreServer`).
+
+1. Grava sessões jogadas por um bot (o mesmo do `bench_replay.py`) e guarda a
+   melhor pontuação de cada uma, medida pelo próprio `Game`.
+2. Sobe o serviço em localhost e confere as respostas: pontuação verdadeira
+   confirmada, pontuação inflada recusada, registro truncado, passo fixo
+   diferente do exigido, batida de asas em um sub-passo inexistente e corpo
+   grande demais rejeitados.
+3. Carga: vários clientes concorrentes (conexões keep-alive) enviam sessões
+   sem parar; mede sessões verificadas por segundo e a latência por
+   requisição. Com 503, o cliente espera um pouco e reenvia.
+4. Sobrecarga: fila pequena e clientes que não reenviam; conta as recusas
+   (503) e mede a latência do `GET /stats` com a fila cheia.
+
+Uso:
+    python benchmarks/bench_score_server.py [--sessions N] [--seconds S] [--requests N] [--workers N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import struct
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+from bench_replay import STEP, record  # noqa: E402
+
+import config  # noqa: E402
+from score_server import ScoreServer  # noqa: E402
+from session_event import SessionEvent  # noqa: E402
+from session_log import SessionLog  # noqa: E402
+
+RETRY_DELAY = 0.05
+"""Espera do cliente após um 503 (o benchmark não respeita o `Retry-After` de 1 s)."""
+
+
+class Client:
+    """Cliente HTTP/1.1 mínimo com keep-alive."""
+
+    def __init__(self, port: int) -> None:
+        self.port = port
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+
+    async def request(self, method: str, target: str, body: bytes = b"") -> tuple[int, dict]:
+        """Envia a requisição e retorna (status, corpo JSON); reconecta se o servidor fechou a conexão."""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection("127.0.0.1", self.port)
+
+        head = f"{method} {target} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n"
+        self.writer.write(head.encode() + body)
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        headers = {}
+
+        while (line := await self.reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode().partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        content = await self.reader.readexactly(int(headers["content-length"]))
+
+        if headers.get("connection") == "close":
+            self.close()
+
+        return status, json.loads(content)
+
+    def close(self) -> None:
+        """Fecha a conexão (a próxima requisição abre outra)."""
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+async def check(port: int, sessions: list[tuple[bytes, int]]) -> None:
+    """Confere as respostas para sessões verdadeiras, infladas e registros inválidos."""
+    client = Client(port)
+
+    for data, best in sessions:
+        status, result = await client.request("POST", f"/verify?score={best}", data)
+
+        if status != 200 or not result["verified"]:
+            raise SystemExit(f"pontuação verdadeira {best} não confirmada: {status} {result}")
+
+        status, result = await client.request("POST", f"/verify?score={best + 1}", data)
+
+        if status != 200 or result["verified"]:
+            raise SystemExit(f"pontuação inflada {best + 1} confirmada: {status} {result}")
+
+    data = sessions[0][0]
+    bad_step = bytearray(data)
+    struct.pack_into("<d", bad_step, SessionLog.HEADER.size - 8, 1 / 60)
+    # Batida no último sub-passo que o formato comporta, além dos que o passo fixo tem
+    forged = SessionLog.decode(data)
+    forged.append(forged.frames, SessionEvent.FLAP_AT, SessionLog.MAX_SUBSTEP)
+    invalid = {
+        "truncado": (data[:-3], 400),
+        "passo fixo diferente": (bytes(bad_step), 400),
+        "sub-passo inexistente": (forged.encode(), 400),
+        "sem pontuação": (data, 400),
+        "grande demais": (bytes(config.SCORE_MAX_LOG_BYTES + 1), 413),
+    }
+
+    for name, (body, expected) in invalid.items():
+        target = "/verify" if name == "sem pontuação" else "/verify?score=1"
+        status, _ = await client.request("POST", target, body)
+
+        if status != expected:
+            raise SystemExit(f"registro {name}: status {status}, esperado {expected}")
+
+    client.close()
+    print(
+        f"{len(sessions)} pontuações verdadeiras confirmadas, {len(sessions)} infladas recusadas, "
+        f"{len(invalid)} registros inválidos rejeitados"
+    )
+
+
+async def load(port: int, sessions: list[tuple[bytes, int]], clients: int, requests: int, retry: bool) -> dict:
+    """
+    `clients` clientes concorrentes enviam `requests` sessões no total.
+
+    Returns:
+        dict: "rate" (verificadas/s), "latencies" (s, das aceitas), "overloaded" (503 recebidos).
+    """
+    remaining = [requests]
+    latencies, overloaded = [], [0]
+
+    async def run(index: int) -> None:
+        client = Client(port)
+        rng = random.Random(index)
+
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            data, best = sessions[rng.randrange(len(sessions))]
+
+            while True:
+                start = time.perf_counter()
+                status, result = await client.request("POST", f"/verify?score={best}", data)
+
+                if status != 503:
+                    break
+
+                overloaded[0] += 1
+
+                if not retry:
+                    break
+
+                await asyncio.sleep(RETRY_DELAY)
+
+            if status == 200:
+                if not result["verified"]:
+                    raise SystemExit(f"sessão verdadeira recusada sob carga: {result}")
+
+                latencies.append(time.perf_counter() - start)
+
+        client.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run(index) for index in range(clients)))
+    elapsed = time.perf_counter() - start
+    return {"rate": len(latencies) / elapsed, "latencies": latencies, "overloaded": overloaded[0]}
+
+
+async def overload(sessions: list[tuple[bytes, int]], workers: int, clients: int) -> None:
+    """Fila pequena e clientes sem reenvio: recusas imediatas e `/stats` responsivo."""
+    server = ScoreServer(port=0, workers=workers, queue_size=4)
+    await server.start()
+
+    stats_latencies = []
+    task = asyncio.create_task(load(server.port, sessions, clients, clients * 4, retry=False))
+    monitor = Client(server.port)
+
+    while not task.done():
+        start = time.perf_counter()
+        await monitor.request("GET", "/stats")
+        stats_latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0.01)
+
+    result = task.result()
+    monitor.close()
+    await server.close()
+    print(
+        f"sobrecarga (fila de 4, {clients} clientes sem reenvio): {result['overloaded']} recusas com 503, "
+        f"{len(result['latencies'])} verificadas; GET /stats com a fila cheia: "
+        f"p50 {np.percentile(stats_latencies, 50) * 1e3:.2f} ms, máx {max(stats_latencies) * 1e3:.2f} ms"
+    )
+
+
+async def main_async(sessions: list[tuple[bytes, int]], workers: int, requests: int) -> None:
+    server = ScoreServer(port=0, workers=workers)
+    await server.start()
+    await check(server.port, sessions)
+    print()
+    print(f"{'clientes':>8} {'verificadas/s':>14} {'p50':>9} {'p99':>9} {'503':>5}   ({server.workers} processos)")
+
+    for clients in [1, 4, 16, 64]:
+        result = await load(server.port, sessions, clients, requests, retry=True)
+        p50, p99 = np.percentile(result["latencies"], [50, 99]) * 1e3
+        print(f"{clients:>8} {result['rate']:>14.1f} {p50:>6.0f} ms {p99:>6.0f} ms {result['overloaded']:>5}")
+
+    await server.close()
+    print()
+    await overload(sessions, server.workers, 64)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=16, help="Sessões gravadas")
+    parser.add_argument("--seconds", type=float, default=60.0, help="Duração de cada sessão")
+    parser.add_argument("--requests", type=int, default=128, help="Sessões enviadas por nível de concorrência")
+    parser.add_argument("--workers", type=int, default=None, help="Processos do servidor (padrão: CPUs)")
+    args = parser.parse_args()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    sessions = []
+
+    for seed in range(args.sessions):
+        log, _, best = record(screen, seed, round(args.seconds / STEP))
+        sessions.append((log.encode(), best))
+
+    pygame.quit()
+    size = sum(len(data) for data, _ in sessions) / len(sessions)
+    print(f"{args.sessions} sessões de {args.seconds:g} s gravadas ({size:.0f} bytes em média)")
+    asyncio.run(main_async(sessions, args.workers, args.requests))
+
+
+if __name__ == "__main__":
+    main()
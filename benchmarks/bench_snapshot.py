@@ -0,0 +1,201 @@
+"""
+Benchmark e verificação do snapshot/restore da `Simulation` (busca em árvore).
+
+1. Custo de `snapshot` e `restore` (voltando à mesma raiz, e com o gerador
+   tendo avançado entre eles), comparado a `copy.deepcopy` da simulação.
+2. Determinismo: a partir de estados variados, joga ramos com ações
+   aleatórias que atravessam reciclagens de obstáculos (o gerador avança),
+   restaura e joga outro ramo; repetir o primeiro ramo dá a mesma trajetória.
+3. Busca: um planejador por rollouts (bater/não bater, profundidade fixa)
+   clona o mundo a cada ramo; mede clones por segundo e a fração do tempo
+   gasta em snapshot/restore.
+
+Uso:
+    python benchmarks/bench_snapshot.py [--iterations N] [--branches N] [--decisions N]
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config  # noqa: E402
+from course import Course  # noqa: E402
+from game_state import GameState  # noqa: E402
+from simulation import Simulation  # noqa: E402
+
+DT = 1 / config.FPS
+
+
+def playing(seed: int, frames: int) -> Simulation:
+    """Uma partida em andamento depois de `frames` quadros com o bot simples (reinicia se morrer)."""
+    simulation = Simulation(Course(seed))
+    simulation.start()
+
+    for _ in range(frames):
+        if simulation.state != GameState.RUNNING:
+            simulation.restart()
+            simulation.start()
+
+        player = simulation.player
+        obstacle = min((o for o in simulation.obstacles if o.right > player.x), key=lambda o: o.x)
+
+        if player.y + player.height // 2 > obstacle.center_y + 8 and player.change_y >= 0:
+            simulation.move_up()
+
+        simulation.update(DT)
+        simulation.events.clear()
+
+    return simulation
+
+
+def branch(simulation: Simulation, actions: list[int]) -> list[tuple]:
+    """Aplica as ações (uma por quadro) e retorna a trajetória (estado, pontos, pássaro e vãos)."""
+    trajectory = []
+
+    for action in actions:
+        if action:
+            simulation.flap()
+
+        simulation.update(DT)
+        simulation.events.clear()
+        player = simulation.player
+        trajectory.append(
+            (simulation.state, simulation.score, player.x, player.y, player.change_y)
+            + tuple((obstacle.x, obstacle.y, obstacle.coin.active) for obstacle in simulation.obstacles)
+        )
+
+    return trajectory
+
+
+def cost(iterations: int) -> None:
+    """Microssegundos por operação."""
+    simulation = playing(0, 600)
+    root = simulation.snapshot()
+    snapshot_cost = timeit.timeit(simulation.snapshot, number=iterations) / iterations
+    restore_cost = timeit.timeit(lambda: simulation.restore(root), number=iterations) / iterations
+
+    # Pior caso: o gerador avançou (obstáculo reciclado) entre o snapshot e o restore
+    other = playing(0, 600)
+    other.obstacles[0].reset()
+
+    def cold() -> None:
+        simulation.restore(other.snapshot())
+        simulation.restore(root)
+
+    cold_cost = timeit.timeit(cold, number=iterations // 10) / (iterations // 10) / 2
+    deepcopy_cost = timeit.timeit(lambda: copy.deepcopy(simulation), number=200) / 200
+
+    print(f"snapshot():                          {snapshot_cost * 1e6:8.2f} µs")
+    print(f"restore() para a mesma raiz:         {restore_cost * 1e6:8.2f} µs")
+    print(f"snapshot/restore com o gerador novo: {cold_cost * 1e6:8.2f} µs (média de um par)")
+    print(f"copy.deepcopy(simulation):           {deepcopy_cost * 1e6:8.2f} µs")
+
+    if snapshot_cost > 5e-6 or restore_cost > 5e-6:
+        print("aviso: acima da meta de 5 µs")
+
+
+def determinism(branches: int) -> None:
+    """Ramos restaurados repetem exatamente a mesma trajetória."""
+    rng = random.Random(1)
+    recycled = 0
+
+    for index in range(branches):
+        simulation = playing(index, rng.randrange(120, 2_400))
+        root = simulation.snapshot()
+        actions = [int(rng.random() < 0.08) for _ in range(rng.randrange(60, 480))]
+        other = [int(rng.random() < 0.08) for _ in range(len(actions))]
+        gaps = [obstacle.y for obstacle in simulation.obstacles]
+
+        first = branch(simulation, actions)
+        recycled += [obstacle.y for obstacle in simulation.obstacles] != gaps
+        simulation.restore(root)
+        branch(simulation, other)
+        simulation.restore(root)
+
+        if branch(simulation, actions) != first:
+            raise SystemExit(f"ramo {index}: a trajetória restaurada difere da original")
+
+        simulation.restore(root)
+
+        if simulation.snapshot() != root:
+            raise SystemExit(f"ramo {index}: o estado restaurado difere da raiz")
+
+    print(f"{branches} ramos repetidos de forma idêntica ({recycled} com obstáculos reciclados no ramo)")
+
+
+def rollout_search(decisions: int, rollouts: int = 16, depth: int = 90) -> None:
+    """Planejador por rollouts: para cada ação, `rollouts` continuações aleatórias a partir de um clone."""
+    simulation = playing(2, 120)
+    rng = random.Random(2)
+    clone_time, clones = 0.0, 0
+    start = time.perf_counter()
+
+    for _ in range(decisions):
+        if simulation.state != GameState.RUNNING:
+            simulation.restart()
+            simulation.start()
+
+        tick = time.perf_counter()
+        root = simulation.snapshot()
+        clone_time += time.perf_counter() - tick
+        clones += 1
+        survival = [0, 0]
+
+        for action in (0, 1):
+            for _ in range(rollouts):
+                tick = time.perf_counter()
+                simulation.restore(root)
+                clone_time += time.perf_counter() - tick
+                clones += 1
+
+                if action:
+                    simulation.flap()
+
+                for step in range(depth):
+                    simulation.update(DT)
+
+                    if simulation.state != GameState.RUNNING:
+                        break
+
+                    if rng.random() < 0.08:
+                        simulation.move_up()
+
+                survival[action] += step
+                simulation.events.clear()
+
+        simulation.restore(root)
+
+        if survival[1] > survival[0]:
+            simulation.flap()
+
+        simulation.update(DT)
+        simulation.events.clear()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"busca por rollouts: {decisions} decisões, {clones / elapsed:,.0f} clones/s, "
+        f"{clone_time / elapsed:.1%} do tempo em snapshot/restore "
+        f"({clone_time / clones * 1e6:.2f} µs por clone)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200_000)
+    parser.add_argument("--branches", type=int, default=200)
+    parser.add_argument("--decisions", type=int, default=240)
+    args = parser.parse_args()
+
+    cost(args.iterations)
+    determinism(args.branches)
+    rollout_search(args.decisions)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark do tempo de carregamento dos ativos (`AssetManager`).
+
+Cada medição roda em um processo novo (como uma inicialização real do jogo)
+e cronometra a criação do `AssetManager` com áudio ligado:
+
+- original: sem atlas, decodificando os PNGs/OGGs originais a cada execução;
+- atlas (frio): atlas gerado, cache em disco vazio (primeira execução, grava o cache);
+- atlas (quente): atlas e cache em disco prontos (execuções seguintes).
+
+O atlas e o cache são gerados em um diretório temporário; os do projeto não são tocados.
+
+Uso:
+    python benchmarks/bench_startup.py [--runs N]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+
+import config  # noqa: E402
+from asset_cache import AssetCache  # noqa: E402
+from asset_manager import AssetManager  # noqa: E402
+from atlas_builder import AtlasBuilder  # noqa: E402
+
+
+def child(atlas_index: str, cache_path: str, seed: int) -> None:
+    """Processo filho: inicializa o Pygame e imprime o tempo de criação do `AssetManager`."""
+    pygame.mixer.pre_init(channels=config.MIXER_CHANNELS)
+    pygame.init()
+    pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+    start = time.perf_counter()
+    AssetManager(True, random.Random(seed), AssetCache(atlas_index, cache_path))
+    print(time.perf_counter() - start)
+
+
+def measure(atlas_index: str, cache_path: str, seed: int) -> float:
+    """Roda um processo filho e retorna o tempo medido (segundos)."""
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", atlas_index, cache_path, str(seed)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--child", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        atlas_index, cache_path, seed = args.child
+        child(atlas_index, cache_path, int(seed))
+        return
+
+    directory = tempfile.mkdtemp()
+
+    try:
+        atlas_index = os.path.join(directory, "atlas", "atlas.json")
+        cache_path = os.path.join(directory, "cache")
+        AtlasBuilder().build(os.path.join(directory, "atlas", "atlas.png"), atlas_index)
+
+        missing_index = os.path.join(directory, "missing.json")
+        original = [measure(missing_index, cache_path, seed) for seed in range(args.runs)]
+
+        cold = []
+        for seed in range(args.runs):
+            shutil.rmtree(cache_path, ignore_errors=True)
+            cold.append(measure(atlas_index, cache_path, seed))
+
+        warm = [measure(atlas_index, cache_path, seed) for seed in range(args.runs)]
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"{'modo':>16} {'1ª execução':>12} {'mediana':>10}")
+    for name, times in [("original", original), ("atlas (frio)", cold), ("atlas (quente)", warm)]:
+        print(f"{name:>16} {times[0] * 1e3:9.2f} ms {statistics.median(times) * 1e3:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Verificação e benchmark da colisão por varredura com passos grandes.
+
+1. Colisões perdidas: a partir de estados reais de partida, avança um único
+   passo grande (como após um travamento da janela) e compara com uma
+   referência simulada em sub-passos de 1/960 s. Conta as batidas e moedas que
+   a referência encontra e o passo grande perde, com e sem varredura (sem
+   varredura = teste apenas na posição final, como antes).
+2. Vazão: segundos de jogo simulados por segundo de relógio na `BatchSimulation`
+   com sub-passos de 1/240 s e com um único passo grande por `step`.
+
+Uso:
+    python benchmarks/bench_sweep.py [--states N] [--worlds N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config  # noqa: E402
+from batch_simulation import BatchSimulation  # noqa: E402
+from course import Course  # noqa: E402
+from game_state import GameState  # noqa: E402
+from simulation import Simulation  # noqa: E402
+
+STEPS = [1 / 60, 1 / 30, 1 / 15, 0.1, 0.25]
+
+
+class EndOnlySimulation(Simulation):
+    """Simulação sem varredura: colisão testada apenas na posição final de cada passo."""
+
+    def find_collision(self, path=None, scroll=0.0):
+        return super().find_collision()
+
+
+def bot(simulation: Simulation) -> None:
+    """Bate as asas quando o pássaro está abaixo do centro do próximo vão e caindo."""
+    player = simulation.player
+    obstacle = min((o for o in simulation.obstacles if o.right > player.x), key=lambda o: o.x)
+
+    if player.y + player.height // 2 > obstacle.center_y + 8 and player.change_y >= 0:
+        simulation.move_up()
+
+
+def prepare(cls: type[Simulation], seed: int, frames: int) -> Simulation | None:
+    """Joga `frames` quadros a 120 Hz com o bot (None se a partida acabou antes)."""
+    simulation = cls(Course(seed))
+    simulation.start()
+
+    for _ in range(frames):
+        bot(simulation)
+        simulation.update(1 / config.FPS)
+
+        if simulation.state != GameState.RUNNING:
+            return None
+
+    # Um último input aleatório antes do passo grande
+    if seed % 2:
+        simulation.move_up()
+
+    return simulation
+
+
+def outcome(simulation: Simulation, dt: float, max_step: float | None, max_substeps: int) -> tuple[bool, int]:
+    """Avança um passo `dt` e retorna (bateu, moedas coletadas)."""
+    score = simulation.score
+    simulation.max_step, simulation.max_substeps = max_step, max_substeps
+    simulation.update(dt)
+    return simulation.state == GameState.GAMEOVER, simulation.score - score
+
+
+def missed_collisions(states: int) -> None:
+    """Compara passos grandes (com e sem varredura) com a referência em sub-passos finos."""
+    rng = random.Random(0)
+    print(f"{'passo':>8} {'estados':>8} {'batidas':>8} {'moedas':>7}   perdidas (sem varredura / com varredura)")
+
+    for dt in STEPS:
+        counts = {"hits": 0, "coins": 0, "end_only": [0, 0], "swept": [0, 0]}
+        tested = 0
+
+        while tested < states:
+            seed, frames = rng.randrange(1_000_000), rng.randrange(60, 1_200)
+            reference = prepare(Simulation, seed, frames)
+
+            if reference is None:
+                continue
+
+            tested += 1
+            hit, coins = outcome(reference, dt, 1 / 960, 1_000)
+            counts["hits"] += hit
+            counts["coins"] += coins
+
+            for name, cls in [("end_only", EndOnlySimulation), ("swept", Simulation)]:
+                coarse_hit, coarse_coins = outcome(prepare(cls, seed, frames), dt, None, 1)
+                counts[name][0] += hit and not coarse_hit
+                counts[name][1] += max(0, coins - coarse_coins)
+
+        end_only, swept = counts["end_only"], counts["swept"]
+        print(
+            f"{dt * 1000:6.1f}ms {tested:8} {counts['hits']:8} {counts['coins']:7}"
+            f"   batidas {end_only[0]:4} / {swept[0]:<4} moedas {end_only[1]:4} / {swept[1]:<4}"
+        )
+
+
+def throughput(worlds: int, dt: float, max_step: float | None, seconds: float = 2.0) -> float:
+    """Segundos de jogo simulados por segundo de relógio (somando todos os mundos)."""
+    batch = BatchSimulation(worlds, dt=dt, seed=0, max_step=max_step)
+    observations = batch.reset()
+    steps = 0
+    start = time.perf_counter()
+
+    while time.perf_counter() - start < seconds:
+        actions = (observations[:, 0] > observations[:, 3] + 8) & (observations[:, 1] >= 0)
+        observations, _, _ = batch.step(actions)
+        steps += 1
+
+    return steps * worlds * dt / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--states", type=int, default=300, help="Estados testados por tamanho de passo")
+    parser.add_argument("--worlds", type=int, default=4_096)
+    args = parser.parse_args()
+
+    missed_collisions(args.states)
+    print()
+
+    fine = throughput(args.worlds, 1 / config.FPS, config.SIMULATION_MAX_STEP)
+    print(f"BatchSimulation, sub-passos de 1/240 s: {fine:12,.0f} s de jogo/s")
+
+    for dt in [1 / 30, 1 / 15]:
+        coarse = throughput(args.worlds, dt, None)
+        print(
+            f"BatchSimulation, passo único de {dt * 1000:4.1f} ms: {coarse:12,.0f} s de jogo/s ({coarse / fine:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
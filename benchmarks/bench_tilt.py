@@ -0,0 +1,214 @@
+"""
+Verificação e benchmark da inclinação do pássaro (`RotationCache`).
+
+1. Carregamento: tempo para girar todos os quadros em todos os ângulos (o
+   que o jogo faz aos poucos, no primeiro uso de cada ângulo), e o
+   `AssetManager` com e sem inclinação.
+2. Correção: o mesmo roteiro de partida com e sem inclinação tem exatamente a
+   mesma simulação (a inclinação é só visual, a hitbox não muda), a imagem
+   inclinada acompanha o corpo em todos os quadros, e o desenho por
+   retângulos sujos continua idêntico ao completo, pixel a pixel.
+3. Custo por quadro (`Game.update` + `Game.draw`, retângulos sujos e desenho
+   completo) com e sem inclinação, e o custo de girar a imagem a cada quadro
+   (`pygame.transform.rotate`/`rotozoom`) que o cache evita.
+
+Uso:
+    python benchmarks/bench_tilt.py [--frames N] [--repeat N] [--seed S]
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+import config  # noqa: E402
+from asset_manager import AssetManager  # noqa: E402
+from game import Game  # noqa: E402
+from game_state import GameState  # noqa: E402
+from player import Player  # noqa: E402
+from player_state import PlayerState  # noqa: E402
+from rotation_cache import RotationCache  # noqa: E402
+
+
+def loading(repeat: int) -> None:
+    """Tempo de pré-renderização e de carregamento do `AssetManager`."""
+    assets = AssetManager(audio=False, rng=random.Random(0), tilt=False)
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rotations = RotationCache(assets.player_images)
+        rotations.render()
+        times.append(time.perf_counter() - start)
+
+    surfaces = len({id(surface) for frame in rotations.frames for surface, _ in frame})
+
+    print(
+        f"RotationCache: {surfaces} superfícies ({len(rotations.angles)} ângulos de {rotations.angles[0]}° a "
+        f"{rotations.angles[-1]}°) em {np.median(times) * 1e3:.2f} ms"
+    )
+
+    for tilt in (False, True):
+        times = []
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            AssetManager(audio=False, rng=random.Random(0), tilt=tilt)
+            times.append(time.perf_counter() - start)
+
+        print(f"AssetManager {'com' if tilt else 'sem'} inclinação: {np.median(times) * 1e3:.2f} ms")
+
+
+def run(screen: pygame.Surface, tilt: bool, dirty_rects: bool, frames: int, seed: int) -> dict:
+    """
+    Joga o roteiro (IDLE, RUNNING com um bot simples, queda até DEAD) e mede cada quadro.
+
+    Returns:
+        dict: Tempos de `update` e `draw` por quadro, o estado da simulação e o hash da tela de cada quadro.
+    """
+    game = Game(screen, audio=False, seed=seed, dirty_rects=dirty_rects)
+
+    if not tilt:
+        # O nível é criado no primeiro `start_level`, a partir dos ativos já carregados
+        game.asset_manager.player_rotations = None
+
+    game.start_level()
+    player = game.level_manager.player
+    dt = 1 / config.FPS
+    result = {"update": [], "draw": [], "states": [], "hashes": []}
+
+    def frame(bot: bool = False) -> None:
+        simulation = game.level_manager.simulation
+        body = simulation.player
+
+        if bot and simulation.state == GameState.RUNNING:
+            # Bot simples: bate as asas abaixo do centro do próximo vão
+            obstacle = min((o for o in simulation.obstacles if o.right > body.x), key=lambda o: o.x)
+
+            if body.y + body.height // 2 > obstacle.center_y + 8 and body.change_y >= 0:
+                game.flap()
+
+        start = time.process_time()
+        game.update(dt)
+        middle = time.process_time()
+        game.draw()
+        end = time.process_time()
+        result["update"].append(middle - start)
+        result["draw"].append(end - middle)
+        result["states"].append((body.y, body.change_y, body.state, simulation.state, simulation.score))
+        result["hashes"].append(hashlib.blake2b(pygame.image.tobytes(screen, "RGB")).digest())
+
+        # A imagem (inclinada ou não) acompanha o corpo, com o deslocamento do seu ângulo
+        if (player.rect.x - player.offset[0], player.rect.y - player.offset[1]) != (body.left, body.top):
+            raise SystemExit(f"quadro {len(result['draw'])}: imagem fora da posição do corpo")
+
+    for _ in range(frames):
+        frame()
+
+    game.flap()
+    for _ in range(frames * 4):
+        frame(bot=True)
+
+    # Para de bater as asas: queda até DEAD
+    while not (game.level_manager.state == GameState.GAMEOVER and player.state == PlayerState.DEAD):
+        frame()
+
+    for _ in range(frames):
+        frame()
+
+    return result
+
+
+def per_frame(screen: pygame.Surface, frames: int, repeat: int, seed: int) -> None:
+    """Custo por quadro com e sem inclinação, nos dois modos de desenho."""
+    runs: dict[tuple[bool, bool], list[dict]] = {}
+
+    # Alterna as configurações a cada repetição (o ruído da máquina afeta todas igualmente)
+    for _ in range(repeat):
+        for dirty_rects in (True, False):
+            for tilt in (False, True):
+                runs.setdefault((dirty_rects, tilt), []).append(run(screen, tilt, dirty_rects, frames, seed))
+
+    for dirty_rects in (True, False):
+        plain, tilted = runs[(dirty_rects, False)][0], runs[(dirty_rects, True)][0]
+
+        if plain["states"] != tilted["states"]:
+            raise SystemExit("a inclinação mudou a simulação")
+
+    for tilt in (False, True):
+        dirty, full = runs[(True, tilt)][0]["hashes"], runs[(False, tilt)][0]["hashes"]
+
+        if dirty != full:
+            raise SystemExit(f"{'com' if tilt else 'sem'} inclinação: retângulos sujos diferem do desenho completo")
+
+    count = len(runs[(True, True)][0]["states"])
+    print(
+        f"{count} quadros: simulação idêntica com e sem inclinação, imagem na posição do corpo, "
+        "retângulos sujos idênticos ao desenho completo"
+    )
+    print(f"{'desenho':>8} {'inclinação':>11} {'update':>10} {'draw':>10} {'total':>10}")
+
+    for dirty_rects in (True, False):
+        for tilt in (False, True):
+            # Mediana por quadro, depois a menor entre as repetições
+            update = min(np.median(result["update"]) for result in runs[(dirty_rects, tilt)]) * 1e6
+            draw = min(np.median(result["draw"]) for result in runs[(dirty_rects, tilt)]) * 1e6
+            print(
+                f"{'sujos' if dirty_rects else 'completo':>8} {'sim' if tilt else 'não':>11} "
+                f"{update:7.1f} µs {draw:7.1f} µs {update + draw:7.1f} µs"
+            )
+
+
+def rotation_cost(repeat: int) -> None:
+    """Custo de girar a imagem a cada quadro contra escolher a superfície pré-renderizada."""
+    assets = AssetManager(audio=False, rng=random.Random(0))
+    image = assets.player_images[0]
+    rotations = assets.player_rotations
+    angles = [Player.tilt(change_y) for change_y in np.linspace(-config.PLAYER_IMPULSE, 600, 1_000).tolist()]
+
+    for name, function in [
+        ("pygame.transform.rotate", lambda angle: pygame.transform.rotate(image, angle)),
+        ("pygame.transform.rotozoom", lambda angle: pygame.transform.rotozoom(image, angle, 1)),
+        ("RotationCache", lambda angle: rotations.frame(0, angle)),
+    ]:
+        times = []
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+
+            for angle in angles:
+                function(angle)
+
+            times.append((time.perf_counter() - start) / len(angles))
+
+        print(f"{name:<26} {np.median(times) * 1e6:6.2f} µs por quadro")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=120, help="Quadros de cada fase do roteiro")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+    loading(args.repeat)
+    print()
+    per_frame(screen, args.frames, args.repeat, args.seed)
+    print()
+    rotation_cost(args.repeat)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark de escalabilidade do `ProcessVectorEnv`.
+
+Mede a vazão total (passos de ambiente por segundo) aumentando o número
+de processos trabalhadores de 1 até o número de núcleos da máquina, com um
+número fixo de ambientes por processo.
+
+Uso:
+    python benchmarks/bench_vector_env.py [--envs-per-worker N] [--steps N] [--max-workers N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from process_vector_env import ProcessVectorEnv  # noqa: E402
+
+
+def run(workers: int, envs_per_worker: int, steps: int) -> float:
+    """Executa `steps` passos vetorizados e retorna passos de ambiente por segundo."""
+    env = ProcessVectorEnv(workers, envs_per_worker)
+    observations = env.reset(seed=0)
+    start = time.perf_counter()
+
+    for _ in range(steps):
+        # Mesmo bot simples do bench_env: bate as asas abaixo do centro do vão
+        actions = (observations[:, 0] > observations[:, 3] + 8) & (observations[:, 1] >= 0)
+        observations, _, _ = env.step(actions)
+
+    elapsed = time.perf_counter() - start
+    env.close()
+    return steps * env.size / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--envs-per-worker", type=int, default=8)
+    parser.add_argument("--steps", type=int, default=2_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    single = None
+
+    for workers in range(1, args.max_workers + 1):
+        throughput = run(workers, args.envs_per_worker, args.steps)
+        single = single or throughput
+        print(f"workers={workers:3d}: {throughput:12,.0f} passos/s ({throughput / single:5.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Suíte de benchmarks do loop do jogo, com comparação contra uma linha de base.
+
+Roda sem janela (driver de vídeo `dummy`) e com inputs roteirizados (bot
+simples), medindo:
+
+- update:       `Game.update` em RUNNING (passos/s);
+- draw:         `Game.draw` com desenho completo e com retângulos sujos (quadros/s);
+- collision:    `Simulation.find_collision` (µs por quadro);
+- restart:      `LevelManager.create_fresh_level` e `restart_level` (µs);
+- assets:       criação do `AssetManager` (ms);
+- score_display: `ScoreDisplay.set` para pontuações de 1 a 6 dígitos (µs).
+
+Os resultados são gravados em JSON e comparados com `benchmarks/baseline.json`:
+uma métrica piora além do limite (`--threshold`, fração) faz o script sair
+com erro. Cada métrica é a melhor de `--repeat` rodadas (a menos afetada por
+ruído de outros processos da máquina).
+
+Uso:
+    python benchmarks/suite.py [--output results.json] [--threshold 0.25]
+    python benchmarks/suite.py --update-baseline
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+
+import config  # noqa: E402
+from asset_manager import AssetManager  # noqa: E402
+from game import Game  # noqa: E402
+from game_state import GameState  # noqa: E402
+from level_manager import LevelManager  # noqa: E402
+from score_display import ScoreDisplay  # noqa: E402
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+HIGHER_IS_BETTER = {"steps_per_second", "frames_per_second"}
+"""Unidades em que um valor maior é melhor (nas demais, menor é melhor)."""
+
+
+def bot(game: Game) -> None:
+    """Input roteirizado: reinicia ao morrer e bate as asas abaixo do centro do próximo vão."""
+    simulation = game.level_manager.simulation
+
+    if simulation.state != GameState.RUNNING:
+        game.start_level()
+        game.flap()
+        return
+
+    player = simulation.player
+    obstacle = min((o for o in simulation.obstacles if o.right > player.x), key=lambda o: o.x)
+
+    if player.y + player.height // 2 > obstacle.center_y + 8 and player.change_y >= 0:
+        game.flap()
+
+
+def bench_update(screen: pygame.Surface, frames: int) -> float:
+    """Passos de `Game.update` por segundo em RUNNING (sem desenho)."""
+    game = Game(screen, audio=False, seed=0)
+    game.start_level()
+    elapsed = 0.0
+
+    for _ in range(frames):
+        bot(game)
+        start = time.perf_counter()
+        game.update(1 / config.FPS)
+        elapsed += time.perf_counter() - start
+
+    return frames / elapsed
+
+
+def bench_draw(screen: pygame.Surface, frames: int, dirty_rects: bool) -> float:
+    """Quadros de `Game.draw` por segundo durante uma partida (driver `dummy`)."""
+    game = Game(screen, audio=False, seed=0, dirty_rects=dirty_rects)
+    game.start_level()
+    elapsed = 0.0
+
+    for _ in range(frames):
+        bot(game)
+        game.update(1 / config.FPS)
+        start = time.perf_counter()
+        game.draw()
+        elapsed += time.perf_counter() - start
+
+    return frames / elapsed
+
+
+def bench_collision(screen: pygame.Surface, frames: int) -> float:
+    """Custo de `Simulation.find_collision` por quadro (µs), sobre estados reais de partida."""
+    game = Game(screen, audio=False, seed=0)
+    game.start_level()
+    elapsed = 0.0
+
+    for _ in range(frames):
+        bot(game)
+        game.update(1 / config.FPS)
+        simulation = game.level_manager.simulation
+        start = time.perf_counter()
+
+        for _ in range(10):
+            simulation.find_collision()
+
+        elapsed += time.perf_counter() - start
+
+    return elapsed / (frames * 10) * 1e6
+
+
+def bench_restart(level_manager: LevelManager, restart, count: int) -> float:
+    """Latência média de um reinício de nível (µs)."""
+    level_manager.create_fresh_level()
+    start = time.perf_counter()
+
+    for _ in range(count):
+        restart()
+
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def bench_assets(count: int) -> float:
+    """Tempo de criação do `AssetManager` (ms), sem áudio e com o cache padrão."""
+    start = time.perf_counter()
+
+    for seed in range(count):
+        AssetManager(audio=False, rng=random.Random(seed))
+
+    return (time.perf_counter() - start) / count * 1e3
+
+
+def bench_score_display(images: list[pygame.Surface], digits: int, count: int) -> float:
+    """Custo de `ScoreDisplay.set` (µs) para pontuações com `digits` dígitos."""
+    score_display = ScoreDisplay(images)
+    low = 10 ** (digits - 1) if digits > 1 else 0
+    scores = [str(low + i % (10**digits - low)) for i in range(count)]
+    start = time.perf_counter()
+
+    for score in scores:
+        score_display.set(score)
+
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def run(frames: int) -> dict[str, dict]:
+    """Executa uma rodada de todas as métricas; retorna nome -> {"value", "unit"}."""
+    screen = pygame.display.get_surface()
+    level_manager = LevelManager(AssetManager(audio=False, rng=random.Random(0)), seed=0)
+    images = level_manager.asset_manager.score_display_images
+
+    results = {
+        "update": (bench_update(screen, frames), "steps_per_second"),
+        "draw_full": (bench_draw(screen, frames, False), "frames_per_second"),
+        "draw_dirty_rects": (bench_draw(screen, frames, True), "frames_per_second"),
+        "collision": (bench_collision(screen, frames), "us_per_frame"),
+        "create_fresh_level": (bench_restart(level_manager, level_manager.create_fresh_level, 2_000), "us"),
+        "restart_level": (bench_restart(level_manager, level_manager.restart_level, 2_000), "us"),
+        "asset_manager": (bench_assets(20), "ms"),
+    }
+
+    for digits in range(1, 7):
+        results[f"score_display_{digits}_digits"] = (bench_score_display(images, digits, 5_000), "us")
+
+    return {name: {"value": value, "unit": unit} for name, (value, unit) in results.items()}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Compara os resultados com a linha de base.
+
+    Returns:
+        list[str]: Métricas que pioraram além do limite (vazia = sem regressões).
+    """
+    regressions = []
+    print(f"{'métrica':>26} {'base':>12} {'atual':>12} {'variação':>9}")
+
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:>26} {'-':>12} {result['value']:12.2f}   (nova)")
+            continue
+
+        base, value = baseline[name]["value"], result["value"]
+        # Variação positiva = melhora, qualquer que seja a unidade
+        change = (value - base) / base if result["unit"] in HIGHER_IS_BETTER else (base - value) / base
+        flag = "  REGRESSÃO" if change < -threshold else ""
+        print(f"{name:>26} {base:12.2f} {value:12.2f} {change:+8.1%}{flag}")
+
+        if flag:
+            regressions.append(name)
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=3_000, help="Quadros por medição de update/draw/colisão")
+    parser.add_argument("--repeat", type=int, default=5, help="Rodadas (vale a melhor)")
+    parser.add_argument("--output", default=None, help="Arquivo JSON onde os resultados são gravados")
+    parser.add_argument("--baseline", default=BASELINE, help="Linha de base para comparação")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Piora máxima tolerada (fração)")
+    parser.add_argument("--update-baseline", action="store_true", help="Grava os resultados como nova linha de base")
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+    rounds = [run(args.frames) for _ in range(args.repeat)]
+    results = {}
+
+    for name, first in rounds[0].items():
+        best = max if first["unit"] in HIGHER_IS_BETTER else min
+        results[name] = {"value": best(r[name]["value"] for r in rounds), "unit": first["unit"]}
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=2)
+            file.write("\n")
+
+        print(f"linha de base gravada em {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        raise SystemExit(f"Linha de base não encontrada: {args.baseline} (use --update-baseline)")
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+
+    regressions = compare(results, baseline, args.threshold)
+
+    if regressions:
+        raise SystemExit(f"Regressões acima de {args.threshold:.0%}: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
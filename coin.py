@@ -1,65 +1,47 @@
 import pygame
 
 import config
+from coin_body import CoinBody
 
 
-class Coin(pygame.sprite.Sprite):
+class Coin(pygame.sprite.DirtySprite):
     """
-    Representa uma moeda colecionável com animação de rotação e efeito de flutuação.
+    Representa visualmente uma moeda colecionável com animação de rotação.
 
-    A moeda se posiciona relativamente a um retângulo pai (geralmente os canos)
-    e oscila verticalmente para dar dinamismo visual.
+    A posição (incluindo o efeito de flutuação) e a hitbox vivem em
+    `CoinBody`. Este sprite apenas acompanha o corpo e gira a moeda.
 
     Attributes:
         _layer (int): 9. Renderizada acima da maioria dos elementos.
-        vertical_offset (int): Deslocamento atual para o efeito de "flutuar".
+        body (CoinBody): O estado físico da moeda na simulação.
+        dirty (int): 1 quando a imagem ou a posição mudou desde o último desenho.
     """
 
-    def __init__(self, parent_rect: pygame.Rect, coin_images: list[pygame.Surface]) -> None:
+    def __init__(self, body: CoinBody, coin_images: list[pygame.Surface]) -> None:
         """
-        Inicializa a moeda vinculada a uma posição pai.
+        Inicializa o sprite da moeda.
 
         Args:
-            parent_rect (pygame.rect.Rect): Referência para centralizar a moeda (ex: meio dos canos).
+            body (CoinBody): Estado físico que o sprite acompanha.
             coin_images (list): Lista de superfícies para a animação de rotação.
         """
         super().__init__()
         self._layer = 9
-        self.parent_rect = parent_rect
+        self.body = body
         self.images = coin_images
+        self.rect = self.images[0].get_rect()
+        self.reset()
 
-        # Estado da animação
+    def reset(self) -> None:
+        """Volta ao primeiro quadro da animação e à posição do corpo (reinício no lugar)."""
         self.image_index = 0
         self.image = self.images[self.image_index]
         self.animation_step = config.COIN_ANIMATION_STEP
 
         # Posicionamento
-        self.rect = self.image.get_rect()
-        self.rect.centerx = parent_rect.centerx
-        self.rect.centery = parent_rect.centery
-
-        # Configuração do efeito de "Flutuar" (Bobbing)
-        self.movement_step = config.COIN_MOVEMENT_STEP
-        self.vertical_offset = 0
-        self.vertical_direction = 1
-        self.vertical_offset_max = 5
-
-        # --- Configuração da Máscara de Colisão (Hitbox) ---
-        # Cria uma superfície vazia do tamanho da moeda
-        mask = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-
-        # Desenha um círculo branco no centro para representar a moeda
-        # Isso cria uma colisão mais "justa" que ignora os cantos do sprite
-        mask_center = (self.rect.width // 2, self.rect.height // 2)
-        mask_radius = min(self.rect.width, self.rect.height) // 3
-        pygame.draw.circle(mask, (255, 255, 255), mask_center, mask_radius)
-
-        # Converte a superfície desenhada em uma máscara de bits para colisão pixel-perfect
-        self.mask = pygame.mask.from_surface(mask)
-
-    def reset(self, dt: float) -> None:
-        """Reinicia a posição da moeda baseada no pai."""
-        self.handle_movement(dt)
+        self.rect.size = self.image.get_size()
+        self.rect.topleft = (self.body.left, self.body.top)
+        self.dirty = 1
 
     def handle_animation(self, dt: float) -> None:
         """
@@ -79,33 +61,19 @@ class Coin(pygame.sprite.Sprite):
             self.rect.size = self.image.get_size()
             self.rect.center = rect_center
             self.animation_step = config.COIN_ANIMATION_STEP
+            self.dirty = 1
         else:
             self.animation_step -= dt
 
-    def handle_movement(self, dt: float) -> None:
-        """
-        Sincroniza a moeda com o pai (eixo X) e aplica o efeito de flutuação (eixo Y).
-
-        A moeda oscila para cima e para baixo (vertical_offset) dentro de um
-        limite máximo (vertical_offset_max).
-        """
-        # Sincronia horizontal com o objeto pai (ex: canos se movendo)
-        self.rect.centerx = self.parent_rect.centerx
-
-        # Lógica de oscilação vertical (Bobbing)
-        if self.movement_step < 0:
-            self.vertical_offset += self.vertical_direction
-
-            if abs(self.vertical_offset) >= self.vertical_offset_max:
-                self.vertical_direction *= -1
-
-            self.movement_step = config.COIN_MOVEMENT_STEP
-        else:
-            self.movement_step -= dt
+    def handle_movement(self) -> None:
+        """Sincroniza o retângulo do sprite com a posição do corpo na simulação."""
+        position = (self.body.left, self.body.top)
 
-        self.rect.centery = self.parent_rect.centery + self.vertical_offset
+        if self.rect.topleft != position:
+            self.rect.topleft = position
+            self.dirty = 1
 
     def update(self, dt: float) -> None:
-        """Atualiza a lógica de movimento e animação a cada frame."""
-        self.handle_movement(dt)
+        """Atualiza a posição e a animação a cada frame."""
+        self.handle_movement()
         self.handle_animation(dt)
@@ -0,0 +1,86 @@
+import config
+from hitbox import Hitbox
+from pixel import pixel
+
+
+class CoinBody:
+    """
+    Estado físico de uma moeda: posição, oscilação vertical e se ainda pode ser coletada.
+
+    A posição segue o obstáculo pai (`ObstacleBody`), exatamente como a
+    moeda original seguia o retângulo pai.
+
+    Attributes:
+        hitbox (Hitbox): Hitbox circular compartilhada por todas as moedas.
+        active (bool): False depois de coletada, até o obstáculo ser reciclado.
+        x (float): Posição horizontal (esquerda) da moeda, com precisão sub-pixel.
+        y (int): Posição vertical (topo) da moeda, incluindo a oscilação.
+        vertical_offset (int): Deslocamento atual do efeito de "flutuar".
+    """
+
+    hitbox = Hitbox.circle(config.COIN_TILE_SIZE, config.COIN_TILE_SIZE, config.COIN_TILE_SIZE // 3)
+
+    def __init__(self, parent) -> None:
+        """
+        Centraliza a moeda no obstáculo pai.
+
+        Args:
+            parent (ObstacleBody): Obstáculo ao qual a moeda pertence.
+        """
+        self.parent = parent
+        self.width = config.COIN_TILE_SIZE
+        self.height = config.COIN_TILE_SIZE
+        self.vertical_offset_max = 5
+        self.restart()
+
+    def restart(self) -> None:
+        """Volta ao estado inicial, centralizada no pai (reinício sem alocar uma moeda nova)."""
+        self.active = True
+
+        # Configuração do efeito de "Flutuar" (Bobbing)
+        self.movement_step = config.COIN_MOVEMENT_STEP
+        self.vertical_offset = 0
+        self.vertical_direction = 1
+
+        self.x = self.parent.center_x - self.width // 2
+        self.y = self.parent.center_y - self.height // 2
+
+    @property
+    def left(self) -> int:
+        """Esquerda do retângulo inteiro da moeda (desenho e colisão)."""
+        return pixel(self.x)
+
+    @property
+    def top(self) -> int:
+        """Topo do retângulo inteiro da moeda (desenho e colisão)."""
+        return self.y
+
+    def reset(self) -> None:
+        """Reativa a moeda e a realinha com o pai."""
+        self.active = True
+        self.handle_movement(0.0)
+
+    def handle_movement(self, dt: float) -> None:
+        """
+        Sincroniza a moeda com o pai (eixo X) e aplica a oscilação (eixo Y).
+
+        O tempo que sobra de cada degrau da oscilação é carregado para o próximo,
+        então o ritmo é o mesmo com qualquer tamanho de passo.
+        """
+        self.x = self.parent.center_x - self.width // 2
+        self.movement_step -= dt
+
+        while self.movement_step < 0:
+            self.vertical_offset += self.vertical_direction
+
+            if abs(self.vertical_offset) >= self.vertical_offset_max:
+                self.vertical_direction *= -1
+
+            self.movement_step += config.COIN_MOVEMENT_STEP
+
+        self.y = self.parent.center_y + self.vertical_offset - self.height // 2
+
+    def update(self, dt: float) -> None:
+        """Moedas já coletadas ficam congeladas até o obstáculo ser reciclado."""
+        if self.active:
+            self.handle_movement(dt)
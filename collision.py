@@ -0,0 +1,212 @@
+import math
+
+from hitbox import Hitbox
+
+
+class Collision:
+    """
+    Testes de colisão analíticos para a hitbox circular do pássaro.
+
+    As máscaras do pássaro e da moeda são círculos rasterizados, então basta
+    conhecer a primeira e a última coluna preenchida de cada linha para
+    responder, em tempo constante, se o círculo toca um retângulo (canos e
+    chão) ou outro círculo (moedas). O resultado é idêntico, pixel a pixel,
+    ao de `pygame.sprite.collide_mask`.
+
+    Para passos grandes, os testes de varredura (`sweep_rect`/`sweep_circle`)
+    tratam as hitboxes como círculos contínuos e encontram o primeiro contato
+    ao longo de todo o trajeto, e não apenas na posição final.
+
+    Attributes:
+        width (int): Largura da hitbox do pássaro.
+        height (int): Altura da hitbox do pássaro.
+        first (list[int]): Primeira coluna preenchida de cada linha.
+        last (list[int]): Última coluna preenchida de cada linha.
+        widest_row (int): Linha mais larga do círculo (as outras se estreitam a partir dela).
+        coin_dx_min (list[int]): Para cada deslocamento vertical da moeda, o menor
+            deslocamento horizontal com sobreposição (indexado por dy + coin_offset).
+        coin_dx_max (list[int]): Idem, maior deslocamento horizontal com sobreposição.
+        coin_offset (int): Deslocamento somado a dy para indexar as tabelas da moeda.
+        radius (int): Raio do círculo do pássaro.
+        center_x (int): Centro do círculo do pássaro, relativo à esquerda da hitbox.
+        center_y (int): Centro do círculo do pássaro, relativo ao topo da hitbox.
+        coin_radius (int): Raio do círculo da moeda.
+        coin_center (int): Centro do círculo da moeda, relativo ao canto da hitbox (quadrada).
+    """
+
+    def __init__(self, hitbox: Hitbox, coin_hitbox: Hitbox) -> None:
+        """
+        Pré-calcula os perfis das hitboxes circulares.
+
+        Args:
+            hitbox (Hitbox): Hitbox circular do pássaro.
+            coin_hitbox (Hitbox): Hitbox circular da moeda.
+        """
+        self.width = hitbox.width
+        self.height = hitbox.height
+        self.first, self.last = self._spans(hitbox)
+        self.widest_row = max(range(self.height), key=lambda row: self.last[row] - self.first[row])
+        self.radius = (self.last[self.widest_row] - self.first[self.widest_row] + 1) // 2
+        self.center_x = self.width // 2
+        self.center_y = self.height // 2
+
+        # Perfil de sobreposição círculo x círculo (soma de Minkowski linha a linha)
+        coin_first, coin_last = self._spans(coin_hitbox)
+        coin_widest = max(coin_last[row] - coin_first[row] for row in range(coin_hitbox.height))
+        self.coin_radius = (coin_widest + 1) // 2
+        self.coin_center = coin_hitbox.width // 2
+        self.coin_offset = coin_hitbox.height - 1
+        self.coin_dx_min: list[int] = []
+        self.coin_dx_max: list[int] = []
+
+        for dy in range(-self.coin_offset, self.height):
+            dx_min, dx_max = self.width, -coin_hitbox.width
+
+            for row in range(max(0, dy), min(self.height, dy + coin_hitbox.height)):
+                if self.first[row] <= self.last[row] and coin_first[row - dy] <= coin_last[row - dy]:
+                    dx_min = min(dx_min, self.first[row] - coin_last[row - dy])
+                    dx_max = max(dx_max, self.last[row] - coin_first[row - dy])
+
+            self.coin_dx_min.append(dx_min)
+            self.coin_dx_max.append(dx_max)
+
+    @staticmethod
+    def _spans(hitbox: Hitbox) -> tuple[list[int], list[int]]:
+        """Primeira e última coluna preenchidas de cada linha (linhas vazias ficam com first > last)."""
+        first = [(row & -row).bit_length() - 1 if row else hitbox.width for row in hitbox.rows]
+        last = [row.bit_length() - 1 for row in hitbox.rows]
+        return first, last
+
+    def overlaps_rect(self, x: int, y: int, left: int, top: int, right: int, bottom: int) -> bool:
+        """
+        Verifica se o círculo em (x, y) toca o retângulo [left, right) x [top, bottom).
+
+        Entre as linhas do círculo que cruzam o retângulo, a mais larga é a
+        mais próxima de `widest_row`; basta comparar o intervalo dessa linha.
+        """
+        first_row = top - y if top > y else 0
+        last_row = bottom - y - 1 if bottom - y < self.height else self.height - 1
+
+        if first_row > last_row:
+            return False
+
+        row = min(max(self.widest_row, first_row), last_row)
+        return x + self.first[row] < right and x + self.last[row] >= left
+
+    def overlaps_coin(self, x: int, y: int, coin_x: int, coin_y: int) -> bool:
+        """Verifica se o círculo em (x, y) toca a moeda (círculo) em (coin_x, coin_y)."""
+        index = coin_y - y + self.coin_offset
+
+        if index < 0 or index >= len(self.coin_dx_min):
+            return False
+
+        dx = coin_x - x
+        return self.coin_dx_min[index] <= dx <= self.coin_dx_max[index]
+
+    # --- Varredura (colisão contínua) ---
+
+    @staticmethod
+    def sweep_circle(
+        x0: float,
+        y0: float,
+        x1: float,
+        y1: float,
+        radius: float,
+        center_x: float,
+        center_y: float,
+        enter: float = 0.0,
+        leave: float = 1.0,
+    ) -> float | None:
+        """
+        Primeiro contato de um ponto que anda de (x0, y0) a (x1, y1) com um círculo parado.
+
+        Equivale a dois círculos se movendo um em relação ao outro, com `radius`
+        igual à soma dos raios.
+
+        Args:
+            x0, y0 (float): Posição inicial do ponto.
+            x1, y1 (float): Posição final do ponto.
+            radius (float): Raio do círculo.
+            center_x, center_y (float): Centro do círculo.
+            enter, leave (float): Intervalo do trajeto considerado (frações de 0 a 1).
+
+        Returns:
+            float | None: Fração do trajeto no primeiro contato, ou None se não há contato.
+        """
+        dx, dy = x1 - x0, y1 - y0
+        fx, fy = x0 - center_x, y0 - center_y
+        c = fx * fx + fy * fy - radius * radius
+
+        # Já começa dentro do círculo
+        if c <= 0:
+            return enter
+
+        a = dx * dx + dy * dy
+        b = fx * dx + fy * dy
+        discriminant = b * b - a * c
+
+        if a == 0 or discriminant < 0:
+            return None
+
+        time = (-b - math.sqrt(discriminant)) / a
+        return time if enter <= time <= leave else None
+
+    @staticmethod
+    def sweep_rect(
+        x0: float,
+        y0: float,
+        x1: float,
+        y1: float,
+        radius: float,
+        left: float,
+        top: float,
+        right: float,
+        bottom: float,
+    ) -> float | None:
+        """
+        Primeiro contato de um círculo que anda de (x0, y0) a (x1, y1) com o retângulo [left, right] x [top, bottom].
+
+        O retângulo é expandido pelo raio (soma de Minkowski, um retângulo de
+        quinas arredondadas) e o centro do círculo é tratado como um ponto: o
+        teste de "slabs" dá o trecho do trajeto dentro do retângulo expandido e,
+        se a entrada cair em uma quina, o contato é com o círculo daquela quina.
+
+        Args:
+            x0, y0 (float): Centro inicial do círculo.
+            x1, y1 (float): Centro final do círculo.
+            radius (float): Raio do círculo.
+            left, top, right, bottom (float): Limites do retângulo.
+
+        Returns:
+            float | None: Fração do trajeto no primeiro contato, ou None se não há contato.
+        """
+        enter, leave = 0.0, 1.0
+
+        for start, end, low, high in ((x0, x1, left - radius, right + radius), (y0, y1, top - radius, bottom + radius)):
+            delta = end - start
+
+            if delta == 0:
+                if start < low or start > high:
+                    return None
+                continue
+
+            time_low, time_high = (low - start) / delta, (high - start) / delta
+
+            if time_low > time_high:
+                time_low, time_high = time_high, time_low
+
+            enter, leave = max(enter, time_low), min(leave, time_high)
+
+            if enter > leave:
+                return None
+
+        # Entrada por uma face: o contato é imediato
+        x, y = x0 + (x1 - x0) * enter, y0 + (y1 - y0) * enter
+
+        if left <= x <= right or top <= y <= bottom:
+            return enter
+
+        # Entrada pela região de uma quina: contato com o círculo da quina
+        corner_x = left if x < left else right
+        corner_y = top if y < top else bottom
+        return Collision.sweep_circle(x0, y0, x1, y1, radius, corner_x, corner_y, enter, leave)
@@ -20,10 +20,81 @@ SCREEN_WIDTH = 288
 SCREEN_HEIGHT = 512
 # Flags: Tela cheia + Escala (para manter pixel art nítida em monitores grandes)
 SCREEN_FLAGS = pygame.FULLSCREEN | pygame.SCALED
+# Passo fixo da simulação (segundos). None = usa o delta time variável de cada quadro
+SIMULATION_STEP = None
+DIRTY_RECTS = False  # Redesenha apenas as regiões alteradas (economiza CPU em hardware fraco)
+MAX_FRAME_TIME = 0.25  # Limite de tempo acumulado por quadro no modo de passo fixo (segundos)
+# Economia de energia: taxa máxima só em RUNNING; IDLE roda a IDLE_FPS e telas paradas (PAUSED,
+# GAMEOVER com o pássaro DEAD) só redesenham ao receber um evento (ou a cada STATIC_WAKE_TIMEOUT ms)
+POWER_SAVE = True
+IDLE_FPS = 30
+STATIC_WAKE_TIMEOUT = 1_000
+# Registro das sessões para replay, ligado com --record (exige passo fixo; sem SIMULATION_STEP usa 1 / FPS)
+SESSION_RECORDING = False
+SESSION_LOG_DIR = os.path.join(BASE_DIR, "sessions")
+REPLAY_KEYFRAME_INTERVAL = 10.0  # Segundos de jogo entre quadros-chave (busca no replay)
+REPLAY_SEEK_STEP = 10.0  # Segundos avançados/voltados pelas setas durante o replay
+# Maior sub-passo interno da simulação (segundos). Cada `Simulation.update(dt)` é dividido em
+# sub-passos iguais de no máximo este tamanho: com 1/240, a 30, 60, 120 e 240 Hz todos os
+# sub-passos são exatamente 1/240 s e a partida é idêntica em qualquer taxa de quadros
+SIMULATION_MAX_STEP = 1 / 240
+# Máximo de sub-passos por update: após travamentos longos (arrastar a janela, alt-tab) os
+# sub-passos ficam maiores que SIMULATION_MAX_STEP e a colisão por varredura evita atravessar canos
+SIMULATION_MAX_SUBSTEPS = 8
+# Folga (px) do teste de colisão por varredura: só contatos com pelo menos essa profundidade ao
+# longo do trajeto contam (os rasantes continuam decididos pelo teste pixel a pixel na posição final)
+COLLISION_SWEEP_MARGIN = 2
+# Maior desvio (px) entre a trajetória curva do pássaro e as cordas usadas na varredura
+COLLISION_SWEEP_TOLERANCE = 1
+
+# --- Profiler (medição de tempo por fase do quadro) ---
+PROFILER_HISTORY = 600  # Quadros mantidos no buffer circular
+PROFILER_GRAPH_WIDTH = 120  # Largura do gráfico na tela (1 coluna por quadro)
+PROFILER_GRAPH_HEIGHT = 40
+PROFILER_TRACE_FILE = "flappy_bird_trace.json"  # Trace do Chrome gravado ao sair
+INPUT_LATENCY_HISTORY = 10_000  # Amostras de latência clique -> tela mantidas no buffer circular
+INPUT_LATENCY_FILE = "flappy_bird_latency.json"  # Distribuição da latência gravada ao sair
+
+# --- Observações em pixels (agentes com visão) ---
+PIXEL_OBSERVATION_SIZE = (84, 84)  # (largura, altura) das observações em tons de cinza
+PIXEL_OBSERVATION_STACK = 4  # Quadros empilhados em cada observação
+
+# --- Piloto automático (modo demonstração) ---
+AUTOPILOT_HORIZON = 1.0  # Segundos simulados à frente a cada decisão
+AUTOPILOT_STEP = 1 / FPS  # Intervalo entre as amostras do planejador (uma por quadro)
+AUTOPILOT_STRIDE = 3  # Intervalo (em amostras) entre as batidas de asas consideradas na busca
+AUTOPILOT_MARGIN = 3  # Folga (px) entre o pássaro e os canos/chão no modelo do planejador
+AUTOPILOT_COIN_TOLERANCE = 10  # Distância vertical (px) do centro da moeda em que o planejador mira
+AUTOPILOT_MAX_NODES = 800  # Limite de estados visitados por busca (teto do tempo de planejamento)
+AUTOPILOT_BUDGET = 0.002  # Prazo de cada decisão (segundos): a busca para antes dele; acima dele, conta como lenta
+
+# --- Modo população (N pássaros no mesmo percurso) ---
+POPULATION_SIZE = 1_000  # Pássaros por corrida
+POPULATION_ELITE = 0.1  # Fração dos melhores controladores mantida a cada geração
+POPULATION_MUTATION = 0.2  # Desvio padrão do ruído aplicado às cópias dos melhores
+POPULATION_MAX_TIME = 120.0  # Duração máxima de uma corrida (segundos de jogo) antes da próxima geração
+
+# --- Partículas (penas na batida, brilho das moedas e poeira no chão) ---
+PARTICLES = True  # Efeitos de partículas no `Game`
+PARTICLE_CAPACITY = 16_384  # Partículas vivas ao mesmo tempo (arrays alocados uma única vez)
+PARTICLE_FRAMES = 8  # Quadros pré-renderizados (desbotando) de cada tipo de partícula
+PARTICLE_FEATHERS = 14  # Penas soltas quando o pássaro bate
+PARTICLE_SPARKLES = 10  # Brilhos ao coletar uma moeda
+PARTICLE_DUST = 16  # Grãos de poeira quando o pássaro cai no chão
+
+# --- Servidor de verificação de pontuação (placar) ---
+SCORE_SERVER_HOST = "127.0.0.1"
+SCORE_SERVER_PORT = 8_765
+SCORE_SERVER_WORKERS = None  # Processos que re-simulam as sessões (None = número de CPUs)
+SCORE_SERVER_QUEUE = 64  # Sessões aguardando verificação; com a fila cheia o servidor responde 503
+SCORE_SERVER_TIMEOUT = 10.0  # Tempo máximo (segundos) para receber cada requisição
+SCORE_MAX_LOG_BYTES = 1_048_576  # Maior registro de sessão aceito
+SCORE_MAX_DURATION = 3_600.0  # Maior sessão aceita (segundos de jogo)
+SCORE_FIXED_STEP = 1 / FPS  # Passo fixo exigido dos registros (o que o jogo grava sem --fixed-step)
 
 # --- Física e Mecânicas Globais ---
-GRAVITY = 7  # Aceleração vertical (pixels/s²)
-GAME_SPEED = 150  # Velocidade de deslocamento do cenário (pixels/s)
+GRAVITY = 840  # Aceleração vertical (pixels/s²)
+GAME_SPEED = 120  # Velocidade de deslocamento do cenário (pixels/s)
 SCREEN_VERTICAL_OFFSET = -42  # Ajuste fino da posição vertical da câmera
 
 # --- Caminhos de Áudio (Audio Paths) ---
@@ -31,6 +102,14 @@ SCORE_SOUND = os.path.join(BASE_DIR, "assets", "audios", "audio_point.ogg")
 HIT_SOUND = os.path.join(BASE_DIR, "assets", "audios", "audio_hit.ogg")
 ACTION_SOUND = os.path.join(BASE_DIR, "assets", "audios", "audio_swoosh.ogg")
 MOVE_UP_SOUND = os.path.join(BASE_DIR, "assets", "audios", "audio_wing.ogg")
+DIE_SOUND = os.path.join(BASE_DIR, "assets", "audios", "audio_die.ogg")
+
+# --- Atlas e Cache de Ativos ---
+# Gerados por `python atlas_builder.py`; sem eles os arquivos originais são carregados
+ATLAS_IMAGE = os.path.join(BASE_DIR, "assets", "atlas", "atlas.png")
+ATLAS_INDEX = os.path.join(BASE_DIR, "assets", "atlas", "atlas.json")
+# Superfícies já convertidas e áudio decodificado (PCM), chaveados pelo hash dos ativos
+ASSET_CACHE_PATH = os.path.join(BASE_DIR, "assets", "cache")
 
 # Eventos Customizados
 # USEREVENT é o último ID de evento reservado pelo Pygame. Somamos +1 para criar o nosso.
@@ -49,6 +128,8 @@ SCORE_IMAGES_PATH = os.path.join(BASE_DIR, "assets", "images", "score")
 # --- Configurações de UI ---
 GAME_UI_OFFSET = 60  # Deslocamento de elementos da UI
 BASE_OFFSET = 28  # Altura visual do chão
+BASE_WIDTH = 336
+BASE_HEIGHT = 112
 
 # --- Entidade: Canos (Pipes) ---
 PIPE_IMAGES = {
@@ -58,9 +139,21 @@ PIPE_IMAGES = {
 PIPE_DISTANCE = 100  # Distância horizontal entre canos (pixels)
 PIPE_WIDTH = 52
 PIPE_HEIGHT = 320
+PIPE_LIP_HEIGHT = 24  # Altura da "boca" do cano (parte mais larga)
+PIPE_BODY_OFFSET = 2  # Recuo lateral do corpo do cano em relação à boca
 # Limites para a geração aleatória da altura dos canos
 PIPE_VERTICAL_OFFSET_MIN = -90 + SCREEN_VERTICAL_OFFSET
 PIPE_VERTICAL_OFFSET_MAX = 90 + SCREEN_VERTICAL_OFFSET
+# Percurso (`Course`): alturas geradas em blocos, à frente dos obstáculos
+COURSE_CHUNK_SIZE = 1024  # Alturas geradas de uma vez (NumPy) em cada bloco da fila
+COURSE_LOOKAHEAD = 4  # Próximos vãos expostos a agentes (`FlappyBirdEnv.info`)
+# Alcançabilidade dos vãos (`CourseAnalyzer`): modelo discreto da física entre um vão e o seguinte
+COURSE_ANALYSIS_STEP = 1 / 60  # Intervalo entre as decisões (bater ou não as asas) no modelo (segundos)
+COURSE_FLAP_INTERVAL = 0.2  # Menor intervalo entre duas batidas de asas (segundos; 5 toques por segundo)
+COURSE_ANALYSIS_MARGIN = 3  # Folga (px) entre o pássaro e os canos/chão no modelo
+COURSE_ANALYSIS_RESOLUTION = 2  # Subdivisões de pixel da grade de alturas
+COURSE_MIN_WINDOW = 16  # Menor faixa de alturas (px) de entrada no cano seguinte para a transição ser justa
+COURSE_MAX_REROLLS = 100  # Rodadas de novos sorteios por bloco antes de desistir (na prática bastam até 3)
 
 # --- Entidade: Jogador (Player) ---
 PLAYER_COLORS = ["YELLOW", "BLUE", "RED"]
@@ -81,9 +174,16 @@ PLAYER_IMAGES = {
         "UPFLAP": os.path.join(BASE_DIR, "assets", "images", "player", "redbird-upflap.png"),
     },
 }
+PLAYER_WIDTH = 34
+PLAYER_HEIGHT = 24
 PLAYER_ANIMATION_STEP = 0.075  # Tempo entre frames da animação (segundos)
-PLAYER_DOWN_SPEED_LIMIT = 10  # Velocidade máxima de queda
-PLAYER_IMPULSE = 2  # Força do pulo (negativo sobe, positivo desce)
+PLAYER_DOWN_SPEED_LIMIT = 1200  # Velocidade máxima de queda (pixels/s)
+PLAYER_IMPULSE = 240  # Velocidade do pulo (pixels/s, para cima)
+PLAYER_TILT = True  # Inclina o pássaro conforme a velocidade vertical (bico para cima ao subir, para baixo ao cair)
+PLAYER_TILT_UP = 25  # Inclinação máxima para cima (graus), logo depois de bater as asas
+PLAYER_TILT_DOWN = -90  # Inclinação máxima para baixo (graus), em queda livre
+PLAYER_TILT_STEP = 5  # Intervalo entre os ângulos pré-renderizados (graus)
+PLAYER_TILT_DIVE_SPEED = 480  # Velocidade de queda (pixels/s) em que o bico já aponta todo para baixo
 
 # --- Entidade: Moedas (Coins) ---
 COIN_ANIMATION_STEP = 0.020  # Rapidez do giro da moeda (segundos)
@@ -0,0 +1,258 @@
+import argparse
+import array
+import mmap
+import os
+import struct
+import time
+
+import numpy as np
+
+import config
+from course_analyzer import CourseAnalyzer
+
+
+class Course:
+    """
+    Sequência infinita das alturas dos vãos de uma sessão (o percurso).
+
+    Os obstáculos não sorteiam mais a própria altura: cada reciclagem consome
+    a próxima altura do percurso (`next`), e qualquer um pode ler as seguintes
+    sem consumi-las (`peek`) — agentes, o piloto automático e a interface.
+
+    As alturas ficam em uma fila à frente da posição atual, preenchida em
+    blocos de `chunk_size` gerados de uma vez com NumPy. Cada bloco é
+    determinado só pela semente e pelo seu índice, então qualquer posição do
+    percurso pode ser reconstruída: `snapshot` é apenas a posição (um int) e
+    `restore` não precisa copiar o estado de um gerador. A fila mantém o bloco
+    anterior ao atual, e voltar a uma posição recente não gera nada.
+
+    Um percurso também pode vir de um arquivo (`open`, "desafio do dia"): o
+    cabeçalho `HEADER` seguido das alturas em int16. O arquivo é mapeado na
+    memória (`mmap`), sem leitura: abrir um percurso de um milhão de canos é
+    instantâneo, só as páginas usadas são carregadas e processos que abrem o
+    mesmo arquivo compartilham essas páginas. Depois da última altura, o
+    percurso recomeça do início.
+
+    Com um `CourseAnalyzer`, um percurso gerado só tem transições justas: cada
+    bloco é sorteado de novo onde o vão seguinte não é alcançável com folga
+    (`CourseAnalyzer.constrain`), ainda determinado só pela semente e pelo índice.
+
+    Attributes:
+        chunk_size (int): Alturas geradas (ou copiadas do arquivo) por bloco.
+        analyzer (CourseAnalyzer | None): Restrição de justiça dos percursos gerados (None = sem restrição).
+        entropy (int): Semente efetiva dos blocos gerados.
+        gaps (np.ndarray | None): Alturas do arquivo (view do `mmap`); None = percurso gerado.
+        position (int): Alturas já consumidas.
+        start (int): Posição da primeira altura em `queue` (múltiplo de `chunk_size`).
+        queue (array.array): Alturas (int16) das posições `start` em diante.
+    """
+
+    MAGIC = b"FBCO"
+    VERSION = 1
+    HEADER = struct.Struct("<4sBxxxQ")
+    """Identificador, versão, alinhamento e número de alturas (uint64)."""
+
+    def __init__(
+        self,
+        seed: int | None = None,
+        chunk_size: int = config.COURSE_CHUNK_SIZE,
+        analyzer: CourseAnalyzer | None = None,
+    ) -> None:
+        """
+        Cria um percurso gerado.
+
+        Args:
+            seed (int | None): Semente do percurso (o sinal é ignorado, como em `random.seed`).
+                None = aleatória.
+            chunk_size (int): Alturas geradas por bloco.
+            analyzer (CourseAnalyzer | None): Se informado, só gera transições justas para ele.
+        """
+        self.chunk_size = chunk_size
+        self.analyzer = analyzer
+        self.gaps: np.ndarray | None = None
+        self.seed(seed)
+
+    @classmethod
+    def open(cls, path: str, chunk_size: int = config.COURSE_CHUNK_SIZE) -> "Course":
+        """
+        Abre um percurso gravado por `save`, mapeado na memória.
+
+        Args:
+            path (str): Arquivo do percurso.
+            chunk_size (int): Alturas copiadas do arquivo para a fila por vez.
+
+        Returns:
+            Course: O percurso, na posição 0.
+        """
+        with open(path, "rb") as file:
+            # O mapa continua válido depois que o arquivo é fechado
+            memory = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(memory) < cls.HEADER.size:
+            raise ValueError("Arquivo de percurso incompleto")
+
+        magic, version, count = cls.HEADER.unpack_from(memory)
+
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Arquivo não é um percurso compatível")
+
+        if count == 0 or len(memory) < cls.HEADER.size + count * 2:
+            raise ValueError("Arquivo de percurso incompleto")
+
+        return cls._from_gaps(np.frombuffer(memory, dtype="<i2", count=count, offset=cls.HEADER.size), chunk_size)
+
+    @classmethod
+    def _from_gaps(cls, gaps: np.ndarray, chunk_size: int = config.COURSE_CHUNK_SIZE) -> "Course":
+        """Percurso fixo com as alturas `gaps`, sem gerar (e descartar) um bloco pelo `__init__`."""
+        course = cls.__new__(cls)
+        course.chunk_size = chunk_size
+        course.analyzer = None
+        course.entropy = 0
+        course.gaps = gaps
+        course.seed()
+        return course
+
+    def save(self, path: str, count: int) -> None:
+        """
+        Grava as `count` primeiras alturas do percurso em um arquivo para `open`.
+
+        Escreve bloco a bloco, sem montar o percurso inteiro na memória. A posição
+        atual não muda.
+
+        Args:
+            path (str): Caminho do arquivo (o diretório é criado, se preciso).
+            count (int): Número de alturas.
+        """
+        directory = os.path.dirname(path)
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(path, "wb") as file:
+            file.write(self.HEADER.pack(self.MAGIC, self.VERSION, count))
+
+            for index in range(0, (count + self.chunk_size - 1) // self.chunk_size):
+                chunk = self._chunk(index)[: count - index * self.chunk_size]
+                file.write(np.frombuffer(chunk, dtype=np.int16).astype("<i2").tobytes())
+
+    def seed(self, seed: int | None = None) -> None:
+        """
+        Volta ao início do percurso; um percurso gerado passa a usar a semente `seed`.
+
+        Args:
+            seed (int | None): Nova semente (ignorada em percursos de arquivo). None = aleatória.
+        """
+        if self.gaps is None:
+            self.entropy = abs(seed) if seed is not None else np.random.SeedSequence().entropy
+
+        self.position = 0
+        self.start = 0
+        self.queue = self._chunk(0)
+
+    def _chunk(self, index: int) -> array.array:
+        """Alturas do bloco `index` (posições `index * chunk_size` em diante), em int16 compactos."""
+        if self.gaps is None:
+            rng = np.random.default_rng([self.entropy, index])
+            gaps = rng.integers(
+                config.PIPE_VERTICAL_OFFSET_MIN, config.PIPE_VERTICAL_OFFSET_MAX, self.chunk_size, endpoint=True
+            )
+
+            if self.analyzer is not None:
+                gaps = self.analyzer.constrain(gaps, rng)
+        else:
+            first = index * self.chunk_size
+            gaps = np.take(self.gaps, np.arange(first, first + self.chunk_size), mode="wrap")
+
+        return array.array("h", gaps.astype(np.int16).tobytes())
+
+    def _fill(self, end: int) -> None:
+        """Garante que a fila cobre as posições de `position` até `end` (exclusive)."""
+        if self.position < self.start:
+            # Voltou para antes da fila (`restore` distante): recomeça no bloco da posição
+            index = self.position // self.chunk_size
+            self.start = index * self.chunk_size
+            self.queue = self._chunk(index)
+
+        while self.start + len(self.queue) < end:
+            self.queue.extend(self._chunk((self.start + len(self.queue)) // self.chunk_size))
+
+        # Descarta os blocos já consumidos, mantendo um para voltas curtas
+        while self.position - self.start >= 2 * self.chunk_size:
+            del self.queue[: self.chunk_size]
+            self.start += self.chunk_size
+
+    def next(self) -> int:
+        """
+        Consome a próxima altura do percurso.
+
+        Returns:
+            int: Deslocamento vertical do vão, entre `PIPE_VERTICAL_OFFSET_MIN` e `PIPE_VERTICAL_OFFSET_MAX`.
+        """
+        index = self.position - self.start
+
+        if not 0 <= index < len(self.queue):
+            self._fill(self.position + 1)
+            index = self.position - self.start
+
+        self.position += 1
+        return self.queue[index]
+
+    def peek(self, count: int) -> list[int]:
+        """
+        Lê as próximas alturas sem consumi-las.
+
+        Args:
+            count (int): Quantas alturas.
+
+        Returns:
+            list[int]: As próximas `count` alturas, na ordem em que `next` as entregaria.
+        """
+        index = self.position - self.start
+
+        if not 0 <= index <= index + count <= len(self.queue):
+            self._fill(self.position + count)
+            index = self.position - self.start
+
+        return self.queue[index : index + count].tolist()
+
+    def snapshot(self) -> int:
+        """Posição atual (basta para voltar a ela com `restore`)."""
+        return self.position
+
+    def restore(self, position: int) -> None:
+        """Volta à posição `position` (a fila é refeita só se ela ficou para trás)."""
+        self.position = position
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera um percurso fixo (desafio do dia) para `--course`")
+    parser.add_argument("path", help="Arquivo do percurso")
+    parser.add_argument("--seed", type=int, default=None, help="Semente do percurso")
+    parser.add_argument("--pipes", type=int, default=1_000_000, help="Número de canos")
+    parser.add_argument("--fair", action="store_true", help="Só transições justas (ver CourseAnalyzer)")
+    parser.add_argument("--check", action="store_true", help="Não grava: procura transições injustas no arquivo")
+    args = parser.parse_args()
+
+    if args.check:
+        start = time.perf_counter()
+        analyzer = CourseAnalyzer()
+        built = time.perf_counter() - start
+        gaps = Course.open(args.path).gaps
+        start = time.perf_counter()
+        unfair = analyzer.check(gaps)
+        checked = time.perf_counter() - start
+        low = config.PIPE_VERTICAL_OFFSET_MIN
+
+        print(f"Tabela de transições em {built:.2f} s; {len(gaps):,} canos verificados em {checked * 1e3:.1f} ms")
+        print(f"{len(unfair):,} transições injustas (janela < {analyzer.min_window} px)")
+
+        for index in unfair[:10].tolist():
+            previous, following = int(gaps[index - 1]), int(gaps[index])
+            window = analyzer.window[previous - low, following - low]
+            print(f"  cano {index}: {previous} -> {following} (janela {window} px)")
+    else:
+        if args.seed is None:
+            parser.error("--seed é obrigatório para gravar um percurso")
+
+        Course(args.seed, analyzer=CourseAnalyzer() if args.fair else None).save(args.path, args.pipes)
+        print(f"{args.pipes:,} canos gravados em {args.path} ({os.path.getsize(args.path):,} bytes)")
@@ -0,0 +1,353 @@
+import math
+
+import numpy as np
+
+import config
+from base_body import BaseBody
+from coin_body import CoinBody
+from collision import Collision
+from player_body import PlayerBody
+
+
+class CourseAnalyzer:
+    """
+    Alcançabilidade dos vãos sob a física real: quais transições entre alturas o pássaro consegue fazer.
+
+    O modelo é discreto e vetorizado com NumPy. O tempo anda em decisões de
+    `step` segundos (bater ou não as asas). A batida fixa a velocidade em
+    `-PLAYER_IMPULSE`, então a trajetória depois dela só depende do tempo: o
+    estado do pássaro é (decisões desde a última batida, altura em que bateu
+    as asas), e a altura atual é a da batida mais o deslocamento exato de
+    `PlayerBody.advance` desde então. Um conjunto de estados é uma grade de
+    booleanos (linhas = decisões desde a batida, colunas = altura da batida em
+    1 / `resolution` px). Sem bater as asas, a grade inteira desce uma linha;
+    bater as asas leva cada linha para a linha 1, com a altura da batida
+    deslocada para a posição atual. Só a batida arredonda a posição, então o
+    erro do modelo não se acumula entre as batidas.
+
+    Bater as asas só é permitido `flap_interval` decisões depois da batida
+    anterior: o modelo é de uma pessoa tocando na tela, não de um bot que bate
+    as asas a cada quadro.
+
+    Enquanto um cano cruza a coluna do pássaro (`overlap` decisões, com
+    `margin` de folga, como no `Autopilot`), o centro do círculo da colisão
+    tem de ficar dentro do vão; entre os canos (o resto do `period`), só
+    acima do chão. No teto, a posição para e a velocidade zera, como na
+    simulação. Para cada altura de vão são calculados:
+
+    - de trás para frente, os estados na entrada do cano de onde ainda dá
+      para atravessá-lo;
+    - de frente para trás, os estados com que o pássaro chega ao cano seguinte
+      depois de atravessar este (partindo de qualquer altura dentro do vão).
+
+    A janela de uma transição (`window`) é a faixa de alturas, na entrada do
+    cano seguinte, que é alcançável a partir do vão anterior e ainda atravessa
+    o seguinte. Transições com janela menor que `min_window` são injustas
+    (zero = impossíveis). A tabela cobre todos os pares de alturas, então
+    verificar um percurso é só indexá-la (`check`). `trace` segue o conjunto
+    de estados ao longo de um percurso inteiro, sem a simplificação por pares.
+
+    Attributes:
+        collision (Collision): Geometria do círculo do pássaro (a mesma da `Simulation`).
+        step (float): Intervalo entre as decisões (segundos).
+        flap_interval (int): Menor número de decisões entre duas batidas de asas.
+        margin (int): Folga do modelo em relação aos canos e ao chão (px).
+        resolution (int): Subdivisões de pixel da grade de alturas.
+        min_window (float): Menor janela (px) de uma transição justa.
+        period (int): Decisões entre dois canos seguidos.
+        overlap (int): Decisões em que um cano cruza a coluna do pássaro.
+        velocities (np.ndarray): Velocidade (pixels/s) em cada linha (decisões desde a batida).
+        shifts (np.ndarray): Deslocamento desde a batida (em células) em cada linha.
+        ceiling (int): Linha em que o pássaro fica ao bater no teto (velocidade mais próxima de zero).
+        heights (int): Células de altura (topo do pássaro do teto até o chão).
+        offsets (np.ndarray): Alturas de vão analisadas (`PIPE_VERTICAL_OFFSET_MIN` a `MAX`).
+        ground (np.ndarray): Estados acima do chão, shape (linhas, alturas).
+        bands (np.ndarray): Estados dentro de cada vão (e acima do chão), shape (offsets, linhas, alturas).
+        window (np.ndarray): Janela (px) de cada transição [anterior, seguinte], shape (offsets, offsets).
+        reachable (np.ndarray): Alturas de vão alcançáveis com folga a partir de qualquer outra.
+    """
+
+    collision = Collision(PlayerBody.hitbox, CoinBody.hitbox)
+
+    def __init__(
+        self,
+        step: float = config.COURSE_ANALYSIS_STEP,
+        flap_interval: float = config.COURSE_FLAP_INTERVAL,
+        margin: int = config.COURSE_ANALYSIS_MARGIN,
+        resolution: int = config.COURSE_ANALYSIS_RESOLUTION,
+        min_window: float = config.COURSE_MIN_WINDOW,
+    ) -> None:
+        """
+        Monta o modelo e calcula a tabela de janelas de todas as transições.
+
+        Args:
+            step (float): Intervalo entre as decisões (segundos).
+            flap_interval (float): Menor intervalo entre duas batidas de asas (segundos).
+            margin (int): Folga do modelo em relação aos canos e ao chão (px).
+            resolution (int): Subdivisões de pixel da grade de alturas.
+            min_window (float): Menor janela (px) de uma transição justa.
+        """
+        self.step = step
+        self.flap_interval = max(1, round(flap_interval / step))
+        self.margin = margin
+        self.resolution = resolution
+        self.min_window = min_window
+
+        # --- Tempo: decisões por cano e decisões com o cano na coluna do pássaro ---
+        scroll = config.GAME_SPEED * step
+        radius = self.collision.radius + margin
+        self.period = round((config.SCREEN_WIDTH // 2 + config.PIPE_WIDTH // 2) / scroll)
+        self.overlap = math.ceil((config.PIPE_WIDTH + 2 * radius) / scroll)
+        ground = BaseBody().y - radius - self.collision.center_y
+        self.heights = int(ground * resolution) + 1
+
+        # --- Trajetória depois da batida: uma linha por decisão, até passar do chão ---
+        # Longe do teto, `advance` devolve o deslocamento exato
+        far = float(config.SCREEN_HEIGHT)
+        y, velocity = far, -float(config.PLAYER_IMPULSE)
+        displacements, velocities = [0.0], [velocity]
+
+        while displacements[-1] <= ground or len(displacements) <= self.flap_interval:
+            y, velocity = PlayerBody.advance(y, velocity, step)
+            displacements.append(y - far)
+            velocities.append(velocity)
+
+        self.velocities = np.array(velocities)
+        self.shifts = np.round(np.array(displacements) * resolution).astype(int)
+        self.ceiling = int(np.abs(self.velocities).argmin())
+        # Linhas em que a posição chega ao teto: (linha, células de altura da batida que batem nele)
+        self._roofs = [(row, -shift + 1) for row, shift in enumerate(self.shifts.tolist()) if row and shift <= 0]
+
+        # --- Limites: o chão sempre, cada vão enquanto o cano cruza a coluna do pássaro ---
+        cells = np.arange(self.heights)
+        positions = cells + self.shifts[:, None]
+        self.ground = positions < self.heights
+        self.offsets = np.arange(config.PIPE_VERTICAL_OFFSET_MIN, config.PIPE_VERTICAL_OFFSET_MAX + 1)
+        gap_top = config.SCREEN_HEIGHT // 2 - config.PIPE_DISTANCE // 2 + self.offsets
+        # Faixa do centro do círculo dentro do vão, em células
+        top_y = gap_top + radius - self.collision.center_y
+        bottom_y = gap_top + config.PIPE_DISTANCE - radius - self.collision.center_y
+        top = np.ceil(top_y * resolution)[:, None, None]
+        bottom = np.floor(bottom_y * resolution)[:, None, None]
+        self.bands = (positions >= top) & (positions <= bottom)
+
+        self.window = self._windows()
+        self.reachable = self.offsets[(self.window >= min_window).all(axis=0)]
+
+    # --- Um passo do modelo ---
+
+    def _advance(self, states: np.ndarray) -> np.ndarray:
+        """Estados depois de uma decisão (batendo as asas ou não), a partir de `states` (..., linhas, alturas)."""
+        following = np.zeros_like(states)
+        following[..., 1:, :] = states[..., :-1, :]
+        flapped = following[..., 1, :]
+
+        # Batendo as asas, a altura da batida passa a ser a posição atual
+        for row in range(self.flap_interval, len(self.shifts)):
+            shift = self.shifts[row]
+            first = max(0, -shift)
+            last = max(first, min(self.heights, self.heights - shift))
+            flapped[..., first + shift : last + shift] |= states[..., row, first:last]
+
+        # No teto a posição para em 0 com velocidade (quase) zero
+        roof = following[..., self.ceiling, -self.shifts[self.ceiling]]
+
+        for row, cells in self._roofs:
+            roof |= following[..., row, :cells].any(axis=-1)
+            following[..., row, :cells] = False
+
+        following[..., self.ceiling, -self.shifts[self.ceiling]] = roof
+        return following & self.ground
+
+    def _retreat(self, states: np.ndarray) -> np.ndarray:
+        """Estados de onde alguma decisão leva a `states` (o inverso de `_advance`)."""
+        landing = states.copy()
+        roof = states[..., self.ceiling, -self.shifts[self.ceiling]]
+
+        for row, cells in self._roofs:
+            landing[..., row, :cells] = roof[..., None]
+
+        previous = np.zeros_like(states)
+        previous[..., :-1, :] = landing[..., 1:, :]
+        flapped = landing[..., 1, :]
+
+        for row in range(self.flap_interval, len(self.shifts)):
+            shift = self.shifts[row]
+            first = max(0, -shift)
+            last = max(first, min(self.heights, self.heights - shift))
+            previous[..., row, first:last] |= flapped[..., first + shift : last + shift]
+
+        return previous & self.ground
+
+    # --- Conjuntos por altura de vão ---
+
+    def _entries(self, offsets: np.ndarray) -> np.ndarray:
+        """Estados na entrada de cada cano de onde dá para atravessá-lo, shape (offsets, linhas, alturas)."""
+        bands = self.bands[offsets - config.PIPE_VERTICAL_OFFSET_MIN]
+        states = bands.copy()
+
+        for _ in range(self.overlap - 1):
+            states = self._retreat(states) & bands
+
+        return states
+
+    def _arrivals(self, offsets: np.ndarray) -> np.ndarray:
+        """Estados com que o pássaro chega ao cano seguinte depois de atravessar cada vão, de qualquer altura nele."""
+        bands = self.bands[offsets - config.PIPE_VERTICAL_OFFSET_MIN]
+        states = bands.copy()
+
+        for sample in range(1, self.period + 1):
+            states = self._advance(states)
+
+            if sample < self.overlap:
+                states &= bands
+
+        return states
+
+    def _positions(self, states: np.ndarray) -> np.ndarray:
+        """Reindexa `states` pela posição atual do pássaro (altura da batida + deslocamento), não pela da batida."""
+        positions = np.zeros_like(states)
+
+        for row, shift in enumerate(self.shifts.tolist()):
+            first = max(0, -shift)
+            last = max(first, min(self.heights, self.heights - shift))
+            positions[..., row, first + shift : last + shift] = states[..., row, first:last]
+
+        return positions
+
+    def _windows(self) -> np.ndarray:
+        """Janela (px) de todas as transições: alturas de entrada alcançáveis e que atravessam o cano seguinte."""
+        arrivals = self._positions(self._arrivals(self.offsets))
+        entries = self._positions(self._entries(self.offsets))
+        # Só as alturas de algum vão importam; a contagem por altura é um produto de matrizes por célula
+        cells = np.flatnonzero(entries.any(axis=(0, 1)))
+        counts = np.zeros((len(self.offsets), len(self.offsets)), dtype=np.int32)
+
+        for chunk in np.array_split(cells, max(1, len(cells) // 32)):
+            reach = arrivals[:, :, chunk].transpose(2, 0, 1).astype(np.float32)
+            viable = entries[:, :, chunk].transpose(2, 1, 0).astype(np.float32)
+            counts += (np.matmul(reach, viable) > 0).sum(axis=0, dtype=np.int32)
+
+        return counts / self.resolution
+
+    # --- Consultas ---
+
+    def fair(self, previous: np.ndarray, following: np.ndarray) -> np.ndarray:
+        """
+        Se cada transição tem janela de pelo menos `min_window`.
+
+        Args:
+            previous (np.ndarray): Alturas (deslocamento vertical) dos vãos anteriores.
+            following (np.ndarray): Alturas dos vãos seguintes (mesmo shape).
+
+        Returns:
+            np.ndarray: Booleanos, um por transição.
+        """
+        low = config.PIPE_VERTICAL_OFFSET_MIN
+        return self.window[np.asarray(previous) - low, np.asarray(following) - low] >= self.min_window
+
+    def check(self, gaps: np.ndarray) -> np.ndarray:
+        """
+        Procura as transições injustas de um percurso.
+
+        Args:
+            gaps (np.ndarray): Alturas dos vãos, na ordem do percurso.
+
+        Returns:
+            np.ndarray: Índices dos vãos que não são alcançados com folga a partir do anterior.
+        """
+        gaps = np.asarray(gaps)
+        return np.flatnonzero(~self.fair(gaps[:-1], gaps[1:])) + 1
+
+    def constrain(
+        self, gaps: np.ndarray, rng: np.random.Generator, max_rerolls: int = config.COURSE_MAX_REROLLS
+    ) -> np.ndarray:
+        """
+        Sorteia de novo (com `rng`) os vãos até que todas as transições sejam justas.
+
+        O primeiro vão passa a ser um dos `reachable`: o bloco seguinte de um
+        percurso pode ser gerado sem conhecer o fim deste.
+
+        Args:
+            gaps (np.ndarray): Alturas sorteadas sem restrição.
+            rng (np.random.Generator): Gerador dos novos sorteios.
+            max_rerolls (int): Rodadas de novos sorteios antes de desistir.
+
+        Returns:
+            np.ndarray: Cópia de `gaps` só com transições justas.
+
+        Raises:
+            ValueError: Se nenhuma altura é alcançável de todas as outras, ou se as transições
+                continuam injustas depois de `max_rerolls` rodadas (parâmetros do modelo exigentes demais).
+        """
+        settings = (
+            f"COURSE_MIN_WINDOW={self.min_window}, COURSE_FLAP_INTERVAL={self.flap_interval * self.step:g} s, "
+            f"COURSE_ANALYSIS_MARGIN={self.margin}"
+        )
+
+        if not self.reachable.size:
+            raise ValueError(f"Nenhuma altura de vão é alcançável com folga a partir de todas as outras ({settings})")
+
+        gaps = np.array(gaps)
+
+        for _ in range(max_rerolls + 1):
+            unfair = self.check(gaps)
+
+            if not np.isin(gaps[0], self.reachable):
+                unfair = np.append(0, unfair)
+
+            if not unfair.size:
+                return gaps
+
+            gaps[unfair] = rng.integers(
+                config.PIPE_VERTICAL_OFFSET_MIN, config.PIPE_VERTICAL_OFFSET_MAX, unfair.size, endpoint=True
+            )
+
+        raise ValueError(f"Transições injustas depois de {max_rerolls} rodadas de novos sorteios ({settings})")
+
+    def states(self, previous: int, following: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Estados na entrada do cano seguinte que vêm do vão anterior e atravessam o seguinte.
+
+        Args:
+            previous (int): Altura do vão anterior.
+            following (int): Altura do vão seguinte.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Topos do pássaro (px) e velocidades (pixels/s) dos estados.
+        """
+        reach = self._arrivals(np.array([previous]))[0] & self._entries(np.array([following]))[0]
+        rows, cells = np.nonzero(reach)
+        return (cells + self.shifts[rows]) / self.resolution, self.velocities[rows]
+
+    def trace(self, courses: np.ndarray) -> np.ndarray:
+        """
+        Segue o conjunto de estados alcançáveis ao longo de percursos inteiros (sem a tabela por pares).
+
+        O pássaro começa em qualquer altura dentro do primeiro vão.
+
+        Args:
+            courses (np.ndarray): Alturas dos vãos, shape (percursos, vãos).
+
+        Returns:
+            np.ndarray: Quantos vãos de cada percurso são atravessados antes do primeiro impossível.
+        """
+        courses = np.atleast_2d(courses)
+        count, length = courses.shape
+        passed = np.full(count, length)
+        states = np.broadcast_to(self.ground, (count, *self.ground.shape)).copy()
+
+        for index in range(length):
+            bands = self.bands[courses[:, index] - config.PIPE_VERTICAL_OFFSET_MIN]
+
+            for sample in range(self.period):
+                if index or sample:
+                    states = self._advance(states)
+
+                if sample < self.overlap:
+                    states &= bands
+
+            blocked = ~states.any(axis=(1, 2)) & (passed == length)
+            passed[blocked] = index
+
+        return passed
@@ -1,10 +1,28 @@
+import argparse
+import os
+import random
 import sys
+import time
 
+import numpy as np
 import pygame
 
 import config
+from autopilot import Autopilot
+from course import Course
+from frame_pacer import FramePacer
+from frame_profiler import FrameProfiler
 from game import Game
 from game_state import GameState
+from input_latency import InputLatency
+from pixel_observer import PixelObserver
+from population import Population
+from population_policy import PopulationPolicy
+from population_renderer import PopulationRenderer
+from profiler_phase import ProfilerPhase
+from replay_player import ReplayPlayer
+from session_log import SessionLog
+from simulation import Simulation
 
 
 class FlappyBird:
@@ -17,15 +35,53 @@ class FlappyBird:
     Attributes:
         screen (pygame.Surface): A superfície principal onde tudo é renderizado.
         clock (pygame.time.Clock): Gerencia a taxa de quadros (FPS) e o delta time.
+        pacer (FramePacer): Escolhe a taxa de quadros de cada estado (economia de energia).
         game (Game): A instância da lógica central do jogo.
+        fixed_step (float | None): Passo fixo da simulação (None = delta time variável).
+        profiler (FrameProfiler): Mede o tempo de cada fase do quadro (desligado por padrão).
+        trace_file (str | None): Arquivo do trace do Chrome gravado ao sair (None = não grava).
+        input_latency (InputLatency): Mede a latência clique -> tela (desligada por padrão).
+        latency_file (str | None): Arquivo da distribuição da latência gravado ao sair (None = não grava).
+        session_log (SessionLog | None): Registro da sessão, gravado em `SESSION_LOG_DIR` ao sair.
+        autopilot (Autopilot | None): Piloto automático do modo demonstração (None = desligado).
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        seed: int | None = None,
+        fixed_step: float | None = config.SIMULATION_STEP,
+        dirty_rects: bool = config.DIRTY_RECTS,
+        profiler: FrameProfiler | None = None,
+        trace_file: str | None = None,
+        power_save: bool = config.POWER_SAVE,
+        latency_file: str | None = None,
+        record: bool = config.SESSION_RECORDING,
+        autopilot: bool = False,
+        course_file: str | None = None,
+    ) -> None:
         """
         Inicializa o ambiente do jogo e configurações de vídeo/áudio.
 
         Configura o mixer, inicia o Pygame, cria a janela com VSync habilitado
         para suavidade, e instancia a lógica do jogo (Game).
+
+        Args:
+            seed (int | None): Semente da sessão. Com passo fixo, a mesma semente e os
+                mesmos inputs reproduzem a partida de forma idêntica.
+            fixed_step (float | None): Passo fixo da simulação em segundos.
+            dirty_rects (bool): Se True, atualiza apenas as regiões da tela que mudaram.
+            profiler (FrameProfiler | None): Profiler do loop principal (None = desligado).
+            trace_file (str | None): Arquivo onde o trace do Chrome é gravado ao sair.
+            power_save (bool): Taxa máxima só em RUNNING; estados parados dormem até o próximo evento.
+            latency_file (str | None): Se informado, mede a latência clique -> tela e grava a
+                distribuição neste arquivo ao sair.
+            record (bool): Grava a sessão (semente, passo fixo e inputs) para replay. Exige
+                passo fixo; sem `fixed_step`, a sessão gravada usa 1 / FPS. Ignorado com
+                `course_file` (o registro guarda só a semente, não o percurso).
+            autopilot (bool): Modo demonstração: o `Autopilot` joga sozinho (e reinicia) no
+                lugar dos cliques. Desliga a economia de energia, que esperaria por inputs.
+            course_file (str | None): Percurso fixo gravado por `Course.save` (desafio do dia),
+                no lugar do gerado a partir de `seed`.
         """
         pygame.mixer.pre_init(channels=config.MIXER_CHANNELS)
         pygame.init()
@@ -47,7 +103,31 @@ class FlappyBird:
 
         # Inicialização da Lógica
         self.clock = pygame.time.Clock()
-        self.game = Game(self.screen)
+        self.autopilot = Autopilot() if autopilot else None
+        self.pacer = FramePacer(self.clock, power_save and not autopilot)
+        self.session_log: SessionLog | None = None
+
+        if record and course_file is None:
+            # O replay só é exato com semente conhecida e passo fixo
+            seed = seed if seed is not None else random.randrange(2**63)
+            fixed_step = fixed_step or 1 / config.FPS
+            self.session_log = SessionLog(seed, fixed_step)
+
+        self.fixed_step = fixed_step
+        self.profiler = profiler if profiler is not None else FrameProfiler()
+        self.trace_file = trace_file
+        self.input_latency = InputLatency(enabled=latency_file is not None)
+        self.latency_file = latency_file
+        self.game = Game(
+            self.screen,
+            seed=seed,
+            dirty_rects=dirty_rects,
+            profiler=self.profiler,
+            input_latency=self.input_latency,
+            session_log=self.session_log,
+            autopilot=self.autopilot,
+            course=Course.open(course_file) if course_file else None,
+        )
         self.game.start_level()
 
     def start(self) -> None:
@@ -59,22 +139,387 @@ class FlappyBird:
         1. Processamento de eventos (handle_events).
         2. Atualização lógica (update).
         3. Renderização (draw).
-        4. Controle de tempo (tick).
+        4. Controle de tempo (`FramePacer`: taxa máxima em RUNNING, menor ou só
+           por eventos nos estados parados).
+
+        No modo de passo fixo, o tempo real de cada quadro é acumulado e a
+        simulação avança em passos de `fixed_step`, independente do FPS da tela.
+
+        Cada `update` recebe o horário real a que corresponde o fim do intervalo
+        simulado, para que as batidas de asas (com o horário anotado pelo
+        `FramePacer`) caiam no sub-passo em que aconteceram.
         """
         dt = 0
+        accumulator = 0
+        events = []
+        self.profiler.start()
 
         while not self.game.level_manager.state == GameState.EXIT:
-            self.game.handle_events()
-            self.game.update(dt)
+            self.game.handle_events(events)
+            self.profiler.mark(ProfilerPhase.EVENTS)
+
+            if self.fixed_step is None:
+                self.game.update(dt, self.pacer.last)
+            else:
+                # Limita o acumulado para não "correr atrás" após travamentos longos da janela
+                accumulator = min(accumulator + dt, config.MAX_FRAME_TIME)
+                # O que sobra no acumulador ainda não foi simulado
+                end_time = self.pacer.last - accumulator
+
+                while accumulator >= self.fixed_step:
+                    end_time += self.fixed_step
+                    self.game.update(self.fixed_step, end_time)
+                    accumulator -= self.fixed_step
+
             self.game.draw()
 
-            # Calcula o delta time em segundos (t / 1000) para movimento independente de FPS
-            dt = self.clock.tick(config.FPS) / 1_000
+            # Delta time em segundos para movimento independente de FPS
+            dt, events = self.pacer.wait(
+                self.game.level_manager.state, self.game.level_manager.player.state, self.game.animating
+            )
+            self.profiler.mark(ProfilerPhase.WAIT)
+            self.profiler.end_frame()
 
         # Limpeza e saída segura
+        if self.session_log:
+            self.session_log.frames = self.game.frame
+            self.session_log.save(
+                os.path.join(config.SESSION_LOG_DIR, time.strftime("session-%Y%m%d-%H%M%S.fbsl"))
+            )
+
+        if self.trace_file:
+            self.profiler.dump(self.trace_file)
+
+        if self.latency_file:
+            self.input_latency.dump(self.latency_file)
+            stats = self.input_latency.stats()
+
+            if stats:
+                print(
+                    f"latência clique -> tela ({stats['count']} cliques): p50 {stats['p50']:.2f} ms, "
+                    f"p90 {stats['p90']:.2f} ms, p99 {stats['p99']:.2f} ms, máx {stats['max']:.2f} ms"
+                )
+
+        if self.autopilot:
+            stats = self.autopilot.stats()
+
+            if stats:
+                print(
+                    f"piloto automático ({stats['decisions']} decisões, {stats['searches']} buscas): "
+                    f"média {stats['mean']:.3f} ms, máx {stats['max']:.2f} ms, "
+                    f"{stats['slow']} acima de {self.autopilot.budget * 1_000:g} ms"
+                )
+
+        pygame.quit()
+        sys.exit()
+
+    def replay(self, path: str, speed: float = 1.0, seek: float = 0.0) -> None:
+        """
+        Reproduz uma sessão gravada na janela do jogo (ver `ReplayPlayer.play`).
+
+        Args:
+            path (str): Arquivo gravado pelo `SessionLog`.
+            speed (float): Velocidade inicial (1 = tempo real).
+            seek (float): Instante inicial da reprodução em segundos de jogo.
+        """
+        player = ReplayPlayer(SessionLog.load(path), self.screen, dirty_rects=self.game.dirty_rects)
+        player.seek_time(seek)
+        player.play(speed)
         pygame.quit()
         sys.exit()
 
+    def population(self, size: int = config.POPULATION_SIZE, seed: int | None = None) -> None:
+        """
+        Modo população: `size` pássaros no mesmo percurso, cada um com seu controlador.
+
+        Cada corrida vai até o último pássaro cair (ou `POPULATION_MAX_TIME`);
+        então os controladores evoluem (`PopulationPolicy.evolve`) e uma corrida
+        nova começa. Um passo fixo de 1 / FPS por quadro. ESC ou fechar a janela sai.
+
+        Args:
+            size (int): Pássaros por corrida.
+            seed (int | None): Semente dos controladores (o percurso é o da sessão).
+        """
+        population = Population(size, seed=seed, course=self.game.level_manager.course)
+        policy = PopulationPolicy(size, seed=seed)
+        renderer = PopulationRenderer(self.screen, self.game.asset_manager)
+        observations = population.observations()
+        alive = None
+
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    pygame.quit()
+                    sys.exit()
+
+            observations, _, _ = population.step(policy.act(observations, population.ids))
+
+            if not population.size or population.time >= config.POPULATION_MAX_TIME:
+                print(
+                    f"geração {policy.generation}: melhor {population.scores.max()} moedas, "
+                    f"{population.survival.max():.1f} s, {population.size} chegaram ao fim"
+                )
+                # Sobreviver vale 1 por segundo; cada moeda vale mais que o trecho até ela
+                policy.evolve(population.survival + population.scores)
+                observations = population.reset()
+
+            renderer.draw(population)
+            pygame.display.flip()
+
+            if population.size != alive:
+                alive = population.size
+                pygame.display.set_caption(
+                    f"{config.SCREEN_TITLE} - geração {policy.generation}, {alive}/{size} vivos"
+                )
+
+            self.clock.tick(config.FPS)
+
+
+class FlappyBirdEnv:
+    """
+    Ambiente programático no estilo Gym (`reset()`/`step()`) para agentes e bots.
+
+    Diferente do `FlappyBird.start`, não existe loop preso ao relógio: cada
+    `step` avança a simulação um passo fixo (`dt`), sem `vsync`, sem
+    `clock.tick` e sem áudio. Sem renderização, apenas a `Simulation` é usada
+    (nem o Pygame é inicializado). Com renderização, o `Game` desenha em uma
+    janela do driver `SDL_VIDEODRIVER=dummy` (a menos que outro driver seja
+    definido), o que permite rodar em containers sem GPU ou monitor.
+
+    Com `pixels=True`, as observações são os últimos quadros desenhados
+    (`PixelObserver`: tons de cinza, reduzidos e empilhados) e o `Game` não
+    envia nada ao monitor (sem `display.flip`).
+
+    Attributes:
+        dt (float): Passo fixo da simulação (segundos).
+        game (Game | None): Jogo usado para desenhar (apenas com renderização).
+        observer (PixelObserver | None): Fonte das observações em pixels (apenas com `pixels`).
+        course (Course): Percurso da sessão; `reset(seed)` o reinicia.
+        simulation (Simulation): A partida atual.
+    """
+
+    OBSERVATION_SIZE = 4
+    """Centro vertical do pássaro, velocidade, distância e altura do próximo vão."""
+
+    def __init__(self, render: bool = False, dt: float = 1 / config.FPS, pixels: bool = False) -> None:
+        """
+        Prepara o ambiente.
+
+        Args:
+            render (bool): Se True, desenha cada passo com o `Game` (tela em memória).
+            dt (float): Passo fixo da simulação em segundos.
+            pixels (bool): Se True, observa os pixels da tela em vez do estado (implica `render`).
+        """
+        self.dt = dt
+        self.game: Game | None = None
+        self.observer: PixelObserver | None = None
+
+        if render or pixels:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            pygame.display.init()
+            screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+            self.game = Game(screen, audio=False, present=not pixels)
+            self.course = self.game.level_manager.course
+
+            if pixels:
+                self.observer = PixelObserver(screen)
+        else:
+            self.course = Course()
+
+        self.simulation = Simulation(self.course)
+
+    def reset(self, seed: int | None = None) -> tuple[np.ndarray, dict]:
+        """
+        Começa uma nova partida já em andamento (equivalente ao primeiro clique).
+
+        Args:
+            seed (int | None): Semente para as alturas dos vãos.
+
+        Returns:
+            tuple: (observação, info).
+        """
+        if seed is not None:
+            self.course.seed(seed)
+
+        if self.game:
+            self.game.start_level()
+            self.game.flap()
+            self.simulation = self.game.level_manager.simulation
+            self.game.handle_simulation_events()
+
+            if self.observer:
+                self.game.draw()
+                return self.observer.reset(), self.info()
+        else:
+            # Reinício no lugar: reaproveita os corpos da partida anterior
+            self.simulation.restart()
+            self.simulation.start()
+            self.simulation.events.clear()
+
+        return self.observation(), self.info()
+
+    def step(self, action: int) -> tuple[np.ndarray, float, bool, dict]:
+        """
+        Aplica a ação e avança a simulação um passo fixo.
+
+        Args:
+            action (int): 1 para bater as asas, 0 para não fazer nada.
+
+        Returns:
+            tuple: (observação, recompensa, terminado, info). A recompensa é o
+            número de moedas coletadas no passo; a partida termina na colisão.
+        """
+        score = self.simulation.score
+
+        if self.game:
+            # Mantém a fila de eventos do SDL drenada, mesmo sem ler inputs
+            pygame.event.pump()
+
+            if action:
+                self.game.flap()
+
+            self.game.update(self.dt)
+            self.game.draw()
+
+            if self.observer:
+                self.observer.capture()
+        else:
+            if action and self.simulation.state == GameState.RUNNING:
+                self.simulation.move_up()
+
+            self.simulation.update(self.dt)
+            self.simulation.events.clear()
+
+        terminated = self.simulation.state == GameState.GAMEOVER
+        return self.observation(), float(self.simulation.score - score), terminated, self.info()
+
+    def observation(self) -> np.ndarray:
+        """
+        Monta a observação da partida atual (mesmo formato da `BatchSimulation`).
+
+        Returns:
+            np.ndarray: (4,) float32 com centro vertical do pássaro, velocidade,
+            distância horizontal até o fim do próximo obstáculo e centro do próximo vão.
+            Com `pixels`, a pilha de quadros do `PixelObserver` ((stack, altura, largura) uint8).
+        """
+        if self.observer:
+            return self.observer.observation()
+
+        player = self.simulation.player
+        # Próximo obstáculo: o mais à esquerda que ainda não passou pelo pássaro
+        obstacle = min(
+            (obstacle for obstacle in self.simulation.obstacles if obstacle.right > player.x),
+            key=lambda obstacle: obstacle.x,
+        )
+
+        return np.array(
+            [player.y + player.height // 2, player.change_y, obstacle.right - player.x, obstacle.center_y],
+            dtype=np.float32,
+        )
+
+    def info(self) -> dict:
+        """Informações extras da partida (pontuação, estados e os próximos `COURSE_LOOKAHEAD` vãos fora da tela)."""
+        return {
+            "score": self.simulation.score,
+            "state": self.simulation.state,
+            "player_state": self.simulation.player.state,
+            "upcoming_gaps": self.simulation.upcoming_gaps(config.COURSE_LOOKAHEAD),
+        }
+
+    def close(self) -> None:
+        """Libera o Pygame (apenas com renderização)."""
+        if self.game:
+            pygame.quit()
+
 
 if __name__ == "__main__":
-    FlappyBird().start()
+    parser = argparse.ArgumentParser(description=config.SCREEN_TITLE)
+    parser.add_argument("--seed", type=int, default=None, help="Semente da sessão (partidas reproduzíveis)")
+    parser.add_argument(
+        "--fixed-step",
+        type=float,
+        default=config.SIMULATION_STEP,
+        help="Passo fixo da simulação em segundos (ex: 0.008333)",
+    )
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        default=config.DIRTY_RECTS,
+        help="Redesenha apenas as regiões da tela que mudaram",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=config.PROFILER_TRACE_FILE,
+        default=None,
+        metavar="TRACE_FILE",
+        help="Mede o tempo de cada fase do quadro e grava um trace do Chrome ao sair",
+    )
+    parser.add_argument(
+        "--profile-graph",
+        action="store_true",
+        help="Exibe o gráfico do tempo de quadro (p50/p99) na tela (implica --profile)",
+    )
+    parser.add_argument(
+        "--power-save",
+        action=argparse.BooleanOptionalAction,
+        default=config.POWER_SAVE,
+        help="Taxa máxima só durante a partida; telas paradas só redesenham ao receber input",
+    )
+    parser.add_argument(
+        "--input-latency",
+        nargs="?",
+        const=config.INPUT_LATENCY_FILE,
+        default=None,
+        metavar="LATENCY_FILE",
+        help="Mede a latência entre o clique e a imagem na tela e grava a distribuição ao sair",
+    )
+    parser.add_argument(
+        "--record",
+        action=argparse.BooleanOptionalAction,
+        default=config.SESSION_RECORDING,
+        help=f"Grava a sessão em {config.SESSION_LOG_DIR}/ para replay",
+    )
+    parser.add_argument(
+        "--autopilot",
+        action="store_true",
+        help="Modo demonstração: o piloto automático joga sozinho (os cliques são ignorados)",
+    )
+    parser.add_argument(
+        "--population",
+        type=int,
+        nargs="?",
+        const=config.POPULATION_SIZE,
+        default=None,
+        metavar="BIRDS",
+        help="Modo população: vários pássaros no mesmo percurso, controladores evoluídos a cada corrida",
+    )
+    parser.add_argument(
+        "--course", default=None, metavar="COURSE_FILE", help="Joga um percurso fixo gravado por course.py"
+    )
+    parser.add_argument("--replay", default=None, metavar="SESSION_FILE", help="Reproduz uma sessão gravada")
+    parser.add_argument("--replay-speed", type=float, default=1.0, help="Velocidade inicial do replay")
+    parser.add_argument("--seek", type=float, default=0.0, metavar="SECONDS", help="Início do replay em segundos")
+    args = parser.parse_args()
+
+    trace_file = args.profile or (config.PROFILER_TRACE_FILE if args.profile_graph else None)
+    profiler = FrameProfiler(enabled=trace_file is not None, overlay=args.profile_graph)
+    flappy_bird = FlappyBird(
+        args.seed,
+        args.fixed_step,
+        args.dirty_rects,
+        profiler,
+        trace_file,
+        args.power_save,
+        args.input_latency,
+        args.record and not args.replay and not args.population,
+        args.autopilot,
+        args.course,
+    )
+
+    if args.replay:
+        flappy_bird.replay(args.replay, args.replay_speed, args.seek)
+    elif args.population:
+        flappy_bird.population(args.population, args.seed)
+    else:
+        flappy_bird.start()
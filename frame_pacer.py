@@ -0,0 +1,142 @@
+import time
+
+import pygame
+
+import config
+from game_state import GameState
+from player_state import PlayerState
+
+
+class FramePacer:
+    """
+    Controle de tempo do loop principal, adaptado ao estado da partida.
+
+    Substitui o `clock.tick(config.FPS)` fixo. Só a partida em andamento (e a
+    queda do pássaro até o chão, e as partículas até sumirem) roda na taxa
+    máxima; a tela inicial (IDLE), onde só o chão rola e o pássaro bate as
+    asas, roda a `idle_fps`; e as telas paradas (PAUSED e GAMEOVER com o
+    pássaro DEAD) não avançam nada e só produzem um quadro novo quando chega
+    um evento.
+
+    A espera é feita com `pygame.event.wait(timeout)`: o processo dorme sem
+    consumir CPU, acorda no mesmo instante em que chega um input e anota o
+    horário de chegada de cada evento (`event.timestamp`). Os eventos são
+    devolvidos para o `Game.handle_events` do próximo quadro, que aplica as
+    batidas de asas no sub-passo da simulação em que aconteceram.
+
+    Attributes:
+        clock (pygame.time.Clock): Relógio do loop principal (mantido em dia para `get_fps`).
+        power_save (bool): Se False, todos os estados rodam na taxa máxima (comportamento original).
+        fps (int): Taxa máxima (RUNNING e queda do pássaro).
+        idle_fps (int): Taxa da tela inicial (IDLE).
+        static_timeout (int): Espera máxima (ms) de uma tela parada sem eventos.
+        last (float): Fim da última espera (`time.perf_counter`), o fim do intervalo já simulado.
+        deadline (float): Prazo da última espera (`time.perf_counter`).
+    """
+
+    def __init__(
+        self,
+        clock: pygame.time.Clock,
+        power_save: bool = config.POWER_SAVE,
+        fps: int = config.FPS,
+        idle_fps: int = config.IDLE_FPS,
+        static_timeout: int = config.STATIC_WAKE_TIMEOUT,
+    ) -> None:
+        """
+        Prepara o controle de tempo a partir do relógio do loop principal.
+
+        Args:
+            clock (pygame.time.Clock): Relógio do loop principal.
+            power_save (bool): Liga a economia de energia nos estados parados.
+            fps (int): Taxa máxima de quadros.
+            idle_fps (int): Taxa de quadros em IDLE.
+            static_timeout (int): Espera máxima (ms) em telas paradas.
+        """
+        self.clock = clock
+        self.power_save = power_save
+        self.fps = fps
+        self.idle_fps = idle_fps
+        self.static_timeout = static_timeout
+        self.last = self.deadline = time.perf_counter()
+
+    def rate(self, state: GameState, player_state: PlayerState, animating: bool = False) -> int | None:
+        """
+        Taxa de quadros de um estado.
+
+        Args:
+            state (GameState): Estado da partida.
+            player_state (PlayerState): Estado do pássaro (a queda em GAMEOVER ainda é animada).
+            animating (bool): Se há efeitos (partículas) ainda em movimento na tela.
+
+        Returns:
+            int | None: Quadros por segundo, ou None para telas paradas (só eventos).
+        """
+        if not self.power_save or state == GameState.RUNNING or animating:
+            return self.fps
+
+        if state == GameState.IDLE:
+            return self.idle_fps
+
+        if state == GameState.GAMEOVER and player_state != PlayerState.DEAD:
+            return self.fps
+
+        return None
+
+    def wait(
+        self, state: GameState, player_state: PlayerState, animating: bool = False
+    ) -> tuple[float, list[pygame.event.Event]]:
+        """
+        Espera o próximo quadro do estado atual, anotando o horário de chegada dos eventos.
+
+        A espera é sempre feita com `pygame.event.wait`, então cada evento que
+        chega durante ela recebe `event.timestamp` (`time.perf_counter`, em
+        segundos) no instante em que chegou. Na taxa máxima o quadro mantém o
+        ritmo e os eventos são acumulados até o fim da espera; nos outros
+        estados o primeiro evento encerra a espera na hora.
+
+        Args:
+            state (GameState): Estado da partida.
+            player_state (PlayerState): Estado do pássaro.
+            animating (bool): Se há efeitos (partículas) ainda em movimento na tela.
+
+        Returns:
+            tuple: (delta time em segundos, eventos que chegaram durante a espera).
+            Telas paradas retornam delta time 0: nada se move nelas, e o tempo
+            parado não pode virar um salto quando a partida continua.
+        """
+        rate = self.rate(state, player_state, animating)
+        now = time.perf_counter()
+
+        # Na taxa máxima o próximo prazo conta a partir do anterior, para que atrasos do
+        # `event.wait` (resolução de 1 ms) não se acumulem; se ficou um quadro para trás, recomeça
+        if rate == self.fps and now - self.deadline < 1 / rate:
+            deadline = self.deadline + 1 / rate
+        else:
+            deadline = self.last + (1 / rate if rate is not None else self.static_timeout / 1_000)
+
+        self.deadline = deadline
+        events = []
+
+        while (timeout := int((deadline - time.perf_counter()) * 1_000)) > 0:
+            event = pygame.event.wait(timeout)
+
+            if event.type == pygame.NOEVENT:
+                continue
+
+            event.timestamp = time.perf_counter()
+            events.append(event)
+
+            # Fora da taxa máxima, qualquer input acorda o loop imediatamente
+            if rate != self.fps:
+                break
+
+        # O que chegou durante o último milissegundo da espera
+        now = time.perf_counter()
+
+        for event in pygame.event.get():
+            event.timestamp = now
+            events.append(event)
+
+        dt, self.last = now - self.last, now
+        self.clock.tick()
+        return (dt if rate is not None else 0.0), events
@@ -0,0 +1,241 @@
+import json
+import time
+
+import numpy as np
+import pygame
+
+import config
+from profiler_phase import ProfilerPhase
+
+
+class FrameProfiler:
+    """
+    Instrumentação leve do loop principal, por fase do quadro.
+
+    O loop chama `mark(fase)` ao fim de cada fase e `end_frame()` ao fim do
+    quadro. Cada marcação grava o intervalo desde a marcação anterior em
+    buffers circulares (ring buffers) de tamanho fixo, alocados uma única vez:
+    apenas o histórico mais recente é mantido. Desligado, `mark`
+    retorna na primeira linha, então pode ficar no código de produção.
+
+    O histórico pode ser exibido na tela (gráfico do tempo de quadro com
+    p50/p99) e exportado no formato `trace_event` do Chrome
+    (abra em chrome://tracing ou https://ui.perfetto.dev).
+
+    Attributes:
+        enabled (bool): Se False, nenhuma medição é feita.
+        overlay (bool): Se True, `draw` desenha o gráfico do tempo de quadro.
+        history (int): Número de quadros mantidos no buffer circular.
+        frame (int): Quadros medidos desde o início.
+        frame_times (np.ndarray): (history,) duração de cada quadro (segundos).
+        phase_times (np.ndarray): (history, fases) tempo de cada fase por quadro (segundos).
+    """
+
+    MAX_MARKS_PER_FRAME = 32
+    """Marcações guardadas por quadro, em média (vários passos fixos geram várias marcações)."""
+
+    def __init__(self, enabled: bool = False, overlay: bool = False, history: int = config.PROFILER_HISTORY) -> None:
+        """
+        Prepara os buffers (apenas se ligado).
+
+        Args:
+            enabled (bool): Liga as medições.
+            overlay (bool): Exibe o gráfico na tela (só tem efeito se `enabled`).
+            history (int): Quadros mantidos no histórico.
+        """
+        self.enabled = enabled
+        self.overlay = enabled and overlay
+        self.history = history
+        self.frame = 0
+
+        if not enabled:
+            return
+
+        # --- Buffers circulares (alocados uma única vez) ---
+        self.frame_times = np.zeros(history)
+        self.phase_times = np.zeros((history, len(ProfilerPhase)))
+        self.frame_starts = np.zeros(history)
+
+        # As marcações usam listas simples: gravar um item é bem mais barato que em um array NumPy
+        marks = history * self.MAX_MARKS_PER_FRAME
+        self.mark_phases = [0] * marks
+        self.mark_starts = [0.0] * marks
+        self.mark_ends = [0.0] * marks
+        self.marks = 0
+        self.current = [0.0] * len(ProfilerPhase)
+
+        self.origin = self.last = self.frame_start = time.perf_counter()
+
+        # --- Gráfico na tela ---
+        self.graph_rect = pygame.Rect(4, 4, config.PROFILER_GRAPH_WIDTH, config.PROFILER_GRAPH_HEIGHT)
+        self.graph = pygame.Surface(self.graph_rect.size, pygame.SRCALPHA)
+        self.font: pygame.font.Font | None = None
+        self.label: pygame.Surface | None = None
+
+    def start(self) -> None:
+        """Reinicia o relógio do quadro atual (chamado logo antes do loop principal)."""
+        if not self.enabled:
+            return
+
+        self.last = self.frame_start = time.perf_counter()
+
+    def mark(self, phase: ProfilerPhase) -> None:
+        """
+        Encerra a fase `phase`: o tempo desde a última marcação é atribuído a ela.
+
+        Args:
+            phase (ProfilerPhase): A fase que acabou de terminar.
+        """
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+        index = self.marks % len(self.mark_phases)
+        value = phase.value
+        self.mark_phases[index] = value
+        self.mark_starts[index] = self.last
+        self.mark_ends[index] = now
+        self.marks += 1
+
+        self.current[value] += now - self.last
+        self.last = now
+
+    def end_frame(self) -> None:
+        """Fecha o quadro atual (a partir da última marcação) e abre o próximo."""
+        if not self.enabled:
+            return
+
+        index = self.frame % self.history
+        self.frame_times[index] = self.last - self.frame_start
+        self.frame_starts[index] = self.frame_start
+        self.phase_times[index] = self.current
+        self.frame += 1
+        self.frame_start = self.last
+
+        # Zera os acumuladores do próximo quadro (no lugar, sem alocar)
+        for value in range(len(self.current)):
+            self.current[value] = 0.0
+
+    # --- Estatísticas ---
+
+    def _filled(self) -> slice:
+        """Parte já preenchida dos buffers de quadros."""
+        return slice(0, min(self.frame, self.history))
+
+    def stats(self) -> dict[str, tuple[float, float]]:
+        """
+        Percentis do histórico atual.
+
+        Returns:
+            dict: "frame" e o nome de cada fase -> (p50, p99) em milissegundos.
+        """
+        if not self.enabled or self.frame == 0:
+            return {}
+
+        filled = self._filled()
+        p50, p99 = np.percentile(self.frame_times[filled], [50, 99]) * 1_000
+        result = {"frame": (float(p50), float(p99))}
+
+        for phase in ProfilerPhase:
+            p50, p99 = np.percentile(self.phase_times[filled, phase.value], [50, 99]) * 1_000
+            result[phase.name.lower()] = (float(p50), float(p99))
+
+        return result
+
+    # --- Gráfico na tela ---
+
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
+        """
+        Desenha o gráfico do tempo de quadro (mais recentes à direita) com p50/p99.
+
+        A linha horizontal marca o orçamento de um quadro (1 / FPS).
+
+        Args:
+            screen (pygame.Surface): Superfície de destino.
+
+        Returns:
+            pygame.Rect: A região da tela que foi desenhada.
+        """
+        width, height = self.graph_rect.size
+        budget = 1 / config.FPS
+        self.graph.fill((0, 0, 0, 160))
+
+        # Um quadro por coluna, escala de 0 a 2x o orçamento
+        count = min(self.frame, self.history, width)
+        for column in range(count):
+            frame_time = self.frame_times[(self.frame - count + column) % self.history]
+            bar = min(height, int(frame_time / (2 * budget) * height))
+            color = (90, 220, 90) if frame_time <= budget else (240, 80, 60)
+            x = width - count + column
+            pygame.draw.line(self.graph, color, (x, height - 1), (x, height - bar))
+
+        pygame.draw.line(self.graph, (255, 255, 255), (0, height // 2), (width, height // 2))
+
+        # O texto é renderizado poucas vezes por segundo (é o passo mais caro)
+        if self.label is None or self.frame % config.FPS == 0:
+            if self.font is None:
+                pygame.font.init()
+                self.font = pygame.font.Font(None, 14)
+
+            p50, p99 = self.stats().get("frame", (0.0, 0.0))
+            self.label = self.font.render(f"p50 {p50:.2f} ms  p99 {p99:.2f} ms", True, (255, 255, 255))
+
+        self.graph.blit(self.label, (2, 2))
+        return screen.blit(self.graph, self.graph_rect)
+
+    # --- Exportação ---
+
+    def trace_events(self) -> list[dict]:
+        """
+        Converte o histórico no formato `trace_event` do Chrome.
+
+        Cada quadro vira um evento "frame" e cada marcação um evento filho com o
+        nome da fase. Os tempos são em microssegundos desde a criação do profiler.
+        """
+        if not self.enabled:
+            return []
+
+        events = []
+
+        def event(name: str, category: str, start: float, end: float) -> dict:
+            return {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self.origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": 1,
+                "tid": 1,
+            }
+
+        for frame in range(max(0, self.frame - self.history), self.frame):
+            index = frame % self.history
+            start = self.frame_starts[index]
+            events.append(event("frame", "frame", start, start + self.frame_times[index]))
+
+        phases = list(ProfilerPhase)
+        for mark in range(max(0, self.marks - len(self.mark_phases)), self.marks):
+            index = mark % len(self.mark_phases)
+            events.append(
+                event(
+                    phases[self.mark_phases[index]].name.lower(),
+                    "phase",
+                    self.mark_starts[index],
+                    self.mark_ends[index],
+                )
+            )
+
+        return events
+
+    def dump(self, path: str) -> None:
+        """
+        Grava o histórico em um arquivo JSON `trace_event` do Chrome.
+
+        Args:
+            path (str): Caminho do arquivo de saída.
+        """
+        if not self.enabled:
+            return
+
+        with open(path, "w") as file:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, file)
@@ -1,20 +1,32 @@
+import random
+
 import pygame
 
 import config
 from asset_manager import AssetManager
-from coin import Coin
+from autopilot import Autopilot
+from course import Course
+from frame_profiler import FrameProfiler
 from game_state import GameState
-from helper import Helper
+from input_latency import InputLatency
 from level_manager import LevelManager
+from particle_kind import ParticleKind
+from particle_system import ParticleSystem
 from player_state import PlayerState
+from profiler_phase import ProfilerPhase
+from session_event import SessionEvent
+from session_log import SessionLog
+from simulation import Simulation
+from simulation_event import SimulationEvent
 
 
 class Game:
     """
-    Controlador central da lógica de gameplay.
+    Controlador central da partida com janela (entrada, som e desenho).
 
     Esta classe orquestra a interação entre a entrada do usuário,
-    o gerenciamento de estados (LevelManager) e a renderização (Draw).
+    a simulação (via LevelManager) e a renderização (Draw). As regras do
+    jogo ficam na `Simulation`; o Game é apenas uma camada fina sobre ela.
     Ela não contém o loop `while` principal (que fica na classe FlappyBird),
     mas executa a lógica de cada frame.
 
@@ -22,29 +34,97 @@ class Game:
         screen (pygame.Surface): Superfície onde o jogo é desenhado.
         asset_manager (AssetManager): Carregador de sons e imagens.
         level_manager (LevelManager): Gerenciador de entidades (player, canos, score).
+        dirty_rects (bool): Se True, só as regiões alteradas são redesenhadas a cada quadro.
+        profiler (FrameProfiler): Mede o tempo de cada fase do quadro (desligado por padrão).
+        input_latency (InputLatency): Mede a latência clique -> tela (desligada por padrão).
+        pending_flaps (list[float]): Horários das batidas de asas ainda não simuladas.
+        shown_flaps (list[float]): Horários das batidas já simuladas, à espera do próximo quadro na tela.
+        scheduled_flaps (list[int]): Sub-passos das batidas agendadas para o próximo `update` (replay).
+        session_log (SessionLog | None): Registro onde os inputs são gravados (None = não grava).
+        frame (int): Número de `update` executados na sessão (índice do passo nos registros).
+        autopilot (Autopilot | None): Piloto automático que joga no lugar dos cliques (None = desligado).
+        present (bool): Se False, `draw` só desenha na superfície (sem `display.flip`/`display.update`).
+        particles (ParticleSystem | None): Penas, brilhos e poeira (None = sem efeitos de partículas).
     """
 
-    def __init__(self, screen: pygame.Surface) -> None:
-        """Inicializa os gerenciadores essenciais do jogo."""
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        audio: bool = True,
+        seed: int | None = None,
+        dirty_rects: bool = config.DIRTY_RECTS,
+        profiler: FrameProfiler | None = None,
+        input_latency: InputLatency | None = None,
+        session_log: SessionLog | None = None,
+        autopilot: Autopilot | None = None,
+        present: bool = True,
+        course: Course | None = None,
+        particles: bool = config.PARTICLES,
+    ) -> None:
+        """
+        Inicializa os gerenciadores essenciais do jogo.
+
+        Args:
+            screen (pygame.Surface): Superfície onde o jogo é desenhado.
+            audio (bool): Se False, o jogo roda sem sons (sem `pygame.mixer`).
+            seed (int | None): Semente da sessão (tema e alturas dos vãos). None = aleatória.
+            dirty_rects (bool): Se True, redesenha e atualiza apenas as regiões que mudaram.
+            profiler (FrameProfiler | None): Profiler do loop principal (None = desligado).
+            input_latency (InputLatency | None): Medição da latência clique -> tela (None = desligada).
+            session_log (SessionLog | None): Registro da sessão; cada input aplicado é gravado nele.
+            autopilot (Autopilot | None): Piloto automático (modo demonstração); os cliques são ignorados.
+            present (bool): Se False, a imagem nunca é enviada ao monitor; `screen` pode ser uma
+                superfície fora da tela, lida por um `PixelObserver`.
+            course (Course | None): Percurso fixo (desafio do dia). None = gerado a partir de `seed`.
+            particles (bool): Se True, mostra os efeitos de partículas (penas, brilhos e poeira).
+        """
         self.screen = screen
-        self.asset_manager = AssetManager()
-        self.level_manager = LevelManager(self.asset_manager)
+        self.dirty_rects = dirty_rects
+        self.profiler = profiler if profiler is not None else FrameProfiler()
+        self.input_latency = input_latency if input_latency is not None else InputLatency()
+        self.pending_flaps: list[float] = []
+        self.shown_flaps: list[float] = []
+        self.scheduled_flaps: list[int] = []
+        self.session_log = session_log
+        self.frame = 0
+        self.autopilot = autopilot
+        self.present = present
+        self.asset_manager = AssetManager(audio, random.Random(seed))
+        self.level_manager = LevelManager(self.asset_manager, seed, self.profiler, course)
+        self.particles = ParticleSystem(self.asset_manager, seed=seed) if particles else None
 
     def start_level(self) -> None:
-        """Solicita ao LevelManager a criação de um novo nível limpo."""
-        self.level_manager.create_fresh_level()
+        """Solicita ao LevelManager um nível limpo (reaproveitando as entidades existentes)."""
+        self.level_manager.restart_level()
+        self.pending_flaps.clear()
+
+        if self.particles is not None:
+            self.particles.clear()
 
-    def handle_events(self) -> None:
+    @property
+    def animating(self) -> bool:
+        """Se há partículas em movimento (uma tela parada precisa continuar na taxa máxima até elas sumirem)."""
+        return self.particles is not None and self.particles.count > 0 and self.level_manager.state != GameState.PAUSED
+
+    def handle_events(self, events: list[pygame.event.Event] | None = None) -> None:
         """
         Processa a fila de eventos do Pygame (Inputs).
 
+        Args:
+            events (list[pygame.event.Event] | None): Eventos já retirados da fila
+                (ex: o que acordou o `FramePacer`), processados antes dos demais.
+
         Mapeamento:
             ESC: Encerra o jogo.
             P: Alterna entre PAUSED e RUNNING.
-            Mouse Esq (Click): Inicia o jogo (se IDLE) ou faz o pássaro voar.
+            Mouse Esq (Click): Inicia o jogo (se IDLE) ou faz o pássaro voar. Cliques com
+                horário (`event.timestamp`) são aplicados no sub-passo em que aconteceram.
             Mouse Dir (Click): Reinicia o jogo se estiver em GAMEOVER.
+
+        Com o piloto automático ligado, os cliques são ignorados e ele decide
+        no lugar deles (ver `_drive_autopilot`).
         """
-        for event in pygame.event.get():
+        for event in [*(events or []), *pygame.event.get()]:
             if event.type == pygame.QUIT:
                 self.level_manager.state = GameState.EXIT
 
@@ -53,90 +133,215 @@ class Game:
                 if event.key == pygame.K_ESCAPE:
                     self.level_manager.state = GameState.EXIT
                 elif event.key == pygame.K_p:
-                    if self.level_manager.state == GameState.RUNNING:
-                        self.level_manager.state = GameState.PAUSED
-                    elif self.level_manager.state == GameState.PAUSED:
-                        self.level_manager.state = GameState.RUNNING
+                    self.toggle_pause()
 
             # Mouse
-            if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.type == pygame.MOUSEBUTTONDOWN and self.autopilot is None:
                 # Botão Esquerdo: Ação principal (Voar / Iniciar)
                 if event.button == 1:
-                    if self.level_manager.state == GameState.IDLE:
-                        self.level_manager.state = GameState.RUNNING
-                        self.level_manager.player.state = PlayerState.FLYING
-                        self.level_manager.sprites.add(self.level_manager.score_display)
-                        self.level_manager.player.move_up()
-                    elif self.level_manager.state in [GameState.IDLE, GameState.RUNNING]:
-                        self.level_manager.player.move_up()
+                    self.flap(getattr(event, "timestamp", None))
 
                 # Botão Direito: Reiniciar após morte
                 elif event.button == 3:
-                    # Só reinicia se a animação de morte acabou
-                    if (
-                        self.level_manager.state == GameState.GAMEOVER
-                        and self.level_manager.player.state == PlayerState.DEAD
-                    ):
-                        self.asset_manager.action_sound.play()
-                        self.start_level()
+                    self.restart()
 
             # Evento customizado de som (Hit acabou -> Toca Die)
             if event.type == config.HIT_SOUND_END_EVENT:
                 self.asset_manager.die_sound.play()
 
-    def update(self, dt: float) -> None:
+        if self.autopilot is not None:
+            self.profiler.mark(ProfilerPhase.EVENTS)
+            self._drive_autopilot()
+            self.profiler.mark(ProfilerPhase.PLANNER)
+
+        self.handle_simulation_events()
+
+    def _drive_autopilot(self) -> None:
+        """Ação do piloto automático: inicia, bate as asas quando o plano manda e reinicia após a morte."""
+        simulation = self.level_manager.simulation
+
+        if simulation.state == GameState.IDLE:
+            self.flap()
+        elif simulation.state == GameState.RUNNING:
+            if self.autopilot.decide(simulation):
+                self.flap()
+        elif simulation.can_restart:
+            self.restart()
+
+    def flap(self, timestamp: float | None = None) -> None:
         """
-        Atualiza a física, colisões e lógica de pontuação.
+        Ação principal: inicia o jogo (se IDLE) ou faz o pássaro voar (se RUNNING).
 
-        Verifica colisões pixel-perfect (máscaras) diferenciando entre
-        coletar uma moeda (Score) e bater em um cano/chão (Game Over).
+        Args:
+            timestamp (float | None): Horário do input (`time.perf_counter`). Se informado,
+                a batida de asas é aplicada pelo `update` no sub-passo correspondente;
+                senão, imediatamente.
         """
-        if self.level_manager.state in [GameState.IDLE, GameState.RUNNING]:
-            self.level_manager.sprites.update(dt)
-            self.level_manager.ground.update(dt)
+        if self.level_manager.state == GameState.IDLE:
+            self.level_manager.simulation.start()
+            self.level_manager.sprites.add(self.level_manager.score_display)
+            self._record(SessionEvent.FLAP)
+        elif self.level_manager.state == GameState.RUNNING:
+            if timestamp is None:
+                self.level_manager.simulation.move_up()
+                self._record(SessionEvent.FLAP)
+            else:
+                # Gravada quando o `update` decidir o sub-passo
+                self.pending_flaps.append(timestamp)
 
-            if self.level_manager.state == GameState.RUNNING:
-                # Lógica de reciclagem de obstáculos
-                for obstacle in self.level_manager.obstacles:
-                    obstacle.update(dt)
+    def flap_at(self, substep: int) -> None:
+        """
+        Agenda uma batida de asas para o início do sub-passo `substep` do próximo `update`.
 
-                    # Se o obstáculo saiu da tela, reseta e reativa a moeda
-                    if obstacle.rect.right < 0:
-                        obstacle.reset(dt)
-                        self.level_manager.hit_sprites.add(obstacle.coin)
-                        self.level_manager.sprites.add(obstacle.coin)
+        Args:
+            substep (int): Índice do sub-passo (como gravado em `SessionEvent.FLAP_AT`).
+        """
+        self.scheduled_flaps.append(substep)
 
-                # Detecção de Colisões (Pixel-Perfect)
-                collided_sprite = pygame.sprite.spritecollideany(
-                    self.level_manager.player,  # type: ignore
-                    self.level_manager.hit_sprites,
-                    pygame.sprite.collide_mask,
-                )
+    def toggle_pause(self) -> None:
+        """Alterna entre PAUSED e RUNNING."""
+        self.level_manager.simulation.toggle_pause()
+        self._record(SessionEvent.PAUSE)
+
+    def restart(self) -> None:
+        """Reinicia o nível, mas só depois que a animação de morte acabou."""
+        if self.level_manager.simulation.can_restart:
+            self.asset_manager.action_sound.play()
+            self.start_level()
+            self._record(SessionEvent.RESTART)
 
-                if collided_sprite:
-                    if isinstance(collided_sprite, Coin):
-                        # Colisão boa: Coletou moeda
-                        self.level_manager.hit_sprites.remove(collided_sprite)
-                        self.level_manager.sprites.remove(collided_sprite)
-                        self.asset_manager.score_sound.play()
-                        self.level_manager.score += 1
-                        self.level_manager.score_display.set(str(self.level_manager.score))
-                    else:
-                        # Colisão ruim: Bateu no cano ou chão
-                        # Toca o som em um canal específico para monitorar o fim dele
-                        self.asset_manager.channel.play(self.asset_manager.hit_sound)
-
-                        # Muda o estado do jogo
-                        self.level_manager.state = GameState.GAMEOVER
-
-                        # Inicia o tratamento da morte do jogador após a colisão
-                        self.level_manager.player.handle_death()
+    def _record(self, event: SessionEvent, substep: int = 0) -> None:
+        """Grava um input no registro da sessão (se houver), antes do passo atual."""
+        if self.session_log is not None:
+            self.session_log.append(self.frame, event, substep)
+
+    def update(self, dt: float, end_time: float | None = None) -> None:
+        """
+        Avança a simulação e sincroniza os sprites com ela.
+
+        Toda a física, colisão e pontuação acontece na `Simulation`. Aqui apenas
+        atualizamos a aparência dos sprites (posição e animação) e reagimos aos
+        eventos da simulação (sons, placar e moedas).
+
+        Args:
+            dt (float): Delta time em segundos.
+            end_time (float | None): Horário real (`time.perf_counter`) a que corresponde o fim do
+                intervalo simulado. Batidas de asas com horário até ele são aplicadas no sub-passo
+                em que aconteceram; as posteriores ficam para o próximo `update`. Se None, as
+                pendentes são aplicadas no início do intervalo.
+        """
+        state = self.level_manager.state
+        falling = self.level_manager.player.state == PlayerState.DYING
+        self.level_manager.simulation.update(dt, self._take_flaps(dt, end_time))
+        self.profiler.mark(ProfilerPhase.SIMULATION)
+
+        if state in [GameState.IDLE, GameState.RUNNING]:
+            self.level_manager.sprites.update(dt)
 
         # Se estiver em GAMEOVER, continuamos atualizando APENAS o player
         # para que ele continue caindo (DYING) até virar DEAD
-        if self.level_manager.state == GameState.GAMEOVER:
-            if self.level_manager.player.state != PlayerState.DEAD:
-                self.level_manager.player.update(dt)
+        elif state == GameState.GAMEOVER:
+            self.level_manager.player.update(dt)
+
+        self.handle_simulation_events()
+
+        if self.particles is not None and state != GameState.PAUSED:
+            body = self.level_manager.simulation.player
+
+            # Poeira onde o pássaro caiu no chão
+            if falling and body.state == PlayerState.DEAD:
+                self.particles.spawn(
+                    ParticleKind.DUST, body.x + body.width / 2, body.y + body.height, config.PARTICLE_DUST
+                )
+
+            # Só o cenário da partida em andamento se desloca
+            self.particles.update(dt, config.GAME_SPEED if state == GameState.RUNNING else 0.0)
+
+        self.profiler.mark(ProfilerPhase.SPRITES)
+        self.frame += 1
+
+    def _take_flaps(self, dt: float, end_time: float | None) -> list[float] | None:
+        """
+        Retira as batidas de asas do intervalo simulado e as converte em instantes dentro dele.
+
+        Cada batida vai para o início do sub-passo em que aconteceu. O sub-passo
+        (e não o horário) é o que fica gravado, então o replay é exato.
+        """
+        if not self.pending_flaps and not self.scheduled_flaps:
+            return None
+
+        simulation = self.level_manager.simulation
+        steps = Simulation.substeps(dt, simulation.max_step, simulation.max_substeps)
+        step = dt / steps
+        substeps, pending = self.scheduled_flaps, []
+        self.scheduled_flaps = []
+
+        for timestamp in self.pending_flaps:
+            if end_time is not None and timestamp > end_time:
+                pending.append(timestamp)
+                continue
+
+            offset = timestamp - (end_time - dt) if end_time is not None else 0.0
+            substep = min(steps - 1, max(0, int(offset / step)))
+            substeps.append(substep)
+            self.shown_flaps.append(timestamp)
+            self._record(SessionEvent.FLAP_AT, substep)
+
+        self.pending_flaps = pending
+        return [substep * step for substep in substeps]
+
+    def handle_simulation_events(self) -> None:
+        """
+        Reage aos eventos registrados pela simulação desde a última chamada.
+
+        Mapeamento:
+            MOVE_UP: Som de bater de asas.
+            SCORE: Som de ponto, atualiza o placar e troca a moeda coletada por brilhos.
+            HIT: Som de batida (canal reservado), efeito visual de morte e penas.
+            RECYCLE: Volta a exibir as moedas reativadas.
+        """
+        simulation = self.level_manager.simulation
+
+        for event in simulation.events:
+            if event == SimulationEvent.MOVE_UP:
+                self.asset_manager.move_up_sound.play()
+
+            elif event == SimulationEvent.SCORE:
+                # Colisão boa: Coletou moeda
+                for obstacle in self.level_manager.obstacles:
+                    if not obstacle.coin.body.active and obstacle.coin.alive():
+                        self.level_manager.sprites.remove(obstacle.coin)
+
+                        if self.particles is not None:
+                            center_x, center_y = obstacle.coin.rect.center
+                            self.particles.spawn(ParticleKind.SPARKLE, center_x, center_y, config.PARTICLE_SPARKLES)
+
+                self.asset_manager.score_sound.play()
+                self.level_manager.score_display.set(str(self.level_manager.score))
+
+            elif event == SimulationEvent.HIT:
+                # Colisão ruim: Bateu no cano ou chão
+                # Toca o som em um canal específico para monitorar o fim dele
+                self.asset_manager.channel.play(self.asset_manager.hit_sound)
+                self.level_manager.player.handle_death()
+
+                if self.particles is not None:
+                    body = self.level_manager.simulation.player
+                    self.particles.spawn(
+                        ParticleKind.FEATHER,
+                        body.x + body.width / 2,
+                        body.y + body.height / 2,
+                        config.PARTICLE_FEATHERS,
+                    )
+
+            elif event == SimulationEvent.RECYCLE:
+                # Se o obstáculo saiu da tela, reativa a moeda
+                for obstacle in self.level_manager.obstacles:
+                    if obstacle.coin.body.active and not obstacle.coin.alive():
+                        obstacle.coin.handle_movement()
+                        self.level_manager.sprites.add(obstacle.coin)
+
+        simulation.events.clear()
 
     def draw(self) -> None:
         """
@@ -146,15 +351,46 @@ class Game:
         1. Fundo (Background)
         2. Sprites (Pássaro, Canos, Moedas, Chão, Score)
         3. UI Overlays (Mensagens de Início ou Game Over)
-        """
-        self.screen.blit(self.asset_manager.background_image, (0, 0))
-        self.level_manager.sprites.draw(self.screen)
+        4. Partículas (uma única chamada a `Surface.blits`)
 
-        if self.level_manager.state == GameState.IDLE:
-            Helper.display_centered_image(self.screen, self.asset_manager.game_start_image)
+        No modo de retângulos sujos, apenas as regiões alteradas desde o último
+        quadro são redesenhadas e enviadas à tela (`display.update(rects)`).
+        Estados parados (PAUSED, GAMEOVER com o pássaro DEAD) não geram nenhum redesenho.
+        """
+        self.level_manager.game_start_display.show(self.level_manager.state == GameState.IDLE)
 
         # Só mostra Game Over quando o corpo esfriar (DEAD)
-        if self.level_manager.state == GameState.GAMEOVER and self.level_manager.player.state == PlayerState.DEAD:
-            Helper.display_centered_image(self.screen, self.asset_manager.game_over_image)
+        self.level_manager.game_over_display.show(
+            self.level_manager.state == GameState.GAMEOVER and self.level_manager.player.state == PlayerState.DEAD
+        )
+
+        if not self.dirty_rects:
+            # Modo completo: redesenha a tela inteira todo quadro
+            self.level_manager.sprites.repaint_rect(self.screen.get_rect())
+
+        rects = self.level_manager.sprites.draw(self.screen, self.asset_manager.background_image)
+
+        if self.particles is not None and (rect := self.particles.draw(self.screen)) and self.dirty_rects:
+            rects.append(rect)
+            # As partículas são apagadas (fundo e sprites redesenhados) no próximo quadro; no modo
+            # completo não: regiões sobrepostas fariam o `LayeredDirty` misturar duas vezes as
+            # bordas translúcidas dos sprites
+            self.level_manager.sprites.repaint_rect(rect)
+
+        if self.profiler.overlay:
+            rect = self.profiler.draw(self.screen)
+            rects.append(rect)
+            # O gráfico é apagado (fundo e sprites redesenhados) no próximo quadro
+            self.level_manager.sprites.repaint_rect(rect)
+
+        self.profiler.mark(ProfilerPhase.DRAW)
+
+        if self.present and self.dirty_rects:
+            pygame.display.update(rects)
+        elif self.present:
+            pygame.display.flip()
+
+        self.input_latency.record(self.shown_flaps)
+        self.shown_flaps.clear()
 
-        pygame.display.flip()
+        self.profiler.mark(ProfilerPhase.PRESENT)
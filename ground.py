@@ -1,48 +1,32 @@
 import pygame
 
 from base import Base
+from base_body import BaseBody
 
 
 class Ground:
     """
-    Gerenciador do chão (solo) com efeito de rolagem infinita (Infinite Scroll).
+    Conjunto visual do chão (solo) com efeito de rolagem infinita (Infinite Scroll).
 
-    Esta classe abstrai a complexidade de gerenciar dois segmentos de chão (`Base`).
-    Ela monitora a posição de ambos e os reposiciona automaticamente para garantir
-    que nunca haja buracos visuais na parte inferior da tela.
+    A reciclagem dos dois segmentos acontece na `Simulation`; esta classe apenas
+    cria um sprite `Base` para cada segmento e os expõe para fácil adição a grupos.
 
     Attributes:
         bases (list[Base]): Lista contendo os dois segmentos ativos para fácil adição a grupos.
     """
 
-    def __init__(self, base_image: pygame.Surface) -> None:
+    def __init__(self, bodies: list[BaseBody], base_image: pygame.Surface) -> None:
         """
-        Inicializa e posiciona os dois segmentos de chão.
-
-        O primeiro segmento começa na posição 0. O segundo é posicionado
-        imediatamente ao final do primeiro, criando uma linha contínua.
+        Cria os sprites dos segmentos de chão.
 
         Args:
+            bodies (list[BaseBody]): Os segmentos do chão na simulação.
             base_image (pygame.surface.Surface): A textura visual do chão.
         """
-        self.left_base = Base(base_image)
-        # O segundo segmento começa exatamente onde o primeiro termina (rect.right)
-        self.right_base = Base(base_image, self.left_base.rect.right)
-
+        self.left_base, self.right_base = (Base(body, base_image) for body in bodies)
         self.bases = [self.left_base, self.right_base]
 
-    def update(self, dt: float) -> None:
-        """
-        Verifica a posição dos segmentos e recicla (teleporta) os que saíram da tela.
-
-        Lógica de Carrossel:
-        Se um segmento sair totalmente da tela pela esquerda (rect.right < 0),
-        ele é movido instantaneamente para a direita do outro segmento.
-        """
-        # Se o segmento esquerdo saiu da tela...
-        if self.left_base.rect.right < 0:
-            self.left_base.rect.left = self.right_base.rect.right
-
-        # Se o segmento direito saiu da tela...
-        if self.right_base.rect.right < 0:
-            self.right_base.rect.left = self.left_base.rect.right
+    def reset(self) -> None:
+        """Realinha os segmentos com seus corpos (reinício no lugar)."""
+        for base in self.bases:
+            base.reset()
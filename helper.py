@@ -12,6 +12,30 @@ class Helper:
     repetição de código matemático complexo em outras classes.
     """
 
+    @staticmethod
+    def get_centered_rect(image: pygame.Surface) -> pygame.Rect:
+        """
+        Calcula o retângulo de uma imagem centralizada na tela, respeitando offsets de UI.
+
+        Calcula o centro exato baseado nas dimensões da tela e da imagem,
+        aplicando ajustes verticais definidos no config (SCREEN_VERTICAL_OFFSET
+        e GAME_UI_OFFSET) para ajustar a posição de logos e mensagens.
+
+        Args:
+            image (pygame.Surface): A imagem a ser posicionada.
+
+        Returns:
+            pygame.Rect: O retângulo da imagem já posicionado.
+        """
+        rect = image.get_rect()
+        # Centraliza no eixo X
+        rect.x = config.SCREEN_WIDTH // 2 - rect.width // 2
+        # Centraliza no eixo Y e aplica os ajustes finos de design
+        rect.y = (
+            config.SCREEN_HEIGHT // 2 - rect.height // 2 + config.SCREEN_VERTICAL_OFFSET + config.GAME_UI_OFFSET
+        )
+        return rect
+
     @staticmethod
     def display_centered_image(screen: pygame.Surface, image: pygame.Surface) -> None:
         """
@@ -25,18 +49,7 @@ class Helper:
             screen (pygame.Surface): A superfície de destino.
             image (pygame.Surface): A imagem a ser desenhada.
         """
-        screen.blit(
-            image,
-            (
-                # Centraliza no eixo X
-                config.SCREEN_WIDTH // 2 - image.get_rect().width // 2,
-                # Centraliza no eixo Y e aplica os ajustes finos de design
-                config.SCREEN_HEIGHT // 2
-                - image.get_rect().height // 2
-                + config.SCREEN_VERTICAL_OFFSET
-                + config.GAME_UI_OFFSET,
-            ),
-        )
+        screen.blit(image, Helper.get_centered_rect(image))
 
     @staticmethod
     def display_cursor_image(screen: pygame.Surface, cursor_image: pygame.Surface):
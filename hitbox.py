@@ -0,0 +1,138 @@
+class Hitbox:
+    """
+    Máscara de colisão em Python puro, equivalente a um `pygame.mask.Mask`.
+
+    Cada linha da hitbox é guardada como um inteiro onde o bit `i` representa
+    a coluna `i`. Isso permite testar sobreposição pixel-perfect com simples
+    operações de deslocamento e AND, sem precisar de superfícies do Pygame.
+
+    Attributes:
+        width (int): Largura da hitbox (pixels).
+        height (int): Altura da hitbox (pixels).
+        rows (list[int]): Bits preenchidos de cada linha.
+    """
+
+    def __init__(self, width: int, height: int, rows: list[int]) -> None:
+        """
+        Cria uma hitbox a partir das linhas já rasterizadas.
+
+        Args:
+            width (int): Largura da hitbox.
+            height (int): Altura da hitbox.
+            rows (list[int]): Bits preenchidos de cada linha (uma entrada por linha).
+        """
+        self.width = width
+        self.height = height
+        self.rows = rows
+
+    @staticmethod
+    def circle_spans(radius: int) -> dict[int, tuple[int, int]]:
+        """
+        Rasteriza um círculo preenchido exatamente como `pygame.draw.circle`.
+
+        Porta o algoritmo do ponto médio usado pelo Pygame, de forma que o
+        resultado coincide pixel a pixel com a máscara criada pelo jogo.
+
+        Args:
+            radius (int): Raio do círculo.
+
+        Returns:
+            dict[int, tuple[int, int]]: Para cada linha (relativa ao centro), a primeira
+            e a última coluna preenchidas (também relativas ao centro).
+        """
+        spans: dict[int, tuple[int, int]] = {}
+
+        def add_line(x1: int, y: int, x2: int) -> None:
+            first, last = spans.get(y, (x1, x2))
+            spans[y] = (min(first, x1), max(last, x2))
+
+        f = 1 - radius
+        ddf_x = 0
+        ddf_y = -2 * radius
+        x = 0
+        y = radius
+
+        while x < y:
+            if f >= 0:
+                y -= 1
+                ddf_y += 2
+                f += ddf_y
+
+            x += 1
+            ddf_x += 2
+            f += ddf_x + 1
+
+            if f >= 0:
+                add_line(-x, y - 1, x - 1)
+                add_line(-x, -y, x - 1)
+
+            add_line(-y, x - 1, y - 1)
+            add_line(-y, -x, y - 1)
+
+        return spans
+
+    @classmethod
+    def circle(cls, width: int, height: int, radius: int) -> "Hitbox":
+        """Cria uma hitbox circular centralizada, igual às máscaras de `Player` e `Coin`."""
+        center_x, center_y = width // 2, height // 2
+        rows = [0] * height
+
+        for y, (first, last) in cls.circle_spans(radius).items():
+            row = center_y + y
+            if 0 <= row < height:
+                first, last = max(0, center_x + first), min(width - 1, center_x + last)
+                rows[row] = ((1 << (last - first + 1)) - 1) << first
+
+        return cls(width, height, rows)
+
+    @classmethod
+    def rect(cls, width: int, height: int) -> "Hitbox":
+        """Cria uma hitbox totalmente preenchida (ex: segmentos do chão)."""
+        return cls(width, height, [(1 << width) - 1] * height)
+
+    @classmethod
+    def pipe(cls, width: int, height: int, lip_height: int, body_offset: int, flip: bool = False) -> "Hitbox":
+        """
+        Cria a hitbox de um cano: a 'boca' ocupa toda a largura e o corpo é mais estreito.
+
+        Args:
+            width (int): Largura da imagem do cano.
+            height (int): Altura da imagem do cano.
+            lip_height (int): Altura da boca do cano.
+            body_offset (int): Recuo lateral do corpo em relação à boca.
+            flip (bool): Se True, a boca fica embaixo (cano do topo).
+        """
+        lip = (1 << width) - 1
+        body = ((1 << (width - 2 * body_offset)) - 1) << body_offset
+        rows = [lip] * lip_height + [body] * (height - lip_height)
+
+        if flip:
+            rows.reverse()
+
+        return cls(width, height, rows)
+
+    def overlaps(self, x: int, y: int, other: "Hitbox", other_x: int, other_y: int) -> bool:
+        """
+        Verifica se esta hitbox, na posição (x, y), toca `other` em (other_x, other_y).
+
+        Returns:
+            bool: True se algum pixel preenchido das duas hitboxes coincidir.
+        """
+        dx = other_x - x
+        dy = other_y - y
+
+        # Descarta rapidamente caixas que nem se tocam
+        if dx >= self.width or -dx >= other.width or dy >= self.height or -dy >= other.height:
+            return False
+
+        rows = self.rows
+        other_rows = other.rows
+
+        for row in range(max(0, dy), min(self.height, dy + other.height)):
+            other_row = other_rows[row - dy]
+            other_row = other_row << dx if dx >= 0 else other_row >> -dx
+
+            if rows[row] & other_row:
+                return True
+
+        return False
@@ -0,0 +1,119 @@
+import json
+import time
+
+import numpy as np
+
+import config
+
+
+class InputLatency:
+    """
+    Instrumentação da latência entre o clique e a imagem na tela (click-to-flip).
+
+    Cada batida de asas com horário (`event.timestamp`, anotado pelo
+    `FramePacer` quando o evento chega) é medida até o fim do
+    `display.flip`/`display.update` do quadro que a mostra. Com VSync, esse é
+    o instante em que o quadro foi entregue ao monitor; o tempo de varredura
+    do próprio monitor não entra na medida.
+
+    Como o `FrameProfiler`, fica desligada por padrão: `record` retorna na
+    primeira linha e as amostras vão para um buffer circular de tamanho fixo.
+
+    Attributes:
+        enabled (bool): Se False, nenhuma medição é feita.
+        history (int): Número de amostras mantidas no buffer circular.
+        count (int): Amostras medidas desde o início.
+        samples (np.ndarray): (history,) latências em segundos.
+    """
+
+    def __init__(self, enabled: bool = False, history: int = config.INPUT_LATENCY_HISTORY) -> None:
+        """
+        Prepara o buffer (apenas se ligada).
+
+        Args:
+            enabled (bool): Liga as medições.
+            history (int): Amostras mantidas no histórico.
+        """
+        self.enabled = enabled
+        self.history = history
+        self.count = 0
+
+        if enabled:
+            self.samples = np.zeros(history)
+
+    def record(self, timestamps: list[float]) -> None:
+        """
+        Registra as entradas mostradas no quadro que acabou de ser apresentado.
+
+        Args:
+            timestamps (list[float]): Horários (`time.perf_counter`) das entradas aplicadas no quadro.
+        """
+        if not self.enabled or not timestamps:
+            return
+
+        now = time.perf_counter()
+
+        for timestamp in timestamps:
+            self.samples[self.count % self.history] = now - timestamp
+            self.count += 1
+
+    # --- Estatísticas ---
+
+    def stats(self) -> dict[str, float]:
+        """
+        Percentis do histórico atual.
+
+        Returns:
+            dict: "count", "mean", "p50", "p90", "p99" e "max" (latências em milissegundos).
+        """
+        if not self.enabled or self.count == 0:
+            return {}
+
+        samples = self.samples[: min(self.count, self.history)] * 1_000
+        p50, p90, p99 = np.percentile(samples, [50, 90, 99])
+        return {
+            "count": self.count,
+            "mean": float(samples.mean()),
+            "p50": float(p50),
+            "p90": float(p90),
+            "p99": float(p99),
+            "max": float(samples.max()),
+        }
+
+    def histogram(self, bin_size: float = 1.0) -> list[tuple[float, int]]:
+        """
+        Distribuição do histórico atual.
+
+        Args:
+            bin_size (float): Largura de cada faixa em milissegundos.
+
+        Returns:
+            list[tuple[float, int]]: (início da faixa em ms, número de amostras) das faixas não vazias.
+        """
+        if not self.enabled or self.count == 0:
+            return []
+
+        samples = self.samples[: min(self.count, self.history)] * 1_000
+        bins = np.floor(samples / bin_size).astype(np.int64)
+        values, counts = np.unique(bins, return_counts=True)
+        return [(float(value * bin_size), int(count)) for value, count in zip(values, counts)]
+
+    # --- Exportação ---
+
+    def dump(self, path: str) -> None:
+        """
+        Grava as estatísticas, o histograma (faixas de 1 ms) e as amostras em um arquivo JSON.
+
+        Args:
+            path (str): Caminho do arquivo de saída.
+        """
+        if not self.enabled:
+            return
+
+        samples = self.samples[: min(self.count, self.history)] * 1_000
+
+        with open(path, "w") as file:
+            json.dump(
+                {"stats": self.stats(), "histogram_ms": self.histogram(), "samples_ms": samples.tolist()},
+                file,
+            )
@@ -2,84 +2,213 @@ import pygame
 
 import config
 from asset_manager import AssetManager
+from course import Course
+from frame_profiler import FrameProfiler
 from game_state import GameState
 from ground import Ground
+from message_display import MessageDisplay
 from obstacle import Obstacle
 from player import Player
 from score_display import ScoreDisplay
+from simulation import Simulation
 
 
 class LevelManager:
     """
     Gerencia a criação e reinicialização das entidades da sessão de jogo.
 
-    Esta classe atua como uma 'fábrica' que instancia o Jogador, o Chão,
-    os Obstáculos e o Placar, organizando-os em grupos de sprites apropriados
-    para renderização (desenho) e lógica (colisão).
+    Esta classe atua como uma 'fábrica' que cria a `Simulation` (regras do jogo)
+    e, sobre ela, os sprites do Jogador, do Chão, dos Obstáculos e do Placar,
+    organizando-os em um grupo de sprites para renderização.
 
     Attributes:
+        course (Course): Percurso da sessão, compartilhado por todas as partidas criadas.
+        simulation (Simulation): Núcleo da simulação da partida atual.
         state (GameState): O estado atual da lógica do nível (IDLE, RUNNING, etc.).
-        sprites (pygame.sprite.LayeredUpdates): Grupo para desenhar tudo na ordem correta (Z-index).
-        hit_sprites (pygame.sprite.Group): Grupo otimizado contendo apenas objetos que colidem.
+        sprites (pygame.sprite.LayeredDirty): Grupo para desenhar tudo na ordem correta (Z-index),
+            redesenhando apenas as regiões que mudaram (retângulos sujos).
+        game_start_display (MessageDisplay): Mensagem de início, exibida em IDLE.
+        game_over_display (MessageDisplay): Mensagem de fim de jogo, exibida após a queda.
     """
 
-    def __init__(self, asset_manager: AssetManager) -> None:
+    def __init__(
+        self,
+        asset_manager: AssetManager,
+        seed: int | None = None,
+        profiler: FrameProfiler | None = None,
+        course: Course | None = None,
+    ) -> None:
         """
         Prepara o gerenciador com os recursos necessários.
 
         Args:
             asset_manager (AssetManager): Referência ao carregador de recursos (imagens/sons).
+            seed (int | None): Semente do percurso da sessão (None = aleatória).
+            profiler (FrameProfiler | None): Profiler repassado à simulação (None = desligado).
+            course (Course | None): Percurso já pronto (ex: um desafio do dia); se informado, `seed` é ignorada.
         """
         self.asset_manager = asset_manager
+        self.profiler = profiler
+        self.course = course if course is not None else Course(seed)
+        # Criada (uma única vez) pelo primeiro `create_fresh_level`
+        self.simulation: Simulation | None = None
+
+    @property
+    def state(self) -> GameState:
+        """Estado atual da partida (mantido pela simulação)."""
+        return self.simulation.state
+
+    @state.setter
+    def state(self, state: GameState) -> None:
+        self.simulation.state = state
+
+    @property
+    def score(self) -> int:
+        """Pontuação atual (mantida pela simulação)."""
+        return self.simulation.score
 
     def create_fresh_level(self) -> None:
         """
         Reseta o jogo e recria todas as entidades para um novo início.
 
-        1. Define o estado como IDLE (aguardando input).
-        2. Cria grupos de sprites (Layered para desenho, Group simples para colisão).
-        3. Instancia Chão, Jogador e Placar.
-        4. Gera o 'pool' inicial de obstáculos que serão reciclados.
+        1. Cria uma nova simulação (estado IDLE, aguardando input).
+        2. Cria o grupo de sprites (LayeredDirty para desenho).
+        3. Instancia os sprites do Chão, do Jogador, do Placar e das mensagens.
+        4. Cria os sprites do 'pool' de obstáculos que serão reciclados.
         """
-        self.state = GameState.IDLE
+        self.simulation = Simulation(self.course, self.profiler)
 
         # --- Grupos de Sprites ---
-        # LayeredUpdates permite definir o que é desenhado na frente (_layer)
-        self.sprites = pygame.sprite.LayeredUpdates()
+        # LayeredDirty permite definir o que é desenhado na frente (_layer) e
+        # redesenha apenas os sprites marcados como sujos (dirty)
+        self.sprites = pygame.sprite.LayeredDirty()
 
-        # hit_sprites contém tudo que mata o player ou dá pontos
-        self.hit_sprites = pygame.sprite.Group()
+        # O nível novo precisa de um redesenho completo no primeiro quadro
+        self.sprites.repaint_rect(pygame.Rect(0, 0, config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
 
         # --- Chão (Ground) ---
-        self.ground = Ground(self.asset_manager.base_image)
-        self.hit_sprites.add(self.ground.bases)
+        self.ground = Ground(self.simulation.bases, self.asset_manager.base_image)
         self.sprites.add(self.ground.bases)
 
         # --- Jogador (Player) ---
-        self.player = Player(self.asset_manager.player_images, self.asset_manager.move_up_sound)
+        # Com inclinação, os quadros invertidos (morte) não são usados nem calculados
+        rotations = self.asset_manager.player_rotations
+        dead_images = self.asset_manager.player_dead_images if rotations is None else None
+        self.player = Player(self.simulation.player, self.asset_manager.player_images, rotations, dead_images)
         self.sprites.add(self.player)
 
         # --- Placar (Score) ---
-        self.score = 0
         self.score_display = ScoreDisplay(self.asset_manager.score_display_images)
         self.score_display.set(str(self.score))
 
+        # --- Mensagens (UI) ---
+        self.game_start_display = MessageDisplay(self.asset_manager.game_start_image)
+        self.game_over_display = MessageDisplay(self.asset_manager.game_over_image)
+        self.sprites.add(self.game_start_display, self.game_over_display)
+
         # --- Obstáculos (Obstacles) ---
         self.obstacles: list[Obstacle] = []
 
-        # Cria 2 pares de obstáculos iniciais suficientes para cobrir a tela
-        # Eles serão reciclados (reposicionados) infinitamente durante o jogo
-        for i in range(2):
+        for body in self.simulation.obstacles:
             obstacle = Obstacle(
-                # Calcula a posição inicial baseada no índice para espaçamento correto
-                (config.SCREEN_WIDTH // 2 + config.PIPE_WIDTH // 2) * i,
+                body,
                 self.asset_manager.pipe_image,
+                self.asset_manager.top_pipe_image,
                 self.asset_manager.coin_images,
             )
             self.obstacles.append(obstacle)
 
-            # Adiciona as partes do obstáculo (canos e moeda) aos grupos
-            self.hit_sprites.add(obstacle.pipes)
-            self.hit_sprites.add(obstacle.coin)
+            # Adiciona as partes do obstáculo (canos e moeda) ao grupo
             self.sprites.add(obstacle.pipes)
             self.sprites.add(obstacle.coin)
+
+    def restart_level(self) -> None:
+        """
+        Reinicia o nível no lugar, sem alocar entidades novas.
+
+        Reaproveita a simulação, o grupo de sprites e todos os sprites: cada
+        um volta ao seu estado inicial. O resultado (incluindo os números
+        aleatórios consumidos) é idêntico ao de `create_fresh_level`.
+        Na primeira chamada, quando ainda não há nível, cria tudo.
+        """
+        if self.simulation is None:
+            self.create_fresh_level()
+            return
+
+        self.simulation.restart()
+
+        self.ground.reset()
+        self.player.reset()
+
+        # O placar só volta ao grupo quando a partida começar
+        self.sprites.remove(self.score_display)
+        self.score_display.set(str(self.score))
+
+        for obstacle in self.obstacles:
+            obstacle.reset()
+
+            # Moedas coletadas foram removidas do grupo
+            if not obstacle.coin.alive():
+                self.sprites.add(obstacle.coin)
+
+        # O nível reiniciado precisa de um redesenho completo no primeiro quadro
+        self.sprites.repaint_rect(pygame.Rect(0, 0, config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+    def snapshot(self) -> tuple:
+        """
+        Copia o estado do nível: a simulação e o que só existe nos sprites (animações e placar visível).
+
+        Returns:
+            tuple: Estado do nível (opaco, só deve ser passado para `restore`).
+        """
+        return (
+            self.simulation.snapshot(),
+            (self.player.image_index, self.player.animation_step),
+            tuple((obstacle.coin.image_index, obstacle.coin.animation_step) for obstacle in self.obstacles),
+            self.score_display.alive(),
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        """
+        Volta ao estado copiado por `snapshot`, no lugar, e agenda um redesenho completo.
+
+        Args:
+            snapshot (tuple): Estado retornado por `snapshot`.
+        """
+        simulation, player, coins, score_visible = snapshot
+        self.simulation.restore(simulation)
+
+        # --- Jogador: quadro da animação (inclinado, ou de cabeça para baixo se estiver morrendo) ---
+        self.player.image_index, self.player.animation_step = player
+        self.player.handle_image()
+        self.player.handle_movement()
+
+        # --- Chão e Obstáculos ---
+        for base in self.ground.bases:
+            base.handle_movement()
+
+        for obstacle, (image_index, animation_step) in zip(self.obstacles, coins):
+            for pipe in obstacle.pipes:
+                pipe.handle_movement()
+
+            coin = obstacle.coin
+            coin.image_index, coin.animation_step = image_index, animation_step
+            coin.image = coin.images[image_index]
+            coin.rect.size = coin.image.get_size()
+            coin.handle_movement()
+
+            # Moedas coletadas ficam fora do grupo até o obstáculo ser reciclado
+            if coin.body.active and not coin.alive():
+                self.sprites.add(coin)
+            elif not coin.body.active and coin.alive():
+                self.sprites.remove(coin)
+
+        # --- Placar ---
+        self.score_display.set(str(self.score))
+
+        if score_visible and not self.score_display.alive():
+            self.sprites.add(self.score_display)
+        elif not score_visible and self.score_display.alive():
+            self.sprites.remove(self.score_display)
+
+        self.sprites.repaint_rect(pygame.Rect(0, 0, config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
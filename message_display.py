@@ -0,0 +1,35 @@
+import pygame
+
+from helper import Helper
+
+
+class MessageDisplay(pygame.sprite.DirtySprite):
+    """
+    Mensagem de UI centralizada na tela (ex: 'Get Ready' e 'Game Over').
+
+    Como sprite, a mensagem participa do desenho por retângulos sujos:
+    só é redesenhada quando aparece, some ou quando algo passa por baixo dela.
+
+    Attributes:
+        _layer (int): 12. Desenhada acima de todos os outros elementos.
+        visible (int): 1 quando a mensagem está sendo exibida.
+    """
+
+    def __init__(self, image: pygame.Surface) -> None:
+        """
+        Inicializa a mensagem, inicialmente oculta.
+
+        Args:
+            image (pygame.Surface): A imagem da mensagem.
+        """
+        super().__init__()
+        self._layer = 12
+        self.image = image
+        self.rect = Helper.get_centered_rect(image)
+        self.visible = 0
+
+    def show(self, visible: bool) -> None:
+        """Exibe ou oculta a mensagem, marcando-a como suja apenas quando muda."""
+        if self.visible != int(visible):
+            self.visible = int(visible)
+            self.dirty = 1
@@ -0,0 +1,121 @@
+import config
+from coin_body import CoinBody
+from course import Course
+from hitbox import Hitbox
+from pixel import pixel
+
+
+class ObstacleBody:
+    """
+    Estado físico de um par de canos com sua moeda.
+
+    Guarda o 'retângulo pai' invisível do `Obstacle` original como números.
+    Os canos ficam sempre alinhados com ele: a posição horizontal é contínua
+    (float) e os retângulos inteiros dos canos são derivados dela.
+
+    Attributes:
+        top_pipe_hitbox (Hitbox): Hitbox do cano de cima (boca embaixo).
+        bottom_pipe_hitbox (Hitbox): Hitbox do cano de baixo (boca em cima).
+        x_offset (int): Distância inicial além da borda direita da tela.
+        x (float): Posição horizontal (esquerda) do retângulo pai, com precisão sub-pixel.
+        y (int): Posição vertical (topo) do retângulo pai (e do cano de cima).
+        coin (CoinBody): A moeda centralizada entre os canos.
+    """
+
+    top_pipe_hitbox = Hitbox.pipe(
+        config.PIPE_WIDTH, config.PIPE_HEIGHT, config.PIPE_LIP_HEIGHT, config.PIPE_BODY_OFFSET, flip=True
+    )
+    bottom_pipe_hitbox = Hitbox.pipe(
+        config.PIPE_WIDTH, config.PIPE_HEIGHT, config.PIPE_LIP_HEIGHT, config.PIPE_BODY_OFFSET
+    )
+
+    def __init__(self, x_offset: int, course: Course) -> None:
+        """
+        Inicializa o par de canos e a moeda na próxima altura do percurso.
+
+        Args:
+            x_offset (int): Distância inicial no eixo X (usado para espaçar múltiplos obstáculos).
+            course (Course): Percurso da sessão (fonte das alturas dos vãos).
+        """
+        self.course = course
+        self.x_offset = x_offset
+        self.width = config.PIPE_WIDTH
+        self.height = (config.PIPE_HEIGHT * 2) + config.PIPE_DISTANCE
+
+        self._place()
+        self.coin = CoinBody(self)
+
+    def _place(self) -> None:
+        """Posiciona o obstáculo no ponto de partida, com a próxima altura do percurso."""
+        y_offset = self.course.next()
+
+        self.x = float(config.SCREEN_WIDTH + self.x_offset)
+        self.y = (config.SCREEN_HEIGHT // 2) - (config.PIPE_DISTANCE // 2) - config.PIPE_HEIGHT + y_offset
+
+    def restart(self) -> None:
+        """Volta ao ponto de partida com nova altura e moeda reativada (reinício sem alocações)."""
+        self._place()
+        self.coin.restart()
+
+    @property
+    def left(self) -> int:
+        """Esquerda do retângulo inteiro dos canos (desenho e colisão)."""
+        return pixel(self.x)
+
+    @property
+    def center_x(self) -> float:
+        """Centro horizontal do retângulo pai."""
+        return self.x + self.width // 2
+
+    @property
+    def center_y(self) -> int:
+        """Centro vertical do retângulo pai (meio do vão)."""
+        return self.y + self.height // 2
+
+    @property
+    def right(self) -> float:
+        """Borda direita do retângulo pai."""
+        return self.x + self.width
+
+    @property
+    def bottom_pipe_y(self) -> int:
+        """Topo do cano de baixo."""
+        return self.y + self.height - config.PIPE_HEIGHT
+
+    @property
+    def pipe_rects(self) -> list[tuple[int, int, int, int]]:
+        """
+        Partes sólidas dos dois canos como retângulos (left, top, right, bottom).
+
+        Cada cano é formado pela boca (largura total) e pelo corpo (recuado nas laterais).
+        """
+        left = self.left
+        right = left + self.width
+        body_left, body_right = left + config.PIPE_BODY_OFFSET, right - config.PIPE_BODY_OFFSET
+        top_pipe_bottom = self.y + config.PIPE_HEIGHT
+        bottom_pipe_top = self.bottom_pipe_y
+
+        return [
+            (body_left, self.y, body_right, top_pipe_bottom - config.PIPE_LIP_HEIGHT),
+            (left, top_pipe_bottom - config.PIPE_LIP_HEIGHT, right, top_pipe_bottom),
+            (left, bottom_pipe_top, right, bottom_pipe_top + config.PIPE_LIP_HEIGHT),
+            (body_left, bottom_pipe_top + config.PIPE_LIP_HEIGHT, body_right, bottom_pipe_top + config.PIPE_HEIGHT),
+        ]
+
+    def reset(self) -> None:
+        """
+        Recicla o obstáculo para a direita da tela, com a próxima altura do percurso e moeda reativada.
+
+        O quanto o obstáculo já tinha passado da borda esquerda é preservado, de
+        forma que o espaçamento entre obstáculos não depende do tamanho do passo.
+        """
+        y_offset = self.course.next()
+
+        self.x += config.SCREEN_WIDTH + self.width
+        self.y = (config.SCREEN_HEIGHT // 2) - (config.PIPE_DISTANCE // 2) - config.PIPE_HEIGHT + y_offset
+
+        self.coin.reset()
+
+    def update(self, dt: float) -> None:
+        """Move o retângulo pai para a esquerda na velocidade do cenário."""
+        self.x -= config.GAME_SPEED * dt
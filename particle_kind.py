@@ -0,0 +1,18 @@
+from enum import Enum
+
+
+class ParticleKind(Enum):
+    """
+    Tipos de partícula do `ParticleSystem`.
+
+    O valor é a linha do tipo nas tabelas de movimento e de imagens.
+    """
+
+    FEATHER = 0
+    """Pena solta quando o pássaro bate (sobe um pouco e cai devagar)."""
+
+    SPARKLE = 1
+    """Brilho ao coletar uma moeda (espalha e some rápido, sem gravidade)."""
+
+    DUST = 2
+    """Poeira levantada quando o pássaro cai no chão."""
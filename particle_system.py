@@ -0,0 +1,329 @@
+import math
+
+import numpy as np
+import pygame
+
+import config
+from asset_manager import AssetManager
+from particle_kind import ParticleKind
+
+
+class ParticleSystem:
+    """
+    Efeitos de partículas (penas, brilhos e poeira) em um pool de arrays NumPy.
+
+    Um `Sprite` por partícula custaria um objeto Python, uma entrada no grupo e
+    uma chamada de `blit` cada. Aqui todas as partículas vivas ficam nas
+    primeiras `count` posições de arrays de capacidade fixa (posição,
+    velocidade, idade, ritmo de desbotamento, gravidade, arrasto e primeira
+    imagem do tipo), alocados uma única vez:
+
+    - `spawn` escreve as partículas novas no fim do trecho vivo, sorteando
+      direções e velocidades direto nos arrays (`out=`), sem alocar nada.
+    - `update` integra todas de uma vez (gravidade, arrasto, deslocamento do
+      cenário) e compacta o trecho vivo quando alguma expira ou sai da tela,
+      também sem alocar: os índices das sobreviventes são calculados em um
+      buffer pré-alocado e cada array é reunido em uma área de trabalho.
+    - `draw` monta a lista de desenho dos arrays e a desenha com uma única
+      chamada a `Surface.blits`.
+
+    As imagens são pré-renderizadas no início, `PARTICLE_FRAMES` quadros por
+    tipo, desbotando até sumir; as cores vêm dos ativos do tema sorteado (o
+    pássaro, a moeda e o chão). A idade da partícula escolhe o quadro.
+
+    Attributes:
+        capacity (int): Máximo de partículas vivas (as que não cabem são descartadas).
+        count (int): Partículas vivas (as primeiras `count` posições dos arrays).
+        rng (np.random.Generator): Gerador das direções e velocidades (separado da simulação).
+        images (np.ndarray): Todas as imagens (objetos `pygame.Surface`), tipo a tipo.
+        size (int): Maior lado das imagens (margem do retângulo ocupado).
+        position (np.ndarray): Canto superior esquerdo de cada partícula (px), shape (capacity, 2).
+        velocity (np.ndarray): Velocidade (px/s), shape (capacity, 2).
+        age (np.ndarray): Tempo de vida já passado (segundos).
+        rate (np.ndarray): Quadros de desbotamento por segundo (`PARTICLE_FRAMES` / duração).
+        gravity (np.ndarray): Aceleração vertical (px/s²).
+        drag (np.ndarray): Arrasto (fração da velocidade perdida por segundo).
+        first (np.ndarray): Índice em `images` do primeiro quadro do tipo da partícula.
+    """
+
+    MOTION = {
+        ParticleKind.FEATHER: (0.9, 40, 140, 180, 360, 260, 2.5),
+        ParticleKind.SPARKLE: (0.45, 40, 110, 0, 360, 0, 4.0),
+        ParticleKind.DUST: (0.5, 20, 70, 200, 340, 120, 3.0),
+    }
+    """Por tipo: duração (s), velocidade mínima e máxima (px/s), faixa de direções (graus, 270 = para
+    cima), gravidade (px/s²) e arrasto (1/s)."""
+
+    COLORKEY = (255, 0, 255)
+    """Cor transparente das imagens (não aparece nas cores dos temas)."""
+
+    def __init__(
+        self,
+        asset_manager: AssetManager,
+        capacity: int = config.PARTICLE_CAPACITY,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Aloca o pool e pré-renderiza as imagens.
+
+        Args:
+            asset_manager (AssetManager): Ativos do tema (de onde vêm as cores).
+            capacity (int): Máximo de partículas vivas.
+            seed (int | None): Semente das direções e velocidades. None = aleatória.
+        """
+        self.capacity = capacity
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+
+        # --- Imagens ---
+        colors = {
+            ParticleKind.FEATHER: self._color(asset_manager.player_images[0]),
+            ParticleKind.SPARKLE: self._color(asset_manager.coin_images[0]),
+            ParticleKind.DUST: self._color(asset_manager.base_image),
+        }
+        images = []
+        self._first = {}
+        self._half = {}
+
+        for kind in ParticleKind:
+            frames = self._frames(kind, colors[kind])
+            self._first[kind] = len(images)
+            width, height = frames[0].get_size()
+            self._half[kind] = (width / 2, height / 2)
+            images.extend(frames)
+
+        self.images = np.empty(len(images), dtype=object)
+        self.images[:] = images
+        self.size = max(max(image.get_size()) for image in images)
+
+        # --- Pool ---
+        self.position = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float32)
+        self.age = np.zeros(capacity, dtype=np.float32)
+        self.rate = np.zeros(capacity, dtype=np.float32)
+        self.gravity = np.zeros(capacity, dtype=np.float32)
+        self.drag = np.zeros(capacity, dtype=np.float32)
+        self.first = np.zeros(capacity, dtype=np.intp)
+
+        # Áreas de trabalho (sorteios, passo da integração, quadro e pixel de cada partícula)
+        # (float32 como o pool: operações entre tipos diferentes usariam buffers de conversão)
+        self._random = np.zeros(capacity, dtype=np.float32)
+        self._angle = np.zeros(capacity, dtype=np.float32)
+        self._scratch = np.zeros(capacity, dtype=np.float32)
+        self._step = np.zeros((capacity, 2), dtype=np.float32)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._inside = np.zeros(capacity, dtype=bool)
+        self._frame = np.zeros(capacity, dtype=np.intp)
+        self._pixels = np.zeros((capacity, 2), dtype=np.intp)
+        # Compactação: 0..capacity-1, ordem de cada sobrevivente e índices das sobreviventes (mais uma
+        # posição de descarte); cada array do pool é reunido na área de trabalho do seu formato e tipo
+        self._arange = np.arange(capacity, dtype=np.intp)
+        self._rank = np.zeros(capacity, dtype=np.intp)
+        self._keep = np.zeros(capacity + 1, dtype=np.intp)
+        self._gather = [
+            (self.position, self._step),
+            (self.velocity, self._step),
+            (self.age, self._scratch),
+            (self.rate, self._scratch),
+            (self.gravity, self._scratch),
+            (self.drag, self._scratch),
+            (self.first, self._frame),
+        ]
+
+    @staticmethod
+    def _color(image: pygame.Surface) -> tuple[int, int, int]:
+        """Cor mais frequente da imagem entre as saturadas (ou a mais frequente, se não houver)."""
+        opaque = pygame.surfarray.array_alpha(image).ravel() > 128
+        colors, counts = np.unique(pygame.surfarray.array3d(image).reshape(-1, 3)[opaque], axis=0, return_counts=True)
+        saturated = colors.max(axis=1).astype(int) - colors.min(axis=1) >= 64
+
+        if saturated.any():
+            colors, counts = colors[saturated], counts[saturated]
+
+        return tuple(colors[counts.argmax()].tolist())
+
+    @staticmethod
+    def _frames(kind: ParticleKind, color: tuple[int, int, int]) -> list[pygame.Surface]:
+        """
+        Quadros de um tipo de partícula, do recém-criado ao quase transparente.
+
+        Cada quadro tem uma cor-chave e uma transparência única para a superfície inteira, ambas
+        aceleradas por RLE: com milhares de imagens minúsculas, o `blits` fica bem mais barato que com
+        transparência por pixel.
+        """
+        frames = []
+        light = tuple((channel + 255) // 2 for channel in color)
+
+        for index in range(config.PARTICLE_FRAMES):
+            fade = 1 - index / config.PARTICLE_FRAMES
+
+            if kind == ParticleKind.FEATHER:
+                surface = pygame.Surface((5, 3)).convert()
+                surface.fill(ParticleSystem.COLORKEY)
+                pygame.draw.ellipse(surface, color, surface.get_rect())
+            elif kind == ParticleKind.SPARKLE:
+                # Cruz clara com o centro branco, encolhendo
+                surface = pygame.Surface((5, 5)).convert()
+                surface.fill(ParticleSystem.COLORKEY)
+                arm = 2 if fade > 0.5 else 1
+                pygame.draw.line(surface, light, (2 - arm, 2), (2 + arm, 2))
+                pygame.draw.line(surface, light, (2, 2 - arm), (2, 2 + arm))
+                surface.set_at((2, 2), (255, 255, 255))
+            else:
+                # Nuvem que cresce enquanto some
+                surface = pygame.Surface((6, 6)).convert()
+                surface.fill(ParticleSystem.COLORKEY)
+                pygame.draw.circle(surface, color, (3, 3), 1.5 + 1.5 * (1 - fade))
+
+            surface.set_colorkey(ParticleSystem.COLORKEY, pygame.RLEACCEL)
+
+            if index:
+                surface.set_alpha(round(255 * fade), pygame.RLEACCEL)
+
+            frames.append(surface)
+
+        return frames
+
+    def clear(self) -> None:
+        """Remove todas as partículas (reinício da partida)."""
+        self.count = 0
+
+    def spawn(self, kind: ParticleKind, x: float, y: float, count: int) -> None:
+        """
+        Cria `count` partículas centradas em (x, y), sem alocar memória.
+
+        Args:
+            kind (ParticleKind): Tipo (movimento e imagens).
+            x (float): Centro horizontal (px).
+            y (float): Centro vertical (px).
+            count (int): Quantidade (limitada ao espaço livre do pool).
+        """
+        start = self.count
+        end = min(self.capacity, start + count)
+
+        if end == start:
+            return
+
+        lifetime, speed_min, speed_max, angle_min, angle_max, gravity, drag = self.MOTION[kind]
+        random, angle = self._random[: end - start], self._angle[: end - start]
+
+        # Direção e velocidade sorteadas; a duração varia entre 70% e 100% da do tipo
+        self.rng.random(dtype=np.float32, out=random)
+        np.multiply(random, math.radians(angle_max - angle_min), out=angle)
+        angle += math.radians(angle_min)
+        self.rng.random(dtype=np.float32, out=random)
+        random *= speed_max - speed_min
+        random += speed_min
+        np.cos(angle, out=self.velocity[start:end, 0])
+        np.sin(angle, out=self.velocity[start:end, 1])
+        self.velocity[start:end, 0] *= random
+        self.velocity[start:end, 1] *= random
+
+        self.rng.random(dtype=np.float32, out=random)
+        random *= 0.3 * lifetime
+        random += 0.7 * lifetime
+        np.divide(config.PARTICLE_FRAMES, random, out=self.rate[start:end])
+
+        half_width, half_height = self._half[kind]
+        self.position[start:end, 0] = x - half_width
+        self.position[start:end, 1] = y - half_height
+        self.age[start:end] = 0
+        self.gravity[start:end] = gravity
+        self.drag[start:end] = drag
+        self.first[start:end] = self._first[kind]
+        self.count = end
+
+    def update(self, dt: float, scroll: float = 0.0) -> None:
+        """
+        Avança todas as partículas e descarta as que expiraram ou saíram pela esquerda.
+
+        Args:
+            dt (float): Delta time em segundos.
+            scroll (float): Velocidade do cenário (px/s); as partículas vão junto com ele.
+        """
+        count = self.count
+
+        if not count:
+            return
+
+        velocity, scratch = self.velocity[:count], self._scratch[:count]
+
+        # Gravidade, depois o arrasto (nunca inverte a velocidade)
+        np.multiply(self.gravity[:count], dt, out=scratch)
+        velocity[:, 1] += scratch
+        np.multiply(self.drag[:count], -dt, out=scratch)
+        scratch += 1
+        np.maximum(scratch, 0, out=scratch)
+        # Coluna a coluna: `velocity *= scratch[:, None]` alocaria um buffer para a difusão (broadcast)
+        velocity[:, 0] *= scratch
+        velocity[:, 1] *= scratch
+
+        position, step = self.position[:count], self._step[:count]
+        np.multiply(velocity, dt, out=step)
+        position += step
+        position[:, 0] -= scroll * dt
+        self.age[:count] += dt
+
+        # Vivas: ainda não passaram do último quadro e não saíram pela esquerda
+        alive = self._alive[:count]
+        np.multiply(self.age[:count], self.rate[:count], out=scratch)
+        np.less(scratch, config.PARTICLE_FRAMES, out=alive)
+        inside = self._inside[:count]
+        np.greater(position[:, 0], -self.size, out=inside)
+        alive &= inside
+
+        # Ordem de cada sobrevivente (1, 2, ...) sem alocar o resultado de `np.flatnonzero`
+        # (copiado para inteiros antes: somar os booleanos direto alocaria um buffer de conversão)
+        rank = self._rank[:count]
+        np.copyto(rank, alive)
+        np.cumsum(rank, out=rank)
+        kept = int(rank[-1])
+
+        if kept == count:
+            return
+
+        # Sobreviventes vão para a sua ordem, as demais para a posição de descarte (`capacity`)
+        rank -= 1
+        np.logical_not(alive, out=alive)
+        np.copyto(rank, self.capacity, where=alive)
+        self._keep[rank] = self._arange[:count]
+        keep = self._keep[:kept]
+
+        for array, buffer in self._gather:
+            # mode="clip" dispensa a cópia interna que `take` faz com `out` para validar os índices
+            np.take(array, keep, axis=0, out=buffer[:kept], mode="clip")
+            array[:kept] = buffer[:kept]
+
+        self.count = kept
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect | None:
+        """
+        Desenha todas as partículas vivas com uma única chamada a `Surface.blits`.
+
+        Args:
+            surface (pygame.Surface): Superfície de destino.
+
+        Returns:
+            pygame.Rect | None: Região ocupada pelas partículas (para os retângulos sujos); None se não há nenhuma.
+        """
+        count = self.count
+
+        if not count:
+            return None
+
+        # Quadro de cada partícula pela idade, a partir do primeiro quadro do seu tipo
+        frame, scratch = self._frame[:count], self._scratch[:count]
+        np.multiply(self.age[:count], self.rate[:count], out=scratch)
+        np.minimum(scratch, config.PARTICLE_FRAMES - 1, out=scratch)
+        np.copyto(frame, scratch, casting="unsafe")
+        frame += self.first[:count]
+
+        pixels = self._pixels[:count]
+        np.copyto(pixels, self.position[:count], casting="unsafe")
+        # Pares (x, y) gerados sob demanda, sem montar uma lista de listas
+        positions = zip(pixels[:, 0].tolist(), pixels[:, 1].tolist())
+        surface.blits(zip(self.images[frame].tolist(), positions), doreturn=False)
+
+        left, top = pixels.min(axis=0).tolist()
+        right, bottom = pixels.max(axis=0).tolist()
+        return pygame.Rect(left, top, right - left + self.size, bottom - top + self.size).clip(surface.get_rect())
@@ -1,57 +1,57 @@
 import pygame
 
+from obstacle_body import ObstacleBody
 
-class Pipe(pygame.sprite.Sprite):
+
+class Pipe(pygame.sprite.DirtySprite):
     """
-    Representa um cano individual (obstáculo) no jogo.
+    Representa visualmente um cano individual (obstáculo) no jogo.
 
-    Esta classe gerencia a imagem (invertida ou não) e a posição do cano,
-    mantendo-o sincronizado com um retângulo pai (parent_rect).
+    Esta classe mantém o sprite sincronizado com a posição (inteira) dos canos
+    do `ObstacleBody` na simulação. A imagem invertida do cano de cima é
+    pré-calculada pelo `AssetManager` e compartilhada por todos os canos.
 
     Attributes:
-        image (pygame.Surface): A imagem final processada do cano.
-        rect (pygame.Rect): O retângulo de posição e colisão do sprite.
+        image (pygame.Surface): A imagem do cano, já na orientação correta.
+        rect (pygame.Rect): O retângulo de posição do sprite.
         flip (bool): Indica se o cano está invertido (topo) ou normal (base).
+        dirty (int): 1 quando a posição mudou desde o último desenho.
     """
 
-    def __init__(self, parent_rect: pygame.Rect, pipe_image: pygame.Surface, flip: bool = False) -> None:
+    def __init__(self, body: ObstacleBody, pipe_image: pygame.Surface, flip: bool = False) -> None:
         """
         Inicializa um novo sprite de cano.
 
         Args:
-            parent_rect (pygame.Rect): O retângulo de referência para o posicionamento X.
-            pipe_image (pygame.Surface): A imagem base do cano.
-            flip (bool, optional): Se True, inverte a imagem verticalmente (cano do topo).
+            body (ObstacleBody): O obstáculo da simulação ao qual o cano pertence.
+            pipe_image (pygame.Surface): A imagem do cano, já na orientação correta.
+            flip (bool, optional): Se True, é o cano do topo (invertido).
                                    Padrão é False (cano de baixo).
         """
         super().__init__()
         self._layer = 5
-        self.parent_rect = parent_rect
-        image = pipe_image
+        self.body = body
         self.flip = flip
-
-        # Configuração da imagem
-        if self.flip:
-            self.image = pygame.transform.flip(image, flip_x=False, flip_y=True)
-        else:
-            self.image = image
+        self.image = pipe_image
 
         # Configuração da posição inicial
         self.rect = self.image.get_rect()
         self.handle_movement()
 
-    def reset(self, dt: float) -> None:
-        """Reinicia o estado do cano, realinhando-o com o pai (obstáculo)."""
+    def reset(self) -> None:
+        """Volta à posição dos canos na simulação (reinício no lugar)."""
         self.handle_movement()
 
     def handle_movement(self) -> None:
-        """Atualiza a posição do cano baseada na posição do retângulo pai (obstáculo)."""
-        self.rect.x = self.parent_rect.x
-
+        """Atualiza a posição do cano baseada na posição dos canos na simulação."""
         if self.flip:
-            self.rect.top = self.parent_rect.top
+            position = (self.body.left, self.body.y)
         else:
-            self.rect.bottom = self.parent_rect.bottom
+            position = (self.body.left, self.body.bottom_pipe_y)
+
+        if self.rect.topleft != position:
+            self.rect.topleft = position
+            self.dirty = 1
 
     def update(self, dt: float) -> None:
         """Chamado a cada frame para atualizar a lógica do sprite."""
@@ -0,0 +1,21 @@
+import math
+
+PIXEL_EPSILON = 1e-6
+"""Tolerância para erros de arredondamento de ponto flutuante (ex: 119.9999999 ainda é o pixel 120)."""
+
+
+def pixel(value: float) -> int:
+    """
+    Converte uma posição contínua (float) no pixel inteiro usado para desenho e colisão.
+
+    As entidades guardam a posição em float (sub-pixel) e só a convertem aqui,
+    na hora de montar retângulos. Nunca arredondar a posição armazenada evita que
+    o erro de arredondamento dependa de quantos quadros por segundo o jogo roda.
+
+    Args:
+        value (float): Posição em pixels (pode ser fracionária).
+
+    Returns:
+        int: O pixel que contém a posição (arredondamento para baixo).
+    """
+    return math.floor(value + PIXEL_EPSILON)
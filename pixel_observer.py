@@ -0,0 +1,127 @@
+import numpy as np
+import pygame
+
+import config
+
+
+class PixelObserver:
+    """
+    Observações em pixels de uma superfície (a tela desenhada pelo `Game`).
+
+    Nada passa por `pygame.image.tobytes`: a cada captura, os pixels são lidos
+    direto da memória da superfície (`get_buffer`, sem cópia) e só os pontos
+    amostrados são copiados. Os deslocamentos em bytes de cada ponto e canal
+    são calculados uma vez, a partir dos strides da view `surfarray.pixels3d`,
+    então servem para qualquer formato de pixel. A view é liberada logo após a
+    leitura, porque uma superfície travada não pode receber `blit`.
+
+    - Redução: vizinho mais próximo, no centro de cada bloco da tela.
+    - Tons de cinza: inteiros, (77 R + 150 G + 29 B) >> 8 (pesos do BT.601).
+    - Pilha: os últimos `stack` quadros em um buffer circular com cada quadro
+      gravado duas vezes (`frames` tem 2 x `stack` posições), de modo que a
+      pilha em ordem é sempre uma fatia contígua, sem cópia.
+
+    Todos os buffers são alocados no construtor; `capture` não aloca arrays.
+
+    Attributes:
+        surface (pygame.Surface): Superfície observada.
+        width (int): Largura da observação.
+        height (int): Altura da observação.
+        stack (int): Quadros por observação.
+        frames (np.ndarray): (2 x stack, height, width) uint8, o buffer circular.
+        index (int): Posição do quadro mais antigo da pilha.
+    """
+
+    GRAY_WEIGHTS = (np.uint16(77), np.uint16(150), np.uint16(29))
+    """Pesos de R, G e B em 1/256 (a soma é 256)."""
+
+    def __init__(
+        self,
+        surface: pygame.Surface,
+        size: tuple[int, int] = config.PIXEL_OBSERVATION_SIZE,
+        stack: int = config.PIXEL_OBSERVATION_STACK,
+    ) -> None:
+        """
+        Calcula os pontos amostrados e aloca os buffers.
+
+        Args:
+            surface (pygame.Surface): Superfície observada (o tamanho não pode mudar depois).
+            size (tuple[int, int]): (largura, altura) da observação.
+            stack (int): Quadros por observação.
+        """
+        self.surface = surface
+        self.width, self.height = size
+        self.stack = stack
+
+        # --- Deslocamento (em bytes) de cada ponto amostrado, por canal ---
+        source_width, source_height = surface.get_size()
+        columns = ((np.arange(self.width) + 0.5) * source_width / self.width).astype(np.intp)
+        rows = ((np.arange(self.height) + 0.5) * source_height / self.height).astype(np.intp)
+
+        view = pygame.surfarray.pixels3d(surface)
+        memory = np.frombuffer(surface.get_buffer(), np.uint8)
+        origin = view.__array_interface__["data"][0] - memory.__array_interface__["data"][0]
+        column_stride, row_stride, channel_stride = view.strides
+        del view, memory
+
+        self.offsets = (
+            origin
+            + np.arange(3)[:, None, None] * channel_stride
+            + rows[None, :, None] * row_stride
+            + columns[None, None, :] * column_stride
+        ).astype(np.intp)
+
+        # --- Buffers ---
+        self.channels = np.empty((3, self.height, self.width), np.uint8)
+        self.gray = np.empty((self.height, self.width), np.uint16)
+        self.weighted = np.empty((self.height, self.width), np.uint16)
+        self.frames = np.zeros((2 * stack, self.height, self.width), np.uint8)
+        self.index = 0
+
+    def capture(self) -> np.ndarray:
+        """
+        Converte o quadro atual da superfície e o empilha.
+
+        Returns:
+            np.ndarray: A pilha atualizada (ver `observation`).
+        """
+        memory = np.frombuffer(self.surface.get_buffer(), np.uint8)
+        np.take(memory, self.offsets, out=self.channels, mode="clip")
+        # Destrava a superfície para o próximo `draw`
+        del memory
+
+        red, green, blue = self.channels
+        red_weight, green_weight, blue_weight = self.GRAY_WEIGHTS
+        np.multiply(red, red_weight, out=self.gray)
+        np.multiply(green, green_weight, out=self.weighted)
+        np.add(self.gray, self.weighted, out=self.gray)
+        np.multiply(blue, blue_weight, out=self.weighted)
+        np.add(self.gray, self.weighted, out=self.gray)
+
+        # O quadro novo entra no lugar do mais antigo, nas duas cópias
+        frame = self.frames[self.index]
+        np.right_shift(self.gray, 8, out=frame, casting="unsafe")
+        self.frames[self.index + self.stack] = frame
+        self.index = (self.index + 1) % self.stack
+        return self.observation()
+
+    def reset(self) -> np.ndarray:
+        """
+        Começa uma pilha nova, com todas as posições iguais ao quadro atual.
+
+        Returns:
+            np.ndarray: A pilha (ver `observation`).
+        """
+        self.capture()
+        self.frames[:] = self.frames[(self.index - 1) % self.stack]
+        return self.observation()
+
+    def observation(self) -> np.ndarray:
+        """
+        A pilha atual, do quadro mais antigo ao mais novo.
+
+        Returns:
+            np.ndarray: (stack, height, width) uint8. É uma view do buffer circular,
+            sobrescrita pelas próximas capturas; copie se precisar guardá-la.
+        """
+        return self.frames[self.index : self.index + self.stack]
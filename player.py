@@ -1,64 +1,95 @@
 import pygame
 
 import config
+from player_body import PlayerBody
 from player_state import PlayerState
+from rotation_cache import RotationCache
 
 
-class Player(pygame.sprite.Sprite):
+class Player(pygame.sprite.DirtySprite):
     """
-    Representa o personagem controlado pelo jogador (Pássaro).
+    Representa visualmente o personagem controlado pelo jogador (Pássaro).
 
-    Esta classe gerencia três aspectos cruciais:
+    A física e a hitbox vivem em `PlayerBody` (núcleo da simulação). Este
+    sprite apenas acompanha a posição do corpo e cuida da aparência:
     1. Animação de sprites (bater de asas).
-    2. Física de gravidade e impulso (pulo).
-    3. Criação de uma máscara de colisão otimizada (Hitbox Circular).
+    2. Inclinação pela velocidade vertical (com `rotations`): bico para cima
+       logo depois de bater as asas, mergulho na queda. As superfícies vêm
+       do `RotationCache` (cada uma girada uma vez só); a imagem girada é centrada no corpo e a
+       hitbox (do `PlayerBody`) não muda.
+    3. Efeito visual de morte: o mergulho da inclinação ou, sem ela, o
+       pássaro de cabeça para baixo.
 
     Attributes:
         _layer (int): 10. O pássaro é desenhado na frente de canos e chão.
-        state (PlayerState): Estado atual (IDLE, FLYING, DEAD).
-        mask (pygame.Mask): A área de colisão física (circular, menor que a imagem).
+        body (PlayerBody): O estado físico do pássaro na simulação.
+        rotations (RotationCache | None): Quadros inclinados (None = sem inclinação).
+        dead_images (list[pygame.Surface] | None): Quadros invertidos usados após a morte (None com inclinação).
+        offset (tuple[int, int]): Deslocamento do canto da imagem atual em relação ao do corpo.
+        dirty (int): 1 quando a imagem ou a posição mudou desde o último desenho.
     """
 
-    def __init__(self, player_images: list[pygame.Surface], move_up_sound: pygame.mixer.Sound) -> None:
+    def __init__(
+        self,
+        body: PlayerBody,
+        player_images: list[pygame.Surface],
+        rotations: RotationCache | None = None,
+        dead_images: list[pygame.Surface] | None = None,
+    ) -> None:
         """
-        Inicializa o pássaro e configura sua hitbox circular.
+        Inicializa o sprite do pássaro.
 
         Args:
+            body (PlayerBody): Estado físico que o sprite acompanha.
             player_images (list): Sequência de imagens para animação.
-            move_up_sound (Sound): Som tocado ao pular.
-            *groups: Grupos de sprites.
+            rotations (RotationCache | None): Os mesmos quadros pré-renderizados em cada inclinação.
+                None = o pássaro não inclina.
+            dead_images (list | None): Quadros invertidos, compartilhados pelo `AssetManager`. Só usados sem
+                inclinação; se None nesse caso, são invertidos aqui.
         """
         super().__init__()
         self._layer = 10
-        self.state = PlayerState.IDLE
+        self.body = body
 
         # Animação
         self.images = player_images
+        self.rotations = rotations
+        # Versões de cabeça para baixo (morte): só existem sem inclinação (com ela, o pássaro mergulha)
+        if rotations is None and dead_images is None:
+            dead_images = [pygame.transform.flip(image, flip_x=False, flip_y=True) for image in player_images]
+        self.dead_images = dead_images
+        self.rect = self.images[0].get_rect()
+        self.reset()
+
+    def reset(self) -> None:
+        """Volta ao primeiro quadro da animação e à posição do corpo (reinício no lugar)."""
         self.image_index = 0
         self.image = self.images[self.image_index]
+        self.offset = (0, 0)
         self.animation_step = config.PLAYER_ANIMATION_STEP
+        self.rect.size = self.image.get_size()
+        self.rect.topleft = (self.body.left, self.body.top)
+        self.dirty = 1
 
-        # Posição Inicial
-        self.rect = self.image.get_rect()
-        self.rect.centerx = config.SCREEN_WIDTH // 4
-        self.rect.centery = config.SCREEN_HEIGHT // 2 + config.SCREEN_VERTICAL_OFFSET
+    @property
+    def state(self) -> PlayerState:
+        """Estado atual do pássaro (lido da simulação)."""
+        return self.body.state
 
-        # Física
-        self.change_y = 0
-        self.move_up_sound = move_up_sound
-
-        # --- Configuração da Máscara de Colisão (Hitbox) ---
-        # Cria uma superfície vazia do tamanho do pássaro
-        mask = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+    @staticmethod
+    def tilt(change_y: float) -> float:
+        """
+        Inclinação para a velocidade vertical: `PLAYER_TILT_UP` logo depois de bater as asas,
+        descendo linearmente até `PLAYER_TILT_DOWN` na velocidade de queda `PLAYER_TILT_DIVE_SPEED`.
 
-        # Desenha um círculo branco no centro para representar o corpo
-        # Isso cria uma colisão mais "justa" que ignora as pontas das asas
-        mask_center = (self.rect.width // 2, self.rect.height // 2)
-        mask_radius = min(self.rect.width, self.rect.height) // 2
-        pygame.draw.circle(mask, (255, 255, 255), mask_center, mask_radius)
+        Args:
+            change_y (float): Velocidade vertical (pixels/s, positivo desce).
 
-        # Converte a superfície desenhada em uma máscara de bits para colisão pixel-perfect
-        self.mask = pygame.mask.from_surface(mask)
+        Returns:
+            float: Ângulo em graus (positivo = bico para cima).
+        """
+        fraction = (change_y + config.PLAYER_IMPULSE) / (config.PLAYER_TILT_DIVE_SPEED + config.PLAYER_IMPULSE)
+        return config.PLAYER_TILT_UP + (config.PLAYER_TILT_DOWN - config.PLAYER_TILT_UP) * min(1.0, max(0.0, fraction))
 
     def handle_animation(self, dt: float) -> None:
         """Cicla entre as imagens do pássaro baseada no tempo (dt)."""
@@ -68,84 +99,50 @@ class Player(pygame.sprite.Sprite):
             if self.image_index >= len(self.images):
                 self.image_index = 0
 
-            self.image = self.images[self.image_index]
             self.animation_step = config.PLAYER_ANIMATION_STEP
         else:
             self.animation_step -= dt
 
-    def handle_movement(self, dt: float) -> None:
-        """
-        Aplica gravidade e limites de tela.
-
-        A gravidade aumenta a velocidade de queda (change_y) constantemente,
-        limitada por uma velocidade terminal (PLAYER_DOWN_SPEED_LIMIT).
-        Também impede que o pássaro voe para fora do topo da tela.
-
-        Durante o estado DYING, o pássaro continua sofrendo ação da gravidade
-        até sair da tela ou atingir o chão, momento em que transita para DEAD.
-        """
-        self.change_y += config.GRAVITY * dt
-
-        # Limita a velocidade de queda (Terminal Velocity)
-        if self.change_y > config.PLAYER_DOWN_SPEED_LIMIT:
-            self.change_y = config.PLAYER_DOWN_SPEED_LIMIT
-
-        # Aplica o movimento se não estiver batendo no teto (y > 0)
-        if (self.rect.y + round(self.change_y)) > 0:
-            self.rect.y += round(self.change_y)
+    def handle_image(self) -> None:
+        """Escolhe a imagem do quadro atual: inclinada pela velocidade ou, sem inclinação, normal/invertida."""
+        if self.rotations is not None:
+            # Parado (IDLE), o pássaro fica na horizontal
+            angle = 0 if self.state == PlayerState.IDLE else self.tilt(self.body.change_y)
+            image, offset = self.rotations.frame(self.image_index, angle)
         else:
-            # Zera a inércia se bater no teto
-            self.change_y = 0
+            dying = self.state in [PlayerState.DYING, PlayerState.DEAD]
+            image, offset = (self.dead_images if dying else self.images)[self.image_index], (0, 0)
 
-        # Transição automática de DYING para DEAD ao sair da tela/chão
-        # O player precisa estar se movento para baixo (gravidade) e não para cima (kick para cima)
-        bottom_limit = config.SCREEN_HEIGHT + config.SCREEN_VERTICAL_OFFSET * 2
+        if image is not self.image:
+            self.image = image
+            self.offset = offset
+            self.rect.size = image.get_size()
+            self.dirty = 1
 
-        if self.rect.bottom > bottom_limit and self.change_y >= 0 and self.state == PlayerState.DYING:
-            self.state = PlayerState.DEAD
-            self.rect.bottom = bottom_limit  # Clamping (Trava perfeita no pixel)
+    def handle_movement(self) -> None:
+        """Sincroniza o retângulo do sprite com a posição do corpo na simulação."""
+        position = (self.body.left + self.offset[0], self.body.top + self.offset[1])
 
-    def handle_death(self):
-        """
-        Altera o estado do jogador e aplica efeitos estéticos
+        if self.rect.topleft != position:
+            self.rect.topleft = position
+            self.dirty = 1
 
-        Kick da morte
-        Efeito visual de morte (Jogador fica de cabeça para baixo)
-        """
-        # Muda o estado do jogador
-        self.state = PlayerState.DYING
-
-        # Efeito físico ("kick" para cima)
-        self.move_up()
-
-        # Efeito visual de morte (cabeça para baixo)
-        self.image = pygame.transform.flip(self.image, flip_x=False, flip_y=True)
-
-    def move_up(self) -> None:
-        """
-        Aplica um impulso vertical instantâneo (Pulo).
-
-        Define a velocidade vertical como negativa para subir.
-        """
-        self.change_y = -config.PLAYER_IMPULSE
-
-        # Não toca o som quando DYING
-        if self.state != PlayerState.DYING:
-            self.move_up_sound.play()
+    def handle_death(self) -> None:
+        """Efeito visual de morte (de cabeça para baixo ou, com inclinação, o mergulho)."""
+        self.handle_image()
+        self.handle_movement()
 
     def update(self, dt) -> None:
         """
-        Atualiza a lógica do jogador baseada em seu estado atual.
+        Atualiza a aparência do jogador baseada em seu estado atual.
 
-        - IDLE: Não aplica física, apenas desenha.
-        - FLYING: Aplica física (gravidade) e animação.
-        - DYING: Gravidade ativa (cai), mas Animação parada (asas estáticas).
-        - DEAD: Estático total
+        - IDLE/FLYING: Animação das asas.
+        - DYING/DEAD: Asas estáticas.
+        - Inclinação (se houver) em todos os estados.
         """
-        # Física aplica-se tanto voando quanto morrendo (caindo)
-        if self.state in [PlayerState.FLYING, PlayerState.DYING]:
-            self.handle_movement(dt)
-
         # Animação só ocorre se estiver vivo e voando/esperando
         if self.state not in [PlayerState.DYING, PlayerState.DEAD]:
             self.handle_animation(dt)
+
+        self.handle_image()
+        self.handle_movement()
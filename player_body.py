@@ -0,0 +1,114 @@
+import config
+from hitbox import Hitbox
+from pixel import pixel
+from player_state import PlayerState
+
+
+class PlayerBody:
+    """
+    Estado físico do pássaro, sem imagens, sons ou sprites.
+
+    Reproduz a física original do `Player` (gravidade, impulso, teto e a
+    transição DYING -> DEAD) operando apenas sobre números. O sprite `Player`
+    apenas lê esta estrutura para se desenhar.
+
+    A posição é contínua (float, sub-pixel) e as velocidades são em pixels por
+    segundo; o retângulo inteiro usado no desenho e na colisão é derivado por
+    `left`/`top`.
+
+    Attributes:
+        hitbox (Hitbox): Hitbox circular compartilhada por todos os pássaros.
+        x (float): Posição horizontal (esquerda) do pássaro.
+        y (float): Posição vertical (topo) do pássaro.
+        change_y (float): Velocidade vertical atual (pixels/s, positivo desce).
+        state (PlayerState): Estado atual (IDLE, FLYING, DYING, DEAD).
+    """
+
+    hitbox = Hitbox.circle(
+        config.PLAYER_WIDTH,
+        config.PLAYER_HEIGHT,
+        min(config.PLAYER_WIDTH, config.PLAYER_HEIGHT) // 2,
+    )
+
+    def __init__(self) -> None:
+        """Posiciona o pássaro no ponto de partida, parado e em IDLE."""
+        self.width = config.PLAYER_WIDTH
+        self.height = config.PLAYER_HEIGHT
+        self.restart()
+
+    def restart(self) -> None:
+        """Volta ao ponto de partida, parado e em IDLE (reinício sem alocar um corpo novo)."""
+        self.x = float(config.SCREEN_WIDTH // 4 - self.width // 2)
+        self.y = float(config.SCREEN_HEIGHT // 2 + config.SCREEN_VERTICAL_OFFSET - self.height // 2)
+        self.change_y = 0.0
+        self.state = PlayerState.IDLE
+
+    @property
+    def left(self) -> int:
+        """Esquerda do retângulo inteiro do pássaro (desenho e colisão)."""
+        return pixel(self.x)
+
+    @property
+    def top(self) -> int:
+        """Topo do retângulo inteiro do pássaro (desenho e colisão)."""
+        return pixel(self.y)
+
+    @staticmethod
+    def advance(y: float, change_y: float, dt: float) -> tuple[float, float]:
+        """
+        Posição e velocidade após `dt` segundos sob gravidade, velocidade terminal e teto.
+
+        O movimento é integrado de forma exata (aceleração constante até atingir
+        a velocidade terminal, velocidade constante depois), sem arredondar a
+        posição, então o resultado não depende do tamanho do passo.
+
+        Args:
+            y (float): Topo do pássaro.
+            change_y (float): Velocidade vertical (pixels/s).
+            dt (float): Intervalo em segundos.
+
+        Returns:
+            tuple[float, float]: O novo topo e a nova velocidade.
+        """
+        # Trecho acelerado, até atingir a velocidade de queda máxima (Terminal Velocity)
+        falling = min(dt, max(0.0, (config.PLAYER_DOWN_SPEED_LIMIT - change_y) / config.GRAVITY))
+        new_y = y + change_y * falling + config.GRAVITY * falling * falling / 2
+        change_y = min(change_y + config.GRAVITY * falling, config.PLAYER_DOWN_SPEED_LIMIT)
+        new_y += change_y * (dt - falling)
+
+        # Aplica o movimento se não estiver batendo no teto (y > 0)
+        if new_y > 0:
+            return new_y, change_y
+
+        # Para no teto e zera a inércia
+        return 0.0, 0.0
+
+    def handle_movement(self, dt: float) -> None:
+        """
+        Aplica gravidade, velocidade terminal, teto e a transição para DEAD.
+
+        Args:
+            dt (float): Delta time em segundos.
+        """
+        self.y, self.change_y = self.advance(self.y, self.change_y, dt)
+
+        # Transição automática de DYING para DEAD ao atingir o chão
+        bottom_limit = config.SCREEN_HEIGHT + config.SCREEN_VERTICAL_OFFSET * 2
+
+        if self.y + self.height > bottom_limit and self.change_y >= 0 and self.state == PlayerState.DYING:
+            self.state = PlayerState.DEAD
+            self.y = bottom_limit - self.height  # Clamping (Trava perfeita no pixel)
+
+    def handle_death(self) -> None:
+        """Muda o estado para DYING e aplica o 'kick' da morte."""
+        self.state = PlayerState.DYING
+        self.move_up()
+
+    def move_up(self) -> None:
+        """Aplica um impulso vertical instantâneo (Pulo)."""
+        self.change_y = -config.PLAYER_IMPULSE
+
+    def update(self, dt: float) -> None:
+        """Aplica a física apenas enquanto o pássaro voa ou cai (FLYING/DYING)."""
+        if self.state in [PlayerState.FLYING, PlayerState.DYING]:
+            self.handle_movement(dt)
@@ -0,0 +1,197 @@
+import numpy as np
+
+import config
+from batch_simulation import BatchSimulation
+from course import Course
+from player_body import PlayerBody
+from simulation import Simulation
+
+
+class Population(BatchSimulation):
+    """
+    N pássaros voando pelo mesmo percurso (modo população, para neuroevolução).
+
+    É uma `BatchSimulation` em que todos os mundos compartilham um único
+    percurso. Os obstáculos e a posição e a oscilação das moedas têm uma
+    linha só (shape (1, 2)), e as alturas dos vãos vêm de um `Course`, como na
+    `Simulation`. Os testes de colisão herdados
+    comparam todos os pássaros com essa linha por broadcasting, em uma única
+    passada vetorizada. Cada pássaro guarda só o próprio estado: altura,
+    velocidade, pontuação e quais moedas do percurso já coletou.
+
+    Um pássaro que bate sai da população no fim do passo: as linhas dele são
+    removidas dos arrays, então o custo de cada passo acompanha o número de
+    vivos. A corrida continua até o último cair. `ids` liga cada linha ao
+    pássaro original (e ao seu controlador).
+
+    Attributes:
+        population (int): Pássaros no início da corrida.
+        course (Course): Percurso compartilhado (cada corrida continua de onde a anterior parou).
+        size (int): Pássaros vivos (linhas dos arrays por pássaro).
+        ids (np.ndarray): (size,) índice original de cada pássaro vivo.
+        time (float): Tempo de corrida (segundos).
+        scores (np.ndarray): (population,) moedas coletadas por cada pássaro.
+        survival (np.ndarray): (population,) tempo de voo de cada pássaro (segundos); dos vivos, até agora.
+    """
+
+    def __init__(
+        self,
+        population: int,
+        dt: float = 1 / config.FPS,
+        seed: int | None = None,
+        max_step: float | None = config.SIMULATION_MAX_STEP,
+        max_substeps: int = config.SIMULATION_MAX_SUBSTEPS,
+        course: Course | None = None,
+    ) -> None:
+        """
+        Cria a população e começa a primeira corrida.
+
+        Args:
+            population (int): Número de pássaros.
+            dt (float): Passo fixo da simulação em segundos.
+            seed (int | None): Semente do percurso (quando `course` não é informado).
+            max_step (float | None): Maior sub-passo (segundos), como na `BatchSimulation`.
+            max_substeps (int): Limite de sub-passos por `step`.
+            course (Course | None): Percurso (ex: o da sessão ou um desafio do dia). None = `Course(seed)`.
+        """
+        self.population = population
+        self.course = course if course is not None else Course(seed)
+        super().__init__(population, dt, seed, max_step, max_substeps)
+
+    def reset(self, worlds: np.ndarray | None = None) -> np.ndarray:
+        """
+        Começa uma corrida nova: todos os pássaros vivos na partida e um percurso novo.
+
+        Args:
+            worlds (np.ndarray | None): Ignorado; a população só reinicia inteira.
+
+        Returns:
+            np.ndarray: Observações de todos os pássaros, shape (population, OBSERVATION_SIZE).
+        """
+        # --- Pássaros ---
+        self.size = self.population
+        self.ids = np.arange(self.population)
+        self.player_y = np.full(self.population, PlayerBody().y)
+        self.change_y = np.zeros(self.population)
+        self.coin_active = np.ones((self.population, 2), dtype=bool)
+        self.score = np.zeros(self.population, dtype=np.int64)
+        self.done = np.zeros(self.population, dtype=bool)
+        self.final_score = np.zeros(self.population, dtype=np.int64)
+        self.time = 0.0
+        self.scores = np.zeros(self.population, dtype=np.int64)
+        self.survival = np.zeros(self.population)
+
+        # --- Percurso compartilhado (uma linha) ---
+        base_y = (config.SCREEN_HEIGHT // 2) - (config.PIPE_DISTANCE // 2) - config.PIPE_HEIGHT
+        spacing = config.SCREEN_WIDTH // 2 + config.PIPE_WIDTH // 2
+        self.obstacle_x = (config.SCREEN_WIDTH + np.arange(2.0) * spacing)[None, :]
+        self.obstacle_y = (base_y + self._random_offsets(2))[None, :]
+        self.coin_offset = np.zeros((1, 2), dtype=np.int64)
+        self.coin_direction = np.ones((1, 2), dtype=np.int64)
+        self.coin_movement_step = np.full((1, 2), config.COIN_MOVEMENT_STEP)
+        self.coin_x = np.zeros((1, 2))
+        self.coin_y = np.zeros((1, 2), dtype=np.int64)
+        self._update_coins(self.coin_active, 0.0)
+
+        return self.observations()
+
+    def _random_offsets(self, count: int) -> np.ndarray:
+        """As próximas `count` alturas do percurso."""
+        return np.array([self.course.next() for _ in range(count)])
+
+    def observations(self) -> np.ndarray:
+        """
+        Monta as observações dos pássaros vivos (mesmo formato da `BatchSimulation`).
+
+        Returns:
+            np.ndarray: (size, 4) float32 com centro vertical do pássaro, velocidade,
+            distância horizontal até o fim do próximo obstáculo e centro do próximo vão.
+        """
+        obstacle_right = self.obstacle_x[0] + config.PIPE_WIDTH
+        # Próximo obstáculo: o mais à esquerda que ainda não passou pelo pássaro (o mesmo para todos)
+        distance = np.where(obstacle_right > self.player_x, obstacle_right - self.player_x, np.inf)
+        index = np.argmin(distance)
+
+        observations = np.empty((self.size, self.OBSERVATION_SIZE), dtype=np.float32)
+        observations[:, 0] = self.player_y + config.PLAYER_HEIGHT // 2
+        observations[:, 1] = self.change_y
+        observations[:, 2] = distance[index]
+        observations[:, 3] = self.obstacle_y[0, index] + self._center_y
+        return observations
+
+    def _update_coins(self, worlds: np.ndarray, dt: float) -> None:
+        """As moedas são do percurso: oscilam enquanto algum pássaro vivo ainda pode coletá-las."""
+        super()._update_coins(worlds.any(axis=0, keepdims=True), dt)
+
+    def _pipe_time(self, segments: list[tuple], columns: slice | np.ndarray = slice(None)) -> np.ndarray:
+        """
+        Testa só os canos que cruzam a coluna do pássaro neste sub-passo.
+
+        Com o percurso compartilhado, a coluna de cada cano é a mesma para todos
+        os pássaros: uma comparação escalar descarta os canos longe dela, e na
+        maior parte dos sub-passos nenhum cano precisa ser testado.
+        """
+        near = self._near(self.obstacle_x[0], config.PIPE_WIDTH)
+
+        if not near.size:
+            return np.full(self.size, np.inf)
+
+        return super()._pipe_time(segments, near)
+
+    def _coin_time(self, segments: list[tuple], columns: slice | np.ndarray = slice(None)) -> np.ndarray:
+        """Testa só as moedas que cruzam a coluna do pássaro (as outras ficam em np.inf)."""
+        time = np.full((self.size, 2), np.inf)
+        near = self._near(self.coin_x[0], config.COIN_TILE_SIZE)
+
+        if near.size:
+            time[:, near] = super()._coin_time(segments, near)
+
+        return time
+
+    def _near(self, x: np.ndarray, width: int) -> np.ndarray:
+        """Índices dos objetos do percurso (esquerda `x`, largura `width`) ao alcance do pássaro no sub-passo."""
+        left = self._pixel(x)
+        # Trecho horizontal varrido pelo pássaro no sub-passo, com 1 px de folga para cada lado
+        reach_left = self.player_left - config.GAME_SPEED * self.dt - 1
+        reach_right = self.player_left + config.PLAYER_WIDTH + 1
+        return np.flatnonzero((left < reach_right) & (left + width > reach_left))
+
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Avança todos os pássaros vivos em um passo fixo e retira os que bateram.
+
+        Args:
+            actions (np.ndarray): (size,) booleano/inteiro na ordem de `ids`; verdadeiro = bater as asas.
+
+        Returns:
+            tuple: (observações dos sobreviventes (size', 4), recompensas (size,), mortos (size,)).
+            Recompensas e mortos seguem a ordem de `ids` de antes do passo; depois
+            dele, `ids` e os arrays por pássaro só têm os sobreviventes.
+        """
+        self.change_y[np.asarray(actions, dtype=bool)] = -config.PLAYER_IMPULSE
+
+        # --- Sub-passos: mesma divisão da `Simulation.update` ---
+        steps = Simulation.substeps(self.dt, self.max_step, self.max_substeps)
+        dt = self.dt / steps
+        dead = np.zeros(self.size, dtype=bool)
+        rewards = np.zeros(self.size, dtype=np.int64)
+
+        for _ in range(steps):
+            rewards += self._substep(dt, dead)
+
+        self.time += self.dt
+        self.scores[self.ids] = self.score
+        self.survival[self.ids] = self.time
+        self.done = dead
+        self.final_score = np.where(dead, self.score, 0)
+
+        # --- Retira os pássaros que bateram (a corrida continua) ---
+        if dead.any():
+            alive = ~dead
+
+            for name in ("ids", "player_y", "change_y", "coin_active", "score"):
+                setattr(self, name, getattr(self, name)[alive])
+
+            self.size = len(self.ids)
+
+        return self.observations(), rewards.astype(np.float32), dead
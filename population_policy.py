@@ -0,0 +1,84 @@
+import numpy as np
+
+import config
+
+
+class PopulationPolicy:
+    """
+    Um controlador linear por pássaro, avaliados todos juntos (neuroevolução simples).
+
+    Cada pássaro bate as asas quando `pesos · observação + viés > 0`, com a
+    observação normalizada pelas dimensões da tela e pela velocidade terminal.
+    Uma multiplicação de matrizes decide a população inteira. Depois de cada
+    corrida, `evolve` mantém os melhores controladores e preenche o resto com
+    cópias deles com ruído gaussiano.
+
+    Attributes:
+        weights (np.ndarray): (population, OBSERVATION_SIZE) pesos de cada controlador.
+        bias (np.ndarray): (population,) viés de cada controlador.
+        elite (float): Fração dos melhores mantida a cada geração.
+        mutation (float): Desvio padrão do ruído das cópias.
+        generation (int): Gerações já evoluídas.
+        rng (np.random.Generator): Gerador dos pesos e das mutações.
+    """
+
+    SCALE = np.array(
+        [config.SCREEN_HEIGHT, config.PLAYER_DOWN_SPEED_LIMIT, config.SCREEN_WIDTH, config.SCREEN_HEIGHT],
+        dtype=np.float32,
+    )
+    """Divisores que levam cada componente da observação para perto de [-1, 1]."""
+
+    def __init__(
+        self,
+        population: int,
+        elite: float = config.POPULATION_ELITE,
+        mutation: float = config.POPULATION_MUTATION,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Sorteia os controladores da primeira geração.
+
+        Args:
+            population (int): Número de controladores (um por pássaro).
+            elite (float): Fração dos melhores mantida a cada geração.
+            mutation (float): Desvio padrão do ruído das cópias.
+            seed (int | None): Semente do gerador.
+        """
+        self.elite = elite
+        self.mutation = mutation
+        self.generation = 0
+        self.rng = np.random.default_rng(seed)
+        self.weights = self.rng.standard_normal((population, len(self.SCALE))).astype(np.float32)
+        self.bias = self.rng.standard_normal(population).astype(np.float32)
+
+    def act(self, observations: np.ndarray, ids: np.ndarray) -> np.ndarray:
+        """
+        Decide as ações dos pássaros vivos.
+
+        Args:
+            observations (np.ndarray): (size, OBSERVATION_SIZE) observações da `Population`.
+            ids (np.ndarray): (size,) índice de cada pássaro (`Population.ids`).
+
+        Returns:
+            np.ndarray: (size,) booleano; True = bater as asas.
+        """
+        scores = np.einsum("ij,ij->i", observations / self.SCALE, self.weights[ids])
+        return scores + self.bias[ids] > 0
+
+    def evolve(self, fitness: np.ndarray) -> None:
+        """
+        Próxima geração: os melhores seguem iguais, os demais viram cópias mutadas deles.
+
+        Args:
+            fitness (np.ndarray): (population,) aptidão de cada controlador na última corrida.
+        """
+        population = len(fitness)
+        keep = max(1, int(population * self.elite))
+        best = np.argsort(fitness)[::-1][:keep]
+        parents = np.concatenate([best, self.rng.choice(best, population - keep)])
+        noise = np.zeros((population, len(self.SCALE) + 1), dtype=np.float32)
+        noise[keep:] = self.rng.normal(0.0, self.mutation, (population - keep, len(self.SCALE) + 1))
+
+        self.weights = self.weights[parents] + noise[:, :-1]
+        self.bias = self.bias[parents] + noise[:, -1]
+        self.generation += 1
@@ -0,0 +1,118 @@
+from itertools import repeat
+
+import numpy as np
+import pygame
+
+import config
+from asset_manager import AssetManager
+from population import Population
+from score_display import ScoreDisplay
+
+
+class PopulationRenderer:
+    """
+    Desenha uma `Population` inteira com uma única chamada a `Surface.blits`.
+
+    Com centenas de pássaros, sprites e o `LayeredDirty` custariam um objeto
+    Python e uma chamada de `blit` por pássaro. Aqui a lista de desenho é
+    montada direto dos arrays: cenário, canos, moedas, os pássaros vivos (todos
+    com a mesma imagem, só a altura muda), o chão e o placar do melhor
+    pássaro, na mesma ordem de camadas do `LevelManager`. Pássaros na mesma
+    altura são desenhados uma vez só, então o custo do desenho é limitado pela
+    altura da tela, não pelo tamanho da população. A tela inteira é redesenhada
+    a cada quadro (com tantos pássaros, quase tudo muda mesmo).
+
+    Attributes:
+        screen (pygame.Surface): Superfície de destino.
+        background (pygame.Surface): Fundo.
+        base (pygame.Surface): Chão.
+        pipe (pygame.Surface): Cano de baixo.
+        top_pipe (pygame.Surface): Cano de cima.
+        players (list[pygame.Surface]): Quadros do bater de asas.
+        coins (list[pygame.Surface]): Quadros do giro da moeda.
+        score_display (ScoreDisplay): Placar (maior pontuação entre os vivos).
+        best (int): Pontuação exibida no placar.
+        blitted (int): Superfícies desenhadas no último quadro.
+    """
+
+    def __init__(self, screen: pygame.Surface, asset_manager: AssetManager) -> None:
+        """
+        Guarda as imagens usadas no desenho.
+
+        Args:
+            screen (pygame.Surface): Superfície de destino.
+            asset_manager (AssetManager): Imagens já carregadas.
+        """
+        self.screen = screen
+        self.background = asset_manager.background_image
+        self.base = asset_manager.base_image
+        self.pipe = asset_manager.pipe_image
+        self.top_pipe = asset_manager.top_pipe_image
+        self.players = asset_manager.player_images
+        self.coins = asset_manager.coin_images
+        self.score_display = ScoreDisplay(asset_manager.score_display_images)
+        self.score_display.set("0")
+        self.best = 0
+        self.blitted = 0
+
+    def draw(self, population: Population) -> None:
+        """
+        Desenha o quadro atual da população (uma chamada a `Surface.blits`).
+
+        Args:
+            population (Population): A corrida em andamento.
+        """
+        blits = self.draw_list(population)
+        self.screen.blits(blits, doreturn=False)
+        self.blitted = len(blits)
+
+    def draw_list(self, population: Population) -> list[tuple]:
+        """
+        Monta a lista de desenho do quadro, de trás para frente.
+
+        Args:
+            population (Population): A corrida em andamento.
+
+        Returns:
+            list[tuple]: Pares (superfície, posição) no formato de `Surface.blits`.
+        """
+        blits = [(self.background, (0, 0))]
+
+        # --- Canos e moedas (percurso compartilhado) ---
+        lefts = population._pixel(population.obstacle_x[0]).tolist()
+        tops = population.obstacle_y[0].tolist()
+        # Uma moeda some quando todos os pássaros vivos já a pegaram
+        coins_visible = population.coin_active.any(axis=0).tolist()
+        coin_lefts = population._pixel(population.coin_x[0]).tolist()
+        coin_tops = population.coin_y[0].tolist()
+        coin = self.coins[int(population.time / config.COIN_ANIMATION_STEP) % len(self.coins)]
+        half = config.COIN_TILE_SIZE // 2
+
+        for left, top, visible, coin_left, coin_top in zip(lefts, tops, coins_visible, coin_lefts, coin_tops):
+            blits.append((self.top_pipe, (left, top)))
+            blits.append((self.pipe, (left, top + config.PIPE_HEIGHT + config.PIPE_DISTANCE)))
+
+            if visible:
+                blits.append((coin, coin.get_rect(center=(coin_left + half, coin_top + half))))
+
+        # --- Pássaros vivos: a mesma imagem em cada altura ---
+        player = self.players[int(population.time / config.PLAYER_ANIMATION_STEP) % len(self.players)]
+        # Pássaros na mesma altura cobrem exatamente os mesmos pixels (o alfa das
+        # imagens é 0 ou 255): cada altura é desenhada uma vez
+        heights = np.unique(population._pixel(population.player_y)).tolist()
+        blits.extend(zip(repeat(player), zip(repeat(population.player_left), heights)))
+
+        # --- Chão rolando e placar ---
+        scroll = -int(population.time * config.GAME_SPEED % config.BASE_WIDTH)
+        base_y = config.SCREEN_HEIGHT + config.BASE_OFFSET - config.BASE_HEIGHT
+        blits.append((self.base, (scroll, base_y)))
+        blits.append((self.base, (scroll + config.BASE_WIDTH, base_y)))
+
+        best = int(np.max(population.score, initial=0))
+
+        if best != self.best:
+            self.best = best
+            self.score_display.set(str(best))
+
+        blits.append((self.score_display.image, self.score_display.rect))
+        return blits
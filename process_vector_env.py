@@ -0,0 +1,222 @@
+import multiprocessing
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+
+import numpy as np
+
+import config
+from flappy_bird import FlappyBirdEnv
+
+
+def _buffers(buffer, size: int) -> dict[str, np.ndarray]:
+    """
+    Cria as views NumPy sobre o bloco de memória compartilhada.
+
+    Layout (em ordem): observações (N, 4) float32, recompensas (N,) float32,
+    pontuação final (N,) int64, ações (N,) int8 e done (N,) bool.
+    """
+    layout = [
+        ("observations", np.float32, (size, FlappyBirdEnv.OBSERVATION_SIZE)),
+        ("rewards", np.float32, (size,)),
+        ("final_scores", np.int64, (size,)),
+        ("actions", np.int8, (size,)),
+        ("dones", np.bool_, (size,)),
+    ]
+    views = {}
+    offset = 0
+
+    for name, dtype, shape in layout:
+        view = np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+        views[name] = view
+        offset += view.nbytes
+
+    return views
+
+
+def _buffer_size(size: int) -> int:
+    """Tamanho em bytes do bloco de memória compartilhada para `size` ambientes."""
+    return size * (FlappyBirdEnv.OBSERVATION_SIZE * 4 + 4 + 8 + 1 + 1)
+
+
+def _worker(connection: Connection, memory_name: str, size: int, first: int, count: int, dt: float) -> None:
+    """
+    Processo trabalhador: executa os ambientes [first, first + count).
+
+    Protocolo (pipe): recebe ("reset", seed), ("step", None) ou ("close", None)
+    e responde com None depois de escrever os resultados na memória compartilhada.
+    """
+    # O bloco pertence ao processo principal: sem o rastreador de recursos, o fim do trabalhador
+    # não o apaga nem avisa de um bloco "vazado"
+    memory = shared_memory.SharedMemory(name=memory_name, track=False)
+    views = _buffers(memory.buf, size)
+    observations = views["observations"][first : first + count]
+    rewards = views["rewards"][first : first + count]
+    final_scores = views["final_scores"][first : first + count]
+    actions = views["actions"][first : first + count]
+    dones = views["dones"][first : first + count]
+
+    envs = [FlappyBirdEnv(render=False, dt=dt) for _ in range(count)]
+
+    try:
+        while True:
+            command, data = connection.recv()
+
+            if command == "reset":
+                for index, env in enumerate(envs):
+                    # Cada ambiente tem seu próprio gerador: semente base + índice global
+                    observations[index], _ = env.reset(seed=None if data is None else data + first + index)
+
+                rewards[:] = 0
+                final_scores[:] = 0
+                dones[:] = False
+
+            elif command == "step":
+                for index, env in enumerate(envs):
+                    observation, reward, terminated, info = env.step(int(actions[index]))
+
+                    # Reinício automático: a observação já é da nova partida
+                    if terminated:
+                        final_scores[index] = info["score"]
+                        observation, _ = env.reset()
+
+                    observations[index] = observation
+                    rewards[index] = reward
+                    dones[index] = terminated
+
+            elif command == "close":
+                break
+
+            connection.send(None)
+    finally:
+        # Solta as views antes de fechar o bloco de memória
+        del observations, rewards, final_scores, actions, dones, views
+        memory.close()
+
+
+class ProcessVectorEnv:
+    """
+    Pool de processos que executa muitos `FlappyBirdEnv` em paralelo.
+
+    Cada processo trabalhador possui vários ambientes e escreve observações,
+    recompensas e flags de fim diretamente em um bloco de
+    `multiprocessing.shared_memory`. O processo principal enxerga esses dados
+    como views NumPy, sem pickling; pelo pipe trafegam apenas comandos curtos.
+    `step_async` + `collect` permitem sobrepor a inferência do agente à simulação.
+
+    Attributes:
+        size (int): Número total de ambientes (workers x envs_per_worker).
+        observations (np.ndarray): View (N, 4) das observações mais recentes.
+        rewards (np.ndarray): View (N,) das recompensas do último passo.
+        dones (np.ndarray): View (N,) das partidas que terminaram no último passo.
+        final_scores (np.ndarray): View (N,) da pontuação final das partidas terminadas.
+    """
+
+    def __init__(self, workers: int, envs_per_worker: int, dt: float = 1 / config.FPS) -> None:
+        """
+        Cria a memória compartilhada e inicia os processos trabalhadores.
+
+        Args:
+            workers (int): Número de processos.
+            envs_per_worker (int): Ambientes executados por cada processo.
+            dt (float): Passo fixo da simulação em segundos.
+        """
+        self.size = workers * envs_per_worker
+        self.memory = shared_memory.SharedMemory(create=True, size=_buffer_size(self.size))
+        views = _buffers(self.memory.buf, self.size)
+        self.observations = views["observations"]
+        self.rewards = views["rewards"]
+        self.final_scores = views["final_scores"]
+        self.actions = views["actions"]
+        self.dones = views["dones"]
+
+        self.connections: list[Connection] = []
+        self.processes: list[multiprocessing.Process] = []
+        self.waiting = False
+
+        for index in range(workers):
+            parent_connection, child_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_worker,
+                args=(child_connection, self.memory.name, self.size, index * envs_per_worker, envs_per_worker, dt),
+                daemon=True,
+            )
+            process.start()
+            child_connection.close()
+            self.connections.append(parent_connection)
+            self.processes.append(process)
+
+    def _send(self, command: str, data=None) -> None:
+        if self.waiting:
+            # Uma segunda resposta ficaria na fila e seria lida como a do comando seguinte
+            raise RuntimeError("Há um passo pendente: chame `collect` antes do próximo comando")
+
+        for connection in self.connections:
+            connection.send((command, data))
+
+        self.waiting = True
+
+    def reset(self, seed: int | None = None) -> np.ndarray:
+        """
+        Reinicia todos os ambientes.
+
+        Args:
+            seed (int | None): Semente base (o ambiente i recebe seed + i).
+
+        Returns:
+            np.ndarray: View (N, 4) das observações iniciais.
+        """
+        self._send("reset", seed)
+        self.collect()
+        return self.observations
+
+    def step_async(self, actions: np.ndarray) -> None:
+        """
+        Dispara um passo em todos os ambientes sem esperar o resultado.
+
+        Args:
+            actions (np.ndarray): (N,) com 1 para bater as asas e 0 caso contrário.
+
+        Raises:
+            RuntimeError: Se o passo anterior ainda não foi recolhido com `collect`.
+        """
+        if self.waiting:
+            # As ações ainda estão sendo lidas pelos trabalhadores
+            raise RuntimeError("Há um passo pendente: chame `collect` antes do próximo `step_async`")
+
+        self.actions[:] = actions
+        self._send("step")
+
+    def collect(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Espera os processos terminarem o passo disparado por `step_async`.
+
+        Returns:
+            tuple: Views (observações, recompensas, dones). Os dados são
+            sobrescritos no próximo passo; copie-os se precisar guardá-los.
+        """
+        if self.waiting:
+            for connection in self.connections:
+                connection.recv()
+
+            self.waiting = False
+
+        return self.observations, self.rewards, self.dones
+
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Equivalente a `step_async(actions)` seguido de `collect()`."""
+        self.step_async(actions)
+        return self.collect()
+
+    def close(self) -> None:
+        """Encerra os processos e libera a memória compartilhada."""
+        self.collect()
+
+        for connection in self.connections:
+            connection.send(("close", None))
+
+        for process in self.processes:
+            process.join()
+
+        del self.observations, self.rewards, self.final_scores, self.actions, self.dones
+        self.memory.close()
+        self.memory.unlink()
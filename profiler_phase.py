@@ -0,0 +1,34 @@
+from enum import Enum
+
+
+class ProfilerPhase(Enum):
+    """
+    Fases de um quadro medidas pelo `FrameProfiler`, na ordem em que acontecem.
+
+    Cada marcação (`FrameProfiler.mark`) encerra a fase indicada: o tempo
+    decorrido desde a marcação anterior é atribuído a ela.
+    """
+
+    EVENTS = 0
+    """Processamento da fila de eventos do Pygame (inputs)."""
+
+    PLANNER = 1
+    """Decisão do piloto automático (`Autopilot.decide`), quando ligado."""
+
+    SIMULATION = 2
+    """Física, rolagem e reciclagem de obstáculos e chão."""
+
+    COLLISION = 3
+    """Testes de colisão do pássaro (canos, chão e moedas)."""
+
+    SPRITES = 4
+    """Sincronização dos sprites com a simulação, animações e reações aos eventos."""
+
+    DRAW = 5
+    """Desenho do fundo, dos sprites e das mensagens na tela."""
+
+    PRESENT = 6
+    """Envio da imagem para o monitor (`display.flip`/`display.update`)."""
+
+    WAIT = 7
+    """Espera do `clock.tick` para manter o FPS alvo."""
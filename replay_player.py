@@ -0,0 +1,181 @@
+import pygame
+
+import config
+from game import Game
+from session_event import SessionEvent
+from session_log import SessionLog
+
+
+class ReplayPlayer:
+    """
+    Reprodutor de sessões gravadas (`SessionLog`).
+
+    Cria um `Game` com a semente gravada e o conduz com os mesmos inputs, nos
+    mesmos passos fixos, chamando `Game.update` exatamente como a partida
+    original: o resultado é idêntico, passo a passo.
+
+    - Avanço rápido sem tela: `advance(frames)` só chama `update`, sem desenhar.
+    - Reprodução na tela em qualquer velocidade: `play(speed)`.
+    - Busca: a cada `keyframe_interval` segundos de jogo o estado do nível é
+      guardado (`LevelManager.snapshot`). `seek` volta ao quadro-chave mais
+      próximo e simula só a partir dele, em vez de recomeçar do passo 0.
+
+    Attributes:
+        log (SessionLog): Sessão reproduzida.
+        game (Game): Jogo conduzido pelo registro.
+        keyframe_frames (int): Passos entre quadros-chave.
+        keyframes (dict[int, tuple]): Passo -> (próximo input, estado do nível).
+        cursor (int): Índice do próximo input de `log.events`.
+    """
+
+    def __init__(
+        self,
+        log: SessionLog,
+        screen: pygame.Surface,
+        keyframe_interval: float = config.REPLAY_KEYFRAME_INTERVAL,
+        dirty_rects: bool = config.DIRTY_RECTS,
+    ) -> None:
+        """
+        Prepara o jogo no início da sessão.
+
+        Args:
+            log (SessionLog): Sessão a reproduzir.
+            screen (pygame.Surface): Superfície onde o jogo é desenhado.
+            keyframe_interval (float): Segundos de jogo entre quadros-chave.
+            dirty_rects (bool): Se True, redesenha apenas as regiões que mudaram.
+        """
+        self.log = log
+        self.game = Game(screen, audio=False, seed=log.seed, dirty_rects=dirty_rects)
+        self.game.start_level()
+        self.keyframe_frames = max(1, round(keyframe_interval / log.fixed_step))
+        self.keyframes: dict[int, tuple] = {}
+        self.cursor = 0
+        self._keyframe()
+
+    @property
+    def frame(self) -> int:
+        """Passo atual da reprodução."""
+        return self.game.frame
+
+    @property
+    def finished(self) -> bool:
+        """Se a reprodução chegou ao fim da sessão."""
+        return self.game.frame >= self.log.frames
+
+    # --- Avanço ---
+
+    def step(self) -> None:
+        """Aplica os inputs gravados para o passo atual e avança um passo fixo."""
+        game = self.game
+        events = self.log.events
+
+        while self.cursor < len(events) and events[self.cursor][0] == game.frame:
+            _, event, substep = events[self.cursor]
+            self.cursor += 1
+
+            if event == SessionEvent.FLAP:
+                game.flap()
+            elif event == SessionEvent.FLAP_AT:
+                game.flap_at(substep)
+            elif event == SessionEvent.PAUSE:
+                game.toggle_pause()
+            elif event == SessionEvent.RESTART:
+                game.restart()
+
+        game.update(self.log.fixed_step)
+
+        if game.frame % self.keyframe_frames == 0 and game.frame not in self.keyframes:
+            self._keyframe()
+
+    def advance(self, frames: int) -> int:
+        """
+        Avança até `frames` passos sem desenhar (para no fim da sessão).
+
+        Returns:
+            int: Passos efetivamente avançados.
+        """
+        start = self.game.frame
+
+        while self.game.frame - start < frames and not self.finished:
+            self.step()
+
+        return self.game.frame - start
+
+    # --- Quadros-chave e busca ---
+
+    def _keyframe(self) -> None:
+        """Guarda o estado do passo atual."""
+        self.keyframes[self.game.frame] = (self.cursor, self.game.level_manager.snapshot())
+
+    def seek(self, frame: int) -> None:
+        """
+        Vai para o passo `frame`, partindo do quadro-chave mais próximo antes dele.
+
+        Se o passo atual já está entre esse quadro-chave e o destino, apenas avança.
+
+        Args:
+            frame (int): Passo de destino (limitado à duração da sessão).
+        """
+        frame = min(max(frame, 0), self.log.frames)
+        keyframe = max(key for key in self.keyframes if key <= frame)
+
+        if not keyframe <= self.game.frame <= frame:
+            self.cursor, snapshot = self.keyframes[keyframe]
+            self.game.level_manager.restore(snapshot)
+            self.game.frame = keyframe
+            self.game.pending_flaps.clear()
+            self.game.scheduled_flaps.clear()
+            self.game.shown_flaps.clear()
+
+        self.advance(frame - self.game.frame)
+
+    def seek_time(self, seconds: float) -> None:
+        """Vai para o instante `seconds` da sessão (tempo de jogo)."""
+        self.seek(round(seconds / self.log.fixed_step))
+
+    # --- Reprodução na tela ---
+
+    def play(self, speed: float = 1.0) -> None:
+        """
+        Reproduz a sessão na tela até ESC ou fechar a janela.
+
+        Controles:
+            Espaço: Pausa/continua.
+            Setas ↑/↓: Dobra/divide a velocidade.
+            Setas →/←: Avança/volta `config.REPLAY_SEEK_STEP` segundos.
+
+        Args:
+            speed (float): Velocidade inicial (1 = tempo real).
+        """
+        clock = pygame.time.Clock()
+        seek_frames = round(config.REPLAY_SEEK_STEP / self.log.fixed_step)
+        accumulator = 0.0
+        dt = 0.0
+        paused = False
+
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    return
+
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_SPACE:
+                        paused = not paused
+                    elif event.key == pygame.K_UP:
+                        speed *= 2
+                    elif event.key == pygame.K_DOWN:
+                        speed /= 2
+                    elif event.key == pygame.K_RIGHT:
+                        self.seek(self.game.frame + seek_frames)
+                    elif event.key == pygame.K_LEFT:
+                        self.seek(self.game.frame - seek_frames)
+
+            if not paused and not self.finished:
+                # Mesmo acumulador do loop principal, com o tempo real escalado pela velocidade
+                accumulator += dt * speed
+                frames = int(accumulator / self.log.fixed_step)
+                accumulator -= frames * self.log.fixed_step
+                self.advance(frames)
+
+            self.game.draw()
+            dt = clock.tick(config.FPS) / 1_000
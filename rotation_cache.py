@@ -0,0 +1,113 @@
+import pygame
+
+import config
+
+
+class RotationCache:
+    """
+    Quadros do pássaro pré-renderizados em ângulos quantizados (inclinação).
+
+    Girar uma superfície a cada quadro (`pygame.transform.rotate`) custa uma
+    alocação e uma reamostragem por desenho. Aqui cada quadro do bater de asas
+    é girado uma única vez em cada ângulo de `minimum` a `maximum` a cada
+    `step` graus, com `rotozoom` (suavizado, já que o custo não se repete).
+    A rotação acontece na primeira vez que o par (quadro, ângulo) é pedido, e
+    não no carregamento: criar o cache é quase de graça e cada ângulo novo
+    custa uma rotação só (dezenas de µs), diluídas nos primeiros quadros
+    inclinados. Depois disso, inclinar o pássaro é só escolher uma superfície
+    da tabela.
+
+    A superfície girada é maior que a original (e é recortada ao contorno
+    visível); `frames` guarda também o deslocamento do seu canto em relação ao
+    do quadro original, de modo que o centro da rotação continua no centro do
+    corpo. A colisão usa a hitbox circular do `PlayerBody`, que não depende da
+    imagem, então a inclinação é puramente visual.
+
+    Attributes:
+        images (list[pygame.Surface]): Quadros da animação, sem inclinação.
+        minimum (int): Menor ângulo (graus, negativo = bico para baixo).
+        step (int): Intervalo entre os ângulos (graus).
+        angles (list[int]): Ângulos pré-renderizados, do menor para o maior.
+        frames (list[list[tuple[pygame.Surface, tuple[int, int]] | None]]): Para cada quadro
+            da animação e cada ângulo, a superfície e o deslocamento (x, y) do seu canto
+            (None = ainda não girado). Quadros repetidos compartilham a mesma lista.
+    """
+
+    def __init__(
+        self,
+        images: list[pygame.Surface],
+        minimum: int = config.PLAYER_TILT_DOWN,
+        maximum: int = config.PLAYER_TILT_UP,
+        step: int = config.PLAYER_TILT_STEP,
+    ) -> None:
+        """
+        Prepara a tabela vazia (nenhum quadro é girado aqui; veja `frame` e `render`).
+
+        Args:
+            images (list[pygame.Surface]): Quadros da animação (quadros repetidos são girados uma vez só).
+            minimum (int): Menor ângulo (graus).
+            maximum (int): Maior ângulo (graus).
+            step (int): Intervalo entre os ângulos (graus).
+        """
+        self.images = images
+        self.minimum = minimum
+        self.step = step
+        self.angles = list(range(minimum, maximum + 1, step))
+        rotated: dict[int, list[tuple[pygame.Surface, tuple[int, int]] | None]] = {}
+
+        for image in images:
+            rotated.setdefault(id(image), [None] * len(self.angles))
+
+        self.frames = [rotated[id(image)] for image in images]
+
+    def frame(self, image_index: int, angle: float) -> tuple[pygame.Surface, tuple[int, int]]:
+        """
+        Superfície do quadro `image_index` no ângulo pré-renderizado mais próximo de `angle`.
+
+        Args:
+            image_index (int): Índice do quadro da animação.
+            angle (float): Ângulo em graus (fora da faixa, usa o extremo mais próximo).
+
+        Returns:
+            tuple[pygame.Surface, tuple[int, int]]: A superfície girada e o deslocamento (x, y) do seu canto.
+        """
+        index = self.index(angle)
+        rotated = self.frames[image_index][index]
+
+        if rotated is None:
+            # Primeira vez neste ângulo: gira agora e guarda (também para os quadros repetidos)
+            rotated = self.frames[image_index][index] = self._rotate(self.images[image_index], self.angles[index])
+
+        return rotated
+
+    def render(self) -> None:
+        """Gira de uma vez todos os quadros ainda não girados (medições e pré-aquecimento)."""
+        for image_index in range(len(self.images)):
+            for angle in self.angles:
+                self.frame(image_index, angle)
+
+    @staticmethod
+    def _rotate(image: pygame.Surface, angle: int) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Superfície girada em `angle` graus e o deslocamento que mantém o centro."""
+        if angle == 0:
+            # Sem inclinação, a imagem original (sem reamostragem)
+            return image, (0, 0)
+
+        surface = pygame.transform.rotozoom(image, angle, 1)
+        # Recorta a borda transparente que a rotação acrescenta (menos área a desenhar e redesenhar)
+        bounds = surface.get_bounding_rect()
+        width, height = image.get_size()
+        offset = ((width - surface.get_width()) // 2 + bounds.x, (height - surface.get_height()) // 2 + bounds.y)
+        return surface.subsurface(bounds).convert_alpha(), offset
+
+    def index(self, angle: float) -> int:
+        """
+        Índice do ângulo pré-renderizado mais próximo de `angle`.
+
+        Args:
+            angle (float): Ângulo em graus (fora da faixa, usa o extremo mais próximo).
+
+        Returns:
+            int: Índice em `angles` (e na lista de cada quadro de `frames`).
+        """
+        return min(len(self.angles) - 1, max(0, round((angle - self.minimum) / self.step)))
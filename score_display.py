@@ -3,7 +3,7 @@ import pygame
 import config
 
 
-class ScoreDisplay(pygame.sprite.Sprite):
+class ScoreDisplay(pygame.sprite.DirtySprite):
     """
     Exibe a pontuação atual utilizando imagens personalizadas (fontes bitmap).
 
@@ -14,6 +14,7 @@ class ScoreDisplay(pygame.sprite.Sprite):
     Attributes:
         _layer (int): 11. O elemento de UI mais alto, desenhado sobre tudo.
         number_width (int): Largura padrão de um dígito + 1px de espaçamento.
+        dirty (int): 1 quando a pontuação mudou desde o último desenho.
     """
 
     def __init__(self, score_display_images: list[pygame.Surface]) -> None:
@@ -72,3 +73,4 @@ class ScoreDisplay(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
         self.rect.centerx = config.SCREEN_WIDTH // 2
         self.rect.y = abs(config.SCREEN_VERTICAL_OFFSET) // 2
+        self.dirty = 1
@@ -0,0 +1,304 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+import config
+from score_verifier import ScoreVerifier
+
+
+class ScoreServer:
+    """
+    Serviço HTTP (asyncio) que confere as pontuações enviadas ao placar.
+
+    O cliente envia o registro da sessão (`SessionLog.encode`, o arquivo
+    gravado em `sessions/`) e a pontuação declarada:
+
+        POST /verify?score=42   (corpo: o registro)
+        GET /stats              (contadores e tamanho da fila)
+
+    A re-simulação (`ScoreVerifier.verify`) roda em um `ProcessPoolExecutor`,
+    fora do loop de eventos. Entre as conexões e o pool há uma fila limitada:
+    com ela cheia, a sessão é recusada na hora com 503 e `Retry-After`, em
+    vez de acumular trabalho sem limite. Cada processo tem uma tarefa
+    consumidora, então há no máximo `workers` sessões em re-simulação e
+    `queue_size` aguardando.
+
+    Attributes:
+        host (str): Endereço de escuta.
+        port (int): Porta de escuta (com 0, a porta escolhida pelo sistema após `start`).
+        workers (int): Processos de re-simulação.
+        queue_size (int): Sessões aguardando verificação antes de responder 503.
+        timeout (float): Tempo máximo para receber cada requisição (segundos).
+        verifier (ScoreVerifier): Re-simulação e limites dos registros.
+        stats (dict[str, int]): Respostas por resultado ("verified", "rejected", "invalid", "overloaded").
+    """
+
+    def __init__(
+        self,
+        host: str = config.SCORE_SERVER_HOST,
+        port: int = config.SCORE_SERVER_PORT,
+        workers: int | None = config.SCORE_SERVER_WORKERS,
+        queue_size: int = config.SCORE_SERVER_QUEUE,
+        timeout: float = config.SCORE_SERVER_TIMEOUT,
+        verifier: ScoreVerifier | None = None,
+    ) -> None:
+        """
+        Configura o serviço (nada é aberto antes de `start`).
+
+        Args:
+            host (str): Endereço de escuta.
+            port (int): Porta de escuta (0 = escolhida pelo sistema).
+            workers (int | None): Processos de re-simulação (None = número de CPUs).
+            queue_size (int): Sessões aguardando verificação antes de responder 503.
+            timeout (float): Tempo máximo para receber cada requisição (segundos).
+            verifier (ScoreVerifier | None): Verificador (None = limites do `config`).
+        """
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.verifier = verifier if verifier is not None else ScoreVerifier()
+        self.stats = {"verified": 0, "rejected": 0, "invalid": 0, "overloaded": 0}
+
+        self.server: asyncio.Server | None = None
+        self.executor: ProcessPoolExecutor | None = None
+        self.queue: asyncio.Queue | None = None
+        self.tasks: list[asyncio.Task] = []
+        self.connections: dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    # --- Ciclo de vida ---
+
+    async def start(self) -> None:
+        """Inicia o pool de processos, as tarefas consumidoras e o servidor TCP."""
+        self.executor = ProcessPoolExecutor(self.workers)
+        self.queue = asyncio.Queue(self.queue_size)
+        self.tasks = [asyncio.create_task(self._consume()) for _ in range(self.workers)]
+        self.server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Para de aceitar conexões e encerra as tarefas e o pool."""
+        if self.server:
+            self.server.close()
+
+        # Conexões abertas (keep-alive) recebem EOF e terminam normalmente
+        for writer in self.connections.values():
+            writer.close()
+
+        for task in self.tasks:
+            task.cancel()
+
+        await asyncio.gather(*self.connections, *self.tasks, return_exceptions=True)
+
+        if self.executor:
+            self.executor.shutdown(cancel_futures=True)
+
+    async def serve_forever(self) -> None:
+        """Atende até ser interrompido (Ctrl+C)."""
+        await self.start()
+        print(f"verificação de pontuação em http://{self.host}:{self.port} ({self.workers} processos)")
+
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    # --- Fila e re-simulação ---
+
+    async def _consume(self) -> None:
+        """Retira sessões da fila e as re-simula no pool, uma por vez."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            data, claimed, future = await self.queue.get()
+
+            try:
+                result = await loop.run_in_executor(self.executor, self.verifier.verify, data, claimed)
+            except Exception as error:
+                # Ex: processo do pool encerrado à força; a conexão recebe 500
+                if not future.done():
+                    future.set_exception(error)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self.queue.task_done()
+
+    async def verify(self, data: bytes, claimed: int) -> tuple[HTTPStatus, dict]:
+        """
+        Enfileira uma sessão e aguarda o resultado da re-simulação.
+
+        Returns:
+            tuple: (status HTTP, corpo JSON).
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        try:
+            self.queue.put_nowait((data, claimed, future))
+        except asyncio.QueueFull:
+            self.stats["overloaded"] += 1
+            return HTTPStatus.SERVICE_UNAVAILABLE, {"error": "fila de verificação cheia"}
+
+        result = await future
+
+        if "error" in result:
+            self.stats["invalid"] += 1
+            return HTTPStatus.BAD_REQUEST, result
+
+        self.stats["verified" if result["verified"] else "rejected"] += 1
+        return HTTPStatus.OK, {**result, "claimed": claimed}
+
+    # --- HTTP ---
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Atende as requisições de uma conexão (HTTP/1.1 com keep-alive)."""
+        task = asyncio.current_task()
+        self.connections[task] = writer
+
+        try:
+            while True:
+                request = await asyncio.wait_for(self._read_head(reader), self.timeout)
+
+                if request is None:
+                    return
+
+                method, target, headers = request
+                status, body, keep_alive = await self._route(reader, method, target, headers)
+                self._write_response(writer, status, body, keep_alive)
+                await writer.drain()
+
+                if not keep_alive:
+                    return
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError, ConnectionError):
+            # Requisição lenta, interrompida, longa demais ou malformada: a conexão é fechada
+            pass
+        finally:
+            del self.connections[task]
+            writer.close()
+
+    async def _read_head(self, reader: asyncio.StreamReader) -> tuple[str, str, dict[str, str]] | None:
+        """
+        Lê a linha de requisição e os cabeçalhos.
+
+        Returns:
+            tuple | None: (método, alvo, cabeçalhos em minúsculas), ou None se a conexão fechou.
+        """
+        line = await reader.readline()
+
+        if not line:
+            return None
+
+        method, target, _ = line.decode("latin-1").split(" ", 2)
+        headers = {}
+
+        while True:
+            line = await reader.readline()
+
+            if not line:
+                raise ValueError("conexão interrompida no cabeçalho")
+
+            if line in (b"\r\n", b"\n"):
+                return method, target, headers
+
+            if len(headers) >= 100:
+                raise ValueError("cabeçalhos demais")
+
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    async def _route(
+        self, reader: asyncio.StreamReader, method: str, target: str, headers: dict[str, str]
+    ) -> tuple[HTTPStatus, dict, bool]:
+        """
+        Lê o corpo (se houver) e executa a rota.
+
+        Returns:
+            tuple: (status, corpo JSON, manter a conexão aberta).
+        """
+        keep_alive = headers.get("connection", "").lower() != "close"
+        url = urlsplit(target)
+
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            return HTTPStatus.BAD_REQUEST, {"error": "Content-Length inválido"}, False
+
+        if length < 0:
+            return HTTPStatus.BAD_REQUEST, {"error": "Content-Length inválido"}, False
+
+        if length > self.verifier.max_log_bytes:
+            # O corpo não é lido: a conexão precisa ser fechada
+            return HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "registro grande demais"}, False
+
+        body = await asyncio.wait_for(reader.readexactly(length), self.timeout)
+
+        if url.path == "/stats":
+            if method != "GET":
+                return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "use GET"}, keep_alive
+
+            return HTTPStatus.OK, {**self.stats, "queued": self.queue.qsize(), "workers": self.workers}, keep_alive
+
+        if url.path != "/verify":
+            return HTTPStatus.NOT_FOUND, {"error": "rota desconhecida"}, keep_alive
+
+        if method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "use POST"}, keep_alive
+
+        try:
+            claimed = int(parse_qs(url.query)["score"][0])
+        except (KeyError, ValueError):
+            return HTTPStatus.BAD_REQUEST, {"error": "informe ?score=N"}, keep_alive
+
+        try:
+            status, result = await self.verify(body, claimed)
+        except (ValueError, struct.error, EOFError):
+            # Registro malformado que passou pelas verificações do `ScoreVerifier`
+            self.stats["invalid"] += 1
+            return HTTPStatus.BAD_REQUEST, {"error": "registro malformado"}, keep_alive
+        except Exception:
+            # Ex: processo do pool encerrado à força; fica registrado para investigação
+            logging.exception("falha inesperada na re-simulação")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "falha na re-simulação"}, keep_alive
+
+        return status, result, keep_alive
+
+    @staticmethod
+    def _write_response(writer: asyncio.StreamWriter, status: HTTPStatus, body: dict, keep_alive: bool) -> None:
+        """Escreve a resposta JSON (503 inclui `Retry-After`)."""
+        content = json.dumps(body).encode()
+        head = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(content)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            head.append("Retry-After: 1")
+
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + content)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verificação das pontuações do placar (re-simulação das sessões)")
+    parser.add_argument("--host", default=config.SCORE_SERVER_HOST)
+    parser.add_argument("--port", type=int, default=config.SCORE_SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=config.SCORE_SERVER_WORKERS, help="Processos (padrão: CPUs)")
+    parser.add_argument("--queue", type=int, default=config.SCORE_SERVER_QUEUE, help="Sessões aguardando (depois, 503)")
+    parser.add_argument(
+        "--fixed-step", type=float, default=config.SCORE_FIXED_STEP, help="Passo fixo exigido dos registros (segundos)"
+    )
+    args = parser.parse_args()
+    verifier = ScoreVerifier(fixed_step=args.fixed_step)
+
+    try:
+        asyncio.run(ScoreServer(args.host, args.port, args.workers, args.queue, verifier=verifier).serve_forever())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,133 @@
+import config
+from course import Course
+from session_event import SessionEvent
+from session_log import SessionLog
+from simulation import Simulation
+
+
+class ScoreVerifier:
+    """
+    Confere a pontuação declarada de uma sessão re-simulando o seu registro sem tela.
+
+    A física, a geração dos vãos e a pontuação das moedas são as da
+    `Simulation`, a mesma usada pelo `Game`. Os inputs do `SessionLog` são
+    aplicados como o `Game` os aplicou (`Game.flap`, `flap_at`,
+    `toggle_pause` e `restart`), então a sessão reproduzida é idêntica à jogada.
+    A melhor partida da sessão é a pontuação que vai para o placar.
+
+    O registro vem de fora: tamanho, passo fixo e duração são conferidos antes
+    da re-simulação, que é o trabalho caro, e inputs em momentos impossíveis
+    (sub-passos que o passo não tem) recusam o registro inteiro.
+
+    Attributes:
+        max_duration (float): Maior sessão aceita (segundos de jogo).
+        fixed_step (float): Passo fixo exigido dos registros (segundos).
+        max_log_bytes (int): Maior registro aceito (bytes).
+    """
+
+    def __init__(
+        self,
+        max_duration: float = config.SCORE_MAX_DURATION,
+        fixed_step: float = config.SCORE_FIXED_STEP,
+        max_log_bytes: int = config.SCORE_MAX_LOG_BYTES,
+    ) -> None:
+        """
+        Define os limites dos registros aceitos.
+
+        Args:
+            max_duration (float): Maior sessão aceita (segundos de jogo).
+            fixed_step (float): Passo fixo exigido dos registros (segundos).
+            max_log_bytes (int): Maior registro aceito (bytes).
+        """
+        self.max_duration = max_duration
+        self.fixed_step = fixed_step
+        self.max_log_bytes = max_log_bytes
+
+    def replay(self, log: SessionLog) -> list[int]:
+        """
+        Re-simula a sessão.
+
+        Args:
+            log (SessionLog): Registro da sessão.
+
+        Returns:
+            list[int]: Pontuação final de cada partida (a última é a do fim do registro).
+
+        Raises:
+            ValueError: Se uma batida de asas com horário está em um sub-passo que o passo não tem.
+        """
+        simulation = Simulation(Course(log.seed))
+        steps = Simulation.substeps(log.fixed_step, simulation.max_step, simulation.max_substeps)
+        step = log.fixed_step / steps
+        events = log.events
+
+        # O `Game` só grava sub-passos do próprio passo; além dele, é um registro forjado
+        if any(event == SessionEvent.FLAP_AT and substep >= steps for _, event, substep in events):
+            raise ValueError("batida de asas em um sub-passo inexistente")
+
+        scores = []
+        cursor = 0
+
+        for frame in range(log.frames):
+            flaps = []
+
+            while cursor < len(events) and events[cursor][0] == frame:
+                _, event, substep = events[cursor]
+                cursor += 1
+
+                if event == SessionEvent.FLAP:
+                    simulation.flap()
+                elif event == SessionEvent.FLAP_AT:
+                    flaps.append(substep * step)
+                elif event == SessionEvent.PAUSE:
+                    simulation.toggle_pause()
+                elif event == SessionEvent.RESTART and simulation.can_restart:
+                    scores.append(simulation.score)
+                    simulation.restart()
+
+            simulation.update(log.fixed_step, flaps)
+            # Os eventos (sons, placar na tela) só interessam ao `Game`
+            simulation.events.clear()
+
+        scores.append(simulation.score)
+        return scores
+
+    def verify(self, data: bytes, claimed: int) -> dict:
+        """
+        Confere a pontuação declarada de um registro serializado.
+
+        Executado pelos processos do `ScoreServer` (recebe e retorna só dados simples).
+
+        Args:
+            data (bytes): Registro serializado por `SessionLog.encode`.
+            claimed (int): Pontuação declarada (a melhor partida da sessão).
+
+        Returns:
+            dict: "verified" e "score" (a melhor partida re-simulada), mais "runs" e
+            "duration"; ou "error" se o registro foi recusado antes da re-simulação.
+        """
+        if len(data) > self.max_log_bytes:
+            return {"error": "registro grande demais"}
+
+        try:
+            log = SessionLog.decode(data)
+        except (ValueError, IndexError) as error:
+            return {"error": str(error) or "registro malformado"}
+
+        if log.fixed_step != self.fixed_step:
+            return {"error": "passo fixo diferente do exigido"}
+
+        if log.duration > self.max_duration:
+            return {"error": "sessão longa demais"}
+
+        try:
+            scores = self.replay(log)
+        except ValueError as error:
+            return {"error": str(error)}
+
+        return {
+            "verified": max(scores) == claimed,
+            "score": max(scores),
+            "runs": len(scores),
+            "duration": log.duration,
+        }
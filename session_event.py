@@ -0,0 +1,26 @@
+from enum import Enum
+
+
+class SessionEvent(Enum):
+    """
+    Inputs gravados no registro da sessão (`SessionLog`), na ordem em que o `Game` os aplicou.
+
+    Cada registro guarda também o índice do passo fixo (`Game.frame`) antes do
+    qual o input foi aplicado; isso basta para repetir a sessão, porque todo o
+    resto é determinado pela semente e pelo passo fixo.
+    """
+
+    FLAP = 0
+    """Ação principal imediata (`Game.flap`): inicia a partida ou bate as asas."""
+
+    FLAP_AT = 1
+    """Batida de asas com horário, aplicada no sub-passo gravado do passo fixo."""
+
+    PAUSE = 2
+    """Alterna entre PAUSED e RUNNING."""
+
+    RESTART = 3
+    """Reinicia o nível após a morte."""
+
+    END = 7
+    """Fim da sessão (o índice do passo é o total de passos simulados)."""
@@ -0,0 +1,160 @@
+import os
+import struct
+
+from session_event import SessionEvent
+
+
+class SessionLog:
+    """
+    Registro binário compacto de uma sessão, suficiente para repeti-la exatamente.
+
+    Como a partida é determinada pela semente e pelo passo fixo, basta guardar
+    os inputs e o passo (`Game.frame`) em que cada um foi aplicado. O arquivo
+    tem um cabeçalho fixo seguido de um registro por input:
+
+    - cabeçalho: `MAGIC`, versão, semente (int64) e passo fixo (float64);
+    - registro: distância em passos até o registro anterior (varint, 1 byte
+      para até 127 passos) e um byte com o evento (3 bits) e o sub-passo
+      (5 bits, usado por `SessionEvent.FLAP_AT`);
+    - o último registro é `SessionEvent.END`, no total de passos da sessão.
+
+    Uma hora de partida com uma batida de asas a cada ~0,3 s ocupa cerca de 24 KB.
+
+    Attributes:
+        seed (int): Semente da sessão (`Game(seed=...)`).
+        fixed_step (float): Passo fixo da simulação em segundos.
+        events (list[tuple[int, SessionEvent, int]]): (passo, evento, sub-passo) na ordem de aplicação.
+        frames (int): Total de passos simulados (conhecido ao fim da sessão).
+    """
+
+    MAGIC = b"FBSL"
+    VERSION = 2
+    """2: as alturas dos vãos vêm do `Course` da semente (a versão 1 usava `random.Random`)."""
+    HEADER = struct.Struct("<4sBqd")
+    MAX_SUBSTEP = 31
+    """Maior sub-passo que cabe nos 5 bits do registro."""
+
+    def __init__(self, seed: int, fixed_step: float) -> None:
+        """
+        Cria um registro vazio.
+
+        Args:
+            seed (int): Semente da sessão.
+            fixed_step (float): Passo fixo da simulação em segundos.
+        """
+        self.seed = seed
+        self.fixed_step = fixed_step
+        self.events: list[tuple[int, SessionEvent, int]] = []
+        self.frames = 0
+
+    def append(self, frame: int, event: SessionEvent, substep: int = 0) -> None:
+        """
+        Grava um input aplicado antes do passo `frame` (ou durante ele, se `FLAP_AT`).
+
+        Args:
+            frame (int): Índice do passo fixo (`Game.frame`).
+            event (SessionEvent): O input.
+            substep (int): Sub-passo de uma batida de asas com horário.
+        """
+        if not 0 <= substep <= self.MAX_SUBSTEP:
+            raise ValueError(f"Sub-passo fora do intervalo do registro: {substep}")
+
+        self.events.append((frame, event, substep))
+        self.frames = max(self.frames, frame)
+
+    @property
+    def duration(self) -> float:
+        """Duração simulada da sessão em segundos."""
+        return self.frames * self.fixed_step
+
+    # --- Formato binário ---
+
+    def encode(self) -> bytes:
+        """Serializa o registro (cabeçalho, inputs e o registro final `END`)."""
+        data = bytearray(self.HEADER.pack(self.MAGIC, self.VERSION, self.seed, self.fixed_step))
+        previous = 0
+
+        for frame, event, substep in [*self.events, (self.frames, SessionEvent.END, 0)]:
+            delta = frame - previous
+            previous = frame
+
+            # Varint: 7 bits por byte, o bit mais alto indica que há mais bytes
+            while delta >= 0x80:
+                data.append((delta & 0x7F) | 0x80)
+                delta >>= 7
+
+            data.append(delta)
+            data.append(event.value | (substep << 3))
+
+        return bytes(data)
+
+    @classmethod
+    def decode(cls, data: bytes) -> "SessionLog":
+        """
+        Lê um registro serializado por `encode`.
+
+        Args:
+            data (bytes): Conteúdo do arquivo.
+
+        Returns:
+            SessionLog: O registro, com `frames` igual ao total de passos da sessão.
+        """
+        if len(data) < cls.HEADER.size:
+            raise ValueError("Registro de sessão incompleto")
+
+        magic, version, seed, fixed_step = cls.HEADER.unpack_from(data)
+
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Arquivo não é um registro de sessão compatível")
+
+        log = cls(seed, fixed_step)
+        position, frame = cls.HEADER.size, 0
+
+        while position < len(data):
+            delta, shift = 0, 0
+
+            while data[position] & 0x80:
+                delta |= (data[position] & 0x7F) << shift
+                shift += 7
+                position += 1
+
+            delta |= data[position] << shift
+            frame += delta
+            value = data[position + 1]
+            position += 2
+
+            event = SessionEvent(value & 0x07)
+
+            if event == SessionEvent.END:
+                log.frames = frame
+                return log
+
+            log.append(frame, event, value >> 3)
+
+        raise ValueError("Registro de sessão sem o registro final (sessão interrompida?)")
+
+    def save(self, path: str) -> None:
+        """
+        Grava o registro em disco (criando o diretório, se preciso).
+
+        Args:
+            path (str): Caminho do arquivo.
+        """
+        directory = os.path.dirname(path)
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(path, "wb") as file:
+            file.write(self.encode())
+
+    @classmethod
+    def load(cls, path: str) -> "SessionLog":
+        """
+        Lê um registro gravado por `save`.
+
+        Args:
+            path (str): Caminho do arquivo.
+        """
+        with open(path, "rb") as file:
+            return cls.decode(file.read())
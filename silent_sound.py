@@ -0,0 +1,11 @@
+class SilentSound:
+    """
+    Substituto mudo para `pygame.mixer.Sound` e `pygame.mixer.Channel`.
+
+    Usado quando o áudio está desabilitado (ex: treinamento em containers sem
+    placa de som), permitindo que o restante do código chame `play()`
+    normalmente sem inicializar o `pygame.mixer`.
+    """
+
+    def play(self, *args, **kwargs) -> None:
+        """Não faz nada."""
@@ -0,0 +1,530 @@
+import math
+
+import config
+from base_body import BaseBody
+from coin_body import CoinBody
+from collision import Collision
+from course import Course
+from frame_profiler import FrameProfiler
+from game_state import GameState
+from obstacle_body import ObstacleBody
+from player_body import PlayerBody
+from player_state import PlayerState
+from profiler_phase import ProfilerPhase
+from simulation_event import SimulationEvent
+from simulation_snapshot import SimulationSnapshot
+
+
+class Simulation:
+    """
+    Núcleo da simulação do jogo, sem display, áudio ou carregamento de imagens.
+
+    Contém toda a regra de gameplay (física do pássaro, rolagem e reciclagem
+    de obstáculos e chão, coleta de moedas e morte) sobre estruturas de dados
+    simples. O `Game` passa a ser apenas um renderizador sobre ela, e bots
+    podem rodar partidas inteiras sem inicializar o Pygame.
+
+    Attributes:
+        state (GameState): O estado atual da partida.
+        player (PlayerBody): O pássaro.
+        bases (list[BaseBody]): Os dois segmentos do chão.
+        obstacles (list[ObstacleBody]): Os obstáculos reciclados infinitamente.
+        score (int): Pontuação atual.
+        events (list[SimulationEvent]): Eventos ocorridos desde a última leitura.
+        course (Course): Percurso da sessão (alturas dos vãos). Dada a mesma semente e a
+            mesma sequência de inputs e passos, a partida é idêntica em qualquer máquina.
+        collision (Collision): Testes de colisão analíticos do pássaro (compartilhados).
+        profiler (FrameProfiler): Mede separadamente a física e a colisão (desligado por padrão).
+    """
+
+    collision = Collision(PlayerBody.hitbox, CoinBody.hitbox)
+
+    def __init__(
+        self,
+        course: Course | None = None,
+        profiler: FrameProfiler | None = None,
+        max_step: float | None = config.SIMULATION_MAX_STEP,
+        max_substeps: int = config.SIMULATION_MAX_SUBSTEPS,
+    ) -> None:
+        """
+        Cria uma partida nova, em IDLE, com a mesma disposição inicial do jogo original.
+
+        Args:
+            course (Course | None): Percurso da sessão. Se None, cria um gerado sem semente fixa.
+            profiler (FrameProfiler | None): Profiler do loop principal. Se None, usa um desligado.
+            max_step (float | None): Maior sub-passo (segundos). None = um único passo por
+                `update` (avaliação rápida sem tela; a colisão por varredura continua exata).
+            max_substeps (int): Limite de sub-passos por `update`.
+        """
+        self.course = course if course is not None else Course()
+        self.profiler = profiler if profiler is not None else FrameProfiler()
+        self.max_step = max_step
+        self.max_substeps = max_substeps
+        self.state = GameState.IDLE
+        self.events: list[SimulationEvent] = []
+        self.score = 0
+
+        # --- Chão (Ground) ---
+        left_base = BaseBody()
+        self.bases = [left_base, BaseBody(left_base.right)]
+
+        # --- Jogador (Player) ---
+        self.player = PlayerBody()
+
+        # --- Obstáculos (Obstacles) ---
+        # 2 pares de obstáculos são suficientes para cobrir a tela
+        self.obstacles = [
+            ObstacleBody((config.SCREEN_WIDTH // 2 + config.PIPE_WIDTH // 2) * i, self.course)
+            for i in range(2)
+        ]
+
+    def restart(self) -> None:
+        """
+        Reinicia a partida no lugar, reaproveitando todos os corpos.
+
+        Equivale a criar uma `Simulation` nova com o mesmo percurso (a partida
+        seguinte continua do ponto do percurso em que a anterior parou), mas sem
+        alocar objetos.
+        """
+        self.state = GameState.IDLE
+        self.events.clear()
+        self.score = 0
+
+        for base in self.bases:
+            base.restart()
+
+        self.player.restart()
+
+        for obstacle in self.obstacles:
+            obstacle.restart()
+
+    def start(self) -> None:
+        """Inicia a partida (IDLE -> RUNNING) com o primeiro pulo."""
+        self.state = GameState.RUNNING
+        self.player.state = PlayerState.FLYING
+        self.move_up()
+
+    def move_up(self) -> None:
+        """Faz o pássaro bater as asas."""
+        self.player.move_up()
+        self.events.append(SimulationEvent.MOVE_UP)
+
+    def flap(self) -> None:
+        """Ação principal: inicia a partida (se IDLE) ou faz o pássaro voar (se RUNNING)."""
+        if self.state == GameState.IDLE:
+            self.start()
+        elif self.state == GameState.RUNNING:
+            self.move_up()
+
+    def toggle_pause(self) -> None:
+        """Alterna entre PAUSED e RUNNING."""
+        if self.state == GameState.RUNNING:
+            self.state = GameState.PAUSED
+        elif self.state == GameState.PAUSED:
+            self.state = GameState.RUNNING
+
+    @property
+    def can_restart(self) -> bool:
+        """Só é possível reiniciar depois que a animação de morte acabou."""
+        return self.state == GameState.GAMEOVER and self.player.state == PlayerState.DEAD
+
+    def upcoming_gaps(self, count: int) -> list[int]:
+        """
+        Centro vertical dos próximos vãos, na ordem em que vão entrar na tela.
+
+        São as alturas ainda na fila do percurso (os obstáculos atuais não
+        entram): lidas sem consumi-las, sem alterar a partida.
+
+        Args:
+            count (int): Quantos vãos.
+
+        Returns:
+            list[int]: Coordenada y do meio de cada vão.
+        """
+        top = config.SCREEN_HEIGHT // 2 - config.PIPE_DISTANCE // 2 - config.PIPE_HEIGHT
+        center = top + self.obstacles[0].height // 2
+        return [center + offset for offset in self.course.peek(count)]
+
+    def snapshot(self) -> SimulationSnapshot:
+        """
+        Copia todo o estado da partida, incluindo a posição no percurso, em um registro compacto.
+
+        Custa poucos microssegundos: só os números da partida são copiados (do
+        percurso, basta a posição). Serve
+        para busca em árvore (clonar o mundo a cada nó) e como quadro-chave do
+        `ReplayPlayer`: `restore` volta exatamente a este ponto e a partida
+        continua igual, com as mesmas alturas de vãos.
+
+        Returns:
+            SimulationSnapshot: Estado da partida.
+        """
+        player = self.player
+        (first, second), (left_base, right_base) = self.obstacles, self.bases
+        first_coin, second_coin = first.coin, second.coin
+        # 2 obstáculos e 2 segmentos de chão (fixos): tuplas literais são bem mais rápidas que comprehensions
+        return SimulationSnapshot(
+            self.state,
+            self.score,
+            self.course.snapshot(),
+            (player.x, player.y, player.change_y, player.state),
+            (left_base.x, right_base.x),
+            (
+                (
+                    first.x,
+                    first.y,
+                    first_coin.active,
+                    first_coin.x,
+                    first_coin.y,
+                    first_coin.movement_step,
+                    first_coin.vertical_offset,
+                    first_coin.vertical_direction,
+                ),
+                (
+                    second.x,
+                    second.y,
+                    second_coin.active,
+                    second_coin.x,
+                    second_coin.y,
+                    second_coin.movement_step,
+                    second_coin.vertical_offset,
+                    second_coin.vertical_direction,
+                ),
+            ),
+        )
+
+    def restore(self, snapshot: SimulationSnapshot) -> None:
+        """
+        Volta ao estado copiado por `snapshot`, no lugar (sem alocar corpos).
+
+        Args:
+            snapshot (SimulationSnapshot): Estado retornado por `snapshot` (pode ser restaurado várias vezes).
+        """
+        self.state = snapshot.state
+        self.score = snapshot.score
+        self.course.restore(snapshot.course_position)
+        self.events.clear()
+        player = self.player
+        player.x, player.y, player.change_y, player.state = snapshot.player
+        self.bases[0].x, self.bases[1].x = snapshot.bases
+
+        for obstacle, state in zip(self.obstacles, snapshot.obstacles):
+            coin = obstacle.coin
+            (
+                obstacle.x,
+                obstacle.y,
+                coin.active,
+                coin.x,
+                coin.y,
+                coin.movement_step,
+                coin.vertical_offset,
+                coin.vertical_direction,
+            ) = state
+
+    def update(self, dt: float, flaps: list[float] | None = None) -> None:
+        """
+        Avança a simulação em `dt` segundos.
+
+        O intervalo é dividido em sub-passos iguais de no máximo `max_step`.
+        Como as posições são contínuas e cada sub-passo tem o mesmo tamanho em
+        qualquer taxa de quadros que seja divisora da taxa de sub-passos (ex: 30,
+        60, 120 e 240 Hz com 1/240 s), a partida é idêntica em todas elas.
+
+        Depois de um travamento (dt muito grande) o número de sub-passos fica
+        limitado a `max_substeps`: os sub-passos ficam maiores, mas a colisão por
+        varredura ainda encontra canos e moedas no meio do trajeto.
+
+        Inputs com horário (`flaps`) são aplicados no início do sub-passo em que
+        aconteceram, e não no início do quadro: o mesmo clique produz a mesma
+        partida em qualquer taxa de quadros.
+
+        Args:
+            dt (float): Delta time em segundos.
+            flaps (list[float] | None): Instantes das batidas de asas, em segundos desde o início do intervalo.
+        """
+        steps = self.substeps(dt, self.max_step, self.max_substeps)
+        step = dt / steps
+        pending = sorted(flaps) if flaps else []
+
+        for index in range(steps):
+            # A última fatia também recebe os inputs arredondados para o fim do intervalo
+            while pending and (pending[0] < (index + 1) * step or index == steps - 1):
+                pending.pop(0)
+                self.flap()
+
+            self.step(step)
+
+    @staticmethod
+    def substeps(dt: float, max_step: float | None, max_substeps: int) -> int:
+        """
+        Número de sub-passos iguais em que `dt` é dividido.
+
+        Args:
+            dt (float): Intervalo a simular (segundos).
+            max_step (float | None): Maior sub-passo (None = sem divisão).
+            max_substeps (int): Limite de sub-passos.
+
+        Returns:
+            int: Número de sub-passos (pelo menos 1).
+        """
+        if max_step is None:
+            return 1
+
+        # A tolerância evita um sub-passo extra quando dt / passo máximo é inteiro mas não exato em float
+        return min(max_substeps, max(1, math.ceil(dt / max_step - 1e-6)))
+
+    def step(self, dt: float) -> None:
+        """
+        Avança a simulação um único sub-passo de `dt` segundos.
+
+        Segue a ordem do `Game.update` original: primeiro o chão e o pássaro se
+        movem, depois o chão é reciclado, então os obstáculos andam (e são
+        reciclados), as moedas os acompanham e por fim as colisões são
+        verificadas ao longo do trajeto do sub-passo.
+
+        Args:
+            dt (float): Duração do sub-passo em segundos.
+        """
+        if self.state in [GameState.IDLE, GameState.RUNNING]:
+            for base in self.bases:
+                base.update(dt)
+
+            start_y, start_change_y = self.player.y, self.player.change_y
+            self.player.update(dt)
+            self._update_ground()
+
+            if self.state == GameState.RUNNING:
+                # Lógica de reciclagem de obstáculos
+                for obstacle in self.obstacles:
+                    obstacle.update(dt)
+
+                    # Se o obstáculo saiu da tela, reseta e reativa a moeda
+                    if obstacle.right < 0:
+                        obstacle.reset()
+                        self.events.append(SimulationEvent.RECYCLE)
+
+            # As moedas acompanham a posição já atualizada dos obstáculos
+            for obstacle in self.obstacles:
+                obstacle.coin.update(dt)
+
+            if self.state == GameState.RUNNING:
+                self.profiler.mark(ProfilerPhase.SIMULATION)
+                path = self.sweep_path(start_y, start_change_y, self.player.y, dt)
+                self._handle_collisions(path, config.GAME_SPEED * dt)
+                self.profiler.mark(ProfilerPhase.COLLISION)
+
+        # Se estiver em GAMEOVER, continuamos atualizando APENAS o player
+        # para que ele continue caindo (DYING) até virar DEAD
+        elif self.state == GameState.GAMEOVER:
+            if self.player.state != PlayerState.DEAD:
+                self.player.update(dt)
+
+    @staticmethod
+    def sweep_chords(dt: float) -> int:
+        """
+        Número de cordas em que a trajetória curva de um sub-passo é dividida.
+
+        Com gravidade a trajetória é uma parábola; as cordas são curtas o
+        bastante para que nenhuma se afaste mais que
+        `config.COLLISION_SWEEP_TOLERANCE` da curva (flecha = g * h² / 8). Em
+        sub-passos pequenos basta uma corda (início e fim).
+
+        Args:
+            dt (float): Duração do sub-passo em segundos.
+
+        Returns:
+            int: Número de cordas (pelo menos 1).
+        """
+        sagitta = config.GRAVITY * dt * dt / 8
+        return max(1, math.ceil(math.sqrt(sagitta / config.COLLISION_SWEEP_TOLERANCE)))
+
+    @classmethod
+    def sweep_path(cls, start_y: float, start_change_y: float, end_y: float, dt: float) -> list[float]:
+        """
+        Topos do pássaro nas extremidades das cordas de um sub-passo (ver `sweep_chords`).
+
+        Args:
+            start_y (float): Topo do pássaro no início do sub-passo.
+            start_change_y (float): Velocidade vertical no início do sub-passo.
+            end_y (float): Topo do pássaro no fim do sub-passo.
+            dt (float): Duração do sub-passo em segundos.
+
+        Returns:
+            list[float]: Topos no início, nos pontos intermediários e no fim.
+        """
+        chords = cls.sweep_chords(dt)
+        path = [start_y]
+
+        for chord in range(1, chords):
+            path.append(PlayerBody.advance(start_y, start_change_y, dt * chord / chords)[0])
+
+        path.append(end_y)
+        return path
+
+    def _update_ground(self) -> None:
+        """Recicla (teleporta) para a direita o segmento de chão que saiu da tela."""
+        left_base, right_base = self.bases
+
+        if left_base.right < 0:
+            left_base.x = right_base.right
+
+        if right_base.right < 0:
+            right_base.x = left_base.right
+
+    def find_collision(
+        self, path: list[float] | None = None, scroll: float = 0.0
+    ) -> BaseBody | ObstacleBody | CoinBody | None:
+        """
+        Procura o primeiro objeto que o pássaro toca no trajeto do último sub-passo.
+
+        Relativo ao cenário, o pássaro anda `scroll` pixels para a direita enquanto
+        sobe ou cai pelos topos de `path` (ver `sweep_path`). Cada objeto é
+        testado de duas formas e vale o contato mais cedo:
+
+        - varredura contínua do círculo do pássaro ao longo do trajeto (`Collision.sweep_rect`
+          e `sweep_circle`), que impede atravessar canos ou pular moedas com passos grandes;
+        - teste pixel a pixel na posição final, que decide os rasantes.
+
+        Só são testados os objetos que cruzam a caixa varrida pelo pássaro
+        (broadphase); sem nenhum, as cordas nem são montadas. Em um empate, chão e canos têm prioridade sobre
+        moedas, reproduzindo a ordem em que os sprites eram testados pelo
+        `spritecollideany` original.
+
+        Args:
+            path (list[float] | None): Topos do pássaro ao longo do sub-passo (`sweep_path`). Se None, só
+                o teste pixel a pixel na posição atual.
+            scroll (float): Deslocamento do cenário no sub-passo (pixels).
+
+        Returns:
+            O segmento de chão, o obstáculo (cano) ou a moeda tocada, ou None.
+        """
+        collision = self.collision
+        player = self.player
+        x, y = player.left, player.top
+        right = x + player.width
+        sweep_left = x - scroll
+        center_y = collision.center_y
+        radius = collision.radius - config.COLLISION_SWEEP_MARGIN
+        coin_radius = collision.radius + collision.coin_radius - config.COLLISION_SWEEP_MARGIN
+
+        # Caixa varrida (retângulo final e trajeto + raio): o que está fora dela é descartado sem varredura
+        band_top, band_bottom = y, y + player.height
+
+        if path:
+            band_top = min(band_top, min(path) + center_y - coin_radius)
+            band_bottom = max(band_bottom, max(path) + center_y + coin_radius)
+
+        rects: list[tuple[BaseBody | ObstacleBody, tuple[int, int, int, int]]] = []
+        coins: list[CoinBody] = []
+
+        for base in self.bases:
+            left = base.left
+
+            if left < right and left + base.width > sweep_left and base.y <= band_bottom:
+                rects.append((base, (left, base.y, left + base.width, base.y + base.height)))
+
+        for obstacle in self.obstacles:
+            left = obstacle.left
+
+            if left < right and left + obstacle.width > sweep_left:
+                for rect in obstacle.pipe_rects:
+                    if rect[3] >= band_top and rect[1] <= band_bottom:
+                        rects.append((obstacle, rect))
+
+        for obstacle in self.obstacles:
+            coin = obstacle.coin
+
+            if coin.active:
+                left, top = coin.left, coin.top
+
+                if (
+                    left < right
+                    and left + coin.width > sweep_left
+                    and top + config.COIN_TILE_SIZE >= band_top
+                    and top <= band_bottom
+                ):
+                    coins.append(coin)
+
+        # Caso comum: nada perto do pássaro, nenhuma corda a montar
+        if not rects and not coins:
+            return None
+
+        # Cordas do trajeto do centro do círculo, relativas ao cenário: (x0, y0, x1, y1).
+        # Sem trajeto, vale só o teste pixel a pixel na posição atual.
+        path = path or []
+        end_x = player.x + collision.center_x
+        chords = max(1, len(path) - 1)
+        segments = [
+            (
+                end_x - scroll * (chords - chord) / chords,
+                path[chord] + center_y,
+                end_x - scroll * (chords - chord - 1) / chords,
+                path[chord + 1] + center_y,
+            )
+            for chord in range(len(path) - 1)
+        ]
+        first, first_time = None, 2.0
+
+        for body, (left, top, rect_right, bottom) in rects:
+            time = None
+
+            for chord, segment in enumerate(segments):
+                contact = collision.sweep_rect(*segment, radius, left, top, rect_right, bottom)
+
+                if contact is not None:
+                    time = (chord + contact) / chords
+                    break
+            else:
+                if collision.overlaps_rect(x, y, left, top, rect_right, bottom):
+                    time = 1.0
+
+            if time is not None and time < first_time:
+                first, first_time = body, time
+
+        center = collision.coin_center
+
+        for coin in coins:
+            left, top = coin.left, coin.top
+            time = None
+
+            for chord, segment in enumerate(segments):
+                contact = collision.sweep_circle(*segment, coin_radius, left + center, top + center)
+
+                if contact is not None:
+                    time = (chord + contact) / chords
+                    break
+            else:
+                if collision.overlaps_coin(x, y, left, top):
+                    time = 1.0
+
+            if time is not None and time < first_time:
+                first, first_time = coin, time
+
+        return first
+
+    def _handle_collisions(self, path: list[float], scroll: float) -> None:
+        """
+        Reage às colisões do sub-passo: coleta moedas ou encerra a partida.
+
+        Moedas tocadas no trajeto antes de uma batida também são coletadas.
+
+        Args:
+            path (list[float]): Topos do pássaro ao longo do sub-passo (`sweep_path`).
+            scroll (float): Deslocamento do cenário no sub-passo (pixels).
+        """
+        collided = self.find_collision(path, scroll)
+
+        while isinstance(collided, CoinBody):
+            # Colisão boa: Coletou moeda
+            collided.active = False
+            self.score += 1
+            self.events.append(SimulationEvent.SCORE)
+            collided = self.find_collision(path, scroll)
+
+        if collided:
+            self._handle_hit()
+
+    def _handle_hit(self) -> None:
+        """Colisão ruim: encerra a partida e inicia a queda do pássaro."""
+        self.state = GameState.GAMEOVER
+        self.player.handle_death()
+        self.events.append(SimulationEvent.HIT)
@@ -0,0 +1,22 @@
+from enum import Enum
+
+
+class SimulationEvent(Enum):
+    """
+    Acontecimentos da simulação que interessam à camada de apresentação.
+
+    A `Simulation` não toca sons nem mexe em sprites. Em vez disso, ela
+    registra estes eventos para que o `Game` reaja (sons, placar, moedas).
+    """
+
+    MOVE_UP = 0
+    """O pássaro bateu as asas (impulso para cima)."""
+
+    SCORE = 1
+    """Uma moeda foi coletada e a pontuação aumentou."""
+
+    HIT = 2
+    """O pássaro bateu em um cano ou no chão."""
+
+    RECYCLE = 3
+    """Um obstáculo saiu da tela e voltou pela direita com a moeda reativada."""
@@ -0,0 +1,45 @@
+from game_state import GameState
+
+
+class SimulationSnapshot:
+    """
+    Cópia compacta do estado de uma `Simulation` (ver `Simulation.snapshot`).
+
+    Guarda apenas os números que definem a partida: poucas dezenas de
+    floats e inteiros em tuplas, mais a posição no percurso. Nada de
+    `pygame.Rect`, máscaras ou superfícies: o resto é derivado desses números.
+
+    Attributes:
+        state (GameState): Estado da partida.
+        score (int): Pontuação.
+        course_position (int): Alturas do percurso já consumidas (`Course.snapshot`).
+        player (tuple): (x, y, change_y, state) do pássaro.
+        bases (tuple[float, ...]): x de cada segmento do chão.
+        obstacles (tuple[tuple, ...]): Por obstáculo, (x, y, moeda ativa, x, y,
+            movement_step, vertical_offset e vertical_direction da moeda).
+    """
+
+    __slots__ = ("state", "score", "course_position", "player", "bases", "obstacles")
+
+    def __init__(
+        self, state: GameState, score: int, course_position: int, player: tuple, bases: tuple, obstacles: tuple
+    ) -> None:
+        self.state = state
+        self.score = score
+        self.course_position = course_position
+        self.player = player
+        self.bases = bases
+        self.obstacles = obstacles
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SimulationSnapshot):
+            return NotImplemented
+
+        return (
+            self.state == other.state
+            and self.score == other.score
+            and self.course_position == other.course_position
+            and self.player == other.player
+            and self.bases == other.bases
+            and self.obstacles == other.obstacles
+        )